@@ -0,0 +1,610 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Benchmark the BigQuery client read and write paths.
+
+The client talks to a local fake HTTP server, which serves canned
+``tabledata.list``, ``jobs.getQueryResults``, ``tabledata.insertAll`` and
+upload responses for a table of configurable size and schema, so no
+credentials are needed and runs are reproducible.
+
+Each run of a case happens in a fresh subprocess, which reports the number
+of rows processed, the elapsed and CPU time, and its peak resident memory.
+The results are written as a JSON document.
+"""
+
+import argparse
+import base64
+import datetime
+import json
+import os
+import platform
+import re
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+
+try:
+    import resource
+except ImportError:  # pragma: NO COVER
+    resource = None
+
+import six
+from six.moves import BaseHTTPServer
+from six.moves import socketserver
+from six.moves.urllib import parse
+
+
+PROJECT = "benchmark-project"
+DATASET = "benchmark_dataset"
+TABLE = "benchmark_table"
+QUERY = "SELECT * FROM `{}.{}.{}`".format(PROJECT, DATASET, TABLE)
+
+DEFAULT_SCHEMA = [
+    {"name": "ts", "type": "TIMESTAMP", "mode": "REQUIRED"},
+    {"name": "int_col", "type": "INT64", "mode": "REQUIRED"},
+    {"name": "nullable_int_col", "type": "INT64", "mode": "NULLABLE"},
+    {"name": "float_col", "type": "FLOAT64", "mode": "REQUIRED"},
+    {"name": "bool_col", "type": "BOOL", "mode": "REQUIRED"},
+    {"name": "str_col", "type": "STRING", "mode": "REQUIRED"},
+    {"name": "date_col", "type": "DATE", "mode": "NULLABLE"},
+    {"name": "numeric_col", "type": "NUMERIC", "mode": "NULLABLE"},
+]
+
+
+# Canned data.
+
+
+def _scalar_value(field_type, index):
+    """The JSON representation of a generated cell value."""
+    if field_type in ("INTEGER", "INT64"):
+        return str(index)
+    if field_type in ("FLOAT", "FLOAT64"):
+        return str(index * 0.5)
+    if field_type in ("BOOLEAN", "BOOL"):
+        return "true" if index % 2 else "false"
+    if field_type == "TIMESTAMP":
+        return "{}.123456".format(1500000000 + index)
+    if field_type == "DATE":
+        return "2018-01-{:02d}".format(index % 28 + 1)
+    if field_type == "DATETIME":
+        return "2018-01-{:02d}T12:34:56.123456".format(index % 28 + 1)
+    if field_type == "TIME":
+        return "12:34:{:02d}".format(index % 60)
+    if field_type == "NUMERIC":
+        return "{}.5".format(index)
+    if field_type == "BYTES":
+        return base64.b64encode("row {}".format(index).encode("ascii")).decode("ascii")
+    return "row {}".format(index)
+
+
+def _make_cell(field, index):
+    """Generate the ``tabledata.list`` cell of ``field`` in row ``index``."""
+    mode = field.get("mode", "NULLABLE")
+    if mode == "NULLABLE" and index % 10 == 0:
+        return {"v": None}
+
+    if field["type"] in ("RECORD", "STRUCT"):
+        value = {"f": [_make_cell(subfield, index) for subfield in field["fields"]]}
+    else:
+        value = _scalar_value(field["type"], index)
+
+    if mode == "REPEATED":
+        return {"v": [{"v": value}, {"v": value}]}
+    return {"v": value}
+
+
+def make_row(schema, index):
+    """Generate row ``index`` in the format of ``tabledata.list``."""
+    return {"f": [_make_cell(field, index) for field in schema]}
+
+
+def _cell_to_json(field, cell):
+    """Convert a ``tabledata.list`` cell to a newline-delimited JSON value."""
+    value = cell["v"]
+    if value is None:
+        return None
+    if field.get("mode") == "REPEATED":
+        item_field = dict(field, mode="NULLABLE")
+        return [_cell_to_json(item_field, item) for item in value]
+    if field["type"] in ("RECORD", "STRUCT"):
+        return {
+            subfield["name"]: _cell_to_json(subfield, subcell)
+            for subfield, subcell in zip(field["fields"], value["f"])
+        }
+    return value
+
+
+def row_to_json(schema, row):
+    """Convert a ``tabledata.list`` row to a newline-delimited JSON row."""
+    return {
+        field["name"]: _cell_to_json(field, cell)
+        for field, cell in zip(schema, row["f"])
+    }
+
+
+def _table_reference():
+    return {"projectId": PROJECT, "datasetId": DATASET, "tableId": TABLE}
+
+
+# Fake server.
+
+
+class _Handler(BaseHTTPServer.BaseHTTPRequestHandler):
+    """Route requests to the methods of :class:`FakeBigQueryServer`."""
+
+    protocol_version = "HTTP/1.1"
+    disable_nagle_algorithm = True
+
+    def log_message(self, *args):
+        pass
+
+    def _handle(self):
+        url = parse.urlsplit(self.path)
+        params = dict(parse.parse_qsl(url.query))
+        length = int(self.headers.get("Content-Length") or 0)
+        body = self.rfile.read(length) if length else b""
+
+        for method, pattern, handler in self.server.routes:
+            match = pattern.match(url.path)
+            if method == self.command and match is not None:
+                status, headers, payload = handler(
+                    params, self.headers, body, *match.groups()
+                )
+                break
+        else:
+            status, headers, payload = 404, {}, {"error": {"code": 404}}
+
+        if not isinstance(payload, bytes):
+            payload = json.dumps(payload).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        for name, value in headers.items():
+            self.send_header(name, value)
+        self.end_headers()
+        self.wfile.write(payload)
+
+    do_GET = do_POST = do_PUT = _handle
+
+
+class _HTTPServer(socketserver.ThreadingMixIn, BaseHTTPServer.HTTPServer):
+    daemon_threads = True
+
+
+class FakeBigQueryServer(object):
+    """A local HTTP server with canned BigQuery API responses.
+
+    Result pages are encoded once, before any benchmark runs, so that the
+    server does as little work as possible while the client is measured.
+
+    Args:
+        schema (List[dict]): The table schema, in API representation.
+        num_rows (int): The number of rows in the table.
+        page_size (int): The default number of rows per result page.
+    """
+
+    def __init__(self, schema, num_rows, page_size):
+        self.schema = schema
+        self.num_rows = num_rows
+        self.page_size = page_size
+        self._pages = {}
+        self._pages_lock = threading.Lock()
+        self._upload_id = 0
+
+        table = r"^/bigquery/v2/projects/([^/]+)/datasets/([^/]+)/tables/([^/]+)"
+        self._httpd = _HTTPServer(("127.0.0.1", 0), _Handler)
+        self._httpd.routes = [
+            ("GET", re.compile(table + "/data$"), self._list_rows),
+            ("POST", re.compile(table + "/insertAll$"), self._insert_all),
+            (
+                "GET",
+                re.compile(r"^/bigquery/v2/projects/([^/]+)/queries/([^/]+)$"),
+                self._query_results,
+            ),
+            (
+                "POST",
+                re.compile(r"^/bigquery/v2/projects/([^/]+)/jobs$"),
+                self._insert_job,
+            ),
+            (
+                "GET",
+                re.compile(r"^/bigquery/v2/projects/([^/]+)/jobs/([^/]+)$"),
+                self._get_job,
+            ),
+            (
+                "POST",
+                re.compile(r"^/upload/bigquery/v2/projects/([^/]+)/jobs$"),
+                self._upload,
+            ),
+            (
+                "PUT",
+                re.compile(r"^/upload/bigquery/v2/projects/([^/]+)/jobs$"),
+                self._upload_chunk,
+            ),
+        ]
+        self._thread = threading.Thread(target=self._httpd.serve_forever)
+        self._thread.daemon = True
+
+        for start in six.moves.range(0, num_rows, page_size):
+            self._page(start, page_size)
+
+    @property
+    def url(self):
+        host, port = self._httpd.server_address
+        return "http://{}:{}".format(host, port)
+
+    def start(self):
+        self._thread.start()
+
+    def stop(self):
+        self._httpd.shutdown()
+        self._httpd.server_close()
+
+    def _page(self, start, page_size):
+        """The encoded rows and page token for a page of results."""
+        key = (start, page_size)
+        with self._pages_lock:
+            page = self._pages.get(key)
+        if page is None:
+            stop = min(start + page_size, self.num_rows)
+            rows = [make_row(self.schema, index) for index in range(start, stop)]
+            page_token = str(stop) if stop < self.num_rows else None
+            page = (json.dumps(rows), page_token)
+            with self._pages_lock:
+                self._pages[key] = page
+        return page
+
+    def _rows_payload(self, params, resource):
+        """Add a page of rows to a response, without decoding them again."""
+        max_results = int(params.get("maxResults", self.page_size))
+        resource["totalRows"] = str(self.num_rows)
+        if max_results == 0:
+            return resource
+
+        start = int(params.get("pageToken", params.get("startIndex", 0)))
+        rows, page_token = self._page(start, max_results)
+        if page_token is not None:
+            resource["pageToken"] = page_token
+        # Splice the pre-encoded rows into the response.
+        resource["rows"] = None
+        encoded = json.dumps(resource).replace('"rows": null', '"rows": ' + rows, 1)
+        return encoded.encode("utf-8")
+
+    def _list_rows(self, params, headers, body, project, dataset, table):
+        return 200, {}, self._rows_payload(params, {"kind": "bigquery#tableDataList"})
+
+    def _insert_all(self, params, headers, body, project, dataset, table):
+        json.loads(body.decode("utf-8"))
+        return 200, {}, {"kind": "bigquery#tableDataInsertAllResponse"}
+
+    def _query_results(self, params, headers, body, project, job_id):
+        resource = {
+            "kind": "bigquery#getQueryResultsResponse",
+            "jobReference": {"projectId": project, "jobId": job_id},
+            "jobComplete": True,
+            "schema": {"fields": self.schema},
+        }
+        return 200, {}, self._rows_payload(params, resource)
+
+    def _query_job(self, project, job_id):
+        return {
+            "jobReference": {"projectId": project, "jobId": job_id},
+            "configuration": {
+                "query": {"query": QUERY, "destinationTable": _table_reference()}
+            },
+            "statistics": {"creationTime": "1500000000000", "query": {}},
+            "status": {"state": "DONE"},
+        }
+
+    def _insert_job(self, params, headers, body, project):
+        resource = json.loads(body.decode("utf-8"))
+        job_id = resource["jobReference"]["jobId"]
+        return 200, {}, self._query_job(project, job_id)
+
+    def _get_job(self, params, headers, body, project, job_id):
+        return 200, {}, self._query_job(project, job_id)
+
+    def _load_job(self, project):
+        self._upload_id += 1
+        return {
+            "jobReference": {
+                "projectId": project,
+                "jobId": "load-{}".format(self._upload_id),
+            },
+            "configuration": {
+                "load": {
+                    "destinationTable": _table_reference(),
+                    "sourceFormat": "NEWLINE_DELIMITED_JSON",
+                }
+            },
+            "status": {"state": "RUNNING"},
+        }
+
+    def _upload(self, params, headers, body, project):
+        if params.get("uploadType") == "resumable":
+            location = "{}/upload/bigquery/v2/projects/{}/jobs?{}".format(
+                self.url,
+                project,
+                parse.urlencode({"uploadType": "resumable", "upload_id": "1"}),
+            )
+            return 200, {"Location": location}, b""
+        return 200, {}, self._load_job(project)
+
+    def _upload_chunk(self, params, headers, body, project):
+        # The Content-Range of a chunk is "bytes {first}-{last}/{total}",
+        # with a total of "*" until the final chunk.
+        total = headers.get("Content-Range", "").rpartition("/")[2]
+        if total == "*":
+            last = headers["Content-Range"].split("-")[1].split("/")[0]
+            return 308, {"Range": "bytes=0-{}".format(last)}, b""
+        return 200, {}, self._load_job(project)
+
+
+# Benchmark cases, run in a subprocess.
+
+
+def make_client(server_url):
+    """Create a client which sends all requests to the fake server."""
+    from google.auth.credentials import AnonymousCredentials
+    from google.cloud.bigquery import _http
+    from google.cloud.bigquery import client as client_module
+
+    _http.Connection.API_BASE_URL = server_url
+    upload_template = (
+        server_url + "/upload/bigquery/v2/projects/{project}/jobs?uploadType="
+    )
+    client_module._MULTIPART_URL_TEMPLATE = upload_template + "multipart"
+    client_module._RESUMABLE_URL_TEMPLATE = upload_template + "resumable"
+    return client_module.Client(project=PROJECT, credentials=AnonymousCredentials())
+
+
+def _make_table(schema):
+    from google.cloud.bigquery.table import Table
+
+    return Table.from_api_repr(
+        {"tableReference": _table_reference(), "schema": {"fields": schema}}
+    )
+
+
+def list_rows_case(client, args, schema):
+    table = _make_table(schema)
+
+    def run():
+        num_rows = 0
+        for _ in client.list_rows(table, page_size=args.page_size):
+            num_rows += 1
+        return num_rows
+
+    return run
+
+
+def to_dataframe_case(client, args, schema):
+    table = _make_table(schema)
+
+    def run():
+        return len(client.list_rows(table, page_size=args.page_size).to_dataframe())
+
+    return run
+
+
+def query_result_case(client, args, schema):
+    def run():
+        num_rows = 0
+        for _ in client.query(QUERY).result():
+            num_rows += 1
+        return num_rows
+
+    return run
+
+
+def insert_rows_case(client, args, schema):
+    from google.cloud.bigquery import _helpers
+
+    table = _make_table(schema)
+    rows = [
+        _helpers._row_tuple_from_json(make_row(schema, index), table.schema)
+        for index in range(args.rows)
+    ]
+
+    def run():
+        for start in range(0, len(rows), args.insert_batch_size):
+            errors = client.insert_rows(
+                table, rows[start : start + args.insert_batch_size]
+            )
+            assert not errors, errors
+        return len(rows)
+
+    return run
+
+
+def load_from_file_case(client, args, schema):
+    from google.cloud.bigquery import job
+
+    source = tempfile.TemporaryFile()
+    for index in range(args.rows):
+        line = json.dumps(row_to_json(schema, make_row(schema, index))) + "\n"
+        source.write(line.encode("utf-8"))
+    job_config = job.LoadJobConfig()
+    job_config.source_format = job.SourceFormat.NEWLINE_DELIMITED_JSON
+
+    def run():
+        source.seek(0)
+        client.load_table_from_file(
+            source, _make_table(schema).reference, job_config=job_config
+        )
+        return args.rows
+
+    return run
+
+
+CASES = [
+    ("list_rows", list_rows_case),
+    ("to_dataframe", to_dataframe_case),
+    ("query_result", query_result_case),
+    ("insert_rows", insert_rows_case),
+    ("load_from_file", load_from_file_case),
+]
+
+
+def _peak_rss_bytes():
+    if resource is None:
+        return None
+    peak_rss = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    # Linux reports kilobytes, macOS reports bytes.
+    return peak_rss if sys.platform == "darwin" else peak_rss * 1024
+
+
+def _cpu_seconds():
+    times = os.times()
+    return times[0] + times[1]
+
+
+def run_case(name, server_url, args, schema):
+    """Set up and measure one run of a case.
+
+    Returns:
+        dict: The measurements of the run.
+    """
+    client = make_client(server_url)
+    run = dict(CASES)[name](client, args, schema)
+    setup_rss = _peak_rss_bytes()
+
+    cpu_start = _cpu_seconds()
+    wall_start = time.time()
+    num_rows = run()
+    wall_seconds = time.time() - wall_start
+    cpu_seconds = _cpu_seconds() - cpu_start
+
+    return {
+        "case": name,
+        "rows": num_rows,
+        "wall_seconds": wall_seconds,
+        "rows_per_second": num_rows / wall_seconds if wall_seconds else None,
+        "cpu_seconds": cpu_seconds,
+        "cpu_microseconds_per_row": cpu_seconds * 1e6 / num_rows if num_rows else None,
+        "setup_peak_rss_bytes": setup_rss,
+        "peak_rss_bytes": _peak_rss_bytes(),
+    }
+
+
+# Driver.
+
+
+def _child_command(name, server_url, args):
+    command = [
+        sys.executable,
+        os.path.abspath(__file__),
+        "--rows",
+        str(args.rows),
+        "--page-size",
+        str(args.page_size),
+        "--insert-batch-size",
+        str(args.insert_batch_size),
+        "--run-case",
+        name,
+        "--server-url",
+        server_url,
+    ]
+    if args.schema is not None:
+        command.extend(["--schema", args.schema])
+    return command
+
+
+def _environment():
+    from google.cloud import bigquery
+
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "google-cloud-bigquery": bigquery.__version__,
+    }
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=100000)
+    parser.add_argument("--page-size", type=int, default=10000)
+    parser.add_argument("--insert-batch-size", type=int, default=500)
+    parser.add_argument(
+        "--schema",
+        help="Path to a JSON file with the table schema, as a list of fields "
+        "in API representation. Defaults to one column of each common type.",
+    )
+    parser.add_argument(
+        "--cases",
+        nargs="+",
+        choices=[name for name, _ in CASES],
+        default=[name for name, _ in CASES],
+    )
+    parser.add_argument("--repeat", type=int, default=3)
+    parser.add_argument(
+        "--output", help="Write the JSON results to this file instead of stdout."
+    )
+    parser.add_argument("--run-case", help=argparse.SUPPRESS)
+    parser.add_argument("--server-url", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    schema = DEFAULT_SCHEMA
+    if args.schema is not None:
+        with open(args.schema) as schema_file:
+            schema = json.load(schema_file)
+
+    if args.run_case is not None:
+        result = run_case(args.run_case, args.server_url, args, schema)
+        print(json.dumps(result))
+        return
+
+    server = FakeBigQueryServer(schema, args.rows, args.page_size)
+    server.start()
+    results = []
+    try:
+        for name in args.cases:
+            for repeat in range(args.repeat):
+                output = subprocess.check_output(_child_command(name, server.url, args))
+                result = json.loads(output.decode("utf-8").splitlines()[-1])
+                result["repeat"] = repeat
+                results.append(result)
+                sys.stderr.write(
+                    "{case}: {rows} rows, {wall_seconds:.3f} sec, "
+                    "{rows_per_second:.0f} rows/sec, "
+                    "{cpu_microseconds_per_row:.1f} CPU usec/row\n".format(**result)
+                )
+    finally:
+        server.stop()
+
+    report = {
+        "timestamp": datetime.datetime.utcnow().isoformat() + "Z",
+        "environment": _environment(),
+        "config": {
+            "rows": args.rows,
+            "page_size": args.page_size,
+            "insert_batch_size": args.insert_batch_size,
+            "repeat": args.repeat,
+            "schema": schema,
+        },
+        "results": results,
+    }
+    if args.output is None:
+        json.dump(report, sys.stdout, indent=2, sort_keys=True)
+        sys.stdout.write("\n")
+    else:
+        with open(args.output, "w") as output_file:
+            json.dump(report, output_file, indent=2, sort_keys=True)
+
+
+if __name__ == "__main__":
+    main()
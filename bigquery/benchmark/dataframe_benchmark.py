@@ -0,0 +1,112 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compare row-based and columnar RowIterator.to_dataframe().
+
+Pages of ``tabledata.list`` rows are generated locally, so no requests are
+made to the BigQuery API.
+"""
+
+import argparse
+import time
+
+import pandas
+
+from google.cloud.bigquery.schema import SchemaField
+from google.cloud.bigquery.table import RowIterator
+
+
+SCHEMA = [
+    SchemaField("ts", "TIMESTAMP"),
+    SchemaField("int_col", "INT64"),
+    SchemaField("nullable_int_col", "INT64"),
+    SchemaField("float_col", "FLOAT64"),
+    SchemaField("bool_col", "BOOL"),
+    SchemaField("str_col", "STRING"),
+    SchemaField("date_col", "DATE"),
+]
+
+
+def make_row(index):
+    return {
+        "f": [
+            {"v": "{}.123456".format(1500000000 + index)},
+            {"v": str(index)},
+            {"v": str(index) if index % 10 else None},
+            {"v": str(index * 0.5)},
+            {"v": "true" if index % 2 else "false"},
+            {"v": "row {}".format(index)},
+            {"v": "2018-01-{:02d}".format(index % 28 + 1)},
+        ]
+    }
+
+
+def make_api_request(num_rows, page_size):
+    pages = []
+    for start in range(0, num_rows, page_size):
+        stop = min(start + page_size, num_rows)
+        page = {"rows": [make_row(index) for index in range(start, stop)]}
+        if stop < num_rows:
+            page["pageToken"] = str(stop)
+        pages.append(page)
+
+    def api_request(method, path, query_params):
+        return pages[int(query_params.get("pageToken", 0)) // page_size]
+
+    return api_request
+
+
+def make_iterator(api_request):
+    return RowIterator(None, api_request, "/benchmark", SCHEMA)
+
+
+def to_dataframe_rows(api_request):
+    """The row-based implementation, which creates a Row per result."""
+    iterator = make_iterator(api_request)
+    column_headers = [field.name for field in SCHEMA]
+    rows = (row.values() for row in iter(iterator))
+    return pandas.DataFrame(rows, columns=column_headers)
+
+
+def to_dataframe_columns(api_request):
+    return make_iterator(api_request).to_dataframe()
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=200000)
+    parser.add_argument("--page-size", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    api_request = make_api_request(args.rows, args.page_size)
+    for name, method in (
+        ("rows", to_dataframe_rows),
+        ("columns", to_dataframe_columns),
+    ):
+        best = None
+        for _ in range(args.repeat):
+            start_time = time.time()
+            method(api_request)
+            elapsed = time.time() - start_time
+            best = elapsed if best is None else min(best, elapsed)
+        print(
+            "{0}: {1} rows, best of {2}: {3:.3f} sec, {4:.0f} rows/sec".format(
+                name, args.rows, args.repeat, best, args.rows / best
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Compare generic and per-schema Row classes when iterating over rows.
+
+Pages of ``tabledata.list`` rows are generated locally, so no requests are
+made to the BigQuery API. Each row is read field by field as attributes.
+"""
+
+import argparse
+import time
+import tracemalloc
+
+from google.cloud.bigquery.schema import SchemaField
+from google.cloud.bigquery.table import Row
+from google.cloud.bigquery.table import RowIterator
+
+
+SCHEMA = [
+    SchemaField("int_col", "INT64"),
+    SchemaField("float_col", "FLOAT64"),
+    SchemaField("bool_col", "BOOL"),
+    SchemaField("str_col", "STRING"),
+    SchemaField("str_col_2", "STRING"),
+]
+FIELD_NAMES = [field.name for field in SCHEMA]
+
+
+def make_page(start, stop):
+    return [
+        {
+            "f": [
+                {"v": str(index)},
+                {"v": str(index * 0.5)},
+                {"v": "true" if index % 2 else "false"},
+                {"v": "row {}".format(index)},
+                {"v": "abc"},
+            ]
+        }
+        for index in range(start, stop)
+    ]
+
+
+def make_api_request(num_rows, page_size):
+    # Pages are made on request and then dropped, so that benchmarking
+    # millions of rows does not need them all in memory.
+    def api_request(method, path, query_params):
+        start = int(query_params.get("pageToken", 0))
+        stop = min(start + page_size, num_rows)
+        page = {"rows": make_page(start, stop)}
+        if stop < num_rows:
+            page["pageToken"] = str(stop)
+        return page
+
+    return api_request
+
+
+def make_iterator(api_request, generic):
+    iterator = RowIterator(None, api_request, "/benchmark", SCHEMA)
+    if generic:
+        # Rows as they were before per-schema classes, read through
+        # Row.__getattr__.
+        iterator._row_class = Row
+    return iterator
+
+
+def read_rows(api_request, generic):
+    """Read every field of every row as an attribute."""
+    for row in make_iterator(api_request, generic):
+        for name in FIELD_NAMES:
+            getattr(row, name)
+
+
+def keep_rows(api_request, generic):
+    """Keep all the rows in memory, to measure their size."""
+    return list(make_iterator(api_request, generic))
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__)
+    parser.add_argument("--rows", type=int, default=1000000)
+    parser.add_argument("--page-size", type=int, default=10000)
+    parser.add_argument("--repeat", type=int, default=3)
+    args = parser.parse_args()
+
+    api_request = make_api_request(args.rows, args.page_size)
+    pages_only = time.time()
+    for start in range(0, args.rows, args.page_size):
+        api_request("GET", "/benchmark", {"pageToken": start})
+    pages_only = time.time() - pages_only
+
+    for name, generic in (("generic", True), ("per-schema", False)):
+        best = None
+        for _ in range(args.repeat):
+            start_time = time.time()
+            read_rows(api_request, generic)
+            elapsed = time.time() - start_time
+            best = elapsed if best is None else min(best, elapsed)
+
+        tracemalloc.start()
+        rows = keep_rows(api_request, generic)
+        kept, _ = tracemalloc.get_traced_memory()
+        tracemalloc.stop()
+        del rows
+
+        print(
+            "{0}: {1} rows, best of {2}: {3:.3f} sec "
+            "({4:.3f} sec without making pages), {5:.0f} bytes/row".format(
+                name,
+                args.rows,
+                args.repeat,
+                best,
+                best - pages_only,
+                kept / float(args.rows),
+            )
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -43,6 +43,7 @@ from google.cloud.bigquery.external_config import BigtableColumn
 from google.cloud.bigquery.external_config import CSVOptions
 from google.cloud.bigquery.external_config import GoogleSheetsOptions
 from google.cloud.bigquery.external_config import ExternalSourceFormat
+from google.cloud.bigquery.inserter import TableInserter
 from google.cloud.bigquery.job import Compression
 from google.cloud.bigquery.job import CopyJob
 from google.cloud.bigquery.job import CopyJobConfig
@@ -59,8 +60,15 @@ from google.cloud.bigquery.job import QueryPriority
 from google.cloud.bigquery.job import SchemaUpdateOption
 from google.cloud.bigquery.job import SourceFormat
 from google.cloud.bigquery.job import UnknownJob
+from google.cloud.bigquery.job import wait_for_jobs
 from google.cloud.bigquery.job import WriteDisposition
+from google.cloud.bigquery.job_group import JobGroup
+from google.cloud.bigquery.job_group import JobGroupResult
 from google.cloud.bigquery.query import ArrayQueryParameter
+from google.cloud.bigquery.query_cache import DiskQueryCache
+from google.cloud.bigquery.query_cache import DryRunCache
+from google.cloud.bigquery.query_cache import MemoryQueryCache
+from google.cloud.bigquery.query_cache import QueryCache
 from google.cloud.bigquery.query import ScalarQueryParameter
 from google.cloud.bigquery.query import StructQueryParameter
 from google.cloud.bigquery.query import UDFResource
@@ -70,6 +78,7 @@ from google.cloud.bigquery.table import EncryptionConfiguration
 from google.cloud.bigquery.table import Table
 from google.cloud.bigquery.table import TableReference
 from google.cloud.bigquery.table import Row
+from google.cloud.bigquery.table import PartitionRowIterator
 from google.cloud.bigquery.table import TimePartitioningType
 from google.cloud.bigquery.table import TimePartitioning
 
@@ -82,6 +91,10 @@ __all__ = [
     "ArrayQueryParameter",
     "ScalarQueryParameter",
     "StructQueryParameter",
+    "QueryCache",
+    "MemoryQueryCache",
+    "DiskQueryCache",
+    "DryRunCache",
     # Datasets
     "Dataset",
     "DatasetReference",
@@ -91,6 +104,8 @@ __all__ = [
     "Table",
     "TableReference",
     "Row",
+    "PartitionRowIterator",
+    "TableInserter",
     "CopyJob",
     "CopyJobConfig",
     "ExtractJob",
@@ -98,6 +113,9 @@ __all__ = [
     "LoadJob",
     "LoadJobConfig",
     "UnknownJob",
+    "JobGroup",
+    "JobGroupResult",
+    "wait_for_jobs",
     "TimePartitioningType",
     "TimePartitioning",
     # Shared helpers
@@ -53,10 +53,15 @@ def _decimal_from_json(value, field):
         return decimal.Decimal(value)
 
 
+def _bool_from_string(value):
+    """Parse a JSON boolean string."""
+    return value.lower() in ["t", "true", "1"]
+
+
 def _bool_from_json(value, field):
     """Coerce 'value' to a bool, if set or not nullable."""
     if _not_null(value, field):
-        return value.lower() in ["t", "true", "1"]
+        return _bool_from_string(value)
 
 
 def _string_from_json(value, _):
@@ -64,17 +69,27 @@ def _string_from_json(value, _):
     return value
 
 
+def _bytes_from_string(value):
+    """Base64-decode a JSON string."""
+    return base64.standard_b64decode(_to_bytes(value))
+
+
 def _bytes_from_json(value, field):
     """Base64-decode value"""
     if _not_null(value, field):
-        return base64.standard_b64decode(_to_bytes(value))
+        return _bytes_from_string(value)
+
+
+def _timestamp_from_string(value):
+    """Parse a JSON row timestamp, in floating point seconds."""
+    # value will be a float in seconds, to microsecond precision, in UTC.
+    return _datetime_from_microseconds(1e6 * float(value))
 
 
 def _timestamp_from_json(value, field):
     """Coerce 'value' to a datetime, if set or not nullable."""
     if _not_null(value, field):
-        # value will be a float in seconds, to microsecond precision, in UTC.
-        return _datetime_from_microseconds(1e6 * float(value))
+        return _timestamp_from_string(value)
 
 
 def _timestamp_query_param_from_json(value, field):
@@ -125,16 +140,21 @@ def _datetime_from_json(value, field):
         :data:`None`).
     """
     if _not_null(value, field):
-        if "." in value:
-            # YYYY-MM-DDTHH:MM:SS.ffffff
-            return datetime.datetime.strptime(value, _RFC3339_MICROS_NO_ZULU)
-        else:
-            # YYYY-MM-DDTHH:MM:SS
-            return datetime.datetime.strptime(value, _RFC3339_NO_FRACTION)
+        return _datetime_from_string(value)
     else:
         return None
 
 
+def _datetime_from_string(value):
+    """Parse a JSON DATETIME string."""
+    if "." in value:
+        # YYYY-MM-DDTHH:MM:SS.ffffff
+        return datetime.datetime.strptime(value, _RFC3339_MICROS_NO_ZULU)
+    else:
+        # YYYY-MM-DDTHH:MM:SS
+        return datetime.datetime.strptime(value, _RFC3339_NO_FRACTION)
+
+
 def _date_from_json(value, field):
     """Coerce 'value' to a datetime date, if set or not nullable"""
     if _not_null(value, field):
@@ -142,16 +162,21 @@ def _date_from_json(value, field):
         return _date_from_iso8601_date(value)
 
 
+def _time_from_string(value):
+    """Parse a JSON TIME string."""
+    if len(value) == 8:  # HH:MM:SS
+        fmt = _TIMEONLY_WO_MICROS
+    elif len(value) == 15:  # HH:MM:SS.micros
+        fmt = _TIMEONLY_W_MICROS
+    else:
+        raise ValueError("Unknown time format: {}".format(value))
+    return datetime.datetime.strptime(value, fmt).time()
+
+
 def _time_from_json(value, field):
     """Coerce 'value' to a datetime date, if set or not nullable"""
     if _not_null(value, field):
-        if len(value) == 8:  # HH:MM:SS
-            fmt = _TIMEONLY_WO_MICROS
-        elif len(value) == 15:  # HH:MM:SS.micros
-            fmt = _TIMEONLY_W_MICROS
-        else:
-            raise ValueError("Unknown time format: {}".format(value))
-        return datetime.datetime.strptime(value, fmt).time()
+        return _time_from_string(value)
 
 
 def _record_from_json(value, field):
@@ -190,12 +215,116 @@ _CELLDATA_FROM_JSON = {
 _QUERY_PARAMS_FROM_JSON = dict(_CELLDATA_FROM_JSON)
 _QUERY_PARAMS_FROM_JSON["TIMESTAMP"] = _timestamp_query_param_from_json
 
+# Parsers for non-null JSON cell values, used by compiled row converters.
+# STRING values need no parsing, so they map to None.
+_CELLDATA_PARSERS = {
+    "INTEGER": int,
+    "INT64": int,
+    "FLOAT": float,
+    "FLOAT64": float,
+    "NUMERIC": decimal.Decimal,
+    "BOOLEAN": _bool_from_string,
+    "BOOL": _bool_from_string,
+    "STRING": None,
+    "GEOGRAPHY": None,
+    "BYTES": _bytes_from_string,
+    "TIMESTAMP": _timestamp_from_string,
+    "DATETIME": _datetime_from_string,
+    "DATE": _date_from_iso8601_date,
+    "TIME": _time_from_string,
+}
+
 
 def _field_to_index_mapping(schema):
     """Create a mapping from schema field name to index of field."""
     return {f.name: i for i, f in enumerate(schema)}
 
 
+def _record_parser(field):
+    """Compile a parser for the JSON value of a RECORD cell.
+
+    Args:
+        field (google.cloud.bigquery.schema.SchemaField):
+            A field of type RECORD.
+
+    Returns:
+        Callable[[dict], dict]: Parses a record into a mapping of subfield
+        names to native values.
+    """
+    subfields = [
+        (subfield.name, _cell_converter(subfield)) for subfield in field.fields
+    ]
+
+    def parse(value):
+        record = {}
+        for (name, convert), cell in zip(subfields, value["f"]):
+            if convert is None:
+                record[name] = cell["v"]
+            else:
+                record[name] = convert(cell["v"])
+        return record
+
+    return parse
+
+
+def _cell_converter(field):
+    """Compile a converter for the JSON value of cells of a field.
+
+    The type lookup and mode checks are done once, rather than for every
+    cell.
+
+    Args:
+        field (google.cloud.bigquery.schema.SchemaField):
+            The field to compile a converter for.
+
+    Returns:
+        Optional[Callable[[object], object]]:
+            Converts a JSON value to a native value, or :data:`None` if the
+            JSON value can be used as-is (such as for STRING fields).
+    """
+    if field.field_type == "RECORD":
+        parse = _record_parser(field)
+    else:
+        parse = _CELLDATA_PARSERS[field.field_type]
+
+    if field.mode == "REPEATED":
+        if parse is None:
+            return lambda value: [item["v"] for item in value]
+        return lambda value: [parse(item["v"]) for item in value]
+
+    if parse is None or field.mode != "NULLABLE":
+        return parse
+
+    return lambda value: None if value is None else parse(value)
+
+
+def _row_converter(schema):
+    """Compile a converter from JSON rows to tuples of native values.
+
+    Compile the converter once per schema and reuse it for every row, rather
+    than calling :func:`_row_tuple_from_json`.
+
+    Args:
+        schema (Sequence[google.cloud.bigquery.schema.SchemaField]):
+            The schema of the rows.
+
+    Returns:
+        Callable[[dict], tuple]:
+            Converts a JSON response row to a tuple of native values.
+    """
+    converters = [_cell_converter(field) for field in schema]
+
+    def convert(row):
+        return tuple(
+            [
+                cell["v"] if converter is None else converter(cell["v"])
+                for converter, cell in zip(converters, row["f"])
+            ]
+        )
+
+    return convert
+
+
 def _row_tuple_from_json(row, schema):
     """Convert JSON row data to row with appropriate types.
 
@@ -224,10 +353,13 @@ def _row_tuple_from_json(row, schema):
 
 def _rows_from_json(values, schema):
     """Convert JSON row data to rows with appropriate types."""
-    from google.cloud.bigquery import Row
+    from google.cloud.bigquery.schema import _compile_schema
 
-    field_to_index = _field_to_index_mapping(schema)
-    return [Row(_row_tuple_from_json(r, schema), field_to_index) for r in values]
+    compiled_schema = _compile_schema(schema)
+    row_class = compiled_schema.row_class
+    row_converter = compiled_schema.row_converter
+    field_to_index = compiled_schema.field_to_index
+    return [row_class(row_converter(r), field_to_index) for r in values]
 
 
 def _int_to_json(value):
@@ -324,6 +456,28 @@ _SCALAR_VALUE_TO_JSON_ROW = {
 }
 
 
+def _row_tuple_to_json(row, schema):
+    """Convert a row tuple to the JSON representation used by ``insertAll``.
+
+    Args:
+        row (Sequence[object]): The values of the row, in schema order.
+        schema (Sequence[google.cloud.bigquery.schema.SchemaField]):
+            The schema of the row.
+
+    Returns:
+        Dict[str, object]: A mapping of field names to JSON-compatible values.
+    """
+    json_row = {}
+
+    for field, value in zip(schema, row):
+        converter = _SCALAR_VALUE_TO_JSON_ROW.get(field.field_type)
+        if converter is not None:  # STRING doesn't need converting
+            value = converter(value)
+        json_row[field.name] = value
+
+    return json_row
+
+
 # Converters used for scalar values marshalled as query parameters.
 _SCALAR_VALUE_TO_JSON_PARAM = _SCALAR_VALUE_TO_JSON_ROW.copy()
 _SCALAR_VALUE_TO_JSON_PARAM["TIMESTAMP"] = _timestamp_to_json_parameter
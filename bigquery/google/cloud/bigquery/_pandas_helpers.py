@@ -0,0 +1,253 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Shared helper functions for connecting BigQuery and pandas."""
+
+try:
+    import numpy
+except ImportError:  # pragma: NO COVER
+    numpy = None
+
+try:
+    import pandas
+except ImportError:  # pragma: NO COVER
+    pandas = None
+
+try:
+    import pyarrow
+    import pyarrow.parquet
+except ImportError:  # pragma: NO COVER
+    pyarrow = None
+
+import six
+
+from google.cloud.bigquery import _helpers
+
+
+def _float_column_from_json(values, field):
+    """Decode a column of FLOAT64 (or nullable INT64) cells."""
+    # NumPy parses the JSON strings (including "NaN" and "Infinity")
+    # directly and maps missing values (None) to NaN.
+    return numpy.array(values, dtype="float64")
+
+
+def _int_column_from_json(values, field):
+    """Decode a column of INT64 cells.
+
+    Columns without any missing values become ``int64`` arrays. Otherwise,
+    the column is decoded as ``float64``, with ``NaN`` for missing values,
+    matching how pandas represents nullable integer data.
+    """
+    if None in values:
+        return _float_column_from_json(values, field)
+    return numpy.array(values, dtype="int64")
+
+
+def _bool_column_from_json(values, field):
+    """Decode a column of BOOL cells.
+
+    Columns with missing values are kept as an ``object`` array so that
+    :data:`None` is preserved.
+    """
+    if None in values:
+        return _object_column_from_json(values, field)
+    return numpy.array([value.lower() in ("t", "true", "1") for value in values])
+
+
+def _timestamp_column_from_json(values, field):
+    """Decode a column of TIMESTAMP cells into microseconds since the epoch.
+
+    The microseconds are converted to ``datetime64`` values once all pages
+    have been concatenated, see :func:`_timestamp_column_finalize`.
+    """
+    # Values are floating point seconds, to microsecond precision, in UTC.
+    return numpy.round(_float_column_from_json(values, field) * 1e6)
+
+
+def _timestamp_column_finalize(array):
+    """Convert microseconds since the epoch to a ``datetime64`` array."""
+    array = array.astype("float64")
+    not_null = ~numpy.isnan(array)
+    datetimes = numpy.full(len(array), numpy.datetime64("NaT"), dtype="datetime64[us]")
+    datetimes[not_null] = array[not_null].astype("int64")
+    return pandas.to_datetime(datetimes, utc=True)
+
+
+def _object_column_from_json(values, field):
+    """Decode a column of cells into an ``object`` array of native values.
+
+    This is the fallback for types without a natural NumPy representation,
+    such as DATE, NUMERIC, or RECORD columns.
+    """
+    converter = _helpers._cell_converter(field)
+    array = numpy.empty(len(values), dtype="object")
+    if converter is None:
+        array[:] = values
+    else:
+        array[:] = [converter(value) for value in values]
+    return array
+
+
+_COLUMN_FROM_JSON = {
+    "INTEGER": _int_column_from_json,
+    "INT64": _int_column_from_json,
+    "FLOAT": _float_column_from_json,
+    "FLOAT64": _float_column_from_json,
+    "BOOLEAN": _bool_column_from_json,
+    "BOOL": _bool_column_from_json,
+    "TIMESTAMP": _timestamp_column_from_json,
+}
+
+_COLUMN_FINALIZE = {"TIMESTAMP": _timestamp_column_finalize}
+
+
+def _column_from_json(values, field):
+    """Decode a list of JSON cell values into a NumPy array.
+
+    Args:
+        values (List[object]): The ``v`` entries of the cells in a column.
+        field (google.cloud.bigquery.schema.SchemaField):
+            The schema field describing the column.
+
+    Returns:
+        numpy.ndarray: The decoded column.
+    """
+    if field.mode == "REPEATED":
+        return _object_column_from_json(values, field)
+    converter = _COLUMN_FROM_JSON.get(field.field_type, _object_column_from_json)
+    return converter(values, field)
+
+
+def rows_to_columns(rows, schema):
+    """Decode a page of ``tabledata.list`` rows into per-column arrays.
+
+    Args:
+        rows (Sequence[Dict[str, object]]):
+            JSON rows, as found in the ``rows`` key of the API response.
+        schema (Sequence[google.cloud.bigquery.schema.SchemaField]):
+            The schema of the rows.
+
+    Returns:
+        List[numpy.ndarray]: One decoded array per field in ``schema``.
+    """
+    columns = []
+    for index, field in enumerate(schema):
+        values = [row["f"][index]["v"] for row in rows]
+        columns.append(_column_from_json(values, field))
+    return columns
+
+
+def columns_to_dataframe(column_chunks, schema, dtypes=None):
+    """Concatenate decoded column chunks into a single DataFrame.
+
+    Args:
+        column_chunks (Sequence[List[numpy.ndarray]]):
+            A list of decoded pages, as returned by :func:`rows_to_columns`.
+        schema (Sequence[google.cloud.bigquery.schema.SchemaField]):
+            The schema of the rows.
+        dtypes (Map[str, Union[str, pandas.Series.dtype]]):
+            (Optional) A dictionary of column names to pandas ``dtype``\\ s.
+            The provided ``dtype`` is used when constructing the series for
+            the column specified. Otherwise, the ``dtype`` is chosen from the
+            BigQuery column type.
+
+    Returns:
+        pandas.DataFrame: A data frame with one column per field in
+        ``schema``.
+    """
+    if dtypes is None:
+        dtypes = {}
+
+    columns = {}
+    column_names = []
+    for index, field in enumerate(schema):
+        chunks = [page_columns[index] for page_columns in column_chunks]
+        if chunks:
+            array = numpy.concatenate(chunks)
+        else:
+            array = numpy.empty(0, dtype="object")
+
+        finalize = _COLUMN_FINALIZE.get(field.field_type)
+        if finalize is not None and field.mode != "REPEATED":
+            array = finalize(array)
+
+        columns[field.name] = pandas.Series(array, dtype=dtypes.get(field.name))
+        column_names.append(field.name)
+
+    return pandas.DataFrame(columns, columns=column_names)
+
+
+def _native_value(value):
+    """Convert a value from a DataFrame into a native Python value.
+
+    Missing values (``NaN`` and ``NaT``) become :data:`None` and NumPy
+    scalars are converted to the equivalent Python scalar.
+    """
+    if value is None or value is pandas.NaT:
+        return None
+    if isinstance(value, float) and value != value:  # NaN
+        return None
+    if isinstance(value, numpy.generic):
+        return value.item()
+    return value
+
+
+def dataframe_to_rows(dataframe):
+    """Iterate over the rows of a DataFrame as mappings of native values.
+
+    Args:
+        dataframe (pandas.DataFrame):
+            The data frame. Column names are used as the keys of the rows.
+
+    Returns:
+        Iterable[Dict[str, object]]:
+            One mapping from column name to value per row, in the form
+            accepted by
+            :func:`~google.cloud.bigquery.table._row_from_mapping`.
+    """
+    column_names = [six.text_type(name) for name in dataframe.columns]
+    for values in dataframe.itertuples(index=False, name=None):
+        yield {name: _native_value(value) for name, value in zip(column_names, values)}
+
+
+def dataframe_to_parquet(dataframe, sink, row_group_size):
+    """Write a DataFrame to a Parquet file, one row group at a time.
+
+    Only one row group is converted to Arrow at a time, so the whole data
+    frame is never copied in memory.
+
+    Args:
+        dataframe (pandas.DataFrame): The data frame to write.
+        sink (file): A file-like object opened in binary mode for writing.
+            It does not need to be seekable, so it can be a pipe.
+        row_group_size (int): The number of rows per row group.
+
+    Raises:
+        ImportError: If :mod:`pyarrow` is not installed.
+    """
+    if pyarrow is None:
+        raise ImportError("pyarrow is required to write Parquet files")
+
+    arrow_schema = pyarrow.Schema.from_pandas(dataframe, preserve_index=False)
+    writer = pyarrow.parquet.ParquetWriter(sink, arrow_schema)
+    try:
+        for start in six.moves.range(0, len(dataframe), row_group_size):
+            row_group = dataframe.iloc[start : start + row_group_size]
+            writer.write_table(
+                pyarrow.Table.from_pandas(
+                    row_group, schema=arrow_schema, preserve_index=False
+                )
+            )
+    finally:
+        writer.close()
@@ -0,0 +1,801 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Asyncio client for the BigQuery API.
+
+This module requires Python 3.5 or later, and the ``aiohttp`` package to
+send requests, which is installed with the ``aiohttp`` extra:
+
+.. code-block:: console
+
+   $ pip install google-cloud-bigquery[aiohttp]
+
+The :class:`AsyncClient` runs queries, pages through rows and streams
+inserts without blocking the event loop. Requests are sent on a single
+pooled :class:`aiohttp.ClientSession`, so many queries can be in flight at
+once from one thread. It returns the same resource classes as the
+synchronous :class:`~google.cloud.bigquery.client.Client`.
+"""
+
+import asyncio
+import collections
+import concurrent.futures
+import json
+import time
+
+try:
+    import aiohttp
+except ImportError:  # pragma: NO COVER
+    aiohttp = None
+import google.api_core.future.polling
+from google.api_core import exceptions
+from google.api_core import retry as api_retry
+import google.auth.transport.requests
+
+from google.cloud._http import CLIENT_INFO_HEADER
+from google.cloud.bigquery import job
+from google.cloud.bigquery._http import _CLIENT_INFO
+from google.cloud.bigquery.client import Client
+from google.cloud.bigquery.client import _insert_all_data
+from google.cloud.bigquery.client import _insert_errors
+from google.cloud.bigquery.client import _list_rows_schema
+from google.cloud.bigquery.client import _make_job_id
+from google.cloud.bigquery.client import _rows_to_json
+from google.cloud.bigquery.query import _QueryResults
+from google.cloud.bigquery.retry import DEFAULT_RETRY
+from google.cloud.bigquery.schema import _compile_schema
+from google.cloud.bigquery.table import Table
+from google.cloud.bigquery.table import TableReference
+
+
+_DEFAULT_CONNECTION_LIMIT = 100
+"""Default maximum number of simultaneous connections of the session."""
+
+_NO_AIOHTTP_ERROR = (
+    "The aiohttp library is not installed, please install aiohttp to use "
+    "the asyncio client, or pass in an aiohttp.ClientSession."
+)
+
+
+class AsyncConnection(object):
+    """A connection to the BigQuery JSON REST API over :mod:`aiohttp`.
+
+    Args:
+        client (google.cloud.bigquery.client.Client):
+            The client which holds the credentials and the URL of the API.
+        session (aiohttp.ClientSession):
+            (Optional) The session to send requests on. If not passed, a
+            session is created on first use and closed by :meth:`close`.
+        connection_limit (int):
+            (Optional) The maximum number of simultaneous connections of
+            the session created when ``session`` is not passed. Defaults
+            to 100.
+    """
+
+    def __init__(
+        self, client, session=None, connection_limit=_DEFAULT_CONNECTION_LIMIT
+    ):
+        self._client = client
+        self._session = session
+        self._owns_session = session is None
+        self._connection_limit = connection_limit
+        self._refresh_lock = None
+
+    @property
+    def session(self):
+        """aiohttp.ClientSession: The session used to send requests."""
+        if self._session is None:
+            if aiohttp is None:
+                raise ValueError(_NO_AIOHTTP_ERROR)
+            connector = aiohttp.TCPConnector(limit=self._connection_limit)
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    async def close(self):
+        """Close the session, if it was created by this connection."""
+        if self._owns_session and self._session is not None:
+            await self._session.close()
+            self._session = None
+
+    async def _refresh_credentials(self):
+        """Refresh the credentials of the client if they are not valid.
+
+        The token is refreshed on a thread of the default executor, since
+        :mod:`google.auth` refreshes it with a blocking request. Concurrent
+        requests wait for a single refresh.
+        """
+        credentials = self._client._credentials
+        if credentials.valid:
+            return
+
+        if self._refresh_lock is None:
+            self._refresh_lock = asyncio.Lock()
+
+        async with self._refresh_lock:
+            if not credentials.valid:
+                request = google.auth.transport.requests.Request()
+                loop = asyncio.get_event_loop()
+                await loop.run_in_executor(None, credentials.refresh, request)
+
+    async def api_request(self, method, path, query_params=None, data=None):
+        """Make a request to the API and parse the JSON response.
+
+        Args:
+            method (str): The HTTP method name (ie, ``GET``, ``POST``, etc).
+            path (str):
+                The path to the resource (ie, ``'/projects/my-project'``).
+            query_params (Mapping[str, object]):
+                (Optional) The query string parameters of the request.
+            data (Mapping[str, object]):
+                (Optional) The body of the request, sent as JSON.
+
+        Returns:
+            Mapping[str, object]: The parsed JSON response.
+
+        Raises:
+            google.api_core.exceptions.GoogleAPICallError:
+                If the response status is not a ``2xx`` code.
+        """
+        url = self._client._connection.build_api_url(
+            path=path, query_params=query_params
+        )
+        headers = {
+            CLIENT_INFO_HEADER: _CLIENT_INFO,
+            "User-Agent": self._client._connection.USER_AGENT,
+        }
+        body = None
+        if data:
+            body = json.dumps(data)
+            headers["Content-Type"] = "application/json"
+
+        await self._refresh_credentials()
+        self._client._credentials.apply(headers)
+
+        async with self.session.request(
+            method, url, data=body, headers=headers
+        ) as response:
+            content = await response.text()
+            status = response.status
+
+        if not 200 <= status < 300:
+            raise _error_from_response(method, url, status, content, response)
+
+        if not content:
+            return {}
+        return json.loads(content)
+
+
+def _error_from_response(method, url, status, content, response):
+    """Create an exception from the response to a failed request.
+
+    Mirrors :func:`google.api_core.exceptions.from_http_response`.
+
+    Returns:
+        google.api_core.exceptions.GoogleAPICallError:
+            The exception for the status of the response, with the message
+            and errors from its body.
+    """
+    try:
+        payload = json.loads(content)
+    except ValueError:
+        payload = {"error": {"message": content or "unknown error"}}
+
+    error_message = payload.get("error", {}).get("message", "unknown error")
+    errors = payload.get("error", {}).get("errors", ())
+
+    message = "{method} {url}: {error}".format(
+        method=method, url=url, error=error_message
+    )
+    return exceptions.from_http_status(
+        status, message, errors=errors, response=response
+    )
+
+
+async def _call_with_retry(retry, func, *args, **kwargs):
+    """Await a coroutine function, retrying it as a ``Retry`` would.
+
+    Args:
+        retry (google.api_core.retry.Retry):
+            How to retry the call. Its predicate, delays and deadline are
+            used, sleeping with :func:`asyncio.sleep`.
+        func (Callable[..., Awaitable]): The coroutine function to call.
+
+    Returns:
+        object: The result of ``func``.
+
+    Raises:
+        google.api_core.exceptions.RetryError:
+            If the deadline of ``retry`` is exceeded.
+    """
+    if not retry:
+        return await func(*args, **kwargs)
+
+    deadline = None
+    if retry._deadline is not None:
+        deadline = time.time() + retry._deadline
+
+    sleep_generator = api_retry.exponential_sleep_generator(
+        retry._initial, retry._maximum, multiplier=retry._multiplier
+    )
+    for sleep in sleep_generator:
+        try:
+            return await func(*args, **kwargs)
+        except Exception as exc:
+            if not retry._predicate(exc):
+                raise
+            if deadline is not None and time.time() + sleep > deadline:
+                raise exceptions.RetryError(
+                    "Deadline of {:.1f}s exceeded while calling {}".format(
+                        retry._deadline, func
+                    ),
+                    exc,
+                ) from exc
+        await asyncio.sleep(sleep)
+
+    raise ValueError("Sleep generator stopped yielding sleep values.")
+
+
+class AsyncClient(object):
+    """Asyncio client to run queries and read and insert rows.
+
+    Args:
+        project (str):
+            (Optional) Project ID for the project which the client acts on
+            behalf of. Will be passed when creating a dataset / job. If not
+            passed, falls back to the default inferred from the environment.
+        credentials (google.auth.credentials.Credentials):
+            (Optional) The OAuth2 Credentials to use for this client. If not
+            passed, falls back to the default inferred from the environment.
+        location (str):
+            (Optional) Default location for jobs / datasets / tables.
+        default_query_job_config (google.cloud.bigquery.job.QueryJobConfig):
+            (Optional) Default ``QueryJobConfig``. Will be merged into job
+            configs passed into the ``query`` method.
+        client (google.cloud.bigquery.client.Client):
+            (Optional) A synchronous client to take the project,
+            credentials, location and default query job config from,
+            instead of the other arguments.
+        session (aiohttp.ClientSession):
+            (Optional) The session to send requests on. If not passed, a
+            session is created on first use, and closed by :meth:`close`.
+        connection_limit (int):
+            (Optional) The maximum number of simultaneous connections of
+            the session created when ``session`` is not passed. Defaults
+            to 100.
+    """
+
+    def __init__(
+        self,
+        project=None,
+        credentials=None,
+        location=None,
+        default_query_job_config=None,
+        client=None,
+        session=None,
+        connection_limit=_DEFAULT_CONNECTION_LIMIT,
+    ):
+        if client is None:
+            client = Client(
+                project=project,
+                credentials=credentials,
+                location=location,
+                default_query_job_config=default_query_job_config,
+            )
+        self._client = client
+        self._connection = AsyncConnection(
+            client, session=session, connection_limit=connection_limit
+        )
+
+    @property
+    def project(self):
+        """str: Project ID of the client."""
+        return self._client.project
+
+    @property
+    def location(self):
+        """str: Default location for jobs / datasets / tables."""
+        return self._client.location
+
+    async def close(self):
+        """Close the HTTP session, if it was created by this client."""
+        await self._connection.close()
+
+    async def __aenter__(self):
+        return self
+
+    async def __aexit__(self, exc_type, exc_value, traceback):
+        await self.close()
+
+    async def _call_api(self, retry, **kwargs):
+        return await _call_with_retry(retry, self._connection.api_request, **kwargs)
+
+    async def get_table(self, table_ref, retry=DEFAULT_RETRY):
+        """Fetch the table referenced by ``table_ref``.
+
+        Args:
+            table_ref (Union[ \
+                :class:`~google.cloud.bigquery.table.TableReference`, \
+                str, \
+            ]):
+                A reference to the table to fetch from the BigQuery API.
+            retry (:class:`google.api_core.retry.Retry`):
+                (Optional) How to retry the RPC.
+
+        Returns:
+            google.cloud.bigquery.table.Table:
+                A ``Table`` instance.
+        """
+        if isinstance(table_ref, str):
+            table_ref = TableReference.from_string(
+                table_ref, default_project=self.project
+            )
+
+        api_response = await self._call_api(retry, method="GET", path=table_ref.path)
+        return Table.from_api_repr(api_response)
+
+    async def query(
+        self,
+        query,
+        job_config=None,
+        job_id=None,
+        job_id_prefix=None,
+        location=None,
+        project=None,
+        retry=DEFAULT_RETRY,
+    ):
+        """Run a SQL query.
+
+        See :meth:`google.cloud.bigquery.client.Client.query` for the
+        arguments. The client's ``query_cache`` is not consulted.
+
+        Returns:
+            google.cloud.bigquery.aio.AsyncQueryJob:
+                The started query job.
+        """
+        job_id = _make_job_id(job_id, job_id_prefix)
+
+        if project is None:
+            project = self.project
+
+        if location is None:
+            location = self.location
+
+        job_config = self._client._query_job_config(job_config)
+
+        job_ref = job._JobReference(job_id, project=project, location=location)
+        query_job = job.QueryJob(
+            job_ref, query, client=self._client, job_config=job_config
+        )
+
+        # jobs.insert is idempotent because we ensure that every new
+        # job has an ID.
+        api_response = await self._call_api(
+            retry,
+            method="POST",
+            path="/projects/%s/jobs" % (project,),
+            data=query_job.to_api_repr(),
+        )
+        query_job._set_properties(api_response)
+        return AsyncQueryJob(query_job, self)
+
+    async def _get_query_results(
+        self, job_id, retry, project=None, timeout_ms=None, location=None
+    ):
+        """Get the query results object for a query job.
+
+        See :meth:`google.cloud.bigquery.client.Client._get_query_results`.
+
+        Returns:
+            google.cloud.bigquery.query._QueryResults:
+                A new ``_QueryResults`` instance.
+        """
+        extra_params = {"maxResults": 0}
+
+        if project is None:
+            project = self.project
+
+        if timeout_ms is not None:
+            extra_params["timeoutMs"] = timeout_ms
+
+        if location is None:
+            location = self.location
+
+        if location is not None:
+            extra_params["location"] = location
+
+        path = "/projects/{}/queries/{}".format(project, job_id)
+        resource = await self._call_api(
+            retry, method="GET", path=path, query_params=extra_params
+        )
+        return _QueryResults.from_api_repr(resource)
+
+    def list_rows(
+        self,
+        table,
+        selected_fields=None,
+        max_results=None,
+        page_token=None,
+        start_index=None,
+        page_size=None,
+        retry=DEFAULT_RETRY,
+    ):
+        """List the rows of the table.
+
+        See :meth:`google.cloud.bigquery.client.Client.list_rows` for the
+        arguments. No request is made until the rows are iterated.
+
+        Returns:
+            google.cloud.bigquery.aio.AsyncRowIterator:
+                Asynchronous iterator of row data
+                :class:`~google.cloud.bigquery.table.Row`-s.
+        """
+        if isinstance(table, str):
+            table = TableReference.from_string(table, default_project=self.project)
+
+        schema = _list_rows_schema(table, selected_fields)
+
+        params = {}
+        if selected_fields is not None:
+            params["selectedFields"] = ",".join(field.name for field in selected_fields)
+        if start_index is not None:
+            params["startIndex"] = start_index
+
+        return AsyncRowIterator(
+            self,
+            "%s/data" % (table.path,),
+            schema,
+            page_token=page_token,
+            max_results=max_results,
+            page_size=page_size,
+            extra_params=params,
+            retry=retry,
+        )
+
+    async def insert_rows(self, table, rows, selected_fields=None, **kwargs):
+        """Insert rows into a table via the streaming API.
+
+        See :meth:`google.cloud.bigquery.client.Client.insert_rows` for
+        the arguments.
+
+        Returns:
+            Sequence[Mappings]:
+                One mapping per row with insert errors: the "index" key
+                identifies the row, and the "errors" key contains a list of
+                the mappings describing one or more problems with the row.
+        """
+        if isinstance(table, str):
+            table = TableReference.from_string(table, default_project=self.project)
+
+        json_rows = _rows_to_json(table, rows, selected_fields)
+        return await self.insert_rows_json(table, json_rows, **kwargs)
+
+    async def insert_rows_json(
+        self,
+        table,
+        json_rows,
+        row_ids=None,
+        skip_invalid_rows=None,
+        ignore_unknown_values=None,
+        template_suffix=None,
+        retry=DEFAULT_RETRY,
+    ):
+        """Insert rows into a table without applying local type conversions.
+
+        See :meth:`google.cloud.bigquery.client.Client.insert_rows_json`
+        for the arguments.
+
+        Returns:
+            Sequence[Mappings]:
+                One mapping per row with insert errors: the "index" key
+                identifies the row, and the "errors" key contains a list of
+                the mappings describing one or more problems with the row.
+        """
+        if isinstance(table, str):
+            table = TableReference.from_string(table, default_project=self.project)
+
+        data = _insert_all_data(
+            json_rows, row_ids, skip_invalid_rows, ignore_unknown_values, template_suffix
+        )
+
+        # We can always retry, because every row has an insert ID.
+        response = await self._call_api(
+            retry, method="POST", path="%s/insertAll" % table.path, data=data
+        )
+        return _insert_errors(response)
+
+
+class AsyncQueryJob(object):
+    """A query job started by an :class:`AsyncClient`.
+
+    Args:
+        query_job (google.cloud.bigquery.job.QueryJob):
+            The started job. Its properties are updated by :meth:`reload`,
+            :meth:`done` and :meth:`result`.
+        client (google.cloud.bigquery.aio.AsyncClient):
+            The client to make API requests with.
+    """
+
+    def __init__(self, query_job, client):
+        self._job = query_job
+        self._client = client
+
+    @property
+    def job(self):
+        """google.cloud.bigquery.job.QueryJob: The wrapped query job."""
+        return self._job
+
+    @property
+    def job_id(self):
+        """str: ID of the job."""
+        return self._job.job_id
+
+    @property
+    def location(self):
+        """str: Location where the job runs."""
+        return self._job.location
+
+    @property
+    def state(self):
+        """str: Status of the job, or :data:`None` if not yet started."""
+        return self._job.state
+
+    async def reload(self, retry=DEFAULT_RETRY):
+        """Refresh the job properties.
+
+        Args:
+            retry (:class:`google.api_core.retry.Retry`):
+                (Optional) How to retry the RPC.
+        """
+        extra_params = {}
+        if self.location:
+            extra_params["location"] = self.location
+
+        api_response = await self._client._call_api(
+            retry, method="GET", path=self._job.path, query_params=extra_params
+        )
+        self._job._set_properties(api_response)
+
+    async def done(self, retry=DEFAULT_RETRY, timeout_ms=None):
+        """Check whether the query is complete.
+
+        Args:
+            retry (:class:`google.api_core.retry.Retry`):
+                (Optional) How to retry the RPC.
+            timeout_ms (int):
+                (Optional) How long, in milliseconds, the server may wait
+                for the query to complete before answering.
+
+        Returns:
+            bool: True if the job is complete, False otherwise.
+        """
+        if self.state != job._DONE_STATE:
+            self._job._query_results = await self._client._get_query_results(
+                self.job_id,
+                retry,
+                project=self._job.project,
+                timeout_ms=timeout_ms,
+                location=self.location,
+            )
+
+            # Only reload the job once we know the query is complete.
+            # This will ensure that fields such as the destination table are
+            # correctly populated.
+            if self._job._query_results.complete:
+                await self.reload(retry=retry)
+
+        return self.state == job._DONE_STATE
+
+    async def _wait(self, timeout):
+        """Poll the query until it completes.
+
+        Polls like :meth:`google.cloud.bigquery.job.QueryJob.result`,
+        sleeping with :func:`asyncio.sleep` between polls.
+
+        Raises:
+            concurrent.futures.TimeoutError:
+                If the query did not complete in the given timeout.
+        """
+        started = time.time()
+        while True:
+            poll_started = time.time()
+            timeout_ms = None
+            if timeout is not None:
+                remaining = started + timeout - poll_started
+                remaining -= job._TIMEOUT_BUFFER_SECS
+                timeout_ms = int(max(min(remaining, 10), 0) * 1000)
+            try:
+                if await self.done(timeout_ms=timeout_ms):
+                    return
+            except Exception as exc:
+                if not google.api_core.future.polling.RETRY_PREDICATE(exc):
+                    raise
+
+            now = time.time()
+            if timeout is not None and now - started >= timeout:
+                raise concurrent.futures.TimeoutError(job._TIMEOUT_MESSAGE)
+            if now - poll_started >= job._LONG_POLL_SECS:
+                continue
+
+            delay = job._poll_interval(self._job, now - started)
+            if timeout is not None:
+                delay = min(delay, started + timeout - now)
+            await asyncio.sleep(delay)
+
+    async def result(self, timeout=None, retry=DEFAULT_RETRY, page_size=None):
+        """Wait for the query to complete and get the result.
+
+        Args:
+            timeout (float):
+                (Optional) How long, in seconds, to wait for the query to
+                complete before raising a
+                :class:`concurrent.futures.TimeoutError`.
+            retry (:class:`google.api_core.retry.Retry`):
+                (Optional) How to retry the calls that retrieve rows.
+            page_size (int):
+                (Optional) The maximum number of rows in each page of
+                results.
+
+        Returns:
+            google.cloud.bigquery.aio.AsyncRowIterator:
+                Asynchronous iterator of row data
+                :class:`~google.cloud.bigquery.table.Row`-s.
+
+        Raises:
+            google.cloud.exceptions.GoogleCloudError:
+                If the job failed.
+            concurrent.futures.TimeoutError:
+                If the job did not complete in the given timeout.
+        """
+        await self._wait(timeout)
+        if self._job.error_result is not None:
+            raise job._error_result_to_exception(self._job.error_result)
+
+        query_results = self._job._query_results
+        if not query_results:
+            query_results = await self._client._get_query_results(
+                self.job_id, retry, project=self._job.project, location=self.location
+            )
+            self._job._query_results = query_results
+
+        # If the query job is complete but there are no query results, this was
+        # special job, such as a DDL query. Return an empty result set to
+        # indicate success and avoid calling tabledata.list on a table which
+        # can't be read (such as a view table).
+        if query_results.total_rows is None:
+            return AsyncRowIterator(self._client, None, ())
+
+        dest_table = Table(self._job.destination, schema=query_results.schema)
+        return self._client.list_rows(dest_table, page_size=page_size, retry=retry)
+
+
+class AsyncRowIterator(object):
+    """Asynchronous iterator over the rows of a table.
+
+    Use ``async for`` to iterate over the rows, or :meth:`fetch_page` to
+    read them a page at a time.
+
+    Args:
+        client (google.cloud.bigquery.aio.AsyncClient):
+            The client to make API requests with.
+        path (str):
+            The path of the ``tabledata.list`` method of the table, or
+            :data:`None` for an empty result set.
+        schema (Sequence[google.cloud.bigquery.schema.SchemaField]):
+            The schema of the rows.
+        page_token (str):
+            (Optional) A token identifying a page in a result set to start
+            fetching results from.
+        max_results (int): (Optional) The maximum number of rows to fetch.
+        page_size (int): (Optional) The number of rows to fetch per page.
+        extra_params (Dict[str, object]):
+            (Optional) Extra query string parameters for the API call.
+        retry (:class:`google.api_core.retry.Retry`):
+            (Optional) How to retry the RPC.
+    """
+
+    def __init__(
+        self,
+        client,
+        path,
+        schema,
+        page_token=None,
+        max_results=None,
+        page_size=None,
+        extra_params=None,
+        retry=DEFAULT_RETRY,
+    ):
+        self._client = client
+        self.path = path
+        self._schema = schema
+        compiled_schema = _compile_schema(schema)
+        self._field_to_index = compiled_schema.field_to_index
+        self._row_converter = compiled_schema.row_converter
+        self._row_class = compiled_schema.row_class
+        self.next_page_token = page_token
+        self.max_results = max_results
+        self._page_size = page_size
+        self.extra_params = extra_params or {}
+        self._retry = retry
+        self._total_rows = None
+        self.page_number = 0
+        self.num_results = 0
+        self._buffer = collections.deque()
+
+    @property
+    def schema(self):
+        """List[google.cloud.bigquery.schema.SchemaField]: Table's schema."""
+        return list(self._schema)
+
+    @property
+    def total_rows(self):
+        """int: The total number of rows in the table."""
+        return self._total_rows
+
+    def _has_next_page(self):
+        """Determine whether there are more pages to fetch."""
+        if self.path is None:
+            return False
+        if self.max_results is not None and self.num_results >= self.max_results:
+            return False
+        return self.page_number == 0 or self.next_page_token is not None
+
+    async def fetch_page(self):
+        """Fetch the next page of rows.
+
+        Returns:
+            Optional[List[google.cloud.bigquery.table.Row]]:
+                The rows of the next page, or :data:`None` if there are no
+                pages left.
+        """
+        if not self._has_next_page():
+            return None
+
+        params = dict(self.extra_params)
+        if self.next_page_token is not None:
+            params["pageToken"] = self.next_page_token
+        page_size = self._page_size
+        if self.max_results is not None:
+            remaining = self.max_results - self.num_results
+            page_size = min(page_size or remaining, remaining)
+        if page_size is not None:
+            params["maxResults"] = page_size
+
+        response = await self._client._call_api(
+            self._retry, method="GET", path=self.path, query_params=params
+        )
+        self.page_number += 1
+        self.next_page_token = response.get("pageToken")
+
+        total_rows = response.get("totalRows")
+        if total_rows is not None:
+            total_rows = int(total_rows)
+        self._total_rows = total_rows
+
+        rows = [
+            self._row_class(self._row_converter(resource), self._field_to_index)
+            for resource in response.get("rows", ())
+        ]
+        self.num_results += len(rows)
+        return rows
+
+    def __aiter__(self):
+        return self
+
+    async def __anext__(self):
+        while not self._buffer:
+            rows = await self.fetch_page()
+            if rows is None:
+                raise StopAsyncIteration
+            self._buffer.extend(rows)
+        return self._buffer.popleft()
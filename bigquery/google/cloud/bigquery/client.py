@@ -21,9 +21,13 @@ try:
 except ImportError:  # Python 2.7
     import collections as collections_abc
 
+import concurrent.futures
+import copy
+import datetime
 import functools
 import gzip
 import os
+import threading
 import uuid
 
 import six
@@ -37,19 +41,25 @@ import google.cloud._helpers
 from google.cloud import exceptions
 from google.cloud.client import ClientWithProject
 
-from google.cloud.bigquery._helpers import _SCALAR_VALUE_TO_JSON_ROW
+from google.cloud.bigquery import _pandas_helpers
+from google.cloud.bigquery._helpers import _row_tuple_to_json
 from google.cloud.bigquery._helpers import _str_or_none
 from google.cloud.bigquery._http import Connection
 from google.cloud.bigquery.dataset import Dataset
 from google.cloud.bigquery.dataset import DatasetListItem
 from google.cloud.bigquery.dataset import DatasetReference
 from google.cloud.bigquery import job
+from google.cloud.bigquery import query_cache
 from google.cloud.bigquery.query import _QueryResults
 from google.cloud.bigquery.retry import DEFAULT_RETRY
+from google.cloud.bigquery.schema import SchemaField
+from google.cloud.bigquery.table import PartitionRowIterator
 from google.cloud.bigquery.table import Table
 from google.cloud.bigquery.table import TableListItem
 from google.cloud.bigquery.table import TableReference
 from google.cloud.bigquery.table import RowIterator
+from google.cloud.bigquery.table import _DEFAULT_MAX_PARTITION_WORKERS
+from google.cloud.bigquery.table import _PARTITIONS_WITH_OFFSETS
 from google.cloud.bigquery.table import _TABLE_HAS_NO_SCHEMA
 from google.cloud.bigquery.table import _row_from_mapping
 
@@ -118,6 +128,12 @@ class Client(ClientWithProject):
         default_query_job_config (google.cloud.bigquery.job.QueryJobConfig):
             (Optional) Default ``QueryJobConfig``.
             Will be merged into job configs passed into the ``query`` method.
+        query_cache (google.cloud.bigquery.query_cache.QueryCache):
+            (Optional) A client-side cache of query results, used by the
+            ``query`` method.
+        dry_run_cache (google.cloud.bigquery.query_cache.DryRunCache):
+            (Optional) A client-side cache of dry runs, used by the
+            ``query`` method for queries with ``dry_run`` set.
 
     Raises:
         google.auth.exceptions.DefaultCredentialsError:
@@ -138,6 +154,8 @@ class Client(ClientWithProject):
         _http=None,
         location=None,
         default_query_job_config=None,
+        query_cache=None,
+        dry_run_cache=None,
     ):
         super(Client, self).__init__(
             project=project, credentials=credentials, _http=_http
@@ -145,6 +163,8 @@ class Client(ClientWithProject):
         self._connection = Connection(self)
         self._location = location
         self._default_query_job_config = default_query_job_config
+        self.query_cache = query_cache
+        self.dry_run_cache = dry_run_cache
 
     @property
     def location(self):
@@ -1045,6 +1065,8 @@ class Client(ClientWithProject):
         location=None,
         project=None,
         job_config=None,
+        row_group_size=None,
+        parallel_jobs=None,
     ):
         """Upload the contents of a table from a pandas DataFrame.
 
@@ -1080,18 +1102,37 @@ class Client(ClientWithProject):
                 to the client's project.
             job_config (google.cloud.bigquery.job.LoadJobConfig, optional):
                 Extra configuration options for the job.
+            row_group_size (int, optional):
+                If set, stream the data frame to the upload instead of
+                serializing it in memory first. The data frame is encoded
+                this many rows at a time, as Parquet row groups, while the
+                resumable upload sends the bytes which are already encoded.
+                The index of the data frame is not uploaded in this mode.
+            parallel_jobs (int, optional):
+                If set, split the data frame into this many slices of rows
+                and load each slice with a separate load job, running the
+                uploads concurrently. All jobs append to ``destination``, so
+                the write disposition of ``job_config`` must be unset or
+                :attr:`~google.cloud.bigquery.job.WriteDisposition.WRITE_APPEND`.
+                If ``job_id`` is given, the index of the slice is appended
+                to it for each job.
 
         Returns:
-            google.cloud.bigquery.job.LoadJob: A new load job.
+            Union[ \
+                google.cloud.bigquery.job.LoadJob, \
+                List[google.cloud.bigquery.job.LoadJob], \
+            ]:
+                A new load job, or a list of load jobs, one per slice, if
+                ``parallel_jobs`` is set.
 
         Raises:
             ImportError:
                 If a usable parquet engine cannot be found. This method
                 requires :mod:`pyarrow` to be installed.
+            ValueError:
+                If ``parallel_jobs`` is set and the write disposition of
+                ``job_config`` is not ``WRITE_APPEND``.
         """
-        buffer = six.BytesIO()
-        dataframe.to_parquet(buffer)
-
         if job_config is None:
             job_config = job.LoadJobConfig()
         job_config.source_format = job.SourceFormat.PARQUET
@@ -1099,6 +1140,36 @@ class Client(ClientWithProject):
         if location is None:
             location = self.location
 
+        if parallel_jobs is not None:
+            return self._load_table_from_dataframe_parallel(
+                dataframe,
+                destination,
+                parallel_jobs,
+                num_retries=num_retries,
+                job_id=job_id,
+                job_id_prefix=job_id_prefix,
+                location=location,
+                project=project,
+                job_config=job_config,
+                row_group_size=row_group_size,
+            )
+
+        if row_group_size is not None:
+            return self._load_table_from_dataframe_stream(
+                dataframe,
+                destination,
+                row_group_size,
+                num_retries=num_retries,
+                job_id=job_id,
+                job_id_prefix=job_id_prefix,
+                location=location,
+                project=project,
+                job_config=job_config,
+            )
+
+        buffer = six.BytesIO()
+        dataframe.to_parquet(buffer)
+
         return self.load_table_from_file(
             buffer,
             destination,
@@ -1111,6 +1182,116 @@ class Client(ClientWithProject):
             job_config=job_config,
         )
 
+    def _load_table_from_dataframe_stream(
+        self, dataframe, destination, row_group_size, **kwargs
+    ):
+        """Upload a DataFrame while it is being encoded as Parquet.
+
+        The data frame is encoded on a background thread into one end of a
+        pipe, while the resumable upload reads from the other end, so that
+        at most a few row groups are held in memory at once.
+
+        Args:
+            dataframe (pandas.DataFrame): The data frame to load.
+            destination (google.cloud.bigquery.table.TableReference):
+                The destination table.
+            row_group_size (int): The number of rows per Parquet row group.
+            kwargs (dict):
+                Keyword arguments to :meth:`load_table_from_file`.
+
+        Returns:
+            google.cloud.bigquery.job.LoadJob: A new load job.
+        """
+        read_fd, write_fd = os.pipe()
+        # A pipe cannot ``tell()``, which the resumable upload relies on.
+        read_file = _PositionTrackingReader(os.fdopen(read_fd, "rb"))
+        write_file = os.fdopen(write_fd, "wb")
+        encode_errors = []
+
+        def encode():
+            try:
+                _pandas_helpers.dataframe_to_parquet(
+                    dataframe, write_file, row_group_size
+                )
+            except Exception as exc:  # Reported once the upload finishes.
+                encode_errors.append(exc)
+            finally:
+                try:
+                    write_file.close()
+                except (IOError, OSError):
+                    # The reading end was closed because the upload failed.
+                    pass
+
+        encode_thread = threading.Thread(target=encode)
+        encode_thread.daemon = True
+        encode_thread.start()
+
+        try:
+            load_job = self.load_table_from_file(read_file, destination, **kwargs)
+        finally:
+            # Unblock the encoding thread if the upload stopped early.
+            read_file.close()
+            encode_thread.join()
+
+        if encode_errors:
+            raise encode_errors[0]
+        return load_job
+
+    def _load_table_from_dataframe_parallel(
+        self, dataframe, destination, parallel_jobs, job_id=None, **kwargs
+    ):
+        """Load slices of a DataFrame with concurrent load jobs.
+
+        Args:
+            dataframe (pandas.DataFrame): The data frame to load.
+            destination (google.cloud.bigquery.table.TableReference):
+                The destination table.
+            parallel_jobs (int): The number of slices to load.
+            job_id (str): (Optional) The base name of the jobs.
+            kwargs (dict):
+                Keyword arguments to :meth:`load_table_from_dataframe`.
+
+        Returns:
+            List[google.cloud.bigquery.job.LoadJob]:
+                The load jobs, one per slice, in the order of the slices.
+        """
+        job_config = kwargs.pop("job_config")
+        if job_config.write_disposition not in (
+            None,
+            job.WriteDisposition.WRITE_APPEND,
+        ):
+            raise ValueError(
+                "Parallel load jobs require the WRITE_APPEND write disposition."
+            )
+
+        slice_rows = max(1, -(-len(dataframe) // parallel_jobs))
+        starts = list(six.moves.range(0, len(dataframe), slice_rows)) or [0]
+
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=parallel_jobs
+        ) as executor:
+            futures = []
+            for index, start in enumerate(starts):
+                slice_job_id = None
+                if job_id is not None:
+                    slice_job_id = "{}-{}".format(job_id, index)
+                # Each job gets its own copy, leaving the caller's intact.
+                slice_config = job.LoadJobConfig()
+                slice_config._properties = copy.deepcopy(job_config._properties)
+                slice_config.write_disposition = job.WriteDisposition.WRITE_APPEND
+                futures.append(
+                    executor.submit(
+                        self.load_table_from_dataframe,
+                        dataframe.iloc[start : start + slice_rows],
+                        destination,
+                        job_id=slice_job_id,
+                        job_config=slice_config,
+                        **kwargs
+                    )
+                )
+
+        return [future.result() for future in futures]
+
     def _do_resumable_upload(self, stream, metadata, num_retries):
         """Perform a resumable upload.
 
@@ -1412,7 +1593,13 @@ class Client(ClientWithProject):
                 (Optional) How to retry the RPC.
 
         Returns:
-            google.cloud.bigquery.job.QueryJob: A new query job instance.
+            google.cloud.bigquery.job.QueryJob:
+                A new query job instance. If the client has a ``query_cache``
+                which holds the results of the query, the job is the
+                completed job which produced them, and no API request is made
+                to start it. Likewise, dry runs found in the client's
+                ``dry_run_cache`` return the statistics of the earlier dry
+                run.
         """
         job_id = _make_job_id(job_id, job_id_prefix)
 
@@ -1422,6 +1609,56 @@ class Client(ClientWithProject):
         if location is None:
             location = self.location
 
+        job_config = self._query_job_config(job_config)
+
+        if job_config is not None and job_config.dry_run:
+            if self.dry_run_cache is not None:
+                return self._dry_run_query(
+                    query, job_config, job_id, project, location, retry
+                )
+
+        cache_key = None
+        if self.query_cache is not None:
+            cache_config = job_config or job.QueryJobConfig()
+            if query_cache._is_cacheable(query, cache_config):
+                cache_key = query_cache._make_key(
+                    query, cache_config, project, location
+                )
+                entry = self.query_cache._lookup(cache_key, self)
+                if entry is not None:
+                    return job.QueryJob._from_cache_entry(entry, self)
+
+        job_ref = job._JobReference(job_id, project=project, location=location)
+        query_job = job.QueryJob(job_ref, query, client=self, job_config=job_config)
+        if cache_key is not None:
+            query_job._cache_key = cache_key
+        query_job._begin(retry=retry)
+
+        return query_job
+
+    def _dry_run_query(self, query, job_config, job_id, project, location, retry):
+        """Dry run a query, or get the dry run from the ``dry_run_cache``.
+
+        Returns:
+            google.cloud.bigquery.job.QueryJob:
+                The dry-run query job. On a cache hit, its properties are
+                those of the earlier dry run, and no job is inserted.
+        """
+        cache_key = query_cache._make_key(query, job_config, project, location)
+        job_ref = job._JobReference(job_id, project=project, location=location)
+        query_job = job.QueryJob(job_ref, query, client=self, job_config=job_config)
+
+        entry = self.dry_run_cache._lookup(cache_key, self)
+        if entry is not None:
+            query_job._set_properties(copy.deepcopy(entry["job"]))
+            return query_job
+
+        query_job._begin(retry=retry)
+        self.dry_run_cache._store(cache_key, query_job)
+        return query_job
+
+    def _query_job_config(self, job_config):
+        """Combine a query job config with the client's default one."""
         if self._default_query_job_config:
             if job_config:
                 # anything that's not defined on the incoming
@@ -1433,12 +1670,7 @@ class Client(ClientWithProject):
                 )
             else:
                 job_config = self._default_query_job_config
-
-        job_ref = job._JobReference(job_id, project=project, location=location)
-        query_job = job.QueryJob(job_ref, query, client=self, job_config=job_config)
-        query_job._begin(retry=retry)
-
-        return query_job
+        return job_config
 
     def insert_rows(self, table, rows, selected_fields=None, **kwargs):
         """Insert rows into a table via the streaming API.
@@ -1484,32 +1716,7 @@ class Client(ClientWithProject):
         if isinstance(table, str):
             table = TableReference.from_string(table, default_project=self.project)
 
-        if selected_fields is not None:
-            schema = selected_fields
-        elif isinstance(table, TableReference):
-            raise ValueError("need selected_fields with TableReference")
-        elif isinstance(table, Table):
-            if len(table.schema) == 0:
-                raise ValueError(_TABLE_HAS_NO_SCHEMA)
-            schema = table.schema
-        else:
-            raise TypeError("table should be Table or TableReference")
-
-        json_rows = []
-
-        for index, row in enumerate(rows):
-            if isinstance(row, dict):
-                row = _row_from_mapping(row, schema)
-            json_row = {}
-
-            for field, value in zip(schema, row):
-                converter = _SCALAR_VALUE_TO_JSON_ROW.get(field.field_type)
-                if converter is not None:  # STRING doesn't need converting
-                    value = converter(value)
-                json_row[field.name] = value
-
-            json_rows.append(json_row)
-
+        json_rows = _rows_to_json(table, rows, selected_fields)
         return self.insert_rows_json(table, json_rows, **kwargs)
 
     def insert_rows_json(
@@ -1564,36 +1771,15 @@ class Client(ClientWithProject):
         if isinstance(table, str):
             table = TableReference.from_string(table, default_project=self.project)
 
-        rows_info = []
-        data = {"rows": rows_info}
-
-        for index, row in enumerate(json_rows):
-            info = {"json": row}
-            if row_ids is not None:
-                info["insertId"] = row_ids[index]
-            else:
-                info["insertId"] = str(uuid.uuid4())
-            rows_info.append(info)
-
-        if skip_invalid_rows is not None:
-            data["skipInvalidRows"] = skip_invalid_rows
-
-        if ignore_unknown_values is not None:
-            data["ignoreUnknownValues"] = ignore_unknown_values
-
-        if template_suffix is not None:
-            data["templateSuffix"] = template_suffix
+        data = _insert_all_data(
+            json_rows, row_ids, skip_invalid_rows, ignore_unknown_values, template_suffix
+        )
 
         # We can always retry, because every row has an insert ID.
         response = self._call_api(
             retry, method="POST", path="%s/insertAll" % table.path, data=data
         )
-        errors = []
-
-        for error in response.get("insertErrors", ()):
-            errors.append({"index": int(error["index"]), "errors": error["errors"]})
-
-        return errors
+        return _insert_errors(response)
 
     def list_partitions(self, table, retry=DEFAULT_RETRY):
         """List the partitions in a table.
@@ -1637,6 +1823,11 @@ class Client(ClientWithProject):
         start_index=None,
         page_size=None,
         retry=DEFAULT_RETRY,
+        prefetch_pages=None,
+        max_prefetch_rows=None,
+        partitions=None,
+        partitions_modified_since=None,
+        max_partition_workers=None,
     ):
         """List the rows of the table.
 
@@ -1678,29 +1869,71 @@ class Client(ClientWithProject):
                 the iterator.
             retry (:class:`google.api_core.retry.Retry`):
                 (Optional) How to retry the RPC.
+            prefetch_pages (int):
+                (Optional) Fetch up to this many pages concurrently, ahead of
+                the page being consumed. Pages after the first are requested
+                by row offset and cannot be combined with ``page_token``.
+            max_prefetch_rows (int):
+                (Optional) The maximum number of rows to request ahead of the
+                page being consumed when ``prefetch_pages`` is set.
+            partitions (Union[Sequence[str], Callable[[str], bool]]):
+                (Optional) Read only these partitions of a partitioned
+                table: either a list of partition IDs, such as
+                ``"20180101"``, or a function which takes a partition ID and
+                returns whether to read the partition. Each partition is
+                read through a ``table$partition_id`` decorator.
+            partitions_modified_since (Union[int, datetime.datetime]):
+                (Optional) Read only the partitions modified after this
+                time, such as the ``high_water_mark`` of an earlier read.
+                An integer is a time in milliseconds since the epoch.
+            max_partition_workers (int):
+                (Optional) The maximum number of partitions to read
+                concurrently when ``partitions`` or
+                ``partitions_modified_since`` is set. Defaults to 4.
 
         Returns:
-            google.cloud.bigquery.table.RowIterator:
+            Union[ \
+                google.cloud.bigquery.table.RowIterator, \
+                google.cloud.bigquery.table.PartitionRowIterator, \
+            ]:
                 Iterator of row data
                 :class:`~google.cloud.bigquery.table.Row`-s. During each
                 page, the iterator will have the ``total_rows`` attribute
                 set, which counts the total number of rows **in the table**
                 (this is distinct from the total number of rows in the
-                current page: ``iterator.page.num_items``).
+                current page: ``iterator.page.num_items``). If
+                ``partitions`` or ``partitions_modified_since`` is set, a
+                :class:`~google.cloud.bigquery.table.PartitionRowIterator`
+                over the selected partitions.
+
+        Raises:
+            ValueError:
+                If ``partitions`` or ``partitions_modified_since`` is
+                combined with ``page_token``, ``start_index`` or
+                ``max_results``.
         """
         if isinstance(table, str):
             table = TableReference.from_string(table, default_project=self.project)
 
-        if selected_fields is not None:
-            schema = selected_fields
-        elif isinstance(table, TableReference):
-            raise ValueError("need selected_fields with TableReference")
-        elif isinstance(table, Table):
-            if len(table.schema) == 0 and table.created is None:
-                raise ValueError(_TABLE_HAS_NO_SCHEMA)
-            schema = table.schema
-        else:
-            raise TypeError("table should be Table or TableReference")
+        schema = _list_rows_schema(table, selected_fields)
+
+        if partitions is not None or partitions_modified_since is not None:
+            if (
+                page_token is not None
+                or start_index is not None
+                or max_results is not None
+            ):
+                raise ValueError(_PARTITIONS_WITH_OFFSETS)
+            return self._list_partition_rows(
+                table,
+                schema,
+                selected_fields,
+                partitions,
+                partitions_modified_since,
+                max_partition_workers,
+                page_size,
+                retry,
+            )
 
         params = {}
         if selected_fields is not None:
@@ -1717,9 +1950,118 @@ class Client(ClientWithProject):
             max_results=max_results,
             page_size=page_size,
             extra_params=params,
+            prefetch_pages=prefetch_pages,
+            max_prefetch_rows=max_prefetch_rows,
+            table=table,
         )
         return row_iterator
 
+    def _list_partition_summaries(self, table, retry=DEFAULT_RETRY):
+        """List the partitions of a table with their modification times.
+
+        Args:
+            table (Union[ \
+                :class:`~google.cloud.bigquery.table.Table`, \
+                :class:`~google.cloud.bigquery.table.TableReference`, \
+            ]):
+                The partitioned table, or a reference to it.
+            retry (google.api_core.retry.Retry):
+                (Optional) How to retry the RPC.
+
+        Returns:
+            List[Tuple[str, int]]:
+                The ID of each partition, with the time it was last
+                modified, in milliseconds since the epoch.
+        """
+        meta_table = TableReference(
+            DatasetReference(table.project, table.dataset_id),
+            "%s$__PARTITIONS_SUMMARY__" % table.table_id,
+        )
+        fields = [
+            SchemaField("partition_id", "STRING"),
+            SchemaField("last_modified_time", "INTEGER"),
+        ]
+        return [
+            (row[0], row[1])
+            for row in self.list_rows(meta_table, selected_fields=fields, retry=retry)
+        ]
+
+    def _list_partition_rows(
+        self,
+        table,
+        schema,
+        selected_fields,
+        partitions,
+        modified_since,
+        max_workers,
+        page_size,
+        retry,
+    ):
+        """List the rows of selected partitions of a table.
+
+        See :meth:`list_rows` for the arguments.
+
+        Returns:
+            google.cloud.bigquery.table.PartitionRowIterator:
+                Iterator over the rows of the selected partitions.
+        """
+        high_water_mark = None
+        if callable(partitions) or modified_since is not None:
+            if isinstance(modified_since, datetime.datetime):
+                modified_since = google.cloud._helpers._millis_from_datetime(
+                    modified_since
+                )
+            selected = partitions
+            if partitions is not None and not callable(partitions):
+                selected = frozenset(partitions).__contains__
+
+            partition_ids = []
+            for partition_id, modified in self._list_partition_summaries(
+                table, retry=retry
+            ):
+                if selected is not None and not selected(partition_id):
+                    continue
+                if modified_since is not None and modified <= modified_since:
+                    continue
+                partition_ids.append(partition_id)
+                if high_water_mark is None or modified > high_water_mark:
+                    high_water_mark = modified
+            if high_water_mark is None:
+                high_water_mark = modified_since
+        else:
+            partition_ids = list(partitions)
+
+        params = {}
+        if selected_fields is not None:
+            params["selectedFields"] = ",".join(field.name for field in selected_fields)
+
+        dataset_ref = DatasetReference(table.project, table.dataset_id)
+        iterators = []
+        for partition_id in partition_ids:
+            partition_ref = TableReference(
+                dataset_ref, "%s$%s" % (table.table_id, partition_id)
+            )
+            iterators.append(
+                RowIterator(
+                    client=self,
+                    api_request=functools.partial(self._call_api, retry),
+                    path="%s/data" % (partition_ref.path,),
+                    schema=schema,
+                    page_size=page_size,
+                    extra_params=dict(params),
+                )
+            )
+
+        if max_workers is None:
+            max_workers = _DEFAULT_MAX_PARTITION_WORKERS
+        return PartitionRowIterator(
+            iterators,
+            partition_ids,
+            schema,
+            high_water_mark=high_water_mark,
+            max_workers=max_workers,
+        )
+
 
 # pylint: disable=unused-argument
 def _item_to_project(iterator, resource):
@@ -1785,6 +2127,134 @@ def _item_to_table(iterator, resource):
     return TableListItem(resource)
 
 
+def _list_rows_schema(table, selected_fields):
+    """Find the schema of the rows listed from a table.
+
+    Args:
+        table (Union[ \
+            :class:`~google.cloud.bigquery.table.Table`, \
+            :class:`~google.cloud.bigquery.table.TableReference`, \
+        ]):
+            The table to list, or a reference to it.
+        selected_fields (Sequence[ \
+            :class:`~google.cloud.bigquery.schema.SchemaField`, \
+        ]):
+            The fields to return. Required if ``table`` is a
+            :class:`~google.cloud.bigquery.table.TableReference`.
+
+    Returns:
+        Sequence[google.cloud.bigquery.schema.SchemaField]:
+            The schema of the listed rows.
+
+    Raises:
+        ValueError: if table's schema is not set
+    """
+    if selected_fields is not None:
+        return selected_fields
+    elif isinstance(table, TableReference):
+        raise ValueError("need selected_fields with TableReference")
+    elif isinstance(table, Table):
+        if len(table.schema) == 0 and table.created is None:
+            raise ValueError(_TABLE_HAS_NO_SCHEMA)
+        return table.schema
+    else:
+        raise TypeError("table should be Table or TableReference")
+
+
+def _rows_to_json(table, rows, selected_fields):
+    """Convert rows to insert into a table to their JSON representation.
+
+    Args:
+        table (Union[ \
+            :class:`~google.cloud.bigquery.table.Table`, \
+            :class:`~google.cloud.bigquery.table.TableReference`, \
+        ]):
+            The destination table for the row data, or a reference to it.
+        rows (Union[Sequence[Tuple], Sequence[dict]]):
+            Row data to be inserted.
+        selected_fields (Sequence[ \
+            :class:`~google.cloud.bigquery.schema.SchemaField`, \
+        ]):
+            The fields to convert. Required if ``table`` is a
+            :class:`~google.cloud.bigquery.table.TableReference`.
+
+    Returns:
+        List[dict]: The rows, as mappings of field names to JSON values.
+
+    Raises:
+        ValueError: if table's schema is not set
+    """
+    if selected_fields is not None:
+        schema = selected_fields
+    elif isinstance(table, TableReference):
+        raise ValueError("need selected_fields with TableReference")
+    elif isinstance(table, Table):
+        if len(table.schema) == 0:
+            raise ValueError(_TABLE_HAS_NO_SCHEMA)
+        schema = table.schema
+    else:
+        raise TypeError("table should be Table or TableReference")
+
+    json_rows = []
+
+    for index, row in enumerate(rows):
+        if isinstance(row, dict):
+            row = _row_from_mapping(row, schema)
+        json_rows.append(_row_tuple_to_json(row, schema))
+
+    return json_rows
+
+
+def _insert_all_data(
+    json_rows, row_ids, skip_invalid_rows, ignore_unknown_values, template_suffix
+):
+    """Build the body of a ``tabledata.insertAll`` request.
+
+    See :meth:`Client.insert_rows_json` for the arguments.
+
+    Returns:
+        dict: The request body.
+    """
+    rows_info = []
+    data = {"rows": rows_info}
+
+    for index, row in enumerate(json_rows):
+        info = {"json": row}
+        if row_ids is not None:
+            info["insertId"] = row_ids[index]
+        else:
+            info["insertId"] = str(uuid.uuid4())
+        rows_info.append(info)
+
+    if skip_invalid_rows is not None:
+        data["skipInvalidRows"] = skip_invalid_rows
+
+    if ignore_unknown_values is not None:
+        data["ignoreUnknownValues"] = ignore_unknown_values
+
+    if template_suffix is not None:
+        data["templateSuffix"] = template_suffix
+
+    return data
+
+
+def _insert_errors(response):
+    """Extract the row errors from a ``tabledata.insertAll`` response.
+
+    Returns:
+        Sequence[Mappings]:
+            One mapping per row with insert errors: the "index" key
+            identifies the row, and the "errors" key contains a list of
+            the mappings describing one or more problems with the row.
+    """
+    errors = []
+
+    for error in response.get("insertErrors", ()):
+        errors.append({"index": int(error["index"]), "errors": error["errors"]})
+
+    return errors
+
+
 def _make_job_id(job_id, prefix=None):
     """Construct an ID for a new job.
 
@@ -1830,6 +2300,50 @@ def _check_mode(stream):
             )
 
 
+class _PositionTrackingReader(object):
+    """Wrap a readable stream which cannot seek, such as a pipe.
+
+    Counts the bytes read, so that :meth:`tell` works without seeking.
+
+    :type stream: IO[bytes]
+    :param stream: A bytes IO object open for reading.
+    """
+
+    def __init__(self, stream):
+        self._stream = stream
+        self._position = 0
+
+    @property
+    def mode(self):
+        """str: The mode of the wrapped stream."""
+        return self._stream.mode
+
+    def read(self, size=-1):
+        """Read up to ``size`` bytes, or until EOF if ``size`` is negative.
+
+        :type size: int
+        :param size: The maximum number of bytes to read.
+
+        :rtype: bytes
+        :returns: The bytes read.
+        """
+        data = self._stream.read(size)
+        self._position += len(data)
+        return data
+
+    def tell(self):
+        """Return the number of bytes read so far.
+
+        :rtype: int
+        :returns: The current position in the stream.
+        """
+        return self._position
+
+    def close(self):
+        """Close the wrapped stream."""
+        self._stream.close()
+
+
 def _get_upload_headers(user_agent):
     """Get the headers for an upload request.
 
@@ -15,6 +15,8 @@
 """Cursor for the Google BigQuery DB-API."""
 
 import collections
+import itertools
+import re
 
 try:
     from collections import abc as collections_abc
@@ -45,6 +47,15 @@ Column = collections.namedtuple(
     ],
 )
 
+_MAX_QUERY_PARAMETERS = 10000
+"""Maximum number of parameters in a single query."""
+
+_INSERT_VALUES = re.compile(
+    r"^(?P<prefix>\s*INSERT\b.*\bVALUES\s*)(?P<values>\(.*\))\s*;?\s*$",
+    re.IGNORECASE | re.DOTALL,
+)
+"""An ``INSERT`` statement with a ``VALUES`` list at the end."""
+
 
 class Cursor(object):
     """DB-API Cursor to Google BigQuery.
@@ -147,16 +158,30 @@ class Cursor(object):
         :param job_id: (Optional) The job_id to use. If not set, a job ID
             is generated at random.
         """
-        self._query_data = None
-        self._query_job = None
-        client = self.connection._client
-
         # The DB-API uses the pyformat formatting, since the way BigQuery does
         # query parameters was not one of the standard options. Convert both
         # the query and the parameters to the format expected by the client
         # libraries.
         formatted_operation = _format_operation(operation, parameters=parameters)
         query_parameters = _helpers.to_query_parameters(parameters)
+        self._execute(formatted_operation, query_parameters, job_id=job_id)
+
+    def _execute(self, formatted_operation, query_parameters, job_id=None):
+        """Run a query which is already in the format BigQuery expects.
+
+        :type formatted_operation: str
+        :param formatted_operation: A Google BigQuery query string.
+
+        :type query_parameters:
+            List[google.cloud.bigquery.query._AbstractQueryParameter]
+        :param query_parameters: The query parameters.
+
+        :type job_id: str
+        :param job_id: (Optional) The job_id to use.
+        """
+        self._query_data = None
+        self._query_job = None
+        client = self.connection._client
 
         config = job.QueryJobConfig()
         config.query_parameters = query_parameters
@@ -178,14 +203,33 @@ class Cursor(object):
     def executemany(self, operation, seq_of_parameters):
         """Prepare and execute a database operation multiple times.
 
+        An ``INSERT`` statement ending with a single ``VALUES`` tuple, such
+        as ``INSERT INTO t (a, b) VALUES (%s, %s)``, is run as one
+        statement which inserts a tuple for each set of parameters (or as a
+        few statements, if the parameters exceed the limit of a single
+        query). The ``rowcount`` is then the total number of inserted rows.
+        Other statements are run once per set of parameters.
+
         :type operation: str
         :param operation: A Google BigQuery query string.
 
         :type seq_of_parameters: Sequence[Mapping[str, Any] or Sequence[Any]]
         :param parameters: Sequence of many sets of parameter values.
         """
-        for parameters in seq_of_parameters:
-            self.execute(operation, parameters)
+        match = _INSERT_VALUES.match(operation)
+        if match is None or not _is_single_tuple(match.group("values")):
+            for parameters in seq_of_parameters:
+                self.execute(operation, parameters)
+            return
+
+        prefix = _format_operation(match.group("prefix"), parameters=())
+        rowcount = 0
+        for values, query_parameters in _batch_values(
+            match.group("values"), seq_of_parameters
+        ):
+            self._execute(prefix + ", ".join(values), query_parameters)
+            rowcount += self.rowcount
+        self.rowcount = rowcount
 
     def _try_fetch(self, size=None):
         """Try to start fetching data, if not yet started.
@@ -206,11 +250,15 @@ class Cursor(object):
             return
 
         if self._query_data is None:
+            # Fetch pages of at least ``arraysize`` rows, and request the
+            # next page in the background while the current one is used.
+            page_size = max(self.arraysize, size or 0)
             client = self.connection._client
             rows_iter = client.list_rows(
                 self._query_job.destination,
                 selected_fields=self._query_job._query_results.schema,
-                page_size=self.arraysize,
+                page_size=page_size,
+                prefetch_pages=1,
             )
             self._query_data = iter(rows_iter)
 
@@ -234,9 +282,10 @@ class Cursor(object):
         """Fetch multiple results from the last ``execute*()`` call.
 
         .. note::
-            The size parameter is not used for the request/response size.
-            Set the ``arraysize`` attribute before calling ``execute()`` to
-            set the batch size.
+            Rows are requested in pages of ``arraysize`` rows, or of ``size``
+            rows if the first fetch is a larger ``fetchmany()``. Set the
+            ``arraysize`` attribute before the first fetch to set the batch
+            size. The next page is fetched in the background.
 
         :type size: int
         :param size:
@@ -252,14 +301,7 @@ class Cursor(object):
             size = self.arraysize
 
         self._try_fetch(size=size)
-        rows = []
-
-        for row in self._query_data:
-            rows.append(row)
-            if len(rows) >= size:
-                break
-
-        return rows
+        return list(itertools.islice(self._query_data, size))
 
     def fetchall(self):
         """Fetch all remaining results from the last ``execute*()`` call.
@@ -334,6 +376,109 @@ def _format_operation_dict(operation, parameters):
         raise exceptions.ProgrammingError(exc)
 
 
+class _ParameterOrder(collections_abc.Mapping):
+    """Record the order in which named parameters appear in an operation.
+
+    Formatting an operation with this mapping replaces each named parameter
+    with a positional one (``?``).
+
+    :type parameters: Mapping[str, Any]
+    :param parameters: Dictionary of parameter values.
+    """
+
+    def __init__(self, parameters):
+        self._parameters = parameters
+        self.values = []
+
+    def __getitem__(self, name):
+        self.values.append(self._parameters[name])
+        return "?"
+
+    def __iter__(self):
+        return iter(self._parameters)
+
+    def __len__(self):
+        return len(self._parameters)
+
+
+def _format_values_tuple(values, parameters):
+    """Format a ``VALUES`` tuple with positional parameters.
+
+    :type values: str
+    :param values: A tuple of a ``VALUES`` list, such as ``(%s, %s)``.
+
+    :type parameters: Mapping[str, Any] or Sequence[Any]
+    :param parameters: Parameter values.
+
+    :rtype: Tuple[str, List[Any]]
+    :returns: The formatted tuple and the parameter values, in order.
+    :raises: :class:`~google.cloud.bigquery.dbapi.ProgrammingError`
+        if a parameter used in the tuple is not found in the
+        ``parameters`` argument.
+    """
+    if not isinstance(parameters, collections_abc.Mapping):
+        return _format_operation_list(values, parameters), list(parameters)
+
+    order = _ParameterOrder(parameters)
+    try:
+        formatted = values % order
+    except KeyError as exc:
+        raise exceptions.ProgrammingError(exc)
+    return formatted, order.values
+
+
+def _batch_values(values, seq_of_parameters):
+    """Format a ``VALUES`` tuple once per set of parameters, in batches.
+
+    :type values: str
+    :param values: A tuple of a ``VALUES`` list, such as ``(%s, %s)``.
+
+    :type seq_of_parameters: Sequence[Mapping[str, Any] or Sequence[Any]]
+    :param seq_of_parameters: Sequence of many sets of parameter values.
+
+    :rtype: Iterator[Tuple[List[str], List[ScalarQueryParameter]]]
+    :returns:
+        Batches of formatted tuples with their positional query
+        parameters. Each batch has at most ``_MAX_QUERY_PARAMETERS``
+        parameters.
+    """
+    batch_values = []
+    batch_parameters = []
+    for parameters in seq_of_parameters:
+        formatted, row_values = _format_values_tuple(values, parameters)
+        if batch_values and (
+            len(batch_parameters) + len(row_values) > _MAX_QUERY_PARAMETERS
+        ):
+            yield batch_values, batch_parameters
+            batch_values = []
+            batch_parameters = []
+        batch_values.append(formatted)
+        batch_parameters.extend(_helpers.to_query_parameters_list(row_values))
+
+    if batch_values:
+        yield batch_values, batch_parameters
+
+
+def _is_single_tuple(values):
+    """Check that the text of a ``VALUES`` list is a single tuple.
+
+    :type values: str
+    :param values: Text starting with ``(`` and ending with ``)``.
+
+    :rtype: bool
+    :returns: True if the first parenthesis is closed by the last one.
+    """
+    depth = 0
+    for index, character in enumerate(values):
+        if character == "(":
+            depth += 1
+        elif character == ")":
+            depth -= 1
+            if depth == 0:
+                return index == len(values) - 1
+    return False
+
+
 def _format_operation(operation, parameters=None):
     """Formats parameters in operation in way BigQuery expects.
 
@@ -0,0 +1,377 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Bulk streaming inserts into BigQuery tables."""
+
+from __future__ import absolute_import
+
+import concurrent.futures
+import json
+import threading
+import time
+import uuid
+
+try:
+    import pandas
+except ImportError:  # pragma: NO COVER
+    pandas = None
+import six
+
+from google.api_core import retry as api_retry
+from google.cloud.bigquery import _helpers
+from google.cloud.bigquery import _pandas_helpers
+from google.cloud.bigquery.retry import DEFAULT_RETRY
+from google.cloud.bigquery.retry import _RETRYABLE_REASONS
+from google.cloud.bigquery.table import Table
+from google.cloud.bigquery.table import TableReference
+from google.cloud.bigquery.table import _TABLE_HAS_NO_SCHEMA
+from google.cloud.bigquery.table import _row_from_mapping
+
+
+_DEFAULT_MAX_ROWS_PER_REQUEST = 500
+"""Recommended maximum number of rows per ``insertAll`` request.
+
+See https://cloud.google.com/bigquery/quotas#streaming_inserts
+"""
+
+_DEFAULT_MAX_BYTES_PER_REQUEST = 5 * 1024 * 1024
+"""Half of the 10 MB HTTP request size limit, leaving room for overhead."""
+
+_DEFAULT_MAX_WORKERS = 4
+_DEFAULT_MAX_RETRIES = 5
+_INITIAL_RETRY_DELAY = 1.0
+_MAXIMUM_RETRY_DELAY = 32.0
+
+
+class InsertChunkStats(object):
+    """Statistics about a single chunk of rows sent by a
+    :class:`~google.cloud.bigquery.inserter.TableInserter`.
+
+    Args:
+        first_index (int):
+            The index of the first row of the chunk in the inserted rows.
+        num_rows (int): The number of rows in the chunk.
+        num_bytes (int): The approximate size of the request, in bytes.
+        attempts (int):
+            The number of ``insertAll`` requests made for the chunk,
+            including the requests to retry failed rows.
+        elapsed (float):
+            The time, in seconds, taken to insert the chunk, including any
+            retries.
+        num_errors (int): The number of rows which could not be inserted.
+    """
+
+    def __init__(self, first_index, num_rows, num_bytes, attempts, elapsed, num_errors):
+        self.first_index = first_index
+        self.num_rows = num_rows
+        self.num_bytes = num_bytes
+        self.attempts = attempts
+        self.elapsed = elapsed
+        self.num_errors = num_errors
+
+    @property
+    def rows_per_second(self):
+        """float: Throughput of the chunk, in rows per second."""
+        if not self.elapsed:
+            return None
+        return self.num_rows / self.elapsed
+
+    def __repr__(self):
+        return (
+            "InsertChunkStats(first_index={}, num_rows={}, num_bytes={}, "
+            "attempts={}, elapsed={:.3f}, num_errors={})".format(
+                self.first_index,
+                self.num_rows,
+                self.num_bytes,
+                self.attempts,
+                self.elapsed,
+                self.num_errors,
+            )
+        )
+
+
+class TableInserter(object):
+    """Stream rows into a table with concurrent, size-limited requests.
+
+    Rows are split into ``insertAll`` requests by row count and size, and
+    the requests are sent on a bounded pool of threads. Every row is given
+    a unique ``insertId``, so that BigQuery can deduplicate rows which are
+    sent more than once. Rows which fail with a transient error, such as
+    ``backendError`` or ``rateLimitExceeded``, are retried with the same
+    ``insertId``.
+
+    Args:
+        client (google.cloud.bigquery.client.Client):
+            The client to use to make API requests.
+        table (Union[ \
+            :class:`~google.cloud.bigquery.table.Table`, \
+            :class:`~google.cloud.bigquery.table.TableReference`, \
+            str, \
+        ]):
+            The destination table for the row data, or a reference to it.
+        selected_fields (Sequence[ \
+            :class:`~google.cloud.bigquery.schema.SchemaField`, \
+        ]):
+            The fields to insert. Required if ``table`` is a
+            :class:`~google.cloud.bigquery.table.TableReference`.
+        max_rows_per_request (int):
+            (Optional) The maximum number of rows to send in one request.
+            Defaults to 500.
+        max_bytes_per_request (int):
+            (Optional) The maximum size of the rows sent in one request, in
+            bytes. Defaults to 5 MB. A row which is larger than this is sent
+            in a request by itself.
+        max_workers (int):
+            (Optional) The maximum number of concurrent requests. Defaults
+            to 4.
+        max_retries (int):
+            (Optional) The maximum number of times to retry rows which
+            failed with a transient error. Defaults to 5.
+        skip_invalid_rows (bool):
+            (Optional) Insert all valid rows of a request, even if invalid
+            rows exist.
+        ignore_unknown_values (bool):
+            (Optional) Accept rows that contain values that do not match the
+            schema. The unknown values are ignored.
+        template_suffix (str):
+            (Optional) treat ``name`` as a template table and provide a
+            suffix.
+        retry (:class:`google.api_core.retry.Retry`):
+            (Optional) How to retry each ``insertAll`` request.
+
+    Raises:
+        ValueError: if the table's schema is not set.
+    """
+
+    def __init__(
+        self,
+        client,
+        table,
+        selected_fields=None,
+        max_rows_per_request=_DEFAULT_MAX_ROWS_PER_REQUEST,
+        max_bytes_per_request=_DEFAULT_MAX_BYTES_PER_REQUEST,
+        max_workers=_DEFAULT_MAX_WORKERS,
+        max_retries=_DEFAULT_MAX_RETRIES,
+        skip_invalid_rows=None,
+        ignore_unknown_values=None,
+        template_suffix=None,
+        retry=DEFAULT_RETRY,
+    ):
+        if isinstance(table, str):
+            table = TableReference.from_string(table, default_project=client.project)
+
+        if selected_fields is not None:
+            schema = selected_fields
+        elif isinstance(table, TableReference):
+            raise ValueError("need selected_fields with TableReference")
+        elif isinstance(table, Table):
+            if len(table.schema) == 0:
+                raise ValueError(_TABLE_HAS_NO_SCHEMA)
+            schema = table.schema
+        else:
+            raise TypeError("table should be Table or TableReference")
+
+        self._client = client
+        self._table = table
+        self._schema = schema
+        self._max_rows_per_request = max_rows_per_request
+        self._max_bytes_per_request = max_bytes_per_request
+        self._max_workers = max_workers
+        self._max_retries = max_retries
+        self._insert_kwargs = {
+            "skip_invalid_rows": skip_invalid_rows,
+            "ignore_unknown_values": ignore_unknown_values,
+            "template_suffix": template_suffix,
+            "retry": retry,
+        }
+        self._stats = []
+        self._stats_lock = threading.Lock()
+
+    @property
+    def stats(self):
+        """List[google.cloud.bigquery.inserter.InsertChunkStats]: Statistics
+        for each chunk inserted so far, in order of completion.
+        """
+        with self._stats_lock:
+            return list(self._stats)
+
+    @property
+    def total_rows(self):
+        """int: The number of rows sent so far."""
+        return sum(chunk.num_rows for chunk in self.stats)
+
+    @property
+    def total_bytes(self):
+        """int: The approximate number of bytes sent so far."""
+        return sum(chunk.num_bytes for chunk in self.stats)
+
+    def insert(self, rows):
+        """Insert rows into the table.
+
+        Args:
+            rows (Union[ \
+                Iterable[Tuple], \
+                Iterable[dict], \
+                pandas.DataFrame, \
+            ]):
+                Row data to be inserted. The rows are consumed lazily, so
+                this may be an unbounded iterable. If tuples are given, each
+                tuple should contain data for each schema field in the same
+                order as the schema fields. If dictionaries are given, the
+                keys must include all required fields in the schema. If a
+                :class:`~pandas.DataFrame` is given, its column names are
+                used as the keys.
+
+        Returns:
+            Sequence[Mappings]:
+                One mapping per row with insert errors: the "index" key
+                identifies the row, and the "errors" key contains a list of
+                the mappings describing one or more problems with the row.
+                Rows which failed with a transient error are only included
+                once all retries have been used.
+        """
+        if pandas is not None and isinstance(rows, pandas.DataFrame):
+            rows = _pandas_helpers.dataframe_to_rows(rows)
+
+        errors = []
+        with concurrent.futures.ThreadPoolExecutor(
+            max_workers=self._max_workers
+        ) as executor:
+            pending = set()
+            for chunk in self._chunks(rows):
+                # Bound the number of chunks held in memory, so that rows
+                # are only read as fast as they can be sent.
+                if len(pending) >= 2 * self._max_workers:
+                    done, pending = concurrent.futures.wait(
+                        pending, return_when=concurrent.futures.FIRST_COMPLETED
+                    )
+                    for future in done:
+                        errors.extend(future.result())
+                pending.add(executor.submit(self._insert_chunk, *chunk))
+
+            for future in concurrent.futures.as_completed(pending):
+                errors.extend(future.result())
+
+        errors.sort(key=lambda error: error["index"])
+        return errors
+
+    def _chunks(self, rows):
+        """Split rows into chunks which fit in a single request.
+
+        Args:
+            rows (Iterable[Union[Tuple, dict]]): The rows to split.
+
+        Yields:
+            Tuple[int, List[dict], List[str], int]:
+                The index of the first row, the JSON rows, their insert IDs
+                and the approximate size of the chunk in bytes.
+        """
+        first_index = 0
+        json_rows = []
+        row_ids = []
+        num_bytes = 0
+
+        for index, row in enumerate(rows):
+            if isinstance(row, dict):
+                row = _row_from_mapping(row, self._schema)
+            json_row = _helpers._row_tuple_to_json(row, self._schema)
+            row_id = str(uuid.uuid4())
+            # Size of the row as it will appear in the request body.
+            row_bytes = len(json.dumps({"insertId": row_id, "json": json_row})) + 2
+
+            if json_rows and (
+                len(json_rows) >= self._max_rows_per_request
+                or num_bytes + row_bytes > self._max_bytes_per_request
+            ):
+                yield first_index, json_rows, row_ids, num_bytes
+                first_index = index
+                json_rows = []
+                row_ids = []
+                num_bytes = 0
+
+            json_rows.append(json_row)
+            row_ids.append(row_id)
+            num_bytes += row_bytes
+
+        if json_rows:
+            yield first_index, json_rows, row_ids, num_bytes
+
+    def _insert_chunk(self, first_index, json_rows, row_ids, num_bytes):
+        """Insert a chunk of rows, retrying rows with transient errors.
+
+        Args:
+            first_index (int): The index of the first row in the chunk.
+            json_rows (List[dict]): The JSON rows to insert.
+            row_ids (List[str]): The insert IDs of the rows.
+            num_bytes (int): The approximate size of the chunk in bytes.
+
+        Returns:
+            List[dict]: The errors for rows which could not be inserted.
+        """
+        start_time = time.time()
+        delays = api_retry.exponential_sleep_generator(
+            _INITIAL_RETRY_DELAY, _MAXIMUM_RETRY_DELAY
+        )
+        positions = list(six.moves.range(len(json_rows)))
+        failed = []
+        attempts = 0
+
+        while positions:
+            attempts += 1
+            response_errors = self._client.insert_rows_json(
+                self._table,
+                [json_rows[position] for position in positions],
+                row_ids=[row_ids[position] for position in positions],
+                **self._insert_kwargs
+            )
+
+            retry_positions = []
+            for error in response_errors:
+                position = positions[error["index"]]
+                if attempts <= self._max_retries and _is_retryable(error["errors"]):
+                    retry_positions.append(position)
+                else:
+                    failed.append(
+                        {"index": first_index + position, "errors": error["errors"]}
+                    )
+
+            positions = retry_positions
+            if positions:
+                time.sleep(next(delays))
+
+        stats = InsertChunkStats(
+            first_index,
+            len(json_rows),
+            num_bytes,
+            attempts,
+            time.time() - start_time,
+            len(failed),
+        )
+        with self._stats_lock:
+            self._stats.append(stats)
+        return failed
+
+
+def _is_retryable(errors):
+    """Check whether the errors for a row are all transient.
+
+    Args:
+        errors (Sequence[Mapping]): The errors reported for a row.
+
+    Returns:
+        bool: True if the row can be sent again.
+    """
+    return bool(errors) and all(
+        error.get("reason") in _RETRYABLE_REASONS for error in errors
+    )
@@ -14,8 +14,11 @@
 
 """Define API Jobs."""
 
+import concurrent.futures
 import copy
+import re
 import threading
+import time
 
 from six.moves import http_client
 
@@ -25,6 +28,7 @@ from google.cloud.exceptions import NotFound
 from google.cloud.bigquery.dataset import DatasetReference
 from google.cloud.bigquery.external_config import ExternalConfig
 from google.cloud.bigquery.query import _query_param_from_api_repr
+from google.cloud.bigquery.query import _QueryResults
 from google.cloud.bigquery.query import ArrayQueryParameter
 from google.cloud.bigquery.query import ScalarQueryParameter
 from google.cloud.bigquery.query import StructQueryParameter
@@ -37,10 +41,19 @@ from google.cloud.bigquery.table import TableReference
 from google.cloud.bigquery.table import Table
 from google.cloud.bigquery.table import TimePartitioning
 from google.cloud.bigquery import _helpers
+from google.cloud.bigquery import query_cache
 
 _DONE_STATE = "DONE"
 _STOPPED_REASON = "stopped"
 _TIMEOUT_BUFFER_SECS = 0.1
+_MIN_POLL_INTERVAL_SECS = 0.2
+_MAX_POLL_INTERVAL_SECS = 10.0
+_POLL_INTERVAL_FRACTION = 0.25
+_LONG_POLL_SECS = 1.0
+_SMALL_QUERY_BYTES = 1024 * 1024 * 1024
+_SMALL_QUERY_POLL_INTERVAL_SECS = 1.0
+_TIMEOUT_MESSAGE = "Operation did not complete within the designated timeout."
+_CONTAINS_ORDER_BY = re.compile(r"ORDER\s+BY", re.IGNORECASE)
 
 _ERROR_REASON_TO_EXCEPTION = {
     "accessDenied": http_client.FORBIDDEN,
@@ -88,6 +101,58 @@ def _error_result_to_exception(error_result):
     )
 
 
+def _contains_order_by(query):
+    """Whether the order of the rows of a query result must be preserved.
+
+    This has false positives, such as ``ORDER BY`` in a window function or
+    a subquery, which only cost the parallelism of the download.
+
+    :type query: str
+    :param query: The SQL text of the query.
+
+    :rtype: bool
+    :returns: True if the query contains an ``ORDER BY`` clause.
+    """
+    return bool(query and _CONTAINS_ORDER_BY.search(query))
+
+
+def _poll_interval(job, elapsed):
+    """Estimate how long to wait before polling a running job again.
+
+    The interval grows with the time the job has been running, so that
+    short jobs are noticed soon after they complete while long jobs are
+    polled less often. When the job statistics include a query plan, the
+    interval is limited to half the remaining time predicted from the
+    fraction of completed work. Queries which process little data are
+    polled at least every second.
+
+    :type job: :class:`_AsyncJob`
+    :param job: the running job
+
+    :type elapsed: float
+    :param elapsed: seconds since the caller started waiting for the job
+
+    :rtype: float
+    :returns: seconds to wait before the next poll
+    """
+    interval = elapsed * _POLL_INTERVAL_FRACTION
+    statistics = job._job_statistics()
+
+    total_inputs = completed_inputs = 0
+    for stage in statistics.get("queryPlan", ()):
+        total_inputs += int(stage.get("parallelInputs", 0))
+        completed_inputs += int(stage.get("completedParallelInputs", 0))
+    if 0 < completed_inputs < total_inputs:
+        remaining = elapsed * (total_inputs - completed_inputs) / completed_inputs
+        interval = min(interval, remaining / 2)
+
+    estimated_bytes = statistics.get("estimatedBytesProcessed")
+    if estimated_bytes is not None and int(estimated_bytes) < _SMALL_QUERY_BYTES:
+        interval = min(interval, _SMALL_QUERY_POLL_INTERVAL_SECS)
+
+    return max(_MIN_POLL_INTERVAL_SECS, min(interval, _MAX_POLL_INTERVAL_SECS))
+
+
 class Compression(object):
     """The compression type to use for exported files. The default value is
     :attr:`NONE`.
@@ -2302,6 +2367,8 @@ class QueryJob(_AsyncJob):
         self._configuration = job_config
         self._query_results = None
         self._done_timeout = None
+        self._cache_entry = None
+        self._cache_key = None
 
     @property
     def allow_large_results(self):
@@ -2479,6 +2546,26 @@ class QueryJob(_AsyncJob):
         job._set_properties(resource)
         return job
 
+    @classmethod
+    def _from_cache_entry(cls, entry, client):
+        """Factory:  construct a completed job from a query cache entry
+
+        :type entry: dict
+        :param entry: an entry of a
+                      :class:`~google.cloud.bigquery.query_cache.QueryCache`
+
+        :type client: :class:`google.cloud.bigquery.client.Client`
+        :param client: Client which holds credentials and project
+                       configuration for the dataset.
+
+        :rtype: :class:`google.cloud.bigquery.job.QueryJob`
+        :returns: Job whose results are served from ``entry``.
+        """
+        job = cls.from_api_repr(copy.deepcopy(entry["job"]), client)
+        job._query_results = _QueryResults.from_api_repr(entry["query_results"])
+        job._cache_entry = entry
+        return job
+
     @property
     def query_plan(self):
         """Return query plan from job statistics, if present.
@@ -2732,10 +2819,55 @@ class QueryJob(_AsyncJob):
         return self.state == _DONE_STATE
 
     def _blocking_poll(self, timeout=None):
+        """Wait for the query to complete.
+
+        Each call to ``getQueryResults`` waits on the server until the query
+        completes, or until its ``timeoutMs`` elapses, so the query is
+        polled again straight away after such a long poll. When the server
+        answers sooner, the next poll is delayed by an interval based on the
+        progress of the query, see :func:`_poll_interval`.
+
+        :type timeout: float
+        :param timeout:
+            How long (in seconds) to wait for the query to complete. If
+            ``None``, wait indefinitely.
+
+        :raises:
+            :class:`concurrent.futures.TimeoutError` if the query did not
+            complete in the given timeout.
+        """
         self._done_timeout = timeout
-        super(QueryJob, self)._blocking_poll(timeout=timeout)
+        if self._result_set:
+            return
 
-    def result(self, timeout=None, retry=DEFAULT_RETRY):
+        started = time.time()
+        while True:
+            poll_started = time.time()
+            try:
+                if self.done():
+                    return
+            except Exception as exc:
+                if not google.api_core.future.polling.RETRY_PREDICATE(exc):
+                    raise
+
+            now = time.time()
+            if timeout is not None and now - started >= timeout:
+                raise concurrent.futures.TimeoutError(_TIMEOUT_MESSAGE)
+            if now - poll_started >= _LONG_POLL_SECS:
+                continue
+
+            delay = _poll_interval(self, now - started)
+            if timeout is not None:
+                delay = min(delay, started + timeout - now)
+            time.sleep(delay)
+
+    def result(
+        self,
+        timeout=None,
+        retry=DEFAULT_RETRY,
+        prefetch_pages=None,
+        max_prefetch_rows=None,
+    ):
         """Start the job and wait for it to complete and get the result.
 
         :type timeout: float
@@ -2746,6 +2878,16 @@ class QueryJob(_AsyncJob):
         :type retry: :class:`google.api_core.retry.Retry`
         :param retry: (Optional) How to retry the call that retrieves rows.
 
+        :type prefetch_pages: int
+        :param prefetch_pages:
+            (Optional) Fetch up to this many pages of rows concurrently,
+            ahead of the page being consumed.
+
+        :type max_prefetch_rows: int
+        :param max_prefetch_rows:
+            (Optional) The maximum number of rows to request ahead of the
+            page being consumed when ``prefetch_pages`` is set.
+
         :rtype: :class:`~google.cloud.bigquery.table.RowIterator`
         :returns:
             Iterator of row data :class:`~google.cloud.bigquery.table.Row`-s.
@@ -2774,13 +2916,48 @@ class QueryJob(_AsyncJob):
             return _EmptyRowIterator()
 
         schema = self._query_results.schema
+        if self._cache_entry is not None:
+            return query_cache._cached_row_iterator(
+                self._client, self._cache_entry, schema
+            )
+
         dest_table_ref = self.destination
         dest_table = Table(dest_table_ref, schema=schema)
-        return self._client.list_rows(dest_table, retry=retry)
+        # Lets to_dataframe() skip the Storage API for small results.
+        dest_table._properties["numRows"] = str(self._query_results.total_rows)
+        rows = self._client.list_rows(
+            dest_table,
+            retry=retry,
+            prefetch_pages=prefetch_pages,
+            max_prefetch_rows=max_prefetch_rows,
+        )
+        rows._preserve_order = _contains_order_by(self.query)
+        if self._cache_key is not None:
+            # Each iterator collects its own pages: iterators of the same
+            # job may be read concurrently, or only partially.
+            rows._cache_writer = self._client.query_cache._writer(
+                self._cache_key, self
+            )
+        return rows
 
-    def to_dataframe(self):
+    def to_dataframe(self, dtypes=None, bqstorage_client=None):
         """Return a pandas DataFrame from a QueryJob
 
+        Args:
+            dtypes ( \
+                Map[str, Union[str, pandas.Series.dtype]] \
+            ):
+                (Optional) A dictionary of column names pandas ``dtype``\\ s.
+                The provided ``dtype`` is used when constructing the series
+                for the column specified. Otherwise, the ``dtype`` is chosen
+                from the BigQuery column type.
+            bqstorage_client ( \
+                google.cloud.bigquery_storage_v1beta1.BigQueryStorageClient \
+            ):
+                (Optional) A BigQuery Storage API client, used to download
+                large results from the destination table in parallel. See
+                :meth:`~google.cloud.bigquery.table.RowIterator.to_dataframe`.
+
         Returns:
             A :class:`~pandas.DataFrame` populated with row data and column
             headers from the query results. The column headers are derived
@@ -2789,7 +2966,9 @@ class QueryJob(_AsyncJob):
         Raises:
             ValueError: If the `pandas` library cannot be imported.
         """
-        return self.result().to_dataframe()
+        return self.result().to_dataframe(
+            dtypes=dtypes, bqstorage_client=bqstorage_client
+        )
 
     def __iter__(self):
         return iter(self.result())
@@ -3148,3 +3327,81 @@ class UnknownJob(_AsyncJob):
         resource["jobReference"] = job_ref_properties
         job._properties = resource
         return job
+
+
+def wait_for_jobs(
+    jobs,
+    timeout=None,
+    return_when=concurrent.futures.ALL_COMPLETED,
+    retry=DEFAULT_RETRY,
+):
+    """Wait for several jobs to complete, polling them from one loop.
+
+    Unlike calling ``result()`` on each job, which blocks on one job at a
+    time, or ``add_done_callback()``, which starts a polling thread per
+    job, all jobs are polled from the calling thread. Each job is polled
+    with ``jobs.get`` at its own interval, based on its statistics, see
+    :func:`_poll_interval`, and the loop sleeps until the next job is due.
+
+    Jobs which have not been started are started first.
+
+    Args:
+        jobs (Iterable[google.cloud.bigquery.job._AsyncJob]):
+            The jobs to wait for.
+        timeout (float):
+            (Optional) How long, in seconds, to wait. If ``None``, wait
+            until ``return_when`` is satisfied.
+        return_when (str):
+            (Optional) When to return, as for
+            :func:`concurrent.futures.wait`: one of
+            :data:`concurrent.futures.ALL_COMPLETED` (default),
+            :data:`concurrent.futures.FIRST_COMPLETED` or
+            :data:`concurrent.futures.FIRST_EXCEPTION`.
+        retry (google.api_core.retry.Retry):
+            (Optional) How to retry the RPCs.
+
+    Returns:
+        Tuple[Set[google.cloud.bigquery.job._AsyncJob], \
+              Set[google.cloud.bigquery.job._AsyncJob]]:
+            The jobs which are done, including failed jobs, and the jobs
+            which are not done, when ``return_when`` was satisfied or the
+            timeout elapsed.
+    """
+    started = time.time()
+    done = set()
+    next_polls = {}
+    for job in jobs:
+        if job.state is None:
+            job._begin(retry=retry)
+        next_polls[job] = started
+
+    while next_polls:
+        now = time.time()
+        for job, next_poll in list(next_polls.items()):
+            if next_poll > now:
+                continue
+            if _AsyncJob.done(job, retry=retry):
+                del next_polls[job]
+                done.add(job)
+            else:
+                next_polls[job] = time.time() + _poll_interval(job, now - started)
+
+        if done and return_when == concurrent.futures.FIRST_COMPLETED:
+            break
+        if return_when == concurrent.futures.FIRST_EXCEPTION and any(
+            job.error_result is not None for job in done
+        ):
+            break
+        if not next_polls:
+            break
+
+        now = time.time()
+        delay = min(next_polls.values()) - now
+        if timeout is not None:
+            if now - started >= timeout:
+                break
+            delay = min(delay, started + timeout - now)
+        if delay > 0:
+            time.sleep(delay)
+
+    return done, set(next_polls)
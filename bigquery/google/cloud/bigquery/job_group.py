@@ -0,0 +1,301 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Run many copy, extract and load jobs as a group."""
+
+from __future__ import absolute_import
+
+import collections
+import concurrent.futures
+import datetime
+import time
+
+from google.api_core import exceptions
+from google.cloud.bigquery.retry import DEFAULT_RETRY
+
+
+_DEFAULT_MAX_CONCURRENT_JOBS = 50
+_DEFAULT_MAX_JOBS_PER_SECOND = 5.0
+_DEFAULT_POLL_INTERVAL = 2.0
+_MAX_SINGLE_POLLS = 5
+"""Above this many running jobs, poll with ``jobs.list`` instead of
+``jobs.get`` for each job."""
+_MAX_LIST_PAGES = 3
+"""The most pages of ``jobs.list`` read per project in one poll. Running
+jobs which were not found in them are polled with ``jobs.get``."""
+_CREATION_TIME_MARGIN = datetime.timedelta(minutes=5)
+"""Allowance for differences between the local and the server clocks."""
+
+
+class JobGroupResult(object):
+    """The outcome of one job of a
+    :class:`~google.cloud.bigquery.job_group.JobGroup`.
+
+    Args:
+        job (google.cloud.bigquery.job._AsyncJob):
+            The job, or :data:`None` if it could not be started.
+        exception (Exception):
+            The error which prevented the job from starting, or the error
+            of the failed job, or :data:`None` if the job succeeded.
+    """
+
+    def __init__(self, job, exception=None):
+        self.job = job
+        self.exception = exception
+
+    @property
+    def succeeded(self):
+        """bool: True if the job completed without error."""
+        return self.exception is None
+
+    def __repr__(self):
+        return "JobGroupResult(job={!r}, exception={!r})".format(
+            self.job, self.exception
+        )
+
+
+class JobGroup(object):
+    """Start and track many copy, extract and load jobs.
+
+    Jobs are added with :meth:`copy_table`, :meth:`extract_table` and
+    :meth:`load_table_from_uri`, which take the same arguments as the
+    :class:`~google.cloud.bigquery.client.Client` methods, and are started
+    by :meth:`run`. At most ``max_concurrent_jobs`` jobs run at once, and
+    jobs are started at most ``max_jobs_per_second`` per second, to stay
+    within the job insertion quota of the project. Running jobs are polled
+    together: a few with one ``jobs.get`` request each, more with a
+    ``jobs.list`` request of the jobs completed per project since the
+    group's jobs were created.
+
+    Args:
+        client (google.cloud.bigquery.client.Client):
+            The client used to start and poll the jobs.
+        max_concurrent_jobs (int):
+            (Optional) The maximum number of jobs running at once.
+            Defaults to 50.
+        max_jobs_per_second (float):
+            (Optional) The maximum rate at which jobs are started. Defaults
+            to 5 jobs per second.
+        poll_interval (float):
+            (Optional) The time, in seconds, between polls of the running
+            jobs. Defaults to 2 seconds.
+        retry (google.api_core.retry.Retry):
+            (Optional) How to retry the RPCs used to poll the jobs.
+    """
+
+    def __init__(
+        self,
+        client,
+        max_concurrent_jobs=_DEFAULT_MAX_CONCURRENT_JOBS,
+        max_jobs_per_second=_DEFAULT_MAX_JOBS_PER_SECOND,
+        poll_interval=_DEFAULT_POLL_INTERVAL,
+        retry=DEFAULT_RETRY,
+    ):
+        self._client = client
+        self._max_concurrent_jobs = max_concurrent_jobs
+        self._max_jobs_per_second = max_jobs_per_second
+        self._poll_interval = poll_interval
+        self._retry = retry
+        self._queued = collections.deque()
+        self._results = []
+        self._running = {}
+        self._next_start = 0.0
+
+    def __len__(self):
+        return len(self._results)
+
+    @property
+    def results(self):
+        """List[Optional[google.cloud.bigquery.job_group.JobGroupResult]]:
+        The outcome of each job, in the order the jobs were added, or
+        :data:`None` for jobs which have not completed.
+        """
+        return list(self._results)
+
+    def _add(self, start_job, args, kwargs):
+        """Queue a call which starts a job."""
+        self._queued.append((len(self._results), start_job, args, kwargs))
+        self._results.append(None)
+        return len(self._results) - 1
+
+    def copy_table(self, *args, **kwargs):
+        """Add a copy job. See
+        :meth:`~google.cloud.bigquery.client.Client.copy_table`.
+
+        Returns:
+            int: The index of the job in :attr:`results`.
+        """
+        return self._add(self._client.copy_table, args, kwargs)
+
+    def extract_table(self, *args, **kwargs):
+        """Add an extract job. See
+        :meth:`~google.cloud.bigquery.client.Client.extract_table`.
+
+        Returns:
+            int: The index of the job in :attr:`results`.
+        """
+        return self._add(self._client.extract_table, args, kwargs)
+
+    def load_table_from_uri(self, *args, **kwargs):
+        """Add a load job. See
+        :meth:`~google.cloud.bigquery.client.Client.load_table_from_uri`.
+
+        Returns:
+            int: The index of the job in :attr:`results`.
+        """
+        return self._add(self._client.load_table_from_uri, args, kwargs)
+
+    def run(self, timeout=None):
+        """Start the jobs which have been added and wait for them.
+
+        Args:
+            timeout (float):
+                (Optional) How long, in seconds, to wait for all jobs to
+                complete. If ``None``, wait indefinitely.
+
+        Returns:
+            List[google.cloud.bigquery.job_group.JobGroupResult]:
+                The outcome of each job, in the order the jobs were added.
+                Jobs which fail do not stop the other jobs.
+
+        Raises:
+            concurrent.futures.TimeoutError:
+                If the jobs did not complete in the given timeout. Running
+                jobs are not cancelled, and calling :meth:`run` again
+                resumes waiting for them and starting queued jobs.
+        """
+        started = time.time()
+        running = self._running
+
+        while self._queued or running:
+            while self._queued and len(running) < self._max_concurrent_jobs:
+                self._start_next(running)
+
+            if running:
+                if timeout is not None and time.time() - started >= timeout:
+                    raise concurrent.futures.TimeoutError(
+                        "Jobs did not complete within the designated timeout."
+                    )
+                time.sleep(self._poll_interval)
+                self._poll(running)
+
+        return self.results
+
+    def _throttle(self):
+        """Wait until another job may be started."""
+        now = time.time()
+        if self._next_start > now:
+            time.sleep(self._next_start - now)
+            now = self._next_start
+        self._next_start = now + 1.0 / self._max_jobs_per_second
+
+    def _start_next(self, running):
+        """Start the next queued job.
+
+        Args:
+            running (Dict[Tuple[str, str], Tuple[int, _AsyncJob]]):
+                The running jobs, keyed by project and job ID. The started
+                job is added to it, unless it completed already.
+        """
+        index, start_job, args, kwargs = self._queued.popleft()
+        self._throttle()
+        try:
+            job = start_job(*args, **kwargs)
+        except exceptions.GoogleAPICallError as exc:
+            self._results[index] = JobGroupResult(None, exc)
+            return
+
+        if job.state == "DONE":
+            self._finish(index, job)
+        else:
+            running[(job.project, job.job_id)] = (index, job)
+
+    def _finish(self, index, job):
+        """Record the outcome of a completed job."""
+        self._results[index] = JobGroupResult(job, job.exception())
+
+    def _poll(self, running):
+        """Refresh the running jobs, and record the completed ones.
+
+        Args:
+            running (Dict[Tuple[str, str], Tuple[int, _AsyncJob]]):
+                The running jobs, keyed by project and job ID. Completed
+                jobs are removed from it.
+        """
+        if len(running) <= _MAX_SINGLE_POLLS:
+            for key, (index, job) in list(running.items()):
+                if job.done(retry=self._retry):
+                    del running[key]
+                    self._finish(index, job)
+            return
+
+        projects = set(project for project, _ in running)
+        for project in projects:
+            self._poll_project(project, running)
+
+    def _poll_project(self, project, running):
+        """Refresh the running jobs of a project with ``jobs.list``.
+
+        The listing stops once every running job of the project was found,
+        and after ``_MAX_LIST_PAGES`` pages, since the project may have many
+        other jobs. The jobs which were not found when it stops early are
+        polled with ``jobs.get``.
+
+        Args:
+            project (str): The project of the jobs.
+            running (Dict[Tuple[str, str], Tuple[int, _AsyncJob]]):
+                The running jobs, keyed by project and job ID. Completed
+                jobs are removed from it.
+        """
+        creation_times = [
+            job.created
+            for (job_project, _), (_, job) in running.items()
+            if job_project == project and job.created is not None
+        ]
+        min_creation_time = None
+        max_creation_time = None
+        if creation_times:
+            min_creation_time = min(creation_times) - _CREATION_TIME_MARGIN
+            max_creation_time = max(creation_times) + _CREATION_TIME_MARGIN
+
+        done_jobs = self._client.list_jobs(
+            project=project,
+            state_filter="done",
+            min_creation_time=min_creation_time,
+            max_creation_time=max_creation_time,
+            retry=self._retry,
+        )
+        pages = done_jobs.pages
+        for _ in range(_MAX_LIST_PAGES):
+            page = next(pages, None)
+            if page is None:
+                return
+            for done_job in page:
+                key = (project, done_job.job_id)
+                if key not in running:
+                    continue
+                index, job = running.pop(key)
+                resource = dict(job._properties)
+                resource.update(done_job._properties)
+                job._set_properties(resource)
+                self._finish(index, job)
+            if not any(job_project == project for job_project, _ in running):
+                return
+
+        if done_jobs.next_page_token is None:
+            return
+        for key, (index, job) in list(running.items()):
+            if key[0] == project and job.done(retry=self._retry):
+                del running[key]
+                self._finish(index, job)
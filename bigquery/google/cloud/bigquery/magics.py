@@ -21,7 +21,7 @@
     .. code-block:: python
 
         %%bigquery [<destination_var>] [--project <project>] [--use_legacy_sql]
-                   [--verbose] [--params <params>]
+                   [--use_bqstorage_api] [--verbose] [--params <params>]
         <query>
 
     Parameters:
@@ -34,6 +34,14 @@
     * ``--use_legacy_sql`` (optional, line argument):
         Runs the query using Legacy SQL syntax. Defaults to Standard SQL if
         this argument not used.
+    * ``--use_bqstorage_api`` (optional, line argument):
+        Downloads large query results with the BigQuery Storage API, which
+        reads the destination table over many streams in parallel. Requires
+        the ``google-cloud-bigquery-storage`` library, with its ``fastavro``
+        and ``pandas`` extras. Small results, or results of queries run
+        without that library installed, are downloaded with the BigQuery
+        API. Defaults to
+        :attr:`~google.cloud.bigquery.magics.Context.use_bqstorage_api`.
     * ``--verbose`` (optional, line argument):
         If this flag is used, information including the query job ID and the
         amount of time for the query to complete will not be cleared after the
@@ -131,6 +139,7 @@ from __future__ import print_function
 
 import ast
 import time
+import warnings
 from concurrent import futures
 
 try:
@@ -155,6 +164,7 @@ class Context(object):
     def __init__(self):
         self._credentials = None
         self._project = None
+        self._use_bqstorage_api = False
 
     @property
     def credentials(self):
@@ -216,6 +226,24 @@ class Context(object):
     def project(self, value):
         self._project = value
 
+    @property
+    def use_bqstorage_api(self):
+        """bool: Whether queries performed through IPython magics download
+        large results with the BigQuery Storage API, as with the
+        ``--use_bqstorage_api`` argument. Defaults to :data:`False`.
+
+        Example:
+            Using the BigQuery Storage API for all queries:
+
+            >>> from google.cloud.bigquery import magics
+            >>> magics.context.use_bqstorage_api = True
+        """
+        return self._use_bqstorage_api
+
+    @use_bqstorage_api.setter
+    def use_bqstorage_api(self, value):
+        self._use_bqstorage_api = value
+
 
 context = Context()
 
@@ -258,6 +286,34 @@ def _run_query(client, query, job_config=None):
     return query_job
 
 
+def _make_bqstorage_client(use_bqstorage_api, credentials):
+    """Create a BigQuery Storage API client, if requested and available.
+
+    Args:
+        use_bqstorage_api (bool): Whether to use the BigQuery Storage API.
+        credentials (google.auth.credentials.Credentials):
+            Credentials for the client.
+
+    Returns:
+        Optional[google.cloud.bigquery_storage_v1beta1.BigQueryStorageClient]:
+            The client, or :data:`None` to download results with the
+            BigQuery API.
+    """
+    if not use_bqstorage_api:
+        return None
+
+    try:
+        from google.cloud import bigquery_storage_v1beta1
+    except ImportError:
+        warnings.warn(
+            "The google-cloud-bigquery-storage library is not installed, "
+            "downloading results with the BigQuery API instead."
+        )
+        return None
+
+    return bigquery_storage_v1beta1.BigQueryStorageClient(credentials=credentials)
+
+
 @magic_arguments.magic_arguments()
 @magic_arguments.argument(
     "destination_var",
@@ -283,6 +339,16 @@ def _run_query(client, query, job_config=None):
         "Standard SQL if this argument is not used."
     ),
 )
+@magic_arguments.argument(
+    "--use_bqstorage_api",
+    action="store_true",
+    default=False,
+    help=(
+        "Use the BigQuery Storage API to download large query results. "
+        "Requires the google-cloud-bigquery-storage library. Defaults to "
+        "the context use_bqstorage_api setting."
+    ),
+)
 @magic_arguments.argument(
     "--verbose",
     action="store_true",
@@ -345,7 +411,10 @@ def _cell_magic(line, query):
     if not args.verbose:
         display.clear_output()
 
-    result = query_job.to_dataframe()
+    bqstorage_client = _make_bqstorage_client(
+        args.use_bqstorage_api or context.use_bqstorage_api, context.credentials
+    )
+    result = query_job.to_dataframe(bqstorage_client=bqstorage_client)
     if args.destination_var:
         IPython.get_ipython().push({args.destination_var: result})
     return result
@@ -0,0 +1,779 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+"""Client-side caches for query results.
+
+A cache is passed to :class:`~google.cloud.bigquery.client.Client` as
+``query_cache``. :meth:`~google.cloud.bigquery.client.Client.query` then
+looks up each cacheable query before creating a job. On a hit, the returned
+:class:`~google.cloud.bigquery.job.QueryJob` is already complete and its
+:meth:`~google.cloud.bigquery.job.QueryJob.result` serves the rows from
+the cache, without any API request. On a miss, the rows are stored once
+they have all been read from the query's
+:class:`~google.cloud.bigquery.table.RowIterator`.
+
+A :class:`DryRunCache`, passed to the client as ``dry_run_cache``, likewise
+serves repeated dry runs, such as the cost estimates made before running a
+query, from the statistics of an earlier dry run.
+"""
+
+from __future__ import absolute_import
+
+import collections
+import concurrent.futures
+import copy
+import hashlib
+import json
+import os
+import re
+import tempfile
+import threading
+import time
+
+import six
+
+from google.api_core.exceptions import GoogleAPICallError
+from google.cloud.bigquery.table import RowIterator
+from google.cloud.bigquery.table import TableReference
+
+
+_DEFAULT_MAX_BYTES = 100 * 1024 * 1024
+_DEFAULT_MAX_DRY_RUNS = 1000
+_MAX_TABLE_CHECK_WORKERS = 10
+
+_SQL_TOKEN = re.compile(r"""('(?:[^'\\]|\\.)*'|"(?:[^"\\]|\\.)*"|`[^`]*`)|\s+""")
+"""Quoted strings and identifiers (group 1), or a run of whitespace."""
+
+_NONDETERMINISTIC_SQL = re.compile(
+    r"\b(CURRENT_DATE|CURRENT_DATETIME|CURRENT_TIME|CURRENT_TIMESTAMP|"
+    r"GENERATE_UUID|NOW|RAND|SESSION_USER)\b|\*`",
+    re.IGNORECASE,
+)
+"""Functions whose results change between runs, or a wildcard table."""
+
+_CACHE_KEY_PROPERTIES = (
+    "defaultDataset",
+    "parameterMode",
+    "queryParameters",
+    "useLegacySql",
+    "userDefinedFunctionResources",
+)
+"""Query configuration properties which affect the results of a query."""
+
+
+def _normalize_sql(query):
+    """Normalize the text of a query for use in a cache key.
+
+    Runs of whitespace outside of string literals and quoted identifiers
+    are collapsed to a single space, and leading and trailing whitespace
+    and semicolons are removed.
+
+    Args:
+        query (str): The SQL text.
+
+    Returns:
+        str: The normalized SQL text.
+    """
+
+    def replace(match):
+        return match.group(1) or " "
+
+    return _SQL_TOKEN.sub(replace, query).strip().rstrip(";").rstrip()
+
+
+def _make_key(query, job_config, project, location):
+    """Compute the cache key of a query.
+
+    Args:
+        query (str): The SQL text of the query.
+        job_config (google.cloud.bigquery.job.QueryJobConfig):
+            The configuration of the query.
+        project (str): The project which runs the query.
+        location (str): The location in which the query runs.
+
+    Returns:
+        str: A hex digest identifying the query and its parameters.
+    """
+    query_properties = job_config._properties.get("query", {})
+    key = {
+        "query": _normalize_sql(query),
+        "project": project,
+        "location": location,
+    }
+    for name in _CACHE_KEY_PROPERTIES:
+        key[name] = query_properties.get(name)
+    # Jobs default to standard SQL by setting ``useLegacySql`` to false.
+    key["useLegacySql"] = bool(key["useLegacySql"])
+    key_json = json.dumps(key, sort_keys=True)
+    return hashlib.sha256(key_json.encode("utf-8")).hexdigest()
+
+
+def _is_cacheable(query, job_config):
+    """Check whether the results of a query can be cached.
+
+    Queries are not cached if they write to a destination table, if they
+    are dry runs, if they disable BigQuery's own query cache, if they read
+    external tables, or if they call functions whose results change with
+    each run (such as ``CURRENT_TIMESTAMP()``) or read wildcard tables.
+
+    Args:
+        query (str): The SQL text of the query.
+        job_config (google.cloud.bigquery.job.QueryJobConfig):
+            The configuration of the query.
+
+    Returns:
+        bool: True if the query may be served from the cache.
+    """
+    return not (
+        job_config.destination is not None
+        or job_config.dry_run
+        or job_config.use_query_cache is False
+        or job_config.table_definitions
+        or _NONDETERMINISTIC_SQL.search(query)
+    )
+
+
+def _table_id(table_ref):
+    """Format a table reference as ``project.dataset_id.table_id``."""
+    return "{}.{}.{}".format(
+        table_ref.project, table_ref.dataset_id, table_ref.table_id
+    )
+
+
+class _CachedRowsRequest(object):
+    """Serve ``tabledata.list`` requests from the rows of a cache entry.
+
+    An instance is used as the ``api_request`` of a
+    :class:`~google.cloud.bigquery.table.RowIterator`, so that cached rows
+    are paged and decoded exactly like rows read from the API.
+
+    Args:
+        rows (List[Dict[str, object]]): The JSON rows of the result.
+    """
+
+    def __init__(self, rows):
+        self._rows = rows
+
+    def __call__(self, method, path, query_params=None):
+        query_params = query_params or {}
+        start = int(
+            query_params.get("pageToken") or query_params.get("startIndex") or 0
+        )
+        stop = len(self._rows)
+        if query_params.get("maxResults") is not None:
+            stop = min(stop, start + int(query_params["maxResults"]))
+
+        response = {"rows": self._rows[start:stop], "totalRows": len(self._rows)}
+        if stop < len(self._rows):
+            response["pageToken"] = str(stop)
+        return response
+
+
+class _CacheWriter(object):
+    """Collect the pages of a query result and store them in a cache.
+
+    Args:
+        cache (google.cloud.bigquery.query_cache.QueryCache):
+            The cache to store the result in.
+        key (str): The cache key of the query.
+        query_job (google.cloud.bigquery.job.QueryJob):
+            The completed query job which produced the rows.
+    """
+
+    def __init__(self, cache, key, query_job):
+        self._cache = cache
+        self._key = key
+        self._query_job = query_job
+        self._rows = []
+        self._num_bytes = 0
+        self._finished = False
+
+    def add_page(self, response, offset):
+        """Collect the rows of a ``tabledata.list`` response.
+
+        The rows are stored once the rows of all pages have been collected.
+        Results which would not fit in the cache, and pages which do not
+        directly follow the collected rows, such as pages read from a
+        ``page_token`` or ``start_index``, stop the collection.
+
+        Args:
+            response (Dict[str, object]): The parsed JSON response.
+            offset (Optional[int]):
+                The index of the first row of the page, or :data:`None` if
+                it is unknown.
+        """
+        if self._finished:
+            return
+
+        if offset != len(self._rows):
+            self._finished = True
+            self._rows = []
+            return
+
+        rows = response.get("rows", ())
+        self._num_bytes += len(json.dumps(rows))
+        if self._num_bytes > self._cache.max_bytes:
+            self._finished = True
+            self._rows = []
+            return
+
+        self._rows.extend(rows)
+        total_rows = response.get("totalRows")
+        if total_rows is not None and len(self._rows) >= int(total_rows):
+            self._finished = True
+            self._cache._store(self._key, self._query_job, self._rows, self._num_bytes)
+
+
+class QueryCache(object):
+    """Base class for client-side caches of query results.
+
+    Subclasses implement the storage methods :meth:`get`, :meth:`set`,
+    :meth:`delete` and :meth:`clear`. Entries are JSON-serializable
+    dictionaries, with the size of the entry in bytes in ``"num_bytes"``.
+
+    Args:
+        ttl (float):
+            (Optional) The time, in seconds, after which an entry expires.
+            Defaults to no expiry, so that entries are only invalidated when
+            a table read by the query is modified.
+        max_bytes (int):
+            (Optional) The maximum total size of the cached rows, in bytes.
+            The least recently used entries are evicted first. Defaults to
+            100 MB.
+        validate_tables (bool):
+            (Optional) Check the ``lastModifiedTime`` of the tables read by
+            a query before serving it from the cache, with one
+            ``tables.get`` request per table. Defaults to :data:`True`.
+            Set to :data:`False` to serve hits without any API request, and
+            rely on ``ttl`` alone to expire results.
+    """
+
+    def __init__(self, ttl=None, max_bytes=_DEFAULT_MAX_BYTES, validate_tables=True):
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self.validate_tables = validate_tables
+
+    def get(self, key):
+        """Get an entry from the storage.
+
+        Args:
+            key (str): The cache key.
+
+        Returns:
+            Optional[dict]: The entry, or :data:`None` if there is none.
+        """
+        raise NotImplementedError
+
+    def set(self, key, entry):
+        """Add an entry to the storage, evicting entries to make space.
+
+        Args:
+            key (str): The cache key.
+            entry (dict): The entry.
+        """
+        raise NotImplementedError
+
+    def delete(self, key):
+        """Remove an entry from the storage, if it exists.
+
+        Args:
+            key (str): The cache key.
+        """
+        raise NotImplementedError
+
+    def clear(self):
+        """Remove all entries from the storage."""
+        raise NotImplementedError
+
+    def _lookup(self, key, client):
+        """Find a valid entry for a query.
+
+        Expired entries, and entries for which a table read by the query
+        has been modified since, or can no longer be fetched, are removed.
+
+        Args:
+            key (str): The cache key of the query.
+            client (google.cloud.bigquery.client.Client):
+                The client used to check the referenced tables.
+
+        Returns:
+            Optional[dict]: The entry, or :data:`None` on a miss.
+        """
+        entry = self.get(key)
+        if entry is None:
+            return None
+
+        if self.ttl is not None and time.time() - entry["created"] > self.ttl:
+            self.delete(key)
+            return None
+
+        if self.validate_tables:
+            for table_id, modified in six.iteritems(entry["tables"]):
+                try:
+                    table = client.get_table(TableReference.from_string(table_id))
+                except GoogleAPICallError:
+                    # Deleted, or not readable by the caller: unverifiable.
+                    self.delete(key)
+                    return None
+                if table._properties.get("lastModifiedTime") != modified:
+                    self.delete(key)
+                    return None
+
+        return entry
+
+    def _store(self, key, query_job, rows, num_bytes):
+        """Store the result of a query.
+
+        The result is not stored if the query was not a ``SELECT``
+        statement, or if a table read by the query was modified after the
+        query started or cannot be fetched, such as a table read through an
+        authorized view.
+
+        Args:
+            key (str): The cache key of the query.
+            query_job (google.cloud.bigquery.job.QueryJob):
+                The completed query job.
+            rows (List[Dict[str, object]]): The JSON rows of the result.
+            num_bytes (int): The size of the rows, in bytes.
+        """
+        if query_job.statement_type != "SELECT":
+            return
+
+        started = query_job._properties.get("statistics", {}).get("startTime")
+        tables = {}
+        for table_ref in query_job.referenced_tables:
+            try:
+                table = query_job._client.get_table(table_ref)
+            except GoogleAPICallError:
+                return
+            modified = table._properties.get("lastModifiedTime")
+            if started is None or modified is None or float(modified) > started:
+                return
+            tables[_table_id(table_ref)] = modified
+
+        query_results = dict(query_job._query_results._properties)
+        query_results.pop("rows", None)
+        query_results.pop("pageToken", None)
+        entry = {
+            "created": time.time(),
+            "job": copy.deepcopy(query_job._properties),
+            "query_results": query_results,
+            "rows": rows,
+            "tables": tables,
+            "num_bytes": num_bytes,
+        }
+        self.set(key, entry)
+
+    def _writer(self, key, query_job):
+        """Create a writer which stores rows as they are read.
+
+        Args:
+            key (str): The cache key of the query.
+            query_job (google.cloud.bigquery.job.QueryJob):
+                The completed query job.
+
+        Returns:
+            google.cloud.bigquery.query_cache._CacheWriter:
+                A writer for the pages of the query result.
+        """
+        return _CacheWriter(self, key, query_job)
+
+
+class MemoryQueryCache(QueryCache):
+    """An in-process, least recently used cache of query results.
+
+    The cache is safe to share between threads.
+
+    Args:
+        ttl (float): (Optional) See :class:`QueryCache`.
+        max_bytes (int): (Optional) See :class:`QueryCache`.
+        validate_tables (bool): (Optional) See :class:`QueryCache`.
+    """
+
+    def __init__(self, ttl=None, max_bytes=_DEFAULT_MAX_BYTES, validate_tables=True):
+        super(MemoryQueryCache, self).__init__(
+            ttl=ttl, max_bytes=max_bytes, validate_tables=validate_tables
+        )
+        self._entries = collections.OrderedDict()
+        self._num_bytes = 0
+        self._lock = threading.Lock()
+
+    @property
+    def num_bytes(self):
+        """int: The total size of the cached rows, in bytes."""
+        return self._num_bytes
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        """See :meth:`QueryCache.get`."""
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._entries[key] = entry  # Most recently used.
+            return entry
+
+    def set(self, key, entry):
+        """See :meth:`QueryCache.set`."""
+        with self._lock:
+            self._delete(key)
+            if entry["num_bytes"] > self.max_bytes:
+                return
+            while (
+                self._entries and self._num_bytes + entry["num_bytes"] > self.max_bytes
+            ):
+                _, evicted = self._entries.popitem(last=False)
+                self._num_bytes -= evicted["num_bytes"]
+            self._entries[key] = entry
+            self._num_bytes += entry["num_bytes"]
+
+    def delete(self, key):
+        """See :meth:`QueryCache.delete`."""
+        with self._lock:
+            self._delete(key)
+
+    def _delete(self, key):
+        """Remove an entry. The lock must be held."""
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._num_bytes -= entry["num_bytes"]
+
+    def clear(self):
+        """See :meth:`QueryCache.clear`."""
+        with self._lock:
+            self._entries.clear()
+            self._num_bytes = 0
+
+
+class DiskQueryCache(QueryCache):
+    """A cache of query results stored as JSON files in a directory.
+
+    The cache can be shared between processes. The least recently used
+    entries, according to the modification times of the files, are evicted
+    first.
+
+    Args:
+        directory (str): The directory of the cache. It is created if it
+            does not exist.
+        ttl (float): (Optional) See :class:`QueryCache`.
+        max_bytes (int): (Optional) See :class:`QueryCache`.
+        validate_tables (bool): (Optional) See :class:`QueryCache`.
+    """
+
+    _SUFFIX = ".json"
+
+    def __init__(
+        self, directory, ttl=None, max_bytes=_DEFAULT_MAX_BYTES, validate_tables=True
+    ):
+        super(DiskQueryCache, self).__init__(
+            ttl=ttl, max_bytes=max_bytes, validate_tables=validate_tables
+        )
+        self.directory = directory
+        if not os.path.isdir(directory):
+            os.makedirs(directory)
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + self._SUFFIX)
+
+    def _paths(self):
+        return [
+            os.path.join(self.directory, name)
+            for name in os.listdir(self.directory)
+            if name.endswith(self._SUFFIX)
+        ]
+
+    def get(self, key):
+        """See :meth:`QueryCache.get`."""
+        path = self._path(key)
+        try:
+            with open(path, "r") as entry_file:
+                entry = json.load(entry_file)
+            os.utime(path, None)  # Most recently used.
+        except (IOError, OSError, ValueError):
+            return None
+        return entry
+
+    def set(self, key, entry):
+        """See :meth:`QueryCache.set`."""
+        self.delete(key)
+        if entry["num_bytes"] > self.max_bytes:
+            return
+        self._evict(self.max_bytes - entry["num_bytes"])
+
+        # Write to a temporary file first so that readers never see a
+        # partially written entry.
+        fd, temp_path = tempfile.mkstemp(dir=self.directory)
+        with os.fdopen(fd, "w") as entry_file:
+            json.dump(entry, entry_file)
+        os.rename(temp_path, self._path(key))
+
+    def _evict(self, max_bytes):
+        """Remove the least recently used entries until at most
+        ``max_bytes`` bytes of files are left.
+        """
+        files = []
+        for path in self._paths():
+            try:
+                stat = os.stat(path)
+            except OSError:
+                continue
+            files.append((stat.st_mtime, stat.st_size, path))
+
+        total_bytes = sum(size for _, size, _ in files)
+        for _, size, path in sorted(files):
+            if total_bytes <= max_bytes:
+                break
+            self._remove(path)
+            total_bytes -= size
+
+    @staticmethod
+    def _remove(path):
+        try:
+            os.remove(path)
+        except OSError:
+            pass
+
+    def delete(self, key):
+        """See :meth:`QueryCache.delete`."""
+        self._remove(self._path(key))
+
+    def clear(self):
+        """See :meth:`QueryCache.clear`."""
+        for path in self._paths():
+            self._remove(path)
+
+
+class DryRunCache(object):
+    """An in-process, least recently used cache of dry-run query jobs.
+
+    Entries are keyed by the text, parameters and configuration of the
+    query, like the entries of a :class:`QueryCache`, and hold the job
+    resource returned by the dry run, with its statistics such as
+    ``totalBytesProcessed``. An entry is invalidated when the
+    ``lastModifiedTime`` of a table referenced by the query changes.
+
+    The modification times are shared by all entries, so queries reading
+    the same table check it with a single ``tables.get`` request. The
+    tables referenced by a query are checked concurrently. The cache is
+    safe to share between threads.
+
+    Args:
+        ttl (float):
+            (Optional) The time, in seconds, after which an entry expires.
+            Defaults to no expiry.
+        max_entries (int):
+            (Optional) The maximum number of cached dry runs. The least
+            recently used entries are evicted first. Defaults to 1000.
+        table_check_interval (float):
+            (Optional) How long, in seconds, the modification time of a
+            table is trusted after it was fetched. Defaults to 0, so that
+            each hit makes one ``tables.get`` request per referenced table.
+            These requests take about as long as the dry run itself, so
+            with the default a hit saves the dry-run job but not its
+            latency. Within a longer interval, hits are served without any
+            API request, and may miss changes made during the interval.
+    """
+
+    def __init__(
+        self, ttl=None, max_entries=_DEFAULT_MAX_DRY_RUNS, table_check_interval=0.0
+    ):
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self.table_check_interval = table_check_interval
+        self._entries = collections.OrderedDict()
+        self._tables = {}
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        """Remove all entries and known table modification times."""
+        with self._lock:
+            self._entries.clear()
+            self._tables.clear()
+
+    def invalidate_table(self, table):
+        """Remove the entries of the queries which reference a table.
+
+        Use this after modifying a table when ``table_check_interval`` is
+        set, so that the next dry run reading it is not served from the
+        cache.
+
+        Args:
+            table (Union[ \
+                :class:`~google.cloud.bigquery.table.Table`, \
+                :class:`~google.cloud.bigquery.table.TableReference`, \
+                str, \
+            ]):
+                The modified table, or a reference to it. A string must be
+                a fully-qualified table ID, ``project.dataset_id.table_id``.
+        """
+        if isinstance(table, six.string_types):
+            table = TableReference.from_string(table)
+        table_id = _table_id(table)
+        with self._lock:
+            self._tables.pop(table_id, None)
+            for key, entry in list(self._entries.items()):
+                if table_id in entry["tables"]:
+                    del self._entries[key]
+
+    def _fetch_modified(self, table_id, client, now):
+        """Fetch the modification time of a table, and remember it.
+
+        Args:
+            table_id (str): The fully-qualified ID of the table.
+            client (google.cloud.bigquery.client.Client):
+                The client used to fetch the table.
+            now (float): The time at which the check started.
+
+        Returns:
+            Optional[str]: The ``lastModifiedTime`` of the table.
+        """
+        table = client.get_table(TableReference.from_string(table_id))
+        modified = table._properties.get("lastModifiedTime")
+        with self._lock:
+            self._tables[table_id] = (modified, now)
+        return modified
+
+    def _tables_modified(self, table_ids, client):
+        """Get the modification times of tables.
+
+        The times which are not known, or older than
+        ``table_check_interval``, are fetched concurrently.
+
+        Args:
+            table_ids (Iterable[str]): The fully-qualified IDs of the tables.
+            client (google.cloud.bigquery.client.Client):
+                The client used to fetch the tables.
+
+        Returns:
+            Dict[str, Optional[str]]:
+                The ``lastModifiedTime`` of each table, by table ID.
+
+        Raises:
+            google.api_core.exceptions.GoogleAPICallError:
+                If a table cannot be fetched.
+        """
+        now = time.time()
+        modified = {}
+        stale = []
+        with self._lock:
+            for table_id in table_ids:
+                known = self._tables.get(table_id)
+                if known is not None and now - known[1] < self.table_check_interval:
+                    modified[table_id] = known[0]
+                else:
+                    stale.append(table_id)
+
+        if len(stale) == 1:
+            modified[stale[0]] = self._fetch_modified(stale[0], client, now)
+        elif stale:
+            with concurrent.futures.ThreadPoolExecutor(
+                max_workers=min(len(stale), _MAX_TABLE_CHECK_WORKERS)
+            ) as executor:
+                futures = [
+                    executor.submit(self._fetch_modified, table_id, client, now)
+                    for table_id in stale
+                ]
+                for table_id, future in zip(stale, futures):
+                    modified[table_id] = future.result()
+        return modified
+
+    def _lookup(self, key, client):
+        """Find a valid dry run for a query.
+
+        Expired entries, and entries for which a table referenced by the
+        query has been modified since or can no longer be fetched, are
+        removed.
+
+        Args:
+            key (str): The cache key of the query.
+            client (google.cloud.bigquery.client.Client):
+                The client used to check the referenced tables.
+
+        Returns:
+            Optional[dict]: The entry, or :data:`None` on a miss.
+        """
+        with self._lock:
+            entry = self._entries.pop(key, None)
+            if entry is not None:
+                self._entries[key] = entry  # Most recently used.
+        if entry is None:
+            return None
+
+        valid = self.ttl is None or time.time() - entry["created"] <= self.ttl
+        if valid:
+            try:
+                modified = self._tables_modified(entry["tables"], client)
+            except GoogleAPICallError:
+                modified = None
+            valid = modified == entry["tables"]
+
+        if not valid:
+            with self._lock:
+                self._entries.pop(key, None)
+            return None
+        return entry
+
+    def _store(self, key, query_job):
+        """Store a completed dry run.
+
+        The dry run is not stored if a table referenced by the query cannot
+        be fetched, such as a table read through an authorized view.
+
+        Args:
+            key (str): The cache key of the query.
+            query_job (google.cloud.bigquery.job.QueryJob):
+                The dry-run query job.
+        """
+        if query_job.error_result is not None:
+            return
+
+        table_ids = [_table_id(table_ref) for table_ref in query_job.referenced_tables]
+        try:
+            tables = self._tables_modified(table_ids, query_job._client)
+        except GoogleAPICallError:
+            return
+
+        entry = {
+            "created": time.time(),
+            "job": copy.deepcopy(query_job._properties),
+            "tables": tables,
+        }
+        with self._lock:
+            self._entries.pop(key, None)
+            self._entries[key] = entry
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+
+def _cached_row_iterator(client, entry, schema):
+    """Create a row iterator over the rows of a cache entry.
+
+    Args:
+        client (google.cloud.bigquery.client.Client): The API client.
+        entry (dict): The cache entry.
+        schema (Sequence[google.cloud.bigquery.schema.SchemaField]):
+            The schema of the rows.
+
+    Returns:
+        google.cloud.bigquery.table.RowIterator:
+            An iterator which does not make any API request.
+    """
+    rows = entry["rows"]
+    iterator = RowIterator(client, _CachedRowsRequest(rows), "", schema)
+    iterator._total_rows = len(rows)
+    return iterator
@@ -14,6 +14,15 @@
 
 """Schemas for BigQuery tables / queries."""
 
+import collections
+import threading
+
+from google.cloud.bigquery import _helpers
+
+
+_SCHEMA_CACHE_SIZE = 1000
+"""The maximum number of parsed schemas kept by :data:`_SCHEMA_CACHE`."""
+
 
 class SchemaField(object):
     """Describe a single field within a table schema.
@@ -164,6 +173,10 @@ class SchemaField(object):
 def _parse_schema_resource(info):
     """Parse a resource fragment into a schema field.
 
+    Parsed schemas are cached, so parsing the same schema again returns the
+    same (immutable) :class:`~google.cloud.bigquery.schema.SchemaField`
+    objects in a new list.
+
     Args:
         info: (Mapping[str->dict]): should contain a "fields" key to be parsed
 
@@ -174,17 +187,214 @@ def _parse_schema_resource(info):
     if "fields" not in info:
         return ()
 
+    return list(_SCHEMA_CACHE.from_resource(info["fields"]).fields)
+
+
+def _parse_schema_fields(resource):
+    """Parse the fields of a schema resource, without caching.
+
+    Args:
+        resource (Sequence[dict]): The "fields" of a schema resource.
+
+    Returns:
+        List[google.cloud.bigquery.schema.SchemaField]: The parsed fields.
+    """
     schema = []
-    for r_field in info["fields"]:
+    for r_field in resource:
         name = r_field["name"]
         field_type = r_field["type"]
         mode = r_field.get("mode", "NULLABLE")
         description = r_field.get("description")
-        sub_fields = _parse_schema_resource(r_field)
+        sub_fields = _parse_schema_fields(r_field.get("fields", ()))
         schema.append(SchemaField(name, field_type, mode, description, sub_fields))
     return schema
 
 
+def _compile_schema(fields):
+    """Get the cached, compiled form of a schema.
+
+    Args:
+        fields (Sequence[google.cloud.bigquery.schema.SchemaField]):
+            The schema.
+
+    Returns:
+        google.cloud.bigquery.schema._CompiledSchema:
+            The schema, with its field-to-index mapping and row converter.
+    """
+    return _SCHEMA_CACHE.from_fields(fields)
+
+
+def _resource_key(resource):
+    """Build a hashable key from the content of a schema resource.
+
+    The key holds the properties of each field which are used when parsing
+    it, so building it is cheaper than parsing the fields, and hashing it
+    hashes their content.
+
+    Args:
+        resource (Sequence[dict]): The "fields" of a schema resource.
+
+    Returns:
+        tuple: The cache key of the schema.
+    """
+    return tuple(
+        (
+            r_field["name"],
+            r_field["type"],
+            r_field.get("mode"),
+            r_field.get("description"),
+            _resource_key(r_field["fields"]) if "fields" in r_field else (),
+        )
+        for r_field in resource
+    )
+
+
+class _CompiledSchema(object):
+    """A parsed schema, with the helpers needed to convert its rows.
+
+    Entries are shared by every table, row iterator and query result with
+    the same schema, so they must not be modified.
+
+    Args:
+        fields (Sequence[google.cloud.bigquery.schema.SchemaField]):
+            The schema.
+    """
+
+    def __init__(self, fields):
+        self.fields = tuple(fields)
+        self.field_ids = tuple(map(id, self.fields))
+        self.field_to_index = _helpers._field_to_index_mapping(self.fields)
+        self._row_converter = None
+        self._row_class = None
+
+    @property
+    def row_converter(self):
+        """Callable[[dict], tuple]: Converts a JSON response row to a tuple
+        of native values.
+
+        Compiled on first use, as schemas parsed for table metadata are
+        often never used to convert rows.
+        """
+        if self._row_converter is None:
+            self._row_converter = _helpers._row_converter(self.fields)
+        return self._row_converter
+
+    @property
+    def row_class(self):
+        """type: The :class:`~google.cloud.bigquery.table.Row` subclass for
+        rows of this schema, with a property for each field.
+
+        Created on first use.
+        """
+        if self._row_class is None:
+            from google.cloud.bigquery.table import _make_row_class
+
+            self._row_class = _make_row_class(self.field_to_index)
+        return self._row_class
+
+
+class _SchemaCache(object):
+    """A least recently used cache of compiled schemas.
+
+    Schema resources are looked up by their content, so that a cached
+    schema is not parsed again. Lists of fields are looked up by the
+    identity of the fields, so that the fields of a cached schema passed
+    back by the caller, such as a table's schema passed to
+    :meth:`~google.cloud.bigquery.client.Client.list_rows`, share its entry.
+
+    Args:
+        max_size (int):
+            (Optional) The maximum number of schemas to keep. Defaults to
+            1000.
+    """
+
+    def __init__(self, max_size=_SCHEMA_CACHE_SIZE):
+        self._max_size = max_size
+        self._lock = threading.Lock()
+        self._entries = collections.OrderedDict()
+        # Entries hold references to their fields, so the IDs of the fields
+        # are not reused while the entry is cached.
+        self._keys_by_field_ids = {}
+
+    def __len__(self):
+        return len(self._entries)
+
+    def clear(self):
+        """Remove all entries from the cache."""
+        with self._lock:
+            self._entries.clear()
+            self._keys_by_field_ids.clear()
+
+    def from_resource(self, resource):
+        """Get the compiled schema for the fields of a schema resource.
+
+        Args:
+            resource (Sequence[dict]): The "fields" of a schema resource.
+
+        Returns:
+            google.cloud.bigquery.schema._CompiledSchema: The cache entry.
+        """
+        key = _resource_key(resource)
+        with self._lock:
+            entry = self._touch(key)
+        if entry is None:
+            entry = self._add(key, _CompiledSchema(_parse_schema_fields(resource)))
+        return entry
+
+    def from_fields(self, fields):
+        """Get the compiled schema for a list of fields.
+
+        Args:
+            fields (Sequence[google.cloud.bigquery.schema.SchemaField]):
+                The schema.
+
+        Returns:
+            google.cloud.bigquery.schema._CompiledSchema: The cache entry.
+        """
+        field_ids = tuple(map(id, fields))
+        with self._lock:
+            key = self._keys_by_field_ids.get(field_ids)
+            entry = None if key is None else self._touch(key)
+        if entry is None:
+            # Fields which are equal to, but not the same objects as, the
+            # fields of a cached schema get their own entry: comparing them
+            # would cost about as much as compiling them.
+            entry = self._add(field_ids, _CompiledSchema(fields))
+        return entry
+
+    def _touch(self, key):
+        """Look up an entry, marking it as the most recently used.
+
+        The caller must hold the lock.
+        """
+        entry = self._entries.pop(key, None)
+        if entry is not None:
+            self._entries[key] = entry
+        return entry
+
+    def _add(self, key, entry):
+        """Add an entry, evicting the least recently used ones if needed.
+
+        Returns:
+            google.cloud.bigquery.schema._CompiledSchema:
+                The cached entry, which is an existing one if another thread
+                added the same schema first.
+        """
+        with self._lock:
+            entry = self._entries.setdefault(key, entry)
+            self._keys_by_field_ids[entry.field_ids] = key
+            while len(self._entries) > self._max_size:
+                # Each entry holds its fields, so their ids are not reused
+                # by the fields of another entry while it is cached.
+                _, evicted = self._entries.popitem(last=False)
+                del self._keys_by_field_ids[evicted.field_ids]
+            return entry
+
+
+_SCHEMA_CACHE = _SchemaCache()
+"""Parsed schemas shared by all clients."""
+
+
 def _build_schema_resource(fields):
     """Generate a resource fragment for a schema.
 
@@ -16,9 +16,12 @@
 
 from __future__ import absolute_import
 
+import collections
+import concurrent.futures
 import copy
 import datetime
 import operator
+import threading
 import warnings
 
 import six
@@ -29,11 +32,14 @@ except ImportError:  # pragma: NO COVER
     pandas = None
 
 from google.api_core.page_iterator import HTTPIterator
+from google.api_core.page_iterator import Page
 
 import google.cloud._helpers
 from google.cloud.bigquery import _helpers
+from google.cloud.bigquery import _pandas_helpers
 from google.cloud.bigquery.schema import SchemaField
 from google.cloud.bigquery.schema import _build_schema_resource
+from google.cloud.bigquery.schema import _compile_schema
 from google.cloud.bigquery.schema import _parse_schema_resource
 from google.cloud.bigquery.external_config import ExternalConfig
 
@@ -43,7 +49,22 @@ _NO_PANDAS_ERROR = (
     "pandas to use the to_dataframe() function."
 )
 _TABLE_HAS_NO_SCHEMA = 'Table has no schema:  call "client.get_table()"'
+_PREFETCH_WITH_PAGE_TOKEN = (
+    "Prefetching pages uses row offsets and cannot be combined with a "
+    "page_token, use start_index instead."
+)
+_PARTITIONS_WITH_OFFSETS = (
+    "page_token, start_index and max_results cannot be combined with "
+    "partitions or partitions_modified_since."
+)
+_DEFAULT_MAX_PARTITION_WORKERS = 4
+_PARTITION_QUEUE_PAGES = 2
+"""The number of pages each partition is read ahead of the consumer."""
+_PARTITION_DONE = object()
 _MARKER = object()
+_MIN_BQSTORAGE_ROWS = 100000
+"""Results with fewer rows are downloaded with ``tabledata.list``, which
+avoids the overhead of creating a BigQuery Storage API read session."""
 
 
 def _reference_getter(table):
@@ -1152,6 +1173,35 @@ class Row(object):
         return "Row({}, {})".format(self._xxx_values, f2i)
 
 
+def _make_row_class(field_to_index):
+    """Create a :class:`Row` subclass for rows of one schema.
+
+    The subclass has a property for each field, so reading a field as an
+    attribute does not go through :meth:`Row.__getattr__`, which is only
+    called after the regular attribute lookup failed with an exception.
+    Fields named like a :class:`Row` method, such as ``keys``, are still
+    only available by key.
+
+    Args:
+        field_to_index (Dict[str, int]):
+            A mapping from schema field names to indexes
+
+    Returns:
+        type: A subclass of :class:`Row`, with no additional instance state.
+    """
+    namespace = {"__slots__": (), "__reduce__": _reduce_row}
+    for name, index in six.iteritems(field_to_index):
+        if hasattr(Row, name):
+            continue
+        namespace[name] = property(lambda row, index=index: row._xxx_values[index])
+    return type("Row", (Row,), namespace)
+
+
+def _reduce_row(row):
+    """Pickle rows of generated classes as plain :class:`Row` objects."""
+    return Row, (row._xxx_values, row._xxx_field_to_index)
+
+
 class RowIterator(HTTPIterator):
     """A class for iterating through HTTP/JSON API row list responses.
 
@@ -1166,6 +1216,25 @@ class RowIterator(HTTPIterator):
         page_size (int, optional): The number of items to return per page.
         extra_params (Dict[str, object]):
             Extra query string parameters for the API call.
+        prefetch_pages (int, optional):
+            If set, fetch up to this many pages concurrently, ahead of the
+            pages being consumed. After the first page, pages are requested
+            by row offset (``startIndex``) on a pool of threads and returned
+            in order. Cannot be combined with ``page_token``.
+        max_prefetch_rows (int, optional):
+            The maximum number of rows to request ahead of the page being
+            consumed when ``prefetch_pages`` is set. Limits the memory used
+            to buffer pages. At least one page is always prefetched.
+        table (Union[ \
+            google.cloud.bigquery.table.Table, \
+            google.cloud.bigquery.table.TableReference, \
+        ]):
+            (Optional) The table which the rows belong to. Required to
+            download the rows with the BigQuery Storage API in
+            :meth:`to_dataframe`.
+
+    Raises:
+        ValueError: If both ``prefetch_pages`` and ``page_token`` are set.
     """
 
     def __init__(
@@ -1178,7 +1247,13 @@ class RowIterator(HTTPIterator):
         max_results=None,
         page_size=None,
         extra_params=None,
+        prefetch_pages=None,
+        max_prefetch_rows=None,
+        table=None,
     ):
+        if prefetch_pages and page_token is not None:
+            raise ValueError(_PREFETCH_WITH_PAGE_TOKEN)
+
         super(RowIterator, self).__init__(
             client,
             api_request,
@@ -1192,9 +1267,84 @@ class RowIterator(HTTPIterator):
             next_token="pageToken",
         )
         self._schema = schema
-        self._field_to_index = _helpers._field_to_index_mapping(schema)
+        compiled_schema = _compile_schema(schema)
+        self._field_to_index = compiled_schema.field_to_index
+        self._row_converter = compiled_schema.row_converter
+        self._row_class = compiled_schema.row_class
         self._total_rows = None
         self._page_size = page_size
+        self._prefetch_pages = prefetch_pages
+        self._max_prefetch_rows = max_prefetch_rows
+        self._prefetcher = None
+        self._cache_writer = None
+        self._preserve_order = False
+        # The offset of the next page, if known, for the cache writer.
+        self._page_offset = None
+        if page_token is None:
+            self._page_offset = int(self.extra_params.get("startIndex", 0))
+        self._table = table
+
+    def _next_page(self):
+        """Get the next page in the iterator.
+
+        Returns:
+            Optional[google.api_core.page_iterator.Page]:
+                The next page in the iterator or :data:`None` if there are no
+                pages left.
+        """
+        if not self._prefetch_pages:
+            return super(RowIterator, self)._next_page()
+
+        if self.page_number == 0:
+            response = self._get_next_page_response()
+            self._prefetcher = self._make_prefetcher(response)
+        elif self._prefetcher is not None:
+            response = self._prefetcher.next_response()
+        else:
+            response = None
+
+        if response is None:
+            return None
+
+        page = Page(self, response.get(self._items_key, ()), self.item_to_value)
+        self._page_start(self, page, response)
+        return page
+
+    def _make_prefetcher(self, response):
+        """Start fetching the pages which follow the first page.
+
+        Args:
+            response (Dict[str, object]):
+                The parsed JSON response of the first page.
+
+        Returns:
+            Optional[google.cloud.bigquery.table._PagePrefetcher]:
+                The prefetcher for the remaining pages, or :data:`None` if
+                the first page was the only page.
+        """
+        rows = response.get(self._items_key, ())
+        total_rows = response.get("totalRows")
+        if not rows or response.get(self._next_token) is None:
+            return None
+        if total_rows is None:
+            # Without a row count the offsets of the pages are unknown, so
+            # continue with the page tokens instead.
+            self.next_page_token = response.get(self._next_token)
+            self._prefetch_pages = None
+            return None
+
+        first_index = int(self.extra_params.get("startIndex", 0))
+        start_index = first_index + len(rows)
+        stop_index = int(total_rows)
+        if self.max_results is not None:
+            stop_index = min(stop_index, first_index + self.max_results)
+
+        page_rows = self._page_size or len(rows)
+        window = self._prefetch_pages
+        if self._max_prefetch_rows is not None:
+            window = min(window, max(1, self._max_prefetch_rows // page_rows))
+
+        return _PagePrefetcher(self, start_index, stop_index, page_rows, window)
 
     def _get_next_page_response(self):
         """Requests the next page from the path provided.
@@ -1220,9 +1370,37 @@ class RowIterator(HTTPIterator):
         """int: The total number of rows in the table."""
         return self._total_rows
 
-    def to_dataframe(self):
+    def to_dataframe(self, dtypes=None, bqstorage_client=None):
         """Create a pandas DataFrame from the query results.
 
+        Each page of results is decoded directly into one array per column,
+        using the column's type from the schema, without creating a
+        :class:`~google.cloud.bigquery.table.Row` for every row. The arrays
+        are concatenated once all pages have been downloaded.
+
+        Args:
+            dtypes ( \
+                Map[str, Union[str, pandas.Series.dtype]] \
+            ):
+                (Optional) A dictionary of column names pandas ``dtype``\\ s.
+                The provided ``dtype`` is used when constructing the series
+                for the column specified. Otherwise, the ``dtype`` is chosen
+                from the BigQuery column type.
+            bqstorage_client ( \
+                google.cloud.bigquery_storage_v1beta1.BigQueryStorageClient \
+            ):
+                (Optional) A BigQuery Storage API client. If set, and the
+                iterator covers a whole table of at least 100,000 rows, the
+                rows are downloaded by reading all streams of a read session
+                in parallel, which is much faster than ``tabledata.list``
+                for large results. Otherwise, this argument is ignored.
+                The rows of a query with an ``ORDER BY`` clause are read
+                from a single stream, to keep their order.
+
+                The Storage API client requires the
+                ``google-cloud-bigquery-storage`` library, with its
+                ``fastavro`` and ``pandas`` extras.
+
         Returns:
             pandas.DataFrame:
                 A :class:`~pandas.DataFrame` populated with row data and column
@@ -1236,11 +1414,354 @@ class RowIterator(HTTPIterator):
         if pandas is None:
             raise ValueError(_NO_PANDAS_ERROR)
 
-        column_headers = [field.name for field in self.schema]
-        # Use generator, rather than pulling the whole rowset into memory.
-        rows = (row.values() for row in iter(self))
+        if self._use_bqstorage(bqstorage_client):
+            return self._to_dataframe_bqstorage(bqstorage_client, dtypes)
+
+        column_chunks = []
+        for page in self.pages:
+            column_chunks.append(
+                _pandas_helpers.rows_to_columns(page._rows, self._schema)
+            )
+
+        return _pandas_helpers.columns_to_dataframe(
+            column_chunks, self._schema, dtypes=dtypes
+        )
+
+    def _use_bqstorage(self, bqstorage_client):
+        """Whether to download the rows with the BigQuery Storage API.
+
+        The Storage API reads whole tables, so it is only used when the
+        iterator has not started and covers all rows of a known table, and
+        when the table is not known to be small.
+        """
+        if bqstorage_client is None or self._table is None or self._started:
+            return False
+        if self.next_page_token is not None or self.max_results is not None:
+            return False
+        if "startIndex" in self.extra_params:
+            return False
+
+        num_rows = getattr(self._table, "num_rows", None)
+        return num_rows is None or num_rows >= _MIN_BQSTORAGE_ROWS
+
+    def _to_dataframe_bqstorage(self, bqstorage_client, dtypes):
+        """Download the rows with the BigQuery Storage API.
+
+        All streams of the read session are read in parallel, unless the
+        order of the rows must be preserved, in which case the session has
+        a single stream.
+        """
+        table = self._table
+        columns = [field.name for field in self._schema]
+        session_kwargs = {"read_options": {"selected_fields": columns}}
+        if self._preserve_order:
+            # Streams are merged in the order their blocks arrive.
+            session_kwargs["requested_streams"] = 1
+        read_session = bqstorage_client.create_read_session(
+            {
+                "project_id": table.project,
+                "dataset_id": table.dataset_id,
+                "table_id": table.table_id,
+            },
+            "projects/{}".format(self.client.project),
+            **session_kwargs
+        )
+        dataframe = bqstorage_client.read_streams(read_session).to_dataframe()
+        dataframe = dataframe.reset_index(drop=True)
+
+        dataframe = dataframe.reindex(columns=columns)
+        for name, dtype in (dtypes or {}).items():
+            # Like the REST download, ignore columns not in the result.
+            if name in dataframe.columns:
+                dataframe[name] = dataframe[name].astype(dtype)
+        return dataframe
+
+
+class _PagePrefetcher(object):
+    """Fetch pages of ``tabledata.list`` rows concurrently by row offset.
+
+    At most ``window`` pages are in flight or waiting to be consumed at any
+    time. Pages are returned in order, regardless of the order in which the
+    requests complete.
+
+    Args:
+        iterator (google.cloud.bigquery.table.RowIterator):
+            The iterator to fetch pages for. Its ``api_request``, ``path``
+            and ``extra_params`` are used to make the requests.
+        start_index (int): The offset of the first row to fetch.
+        stop_index (int): The offset after the last row to fetch.
+        page_rows (int): The number of rows to request per page.
+        window (int): The maximum number of pages to fetch ahead.
+    """
+
+    def __init__(self, iterator, start_index, stop_index, page_rows, window):
+        self._iterator = iterator
+        self._stop_index = stop_index
+        self._page_rows = page_rows
+        self._starts = iter(six.moves.range(start_index, stop_index, page_rows))
+        self._executor = concurrent.futures.ThreadPoolExecutor(max_workers=window)
+        self._futures = collections.deque()
+        for _ in six.moves.range(window):
+            self._submit_next()
+
+    def _submit_next(self):
+        """Start fetching the next page, if there are any pages left."""
+        start = next(self._starts, None)
+        if start is None:
+            return
+        count = min(self._page_rows, self._stop_index - start)
+        self._futures.append(self._executor.submit(self._fetch_rows, start, count))
+
+    def _fetch_rows(self, start, count):
+        """Fetch a range of rows as a single page.
+
+        The API may return fewer rows than requested when a page would
+        exceed the maximum response size, so keep requesting the remaining
+        rows until the range is complete.
+
+        Args:
+            start (int): The offset of the first row to fetch.
+            count (int): The number of rows to fetch.
+
+        Returns:
+            Dict[str, object]:
+                The parsed JSON response, with the ``rows`` of all the
+                responses for the range.
+        """
+        rows = []
+        while True:
+            params = dict(self._iterator.extra_params)
+            params["startIndex"] = start + len(rows)
+            params["maxResults"] = count - len(rows)
+            response = self._iterator.api_request(
+                method="GET", path=self._iterator.path, query_params=params
+            )
+            page_rows = response.get("rows", ())
+            rows.extend(page_rows)
+            if not page_rows or len(rows) >= count:
+                break
+
+        response = dict(response)
+        response["rows"] = rows
+        return response
+
+    def next_response(self):
+        """Wait for the next page in order.
+
+        Returns:
+            Optional[Dict[str, object]]:
+                The parsed JSON response of the next page, or :data:`None`
+                if there are no pages left.
+
+        Raises:
+            Exception: Any error raised while fetching the page.
+        """
+        if not self._futures:
+            self._executor.shutdown(wait=False)
+            return None
+        future = self._futures.popleft()
+        try:
+            response = future.result()
+        except Exception:
+            for pending in self._futures:
+                pending.cancel()
+            self._futures.clear()
+            self._executor.shutdown(wait=False)
+            raise
+        self._submit_next()
+        return response
+
+
+class PartitionRowIterator(object):
+    """Iterate over the rows of several partitions of a table.
+
+    The partitions are read concurrently, each through its own
+    ``table$partition_id`` decorator, and their rows are returned in the
+    order of the partitions.
+
+    Args:
+        iterators (Sequence[google.cloud.bigquery.table.RowIterator]):
+            One iterator over the rows of each partition.
+        partition_ids (Sequence[str]):
+            The IDs of the partitions, in the order of ``iterators``.
+        schema (Sequence[google.cloud.bigquery.schema.SchemaField]):
+            The schema of the rows.
+        high_water_mark (int):
+            (Optional) The latest modification time of the read
+            partitions, in milliseconds since the epoch.
+        max_workers (int):
+            (Optional) The maximum number of partitions to read
+            concurrently. Defaults to 4.
+    """
+
+    def __init__(
+        self,
+        iterators,
+        partition_ids,
+        schema,
+        high_water_mark=None,
+        max_workers=_DEFAULT_MAX_PARTITION_WORKERS,
+    ):
+        self._iterators = iterators
+        self._partition_ids = list(partition_ids)
+        self._schema = schema
+        compiled_schema = _compile_schema(schema)
+        self._field_to_index = compiled_schema.field_to_index
+        self._row_converter = compiled_schema.row_converter
+        self._row_class = compiled_schema.row_class
+        self._high_water_mark = high_water_mark
+        self._max_workers = max_workers
+        self._total_rows = None
+        self._started = False
+
+    @property
+    def schema(self):
+        """List[google.cloud.bigquery.schema.SchemaField]: Table's schema."""
+        return list(self._schema)
+
+    @property
+    def partition_ids(self):
+        """List[str]: The IDs of the read partitions."""
+        return list(self._partition_ids)
+
+    @property
+    def high_water_mark(self):
+        """Optional[int]: Latest modification time of the read partitions.
+
+        The time is in milliseconds since the epoch. Pass it as
+        ``partitions_modified_since`` to
+        :meth:`~google.cloud.bigquery.client.Client.list_rows` to read only
+        the partitions modified after this read.
+        """
+        return self._high_water_mark
+
+    @property
+    def total_rows(self):
+        """int: The total number of rows in the partitions, once read."""
+        return self._total_rows
+
+    @staticmethod
+    def _read_partition(iterator, pages, stopped):
+        """Read the pages of a partition into a bounded queue.
+
+        Args:
+            iterator (google.cloud.bigquery.table.RowIterator):
+                The iterator over the rows of the partition.
+            pages (queue.Queue):
+                The queue receiving the JSON rows of each page, followed
+                by ``_PARTITION_DONE``.
+            stopped (threading.Event):
+                Set once the consumer has stopped reading the pages.
+
+        Returns:
+            int: The number of rows in the partition.
+        """
+
+        def put(item):
+            # Give up once the consumer has stopped consuming.
+            while not stopped.is_set():
+                try:
+                    pages.put(item, timeout=0.1)
+                    return
+                except six.moves.queue.Full:
+                    pass
+
+        try:
+            for page in iterator.pages:
+                if stopped.is_set():
+                    break
+                put(page._rows)
+        finally:
+            put(_PARTITION_DONE)
+        return iterator.total_rows or 0
+
+    def _partition_pages(self):
+        """Read the partitions concurrently and yield their pages in order.
+
+        At most ``max_workers`` partitions are read at a time, each at most
+        ``_PARTITION_QUEUE_PAGES`` pages ahead of the consumer.
+
+        Yields:
+            List[Dict[str, object]]: The JSON rows of a page.
+
+        Raises:
+            ValueError: If the rows have already been read.
+        """
+        if self._started:
+            raise ValueError("Iterator has already started.")
+        self._started = True
+
+        total_rows = 0
+        stopped = threading.Event()
+        iterators = iter(self._iterators)
+        readers = collections.deque()
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=max(1, self._max_workers)
+        )
+
+        def submit_next():
+            iterator = next(iterators, None)
+            if iterator is not None:
+                pages = six.moves.queue.Queue(maxsize=_PARTITION_QUEUE_PAGES)
+                future = executor.submit(
+                    self._read_partition, iterator, pages, stopped
+                )
+                readers.append((future, pages))
+
+        try:
+            for _ in six.moves.range(max(1, self._max_workers)):
+                submit_next()
+            while readers:
+                future, pages = readers.popleft()
+                rows = pages.get()
+                while rows is not _PARTITION_DONE:
+                    yield rows
+                    rows = pages.get()
+                # Raise any error reading the partition.
+                total_rows += future.result()
+                submit_next()
+        finally:
+            stopped.set()
+            for future, _ in readers:
+                future.cancel()
+            executor.shutdown(wait=True)
+        self._total_rows = total_rows
+
+    def __iter__(self):
+        for rows in self._partition_pages():
+            for resource in rows:
+                yield self._row_class(
+                    self._row_converter(resource), self._field_to_index
+                )
+
+    def to_dataframe(self, dtypes=None):
+        """Create a pandas DataFrame from the rows of the partitions.
+
+        Args:
+            dtypes ( \
+                Map[str, Union[str, pandas.Series.dtype]] \
+            ):
+                (Optional) A dictionary of column names pandas ``dtype``\\ s.
+                See :meth:`RowIterator.to_dataframe`.
+
+        Returns:
+            pandas.DataFrame:
+                A :class:`~pandas.DataFrame` populated with the rows of all
+                the partitions, in order.
+
+        Raises:
+            ValueError: If the :mod:`pandas` library cannot be imported.
+        """
+        if pandas is None:
+            raise ValueError(_NO_PANDAS_ERROR)
+
+        column_chunks = []
+        for rows in self._partition_pages():
+            column_chunks.append(_pandas_helpers.rows_to_columns(rows, self._schema))
 
-        return pandas.DataFrame(rows, columns=column_headers)
+        return _pandas_helpers.columns_to_dataframe(
+            column_chunks, self._schema, dtypes=dtypes
+        )
 
 
 class _EmptyRowIterator(object):
@@ -1255,7 +1776,19 @@ class _EmptyRowIterator(object):
     pages = ()
     total_rows = 0
 
-    def to_dataframe(self):
+    def to_dataframe(self, dtypes=None, bqstorage_client=None):
+        """Create an empty dataframe.
+
+        Args:
+            dtypes (Any):
+                Ignored. Added for compatibility with RowIterator.
+            bqstorage_client (Any):
+                Ignored. Added for compatibility with RowIterator.
+
+        Returns:
+            pandas.DataFrame:
+                An empty :class:`~pandas.DataFrame`.
+        """
         if pandas is None:
             raise ValueError(_NO_PANDAS_ERROR)
         return pandas.DataFrame()
@@ -1418,9 +1951,9 @@ def _item_to_row(iterator, resource):
 
     .. note::
 
-        This assumes that the ``schema`` attribute has been
-        added to the iterator after being created, which
-        should be done by the caller.
+        This assumes that the ``_row_converter`` and ``_row_class``
+        compiled from the ``schema`` have been added to the iterator after
+        being created, which should be done by the caller.
 
     :type iterator: :class:`~google.api_core.page_iterator.Iterator`
     :param iterator: The iterator that is currently in use.
@@ -1431,9 +1964,8 @@ def _item_to_row(iterator, resource):
     :rtype: :class:`~google.cloud.bigquery.table.Row`
     :returns: The next row in the page.
     """
-    return Row(
-        _helpers._row_tuple_from_json(resource, iterator.schema),
-        iterator._field_to_index,
+    return iterator._row_class(
+        iterator._row_converter(resource), iterator._field_to_index
     )
 
 
@@ -1454,6 +1986,13 @@ def _rows_page_start(iterator, page, response):
     if total_rows is not None:
         total_rows = int(total_rows)
     iterator._total_rows = total_rows
+    # Keep a reference to the raw rows so that they can be decoded a column
+    # at a time by :meth:`RowIterator.to_dataframe`.
+    page._rows = response.get("rows", ())
+    if iterator._cache_writer is not None:
+        iterator._cache_writer.add_page(response, iterator._page_offset)
+    if iterator._page_offset is not None:
+        iterator._page_offset += len(page._rows)
 
 
 # pylint: enable=unused-argument
@@ -34,6 +34,8 @@ dependencies = [
     'google-resumable-media >= 0.3.1',
 ]
 extras = {
+    'aiohttp: python_version >= "3.5"': 'aiohttp >= 3.0.0, < 4.0.0dev',
+    'bqstorage': 'google-cloud-bigquery-storage[pandas,fastavro] >= 0.1.0, < 2.0.0dev',
     'pandas': 'pandas>=0.17.1',
     # Exclude PyArrow dependency from Windows Python 2.7.
     'pyarrow: platform_system != "Windows" or python_version >= "3.4"':
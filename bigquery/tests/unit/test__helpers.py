@@ -525,6 +525,74 @@ class Test_row_tuple_from_json(unittest.TestCase):
         )
 
 
+class Test_row_converter(Test_row_tuple_from_json):
+    def _call_fut(self, row, schema):
+        from google.cloud.bigquery._helpers import _row_converter
+
+        return _row_converter(schema)(row)
+
+    def test_w_nullable_scalar_columns(self):
+        import pytz
+
+        schema = [
+            _Field("NULLABLE", "int_col", "INTEGER"),
+            _Field("NULLABLE", "bool_col", "BOOLEAN"),
+            _Field("NULLABLE", "ts_col", "TIMESTAMP"),
+            _Field("NULLABLE", "str_col", "STRING"),
+        ]
+        row = {"f": [{"v": "1"}, {"v": "true"}, {"v": "0.5"}, {"v": "a"}]}
+        null_row = {"f": [{"v": None}, {"v": None}, {"v": None}, {"v": None}]}
+        convert = self._make_converter(schema)
+        epoch = datetime.datetime(1970, 1, 1, tzinfo=pytz.utc)
+
+        self.assertEqual(
+            convert(row),
+            (1, True, epoch + datetime.timedelta(microseconds=500000), "a"),
+        )
+        self.assertEqual(convert(null_row), (None, None, None, None))
+
+    def test_w_all_scalar_types(self):
+        from google.cloud.bigquery._helpers import _row_tuple_from_json
+
+        values = {
+            "FLOAT": "1.25",
+            "NUMERIC": "1.25",
+            "BYTES": "AQI=",
+            "DATETIME": "2016-12-05T12:34:56.789",
+            "DATE": "2016-12-05",
+            "TIME": "12:34:56",
+        }
+        schema = [
+            _Field("NULLABLE", field_type.lower(), field_type)
+            for field_type in sorted(values)
+        ]
+        row = {"f": [{"v": values[field.field_type]} for field in schema]}
+
+        self.assertEqual(
+            self._make_converter(schema)(row), _row_tuple_from_json(row, schema)
+        )
+
+    def test_w_required_null_value(self):
+        col = _Field("REQUIRED", "col", "INTEGER")
+        with self.assertRaises(TypeError):
+            self._call_fut({"f": [{"v": None}]}, schema=[col])
+
+    def test_w_repeated_strings(self):
+        col = _Field("REPEATED", "col", "STRING")
+        row = {"f": [{"v": [{"v": "a"}, {"v": "b"}]}]}
+        self.assertEqual(self._call_fut(row, schema=[col]), (["a", "b"],))
+
+    def test_w_nullable_null_struct(self):
+        sub_1 = _Field("REQUIRED", "sub_1", "INTEGER")
+        col = _Field("NULLABLE", "col", "RECORD", fields=[sub_1])
+        self.assertEqual(self._call_fut({"f": [{"v": None}]}, schema=[col]), (None,))
+
+    def _make_converter(self, schema):
+        from google.cloud.bigquery._helpers import _row_converter
+
+        return _row_converter(schema)
+
+
 class Test_rows_from_json(unittest.TestCase):
     def _call_fut(self, rows, schema):
         from google.cloud.bigquery._helpers import _rows_from_json
@@ -0,0 +1,192 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import datetime
+import decimal
+import unittest
+
+import mock
+
+try:
+    import pandas
+except (ImportError, AttributeError):  # pragma: NO COVER
+    pandas = None
+
+from google.cloud.bigquery.schema import SchemaField
+
+
+@unittest.skipIf(pandas is None, "Requires `pandas`")
+class Test_column_from_json(unittest.TestCase):
+    def _call_fut(self, values, field):
+        from google.cloud.bigquery._pandas_helpers import _column_from_json
+
+        return _column_from_json(values, field)
+
+    def test_int(self):
+        array = self._call_fut(
+            ["1", "-2", "9007199254740993"], SchemaField("x", "INT64")
+        )
+        self.assertEqual(array.dtype.name, "int64")
+        self.assertEqual(list(array), [1, -2, 9007199254740993])
+
+    def test_int_w_nulls(self):
+        array = self._call_fut(["1", None], SchemaField("x", "INTEGER"))
+        self.assertEqual(array.dtype.name, "float64")
+        self.assertEqual(array[0], 1.0)
+        self.assertTrue(pandas.isnull(array[1]))
+
+    def test_float(self):
+        array = self._call_fut(
+            ["1.5", "NaN", "Infinity", "-Infinity", None], SchemaField("x", "FLOAT")
+        )
+        self.assertEqual(array.dtype.name, "float64")
+        self.assertEqual(array[0], 1.5)
+        self.assertTrue(pandas.isnull(array[1]))
+        self.assertEqual(array[2], float("inf"))
+        self.assertEqual(array[3], float("-inf"))
+        self.assertTrue(pandas.isnull(array[4]))
+
+    def test_bool(self):
+        array = self._call_fut(["true", "false", "1"], SchemaField("x", "BOOL"))
+        self.assertEqual(array.dtype.name, "bool")
+        self.assertEqual(list(array), [True, False, True])
+
+    def test_bool_w_nulls(self):
+        array = self._call_fut(["true", None], SchemaField("x", "BOOLEAN"))
+        self.assertEqual(array.dtype.name, "object")
+        self.assertEqual(list(array), [True, None])
+
+    def test_timestamp(self):
+        array = self._call_fut(["1.4338368E9", None], SchemaField("x", "TIMESTAMP"))
+        self.assertEqual(array[0], 1.4338368e15)
+        self.assertTrue(pandas.isnull(array[1]))
+
+    def test_string(self):
+        array = self._call_fut(["a", None], SchemaField("x", "STRING"))
+        self.assertEqual(array.dtype.name, "object")
+        self.assertEqual(list(array), ["a", None])
+
+    def test_numeric(self):
+        array = self._call_fut(["1.25"], SchemaField("x", "NUMERIC"))
+        self.assertEqual(list(array), [decimal.Decimal("1.25")])
+
+    def test_date(self):
+        array = self._call_fut(["1999-12-01"], SchemaField("x", "DATE"))
+        self.assertEqual(list(array), [datetime.date(1999, 12, 1)])
+
+    def test_repeated(self):
+        values = [[{"v": "1"}, {"v": "2"}], []]
+        array = self._call_fut(values, SchemaField("x", "INT64", mode="REPEATED"))
+        self.assertEqual(array.dtype.name, "object")
+        self.assertEqual(list(array), [[1, 2], []])
+
+
+@unittest.skipIf(pandas is None, "Requires `pandas`")
+class Test_columns_to_dataframe(unittest.TestCase):
+    def _call_fut(self, column_chunks, schema, dtypes=None):
+        from google.cloud.bigquery._pandas_helpers import columns_to_dataframe
+
+        return columns_to_dataframe(column_chunks, schema, dtypes=dtypes)
+
+    def _rows_to_columns(self, rows, schema):
+        from google.cloud.bigquery._pandas_helpers import rows_to_columns
+
+        return rows_to_columns(rows, schema)
+
+    def test_empty(self):
+        schema = [SchemaField("ts", "TIMESTAMP"), SchemaField("n", "INT64")]
+        df = self._call_fut([], schema)
+        self.assertEqual(len(df), 0)
+        self.assertEqual(list(df), ["ts", "n"])
+
+    def test_timestamps_across_pages(self):
+        schema = [SchemaField("ts", "TIMESTAMP")]
+        chunks = [
+            self._rows_to_columns([{"f": [{"v": "0.000001"}]}], schema),
+            self._rows_to_columns([{"f": [{"v": None}]}], schema),
+        ]
+        df = self._call_fut(chunks, schema)
+        self.assertEqual(df.ts.dtype.name, "datetime64[ns, UTC]")
+        self.assertEqual(
+            df.ts[0], pandas.Timestamp("1970-01-01T00:00:00.000001", tz="UTC")
+        )
+        self.assertTrue(pandas.isnull(df.ts[1]))
+
+    def test_w_dtypes(self):
+        schema = [SchemaField("n", "INT64"), SchemaField("f", "FLOAT64")]
+        chunks = [self._rows_to_columns([{"f": [{"v": "7"}, {"v": "0.5"}]}], schema)]
+        df = self._call_fut(chunks, schema, dtypes={"n": "int8"})
+        self.assertEqual(df.n.dtype.name, "int8")
+        self.assertEqual(df.f.dtype.name, "float64")
+
+
+@unittest.skipIf(pandas is None, "Requires `pandas`")
+class Test_dataframe_to_rows(unittest.TestCase):
+    def _call_fut(self, dataframe):
+        from google.cloud.bigquery._pandas_helpers import dataframe_to_rows
+
+        return list(dataframe_to_rows(dataframe))
+
+    def test_native_values(self):
+        dataframe = pandas.DataFrame(
+            {
+                "int_col": [1, 2],
+                "float_col": [1.5, float("nan")],
+                "ts_col": [pandas.Timestamp("2018-01-01", tz="UTC"), pandas.NaT],
+                "str_col": ["a", None],
+            },
+            columns=["int_col", "float_col", "ts_col", "str_col"],
+        )
+
+        rows = self._call_fut(dataframe)
+
+        self.assertEqual(
+            rows,
+            [
+                {
+                    "int_col": 1,
+                    "float_col": 1.5,
+                    "ts_col": pandas.Timestamp("2018-01-01", tz="UTC"),
+                    "str_col": "a",
+                },
+                {"int_col": 2, "float_col": None, "ts_col": None, "str_col": None},
+            ],
+        )
+        self.assertIs(type(rows[0]["int_col"]), int)
+
+    def test_numpy_scalars_in_object_column(self):
+        import numpy
+
+        values = pandas.Series([numpy.int64(3), numpy.float64(0.5)], dtype=object)
+        dataframe = pandas.DataFrame({"obj_col": values})
+
+        rows = self._call_fut(dataframe)
+
+        self.assertEqual(rows, [{"obj_col": 3}, {"obj_col": 0.5}])
+        self.assertIs(type(rows[0]["obj_col"]), int)
+        self.assertIs(type(rows[1]["obj_col"]), float)
+
+
+@unittest.skipIf(pandas is None, "Requires `pandas`")
+class Test_dataframe_to_parquet(unittest.TestCase):
+    def test_wo_pyarrow(self):
+        import io
+
+        from google.cloud.bigquery import _pandas_helpers
+
+        dataframe = pandas.DataFrame({"int_col": [1, 2]})
+
+        with mock.patch.object(_pandas_helpers, "pyarrow", new=None):
+            with self.assertRaises(ImportError):
+                _pandas_helpers.dataframe_to_parquet(dataframe, io.BytesIO(), 1)
@@ -0,0 +1,855 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import mock
+import pytest
+
+# The asyncio client requires Python 3.5 or later.
+asyncio = pytest.importorskip("asyncio")
+
+
+def _resolved(value):
+    future = asyncio.Future()
+    future.set_result(value)
+    return future
+
+
+def _failed(exc):
+    future = asyncio.Future()
+    future.set_exception(exc)
+    return future
+
+
+def _make_credentials():
+    import google.auth.credentials
+
+    return mock.Mock(spec=google.auth.credentials.Credentials)
+
+
+class _EventLoopTestCase(unittest.TestCase):
+    def setUp(self):
+        self._loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(self._loop)
+
+    def tearDown(self):
+        asyncio.set_event_loop(None)
+        self._loop.close()
+
+    def _run(self, awaitable):
+        return self._loop.run_until_complete(awaitable)
+
+
+class _Connection(object):
+    """Fake ``AsyncConnection`` which returns canned responses."""
+
+    def __init__(self, *responses):
+        self._responses = list(responses)
+        self.requests = []
+        self.closed = False
+
+    def api_request(self, **kwargs):
+        self.requests.append(kwargs)
+        response = self._responses.pop(0)
+        if isinstance(response, Exception):
+            return _failed(response)
+        return _resolved(response)
+
+    def close(self):
+        self.closed = True
+        return _resolved(None)
+
+
+class _Response(object):
+    """Fake ``aiohttp.ClientResponse``."""
+
+    def __init__(self, status, content):
+        self.status = status
+        self._content = content
+
+    def text(self):
+        return _resolved(self._content)
+
+    def __aenter__(self):
+        return _resolved(self)
+
+    def __aexit__(self, exc_type, exc_value, traceback):
+        return _resolved(None)
+
+
+class TestAsyncClient(_EventLoopTestCase):
+    PROJECT = "prahj-ekt"
+    DS_ID = "dataset_name"
+    TABLE_ID = "table_name"
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.bigquery.aio import AsyncClient
+
+        return AsyncClient
+
+    def _make_one(self, *responses, **kw):
+        from google.cloud.bigquery.client import Client
+
+        credentials = _make_credentials()
+        sync_client = Client(project=self.PROJECT, credentials=credentials, **kw)
+        client = self._get_target_class()(client=sync_client)
+        client._connection = _Connection(*responses)
+        return client
+
+    def _table_path(self):
+        return "/projects/%s/datasets/%s/tables/%s" % (
+            self.PROJECT,
+            self.DS_ID,
+            self.TABLE_ID,
+        )
+
+    def _table_resource(self):
+        return {
+            "tableReference": {
+                "projectId": self.PROJECT,
+                "datasetId": self.DS_ID,
+                "tableId": self.TABLE_ID,
+            },
+            "schema": {
+                "fields": [
+                    {"name": "full_name", "type": "STRING", "mode": "REQUIRED"},
+                    {"name": "age", "type": "INTEGER", "mode": "NULLABLE"},
+                ]
+            },
+        }
+
+    def _make_table(self):
+        from google.cloud.bigquery.table import Table
+
+        return Table.from_api_repr(self._table_resource())
+
+    def test_ctor_wo_client(self):
+        from google.cloud.bigquery.aio import AsyncConnection
+
+        credentials = _make_credentials()
+        client = self._get_target_class()(
+            project=self.PROJECT, credentials=credentials, location="EU"
+        )
+        self.assertEqual(client.project, self.PROJECT)
+        self.assertEqual(client.location, "EU")
+        self.assertIsInstance(client._connection, AsyncConnection)
+
+    def test_close_w_context_manager(self):
+        client = self._make_one()
+        connection = client._connection
+
+        self.assertIs(self._run(client.__aenter__()), client)
+        self._run(client.__aexit__(None, None, None))
+
+        self.assertTrue(connection.closed)
+
+    def test_get_table(self):
+        from google.cloud.bigquery.table import Table
+
+        client = self._make_one(self._table_resource())
+        table_id = "%s.%s.%s" % (self.PROJECT, self.DS_ID, self.TABLE_ID)
+
+        table = self._run(client.get_table(table_id))
+
+        self.assertIsInstance(table, Table)
+        self.assertEqual(table.table_id, self.TABLE_ID)
+        self.assertEqual([field.name for field in table.schema], ["full_name", "age"])
+        request = client._connection.requests[0]
+        self.assertEqual(request["method"], "GET")
+        self.assertEqual(request["path"], self._table_path())
+
+    def test_get_table_retries_transient_error(self):
+        from google.api_core import exceptions
+        from google.cloud.bigquery.retry import DEFAULT_RETRY
+
+        client = self._make_one(
+            exceptions.InternalServerError("try again"), self._table_resource()
+        )
+        retry = DEFAULT_RETRY.with_delay(initial=0.0, maximum=0.0, multiplier=1.0)
+        table_id = "%s.%s.%s" % (self.PROJECT, self.DS_ID, self.TABLE_ID)
+
+        table = self._run(client.get_table(table_id, retry=retry))
+
+        self.assertEqual(table.table_id, self.TABLE_ID)
+        self.assertEqual(len(client._connection.requests), 2)
+
+    def test_get_table_w_table_reference_wo_retry(self):
+        from google.api_core import exceptions
+        from google.cloud.bigquery.table import TableReference
+
+        client = self._make_one(exceptions.InternalServerError("try again"))
+        table_ref = TableReference.from_string(
+            "%s.%s.%s" % (self.PROJECT, self.DS_ID, self.TABLE_ID)
+        )
+
+        with self.assertRaises(exceptions.InternalServerError):
+            self._run(client.get_table(table_ref, retry=None))
+
+        (request,) = client._connection.requests
+        self.assertEqual(request["path"], self._table_path())
+
+    def test_get_table_does_not_retry_permanent_error(self):
+        from google.api_core import exceptions
+
+        client = self._make_one(exceptions.NotFound("missing"))
+        table_id = "%s.%s.%s" % (self.PROJECT, self.DS_ID, self.TABLE_ID)
+
+        with self.assertRaises(exceptions.NotFound):
+            self._run(client.get_table(table_id))
+
+        self.assertEqual(len(client._connection.requests), 1)
+
+    def test_query_and_result(self):
+        from google.cloud.bigquery.aio import AsyncQueryJob
+        from google.cloud.bigquery.job import QueryJobConfig
+
+        job_resource = {
+            "jobReference": {
+                "projectId": self.PROJECT,
+                "jobId": "JOB_ID",
+                "location": "EU",
+            },
+            "configuration": {"query": {"query": "SELECT 1"}},
+            "status": {"state": "RUNNING"},
+        }
+        done_resource = dict(job_resource, status={"state": "DONE"})
+        done_resource["configuration"] = {
+            "query": {
+                "query": "SELECT 1",
+                "destinationTable": {
+                    "projectId": self.PROJECT,
+                    "datasetId": "_temp",
+                    "tableId": "anon",
+                },
+            }
+        }
+        query_resource = {
+            "jobReference": {"projectId": self.PROJECT, "jobId": "JOB_ID"},
+            "jobComplete": True,
+            "totalRows": "2",
+            "schema": self._table_resource()["schema"],
+        }
+        rows_resource = {
+            "totalRows": "2",
+            "rows": [
+                {"f": [{"v": "Phred Phlyntstone"}, {"v": "32"}]},
+                {"f": [{"v": "Bharney Rhubble"}, {"v": "33"}]},
+            ],
+        }
+        client = self._make_one(
+            job_resource,
+            query_resource,
+            done_resource,
+            rows_resource,
+            location="EU",
+            default_query_job_config=QueryJobConfig(use_legacy_sql=False),
+        )
+
+        async_job = self._run(client.query("SELECT 1", job_id="JOB_ID"))
+
+        self.assertIsInstance(async_job, AsyncQueryJob)
+        self.assertEqual(async_job.job_id, "JOB_ID")
+        self.assertEqual(async_job.location, "EU")
+        self.assertEqual(async_job.state, "RUNNING")
+
+        rows = self._run(async_job.result())
+        row_values = self._run(_collect(rows))
+
+        self.assertEqual(async_job.state, "DONE")
+        self.assertEqual(
+            row_values, [("Phred Phlyntstone", 32), ("Bharney Rhubble", 33)]
+        )
+        self.assertEqual(rows.total_rows, 2)
+
+        insert_request, query_request, reload_request, list_request = (
+            client._connection.requests
+        )
+        self.assertEqual(insert_request["method"], "POST")
+        self.assertEqual(insert_request["path"], "/projects/%s/jobs" % self.PROJECT)
+        self.assertEqual(
+            insert_request["data"]["configuration"]["query"]["useLegacySql"], False
+        )
+        self.assertEqual(
+            query_request["path"], "/projects/%s/queries/JOB_ID" % self.PROJECT
+        )
+        self.assertEqual(query_request["query_params"]["location"], "EU")
+        self.assertEqual(
+            reload_request["path"], "/projects/%s/jobs/JOB_ID" % self.PROJECT
+        )
+        self.assertEqual(
+            list_request["path"],
+            "/projects/%s/datasets/_temp/tables/anon/data" % self.PROJECT,
+        )
+
+    def test_query_w_project_and_location(self):
+        job_resource = {
+            "jobReference": {
+                "projectId": "other-project",
+                "jobId": "JOB_ID",
+                "location": "US",
+            },
+            "configuration": {"query": {"query": "SELECT 1"}},
+            "status": {"state": "RUNNING"},
+        }
+        client = self._make_one(job_resource, location="EU")
+
+        async_job = self._run(
+            client.query(
+                "SELECT 1", job_id="JOB_ID", project="other-project", location="US"
+            )
+        )
+
+        self.assertEqual(async_job.location, "US")
+        (request,) = client._connection.requests
+        self.assertEqual(request["path"], "/projects/other-project/jobs")
+        self.assertEqual(request["data"]["jobReference"]["location"], "US")
+
+    def test_get_query_results_w_timeout(self):
+        client = self._make_one(
+            {
+                "jobReference": {"projectId": self.PROJECT, "jobId": "JOB_ID"},
+                "jobComplete": False,
+            }
+        )
+
+        query_results = self._run(
+            client._get_query_results("JOB_ID", None, timeout_ms=500)
+        )
+
+        self.assertFalse(query_results.complete)
+        (request,) = client._connection.requests
+        self.assertEqual(
+            request["path"], "/projects/%s/queries/JOB_ID" % self.PROJECT
+        )
+        self.assertEqual(request["query_params"], {"maxResults": 0, "timeoutMs": 500})
+
+    def test_query_result_w_error(self):
+        from google.api_core import exceptions
+
+        job_resource = {
+            "jobReference": {"projectId": self.PROJECT, "jobId": "JOB_ID"},
+            "configuration": {"query": {"query": "SELECT bad"}},
+            "status": {
+                "state": "DONE",
+                "errorResult": {"reason": "invalidQuery", "message": "bad"},
+            },
+        }
+        client = self._make_one(job_resource)
+
+        async_job = self._run(client.query("SELECT bad", job_id="JOB_ID"))
+
+        with self.assertRaises(exceptions.BadRequest):
+            self._run(async_job.result())
+
+    def test_list_rows_pages(self):
+        client = self._make_one(
+            {
+                "totalRows": "3",
+                "pageToken": "next",
+                "rows": [
+                    {"f": [{"v": "Phred Phlyntstone"}, {"v": "32"}]},
+                    {"f": [{"v": "Bharney Rhubble"}, {"v": "33"}]},
+                ],
+            },
+            {
+                "totalRows": "3",
+                "rows": [{"f": [{"v": "Wylma Phlyntstone"}, {"v": None}]}],
+            },
+        )
+
+        rows = client.list_rows(self._make_table(), page_size=2)
+        first_page = self._run(rows.fetch_page())
+        second_page = self._run(rows.fetch_page())
+        last_page = self._run(rows.fetch_page())
+
+        self.assertEqual(len(first_page), 2)
+        self.assertEqual(first_page[0].full_name, "Phred Phlyntstone")
+        self.assertEqual(second_page[0]["age"], None)
+        self.assertIsNone(last_page)
+        self.assertEqual(rows.total_rows, 3)
+        first_request, second_request = client._connection.requests
+        self.assertEqual(first_request["query_params"], {"maxResults": 2})
+        self.assertEqual(
+            second_request["query_params"], {"maxResults": 2, "pageToken": "next"}
+        )
+
+    def test_list_rows_w_max_results(self):
+        client = self._make_one(
+            {
+                "totalRows": "3",
+                "pageToken": "next",
+                "rows": [{"f": [{"v": "Phred Phlyntstone"}, {"v": "32"}]}],
+            }
+        )
+
+        rows = client.list_rows(self._make_table(), max_results=1, page_size=10)
+        row_values = self._run(_collect(rows))
+
+        self.assertEqual(row_values, [("Phred Phlyntstone", 32)])
+        (request,) = client._connection.requests
+        self.assertEqual(request["query_params"], {"maxResults": 1})
+
+    def test_list_rows_w_table_id_and_selected_fields(self):
+        from google.cloud.bigquery.schema import SchemaField
+
+        client = self._make_one({"rows": [{"f": [{"v": "Phred Phlyntstone"}]}]})
+        table_id = "%s.%s.%s" % (self.PROJECT, self.DS_ID, self.TABLE_ID)
+        full_name = SchemaField("full_name", "STRING")
+
+        rows = client.list_rows(table_id, selected_fields=[full_name], start_index=1)
+        row_values = self._run(_collect(rows))
+
+        self.assertIs(rows.__aiter__(), rows)
+        self.assertEqual(rows.schema, [full_name])
+        self.assertEqual(row_values, [("Phred Phlyntstone",)])
+        self.assertIsNone(rows.total_rows)
+        (request,) = client._connection.requests
+        self.assertEqual(request["path"], self._table_path() + "/data")
+        self.assertEqual(
+            request["query_params"], {"selectedFields": "full_name", "startIndex": 1}
+        )
+
+    def test_list_rows_w_table_reference_wo_selected_fields(self):
+        from google.cloud.bigquery.table import TableReference
+
+        client = self._make_one()
+        table_ref = TableReference.from_string(
+            "%s.%s.%s" % (self.PROJECT, self.DS_ID, self.TABLE_ID)
+        )
+
+        with self.assertRaises(ValueError):
+            client.list_rows(table_ref)
+
+    def test_insert_rows(self):
+        client = self._make_one(
+            {"insertErrors": [{"index": "1", "errors": [{"reason": "invalid"}]}]}
+        )
+        rows = [("Phred Phlyntstone", 32), {"full_name": "Bharney Rhubble", "age": 33}]
+
+        errors = self._run(
+            client.insert_rows(self._make_table(), rows, row_ids=["a", "b"])
+        )
+
+        self.assertEqual(errors, [{"index": 1, "errors": [{"reason": "invalid"}]}])
+        (request,) = client._connection.requests
+        self.assertEqual(request["method"], "POST")
+        self.assertEqual(request["path"], self._table_path() + "/insertAll")
+        self.assertEqual(
+            request["data"],
+            {
+                "rows": [
+                    {
+                        "json": {"full_name": "Phred Phlyntstone", "age": "32"},
+                        "insertId": "a",
+                    },
+                    {
+                        "json": {"full_name": "Bharney Rhubble", "age": "33"},
+                        "insertId": "b",
+                    },
+                ]
+            },
+        )
+
+    def test_insert_rows_w_table_id(self):
+        client = self._make_one({})
+        table_id = "%s.%s.%s" % (self.PROJECT, self.DS_ID, self.TABLE_ID)
+
+        errors = self._run(
+            client.insert_rows(
+                table_id,
+                [("Phred Phlyntstone", 32)],
+                selected_fields=self._make_table().schema,
+                row_ids=["a"],
+            )
+        )
+
+        self.assertEqual(errors, [])
+        (request,) = client._connection.requests
+        self.assertEqual(request["path"], self._table_path() + "/insertAll")
+        self.assertEqual(
+            request["data"]["rows"][0]["json"],
+            {"full_name": "Phred Phlyntstone", "age": "32"},
+        )
+
+    def test_insert_rows_json_w_table_id(self):
+        client = self._make_one({})
+        table_id = "%s.%s.%s" % (self.PROJECT, self.DS_ID, self.TABLE_ID)
+
+        errors = self._run(
+            client.insert_rows_json(
+                table_id, [{"full_name": "Phred Phlyntstone"}], row_ids=["a"]
+            )
+        )
+
+        self.assertEqual(errors, [])
+        (request,) = client._connection.requests
+        self.assertEqual(request["path"], self._table_path() + "/insertAll")
+
+
+class TestAsyncQueryJob(_EventLoopTestCase):
+    PROJECT = "prahj-ekt"
+    JOB_ID = "JOB_ID"
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.bigquery.aio import AsyncQueryJob
+
+        return AsyncQueryJob
+
+    def _make_one(self, *responses):
+        from google.cloud.bigquery.aio import AsyncClient
+        from google.cloud.bigquery.client import Client
+        from google.cloud.bigquery.job import QueryJob
+
+        sync_client = Client(project=self.PROJECT, credentials=_make_credentials())
+        client = AsyncClient(client=sync_client)
+        client._connection = _Connection(*responses)
+        query_job = QueryJob(self.JOB_ID, "SELECT 1", sync_client)
+        return self._get_target_class()(query_job, client)
+
+    def _job_resource(self, state):
+        return {
+            "jobReference": {"projectId": self.PROJECT, "jobId": self.JOB_ID},
+            "configuration": {"query": {"query": "SELECT 1"}},
+            "status": {"state": state},
+        }
+
+    def test_job(self):
+        async_job = self._make_one()
+
+        self.assertIs(async_job.job, async_job._job)
+
+    def test_reload_wo_location(self):
+        async_job = self._make_one(self._job_resource("DONE"))
+
+        self._run(async_job.reload())
+
+        self.assertEqual(async_job.state, "DONE")
+        (request,) = async_job._client._connection.requests
+        self.assertEqual(request["path"], "/projects/%s/jobs/JOB_ID" % self.PROJECT)
+        self.assertEqual(request["query_params"], {})
+
+    def test_done_w_incomplete_results(self):
+        async_job = self._make_one(
+            {
+                "jobReference": {"projectId": self.PROJECT, "jobId": self.JOB_ID},
+                "jobComplete": False,
+            }
+        )
+
+        self.assertFalse(self._run(async_job.done(timeout_ms=500)))
+
+        # The job is not reloaded until the query is complete.
+        (request,) = async_job._client._connection.requests
+        self.assertEqual(request["query_params"]["timeoutMs"], 500)
+
+    def test_result_wo_rows(self):
+        async_job = self._make_one(
+            {
+                "jobReference": {"projectId": self.PROJECT, "jobId": self.JOB_ID},
+                "jobComplete": True,
+            }
+        )
+        async_job._job._set_properties(self._job_resource("DONE"))
+
+        rows = self._run(async_job.result())
+
+        self.assertIsNone(rows.path)
+        self.assertEqual(self._run(_collect(rows)), [])
+        self.assertIsNone(self._run(rows.fetch_page()))
+        (request,) = async_job._client._connection.requests
+        self.assertEqual(request["query_params"], {"maxResults": 0})
+
+    @staticmethod
+    def _make_sleep():
+        return mock.Mock(side_effect=lambda delay: _resolved(None))
+
+    def _wait(self, async_job, times, sleep, timeout=None):
+        from google.cloud.bigquery import aio
+
+        with mock.patch.object(aio, "time") as time_mock:
+            time_mock.time.side_effect = times
+            with mock.patch.object(aio.asyncio, "sleep", new=sleep):
+                self._run(async_job._wait(timeout))
+
+    def test__wait_retries_transient_error(self):
+        from google.api_core import exceptions
+        from google.cloud.bigquery import job
+
+        async_job = self._make_one()
+        # Not retried by the default retry of done(), but by the polling.
+        error = exceptions.InternalServerError(
+            "try again", errors=[{"reason": "jobInternalError"}]
+        )
+        async_job.done = mock.Mock(
+            side_effect=[_failed(error), _resolved(False), _resolved(True)]
+        )
+
+        # The second poll takes longer than a long poll, so the third poll
+        # starts without sleeping.
+        sleep = self._make_sleep()
+        self._wait(async_job, [0.0, 0.0, 0.5, 1.0, 3.0, 3.0], sleep)
+
+        self.assertEqual(async_job.done.call_count, 3)
+        sleep.assert_called_once_with(job._poll_interval(async_job._job, 0.5))
+        for call in async_job.done.call_args_list:
+            self.assertEqual(call, mock.call(timeout_ms=None))
+
+    def test__wait_w_permanent_error(self):
+        from google.api_core import exceptions
+
+        async_job = self._make_one()
+        async_job.done = mock.Mock(
+            return_value=_failed(exceptions.NotFound("missing"))
+        )
+
+        with self.assertRaises(exceptions.NotFound):
+            self._wait(async_job, [0.0, 0.0], self._make_sleep())
+
+        async_job.done.assert_called_once_with(timeout_ms=None)
+
+    def test__wait_w_timeout(self):
+        import concurrent.futures
+        from google.cloud.bigquery import job
+
+        async_job = self._make_one()
+        async_job.done = mock.Mock(side_effect=[_resolved(False), _resolved(False)])
+
+        sleep = self._make_sleep()
+
+        with self.assertRaises(concurrent.futures.TimeoutError):
+            self._wait(async_job, [0.0, 0.0, 0.5, 2.0, 2.5], sleep, timeout=2.5)
+
+        sleep.assert_called_once_with(
+            min(job._poll_interval(async_job._job, 0.5), 2.0)
+        )
+        self.assertEqual(
+            async_job.done.call_args_list,
+            [mock.call(timeout_ms=2400), mock.call(timeout_ms=400)],
+        )
+
+
+class Test_call_with_retry(_EventLoopTestCase):
+    def _call_fut(self, retry, func, *args, **kwargs):
+        from google.cloud.bigquery.aio import _call_with_retry
+
+        return self._run(_call_with_retry(retry, func, *args, **kwargs))
+
+    @staticmethod
+    def _make_retry(**kw):
+        from google.api_core import retry
+
+        return retry.Retry(
+            predicate=retry.if_exception_type(ValueError), multiplier=1.0, **kw
+        )
+
+    def test_wo_retry(self):
+        func = mock.Mock(return_value=_resolved("result"))
+
+        self.assertEqual(self._call_fut(None, func, 1, two=2), "result")
+
+        func.assert_called_once_with(1, two=2)
+
+    def test_wo_deadline(self):
+        retry = self._make_retry(initial=0.0, maximum=0.0, deadline=None)
+        func = mock.Mock(side_effect=[_failed(ValueError("again")), _resolved("ok")])
+
+        self.assertEqual(self._call_fut(retry, func), "ok")
+
+        self.assertEqual(func.call_count, 2)
+
+    def test_w_deadline_exceeded(self):
+        from google.api_core import exceptions
+        from google.cloud.bigquery import aio
+
+        retry = self._make_retry(initial=0.0, maximum=0.0, deadline=0.5)
+        error = ValueError("again")
+        func = mock.Mock(return_value=_failed(error))
+
+        with mock.patch.object(aio, "time") as time_mock:
+            time_mock.time.side_effect = [0.0, 1.0]
+            with self.assertRaises(exceptions.RetryError) as exc_info:
+                self._call_fut(retry, func)
+
+        self.assertIs(exc_info.exception.cause, error)
+        func.assert_called_once_with()
+
+    def test_w_exhausted_sleep_generator(self):
+        from google.api_core import retry as api_retry
+
+        retry = self._make_retry(initial=0.0, maximum=0.0, deadline=None)
+        func = mock.Mock(return_value=_failed(ValueError("again")))
+
+        with mock.patch.object(
+            api_retry, "exponential_sleep_generator", return_value=iter([0.0])
+        ):
+            with self.assertRaises(ValueError) as exc_info:
+                self._call_fut(retry, func)
+
+        self.assertIn("Sleep generator", str(exc_info.exception))
+        func.assert_called_once_with()
+
+
+class TestAsyncConnection(_EventLoopTestCase):
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.bigquery.aio import AsyncConnection
+
+        return AsyncConnection
+
+    def _make_one(self, status, content, valid=True):
+        from google.cloud.bigquery._http import Connection
+
+        client = mock.Mock(spec=["_connection", "_credentials"])
+        client._connection = Connection(client)
+        client._credentials = mock.Mock(spec=["valid", "apply", "refresh"])
+        client._credentials.valid = valid
+
+        def apply(headers):
+            headers["authorization"] = "Bearer token"
+
+        client._credentials.apply.side_effect = apply
+
+        response = _Response(status, content)
+        session = mock.Mock(spec=["request"])
+        session.request.return_value = response
+        return self._get_target_class()(client, session=session)
+
+    def test_api_request(self):
+        connection = self._make_one(200, '{"id": "table"}')
+
+        result = self._run(
+            connection.api_request(
+                "POST", "/projects/p/jobs", query_params={"a": "b"}, data={"x": 1}
+            )
+        )
+
+        self.assertEqual(result, {"id": "table"})
+        args, kwargs = connection.session.request.call_args
+        self.assertEqual(args[0], "POST")
+        self.assertEqual(
+            args[1], "https://www.googleapis.com/bigquery/v2/projects/p/jobs?a=b"
+        )
+        self.assertEqual(kwargs["data"], '{"x": 1}')
+        self.assertEqual(kwargs["headers"]["Content-Type"], "application/json")
+        self.assertEqual(kwargs["headers"]["authorization"], "Bearer token")
+
+    def test_api_request_refreshes_credentials(self):
+        connection = self._make_one(200, "", valid=False)
+
+        result = self._run(connection.api_request("GET", "/projects/p"))
+
+        self.assertEqual(result, {})
+        connection._client._credentials.refresh.assert_called_once()
+
+    def test_refresh_credentials_waits_for_refresh_in_progress(self):
+        connection = self._make_one(200, "", valid=False)
+        credentials = connection._client._credentials
+        # Another request holds the lock while it refreshes the credentials.
+        lock = connection._refresh_lock = asyncio.Lock()
+        self._run(lock.acquire())
+
+        task = self._loop.create_task(connection._refresh_credentials())
+        self._run(asyncio.sleep(0))
+        self.assertFalse(task.done())
+        credentials.valid = True
+        lock.release()
+        self._run(task)
+
+        credentials.refresh.assert_not_called()
+
+    def test_api_request_w_error(self):
+        from google.api_core import exceptions
+
+        connection = self._make_one(
+            404, '{"error": {"message": "Not found: Table", "errors": []}}'
+        )
+
+        with self.assertRaises(exceptions.NotFound) as exc_info:
+            self._run(connection.api_request("GET", "/projects/p"))
+
+        self.assertIn("Not found: Table", exc_info.exception.message)
+
+    def test_api_request_w_non_json_error(self):
+        from google.api_core import exceptions
+
+        connection = self._make_one(502, "Bad Gateway")
+
+        with self.assertRaises(exceptions.BadGateway) as exc_info:
+            self._run(connection.api_request("GET", "/projects/p"))
+
+        self.assertIn("Bad Gateway", exc_info.exception.message)
+
+    def test_session_wo_aiohttp(self):
+        from google.cloud.bigquery import aio
+
+        connection = self._get_target_class()(mock.sentinel.client)
+
+        with mock.patch.object(aio, "aiohttp", new=None):
+            with self.assertRaises(ValueError):
+                connection.session
+
+    def test_session_created_on_first_use_and_closed(self):
+        from google.cloud.bigquery import aio
+
+        connection = self._get_target_class()(
+            mock.sentinel.client, connection_limit=10
+        )
+
+        with mock.patch.object(aio, "aiohttp") as aiohttp:
+            session = connection.session
+            self.assertIs(connection.session, session)
+
+        aiohttp.TCPConnector.assert_called_once_with(limit=10)
+        aiohttp.ClientSession.assert_called_once_with(
+            connector=aiohttp.TCPConnector.return_value
+        )
+        self.assertIs(session, aiohttp.ClientSession.return_value)
+        session.close.return_value = _resolved(None)
+
+        self._run(connection.close())
+
+        session.close.assert_called_once_with()
+        self.assertIsNone(connection._session)
+
+    def test_close_w_session_passed_in(self):
+        connection = self._make_one(200, "")
+
+        self._run(connection.close())
+
+        self.assertIsNotNone(connection._session)
+
+
+def _collect(rows):
+    """Collect the values of the rows of an ``AsyncRowIterator``."""
+    result = []
+    done = asyncio.Future()
+
+    def next_row():
+        future = asyncio.ensure_future(rows.__anext__())
+        future.add_done_callback(on_row)
+
+    def on_row(future):
+        try:
+            row = future.result()
+        except StopAsyncIteration:
+            done.set_result(result)
+            return
+        result.append(tuple(row.values()))
+        next_row()
+
+    next_row()
+    return done
@@ -3985,6 +3985,167 @@ class TestClient(unittest.TestCase):
             method="GET", path="/%s" % PATH, query_params={}
         )
 
+    def _make_partitioned_client(self, partition_rows):
+        creds = _make_credentials()
+        http = object()
+        client = self._make_one(project=self.PROJECT, credentials=creds, _http=http)
+        table_path = "/projects/%s/datasets/%s/tables/%s" % (
+            self.PROJECT,
+            self.DS_ID,
+            self.TABLE_ID,
+        )
+        summary = {
+            "totalRows": str(len(partition_rows)),
+            "rows": [
+                {"f": [{"v": partition_id}, {"v": str(modified)}]}
+                for partition_id, (modified, _) in sorted(partition_rows.items())
+            ],
+        }
+        responses = {table_path + "$__PARTITIONS_SUMMARY__/data": summary}
+        for partition_id, (_, rows) in partition_rows.items():
+            responses["%s$%s/data" % (table_path, partition_id)] = {
+                "totalRows": str(len(rows)),
+                "rows": [{"f": [{"v": name}, {"v": str(age)}]} for name, age in rows],
+            }
+
+        def api_request(method, path, query_params=None):
+            return responses[path]
+
+        client._connection = _make_connection()
+        client._connection.api_request.side_effect = api_request
+        return client
+
+    def _partitioned_table(self):
+        from google.cloud.bigquery.table import Table
+        from google.cloud.bigquery.table import SchemaField
+
+        schema = [
+            SchemaField("name", "STRING", mode="REQUIRED"),
+            SchemaField("age", "INTEGER", mode="REQUIRED"),
+        ]
+        return Table(self.TABLE_REF, schema=schema)
+
+    def _partition_rows(self):
+        return {
+            "20180101": (1000, [("Phred", 32)]),
+            "20180102": (2000, [("Bharney", 33), ("Wylma", 29)]),
+            "20180103": (3000, [("Bhettye", 27)]),
+        }
+
+    def test_list_rows_w_partition_ids(self):
+        from google.cloud.bigquery.table import PartitionRowIterator
+
+        client = self._make_partitioned_client(self._partition_rows())
+
+        iterator = client.list_rows(
+            self._partitioned_table(), partitions=["20180103", "20180101"]
+        )
+
+        self.assertIsInstance(iterator, PartitionRowIterator)
+        rows = [tuple(row.values()) for row in iterator]
+        self.assertEqual(rows, [("Bhettye", 27), ("Phred", 32)])
+        self.assertEqual(iterator.total_rows, 2)
+        self.assertIsNone(iterator.high_water_mark)
+        paths = sorted(
+            call[1]["path"] for call in client._connection.api_request.call_args_list
+        )
+        self.assertEqual(
+            paths,
+            [
+                "/projects/PROJECT/datasets/DATASET_ID/tables/TABLE_ID$20180101/data",
+                "/projects/PROJECT/datasets/DATASET_ID/tables/TABLE_ID$20180103/data",
+            ],
+        )
+
+    def test_list_rows_w_partition_filter(self):
+        client = self._make_partitioned_client(self._partition_rows())
+
+        iterator = client.list_rows(
+            self._partitioned_table(),
+            partitions=lambda partition_id: partition_id >= "20180102",
+            max_partition_workers=2,
+        )
+
+        self.assertEqual(iterator.partition_ids, ["20180102", "20180103"])
+        self.assertEqual(iterator.high_water_mark, 3000)
+        rows = [tuple(row.values()) for row in iterator]
+        self.assertEqual(rows, [("Bharney", 33), ("Wylma", 29), ("Bhettye", 27)])
+        self.assertEqual(iterator.total_rows, 3)
+
+    def test_list_rows_w_partitions_modified_since(self):
+        from google.cloud.bigquery.table import SchemaField
+
+        client = self._make_partitioned_client(self._partition_rows())
+        selected_fields = [SchemaField("name", "STRING", mode="REQUIRED")]
+
+        iterator = client.list_rows(
+            self.TABLE_REF,
+            selected_fields=selected_fields,
+            partitions_modified_since=1000,
+        )
+
+        self.assertEqual(iterator.partition_ids, ["20180102", "20180103"])
+        self.assertEqual(iterator.high_water_mark, 3000)
+        self.assertEqual(len(list(iterator)), 3)
+        _, req = client._connection.api_request.call_args
+        self.assertEqual(req["query_params"], {"selectedFields": "name"})
+
+        unchanged = client.list_rows(
+            self.TABLE_REF,
+            selected_fields=selected_fields,
+            partitions_modified_since=iterator.high_water_mark,
+        )
+        self.assertEqual(unchanged.partition_ids, [])
+        self.assertEqual(unchanged.high_water_mark, 3000)
+        self.assertEqual(list(unchanged), [])
+
+    def test_list_rows_w_partition_ids_modified_since_datetime(self):
+        from google.cloud._helpers import UTC
+
+        # Partitions are not necessarily modified in the order of their IDs.
+        client = self._make_partitioned_client(
+            {
+                "20180101": (3000, [("Phred", 32)]),
+                "20180102": (2000, [("Bharney", 33)]),
+                "20180103": (4000, [("Bhettye", 27)]),
+            }
+        )
+        modified_since = datetime.datetime(1970, 1, 1, 0, 0, 1, tzinfo=UTC)
+
+        iterator = client.list_rows(
+            self._partitioned_table(),
+            partitions=["20180101", "20180102"],
+            partitions_modified_since=modified_since,
+        )
+
+        self.assertEqual(iterator.partition_ids, ["20180101", "20180102"])
+        self.assertEqual(iterator.high_water_mark, 3000)
+        rows = [tuple(row.values()) for row in iterator]
+        self.assertEqual(rows, [("Phred", 32), ("Bharney", 33)])
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    def test_list_rows_w_partitions_to_dataframe(self):
+        client = self._make_partitioned_client(self._partition_rows())
+
+        iterator = client.list_rows(
+            self._partitioned_table(), partitions=["20180101", "20180102"]
+        )
+        df = iterator.to_dataframe()
+
+        self.assertEqual(list(df.columns), ["name", "age"])
+        self.assertEqual(list(df["name"]), ["Phred", "Bharney", "Wylma"])
+        self.assertEqual(list(df["age"]), [32, 33, 29])
+
+    def test_list_rows_w_partitions_and_offsets(self):
+        creds = _make_credentials()
+        http = object()
+        client = self._make_one(project=self.PROJECT, credentials=creds, _http=http)
+
+        with self.assertRaises(ValueError):
+            client.list_rows(
+                self._partitioned_table(), partitions=["20180101"], start_index=1
+            )
+
     def test_list_rows_errors(self):
         from google.cloud.bigquery.table import Table
 
@@ -4482,6 +4643,240 @@ class TestClientUpload(object):
         assert sent_config is job_config
         assert sent_config.source_format == job.SourceFormat.PARQUET
 
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    def test_load_table_from_dataframe_w_row_group_size(self):
+        import pyarrow.parquet
+        from google.cloud.bigquery.client import _DEFAULT_NUM_RETRIES
+        from google.cloud.bigquery import job
+
+        client = self._make_client()
+        dataframe = pandas.DataFrame({"name": ["row"] * 10, "age": list(range(10))})
+        uploaded = []
+
+        def read_upload(client, file_obj, destination, **kwargs):
+            uploaded.append(file_obj.read())
+            return mock.sentinel.load_job
+
+        load_patch = mock.patch(
+            "google.cloud.bigquery.client.Client.load_table_from_file",
+            autospec=True,
+            side_effect=read_upload,
+        )
+        with load_patch as load_table_from_file:
+            load_job = client.load_table_from_dataframe(
+                dataframe, self.TABLE_REF, location=self.LOCATION, row_group_size=4
+            )
+
+        assert load_job is mock.sentinel.load_job
+        load_table_from_file.assert_called_once_with(
+            client,
+            mock.ANY,
+            self.TABLE_REF,
+            num_retries=_DEFAULT_NUM_RETRIES,
+            job_id=None,
+            job_id_prefix=None,
+            location=self.LOCATION,
+            project=None,
+            job_config=mock.ANY,
+        )
+        sent_config = load_table_from_file.mock_calls[0][2]["job_config"]
+        assert sent_config.source_format == job.SourceFormat.PARQUET
+
+        parquet_file = pyarrow.parquet.ParquetFile(io.BytesIO(uploaded[0]))
+        assert parquet_file.num_row_groups == 3
+        assert parquet_file.read().to_pandas().equals(dataframe)
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    def test_load_table_from_dataframe_w_row_group_size_resumable_upload(self):
+        import pyarrow.parquet
+        from google.cloud.bigquery import job
+
+        resumable_url = "http://test.invalid?upload_id=and-then-there-was-1"
+        resource = {
+            "jobReference": {"projectId": "project_id", "jobId": "my-job"},
+            "configuration": {
+                "load": {
+                    "sourceFormat": "PARQUET",
+                    "destinationTable": {
+                        "projectId": "project_id",
+                        "datasetId": "test_dataset",
+                        "tableId": "test_table",
+                    },
+                }
+            },
+        }
+        transport = self._make_transport(
+            [
+                self._make_response(http_client.OK, "", {"location": resumable_url}),
+                self._make_response(
+                    http_client.OK,
+                    json.dumps(resource),
+                    {"Content-Type": "application/json"},
+                ),
+            ]
+        )
+        client = self._make_client(transport)
+        dataframe = pandas.DataFrame({"name": ["row"] * 10, "age": list(range(10))})
+
+        load_job = client.load_table_from_dataframe(
+            dataframe, self.TABLE_REF, job_id="my-job", row_group_size=4
+        )
+
+        assert isinstance(load_job, job.LoadJob)
+        assert load_job.job_id == "my-job"
+        assert transport.request.call_count == 2
+        upload_call = transport.request.mock_calls[1]
+        assert upload_call[1][:2] == ("PUT", resumable_url)
+        parquet_file = pyarrow.parquet.ParquetFile(
+            io.BytesIO(upload_call[2]["data"])
+        )
+        assert parquet_file.num_row_groups == 3
+        assert parquet_file.read().to_pandas().equals(dataframe)
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    def test_load_table_from_dataframe_w_row_group_size_upload_error(self):
+        client = self._make_client()
+        dataframe = pandas.DataFrame({"age": list(range(100000))})
+
+        def fail_upload(client, file_obj, destination, **kwargs):
+            file_obj.read(1)
+            raise ValueError("upload failed")
+
+        load_patch = mock.patch(
+            "google.cloud.bigquery.client.Client.load_table_from_file",
+            autospec=True,
+            side_effect=fail_upload,
+        )
+        with load_patch, pytest.raises(ValueError, match="upload failed"):
+            client.load_table_from_dataframe(
+                dataframe, self.TABLE_REF, row_group_size=10
+            )
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    def test_load_table_from_dataframe_w_row_group_size_encode_error(self):
+        client = self._make_client()
+        dataframe = pandas.DataFrame({"age": [1, 2, 3]})
+
+        def read_upload(client, file_obj, destination, **kwargs):
+            file_obj.read()
+            return mock.sentinel.load_job
+
+        load_patch = mock.patch(
+            "google.cloud.bigquery.client.Client.load_table_from_file",
+            autospec=True,
+            side_effect=read_upload,
+        )
+        encode_patch = mock.patch(
+            "google.cloud.bigquery._pandas_helpers.dataframe_to_parquet",
+            side_effect=TypeError("cannot encode"),
+        )
+        with load_patch, encode_patch, pytest.raises(TypeError):
+            client.load_table_from_dataframe(
+                dataframe, self.TABLE_REF, row_group_size=10
+            )
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    def test_load_table_from_dataframe_w_parallel_jobs(self):
+        from google.cloud.bigquery import job
+
+        client = self._make_client()
+        dataframe = pandas.DataFrame({"age": list(range(10))})
+        uploaded = {}
+
+        def read_upload(client, file_obj, destination, **kwargs):
+            uploaded[kwargs["job_id"]] = file_obj.getvalue()
+            return kwargs["job_id"]
+
+        load_patch = mock.patch(
+            "google.cloud.bigquery.client.Client.load_table_from_file",
+            autospec=True,
+            side_effect=read_upload,
+        )
+        with load_patch as load_table_from_file:
+            load_jobs = client.load_table_from_dataframe(
+                dataframe, self.TABLE_REF, job_id="my-job", parallel_jobs=3
+            )
+
+        assert load_jobs == ["my-job-0", "my-job-1", "my-job-2"]
+        assert load_table_from_file.call_count == 3
+        sent_config = load_table_from_file.mock_calls[0][2]["job_config"]
+        assert sent_config.write_disposition == job.WriteDisposition.WRITE_APPEND
+        ages = [
+            list(pandas.read_parquet(io.BytesIO(uploaded[job_id]))["age"])
+            for job_id in load_jobs
+        ]
+        assert ages == [[0, 1, 2, 3], [4, 5, 6, 7], [8, 9]]
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    def test_load_table_from_dataframe_w_parallel_jobs_copies_config(self):
+        from google.cloud.bigquery import job
+
+        client = self._make_client()
+        dataframe = pandas.DataFrame({"age": list(range(10))})
+        job_config = job.LoadJobConfig()
+        job_config.max_bad_records = 3
+
+        load_patch = mock.patch(
+            "google.cloud.bigquery.client.Client.load_table_from_file",
+            autospec=True,
+            return_value=mock.sentinel.load_job,
+        )
+        with load_patch as load_table_from_file:
+            client.load_table_from_dataframe(
+                dataframe, self.TABLE_REF, job_config=job_config, parallel_jobs=2
+            )
+
+        assert job_config.write_disposition is None
+        sent_configs = [
+            call[2]["job_config"] for call in load_table_from_file.mock_calls
+        ]
+        assert len(sent_configs) == 2
+        assert sent_configs[0] is not sent_configs[1]
+        for sent_config in sent_configs:
+            assert sent_config is not job_config
+            assert sent_config.max_bad_records == 3
+            assert sent_config.write_disposition == job.WriteDisposition.WRITE_APPEND
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    @unittest.skipIf(pyarrow is None, "Requires `pyarrow`")
+    def test_load_table_from_dataframe_w_parallel_jobs_empty(self):
+        client = self._make_client()
+        dataframe = pandas.DataFrame({"age": []})
+
+        load_patch = mock.patch(
+            "google.cloud.bigquery.client.Client.load_table_from_file",
+            autospec=True,
+            return_value=mock.sentinel.load_job,
+        )
+        with load_patch as load_table_from_file:
+            load_jobs = client.load_table_from_dataframe(
+                dataframe, self.TABLE_REF, parallel_jobs=3
+            )
+
+        assert load_jobs == [mock.sentinel.load_job]
+        load_table_from_file.assert_called_once()
+        assert load_table_from_file.mock_calls[0][2]["job_id"] is None
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    def test_load_table_from_dataframe_w_parallel_jobs_truncate(self):
+        from google.cloud.bigquery import job
+
+        client = self._make_client()
+        dataframe = pandas.DataFrame({"age": [1, 2, 3]})
+        job_config = job.LoadJobConfig()
+        job_config.write_disposition = job.WriteDisposition.WRITE_TRUNCATE
+
+        with pytest.raises(ValueError):
+            client.load_table_from_dataframe(
+                dataframe, self.TABLE_REF, job_config=job_config, parallel_jobs=2
+            )
+
     # Low-level tests
 
     @classmethod
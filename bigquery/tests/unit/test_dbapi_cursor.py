@@ -161,6 +161,20 @@ class TestCursor(unittest.TestCase):
         third_page = cursor.fetchmany()
         self.assertEqual(third_page, [])
 
+    def test_fetchmany_page_size(self):
+        from google.cloud.bigquery import dbapi
+
+        client = self._mock_client(rows=[(1, 2, 3), (4, 5, 6), (7, 8, 9)])
+        connection = dbapi.connect(client)
+        cursor = connection.cursor()
+        cursor.arraysize = 100
+        cursor.execute("SELECT a, b, c;")
+        cursor.fetchmany(size=500)
+
+        client.list_rows.assert_called_once_with(
+            mock.ANY, selected_fields=None, page_size=500, prefetch_pages=1
+        )
+
     def test_fetchall_wo_execute_raises_error(self):
         from google.cloud.bigquery import dbapi
 
@@ -276,6 +290,139 @@ class TestCursor(unittest.TestCase):
         self.assertIsNone(cursor.description)
         self.assertEqual(cursor.rowcount, 12)
 
+    def test_executemany_w_insert_list(self):
+        from google.cloud.bigquery.dbapi import connect
+        from google.cloud.bigquery.query import ScalarQueryParameter
+
+        client = self._mock_client(rows=[], num_dml_affected_rows=2)
+        connection = connect(client)
+        cursor = connection.cursor()
+        cursor.executemany(
+            "INSERT INTO people (name, age) VALUES (%s, %s);",
+            [("Phred", 32), ("Bharney", 33)],
+        )
+
+        client.query.assert_called_once()
+        args, kwargs = client.query.call_args
+        self.assertEqual(
+            args[0], "INSERT INTO people (name, age) VALUES (?, ?), (?, ?)"
+        )
+        self.assertEqual(
+            kwargs["job_config"].query_parameters,
+            [
+                ScalarQueryParameter(None, "STRING", "Phred"),
+                ScalarQueryParameter(None, "INT64", 32),
+                ScalarQueryParameter(None, "STRING", "Bharney"),
+                ScalarQueryParameter(None, "INT64", 33),
+            ],
+        )
+        self.assertEqual(cursor.rowcount, 2)
+
+    def test_executemany_w_insert_dict(self):
+        from google.cloud.bigquery.dbapi import connect
+        from google.cloud.bigquery.query import ScalarQueryParameter
+
+        client = self._mock_client(rows=[], num_dml_affected_rows=2)
+        connection = connect(client)
+        cursor = connection.cursor()
+        cursor.executemany(
+            "INSERT INTO people (name, age, note) "
+            "VALUES (%(name)s, %(age)s, '100%%')",
+            [{"age": 32, "name": "Phred"}, {"name": "Bharney", "age": 33}],
+        )
+
+        args, kwargs = client.query.call_args
+        self.assertEqual(
+            args[0],
+            "INSERT INTO people (name, age, note) "
+            "VALUES (?, ?, '100%'), (?, ?, '100%')",
+        )
+        self.assertEqual(
+            kwargs["job_config"].query_parameters,
+            [
+                ScalarQueryParameter(None, "STRING", "Phred"),
+                ScalarQueryParameter(None, "INT64", 32),
+                ScalarQueryParameter(None, "STRING", "Bharney"),
+                ScalarQueryParameter(None, "INT64", 33),
+            ],
+        )
+
+    def test_executemany_w_insert_batches(self):
+        from google.cloud.bigquery.dbapi import connect
+
+        client = self._mock_client(rows=[], num_dml_affected_rows=2)
+        connection = connect(client)
+        cursor = connection.cursor()
+        with mock.patch(
+            "google.cloud.bigquery.dbapi.cursor._MAX_QUERY_PARAMETERS", new=4
+        ):
+            cursor.executemany(
+                "INSERT INTO t (a, b) VALUES (%s, %s)",
+                [(1, 2), (3, 4), (5, 6), (7, 8), (9, 10)],
+            )
+
+        queries = [call[0][0] for call in client.query.call_args_list]
+        self.assertEqual(
+            queries,
+            [
+                "INSERT INTO t (a, b) VALUES (?, ?), (?, ?)",
+                "INSERT INTO t (a, b) VALUES (?, ?), (?, ?)",
+                "INSERT INTO t (a, b) VALUES (?, ?)",
+            ],
+        )
+        self.assertEqual(cursor.rowcount, 6)
+
+    def test_executemany_w_insert_multiple_tuples(self):
+        from google.cloud.bigquery.dbapi import connect
+
+        client = self._mock_client(rows=[], num_dml_affected_rows=2)
+        connection = connect(client)
+        cursor = connection.cursor()
+        cursor.executemany(
+            "INSERT INTO t (a) VALUES (%s), (%s)", [(1, 2), (3, 4), (5, 6)]
+        )
+        self.assertEqual(client.query.call_count, 3)
+
+    def test_executemany_w_insert_wrong_parameters(self):
+        from google.cloud.bigquery import dbapi
+
+        connection = dbapi.connect(self._mock_client())
+        cursor = connection.cursor()
+        self.assertRaises(
+            dbapi.ProgrammingError,
+            cursor.executemany,
+            "INSERT INTO t (a) VALUES (%(a)s)",
+            [{"b": 1}],
+        )
+
+    def test_executemany_w_insert_wo_parameters(self):
+        from google.cloud.bigquery.dbapi import connect
+
+        client = self._mock_client(rows=[], num_dml_affected_rows=2)
+        connection = connect(client)
+        cursor = connection.cursor()
+        cursor.executemany("INSERT INTO t (a) VALUES (%s)", [])
+
+        client.query.assert_not_called()
+        self.assertEqual(cursor.rowcount, 0)
+
+    def test__is_single_tuple(self):
+        from google.cloud.bigquery.dbapi import cursor
+
+        self.assertTrue(cursor._is_single_tuple("(%s, (%s + 1))"))
+        self.assertFalse(cursor._is_single_tuple("(%s), (%s)"))
+        self.assertFalse(cursor._is_single_tuple("((%s)"))
+
+    def test__parameter_order(self):
+        from google.cloud.bigquery.dbapi import cursor
+
+        order = cursor._ParameterOrder({"a": 1, "b": 2})
+        self.assertEqual(order["b"], "?")
+        self.assertEqual(order["a"], "?")
+        self.assertEqual(order.values, [2, 1])
+        self.assertEqual(sorted(order), ["a", "b"])
+        self.assertEqual(len(order), 2)
+
     def test__format_operation_w_dict(self):
         from google.cloud.bigquery.dbapi import cursor
 
@@ -0,0 +1,242 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import mock
+
+try:
+    import pandas
+except (ImportError, AttributeError):  # pragma: NO COVER
+    pandas = None
+
+
+class TestTableInserter(unittest.TestCase):
+    PROJECT = "prahj-ekt"
+    TABLE_ID = "prahj-ekt.dataset.table"
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.bigquery.inserter import TableInserter
+
+        return TableInserter
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    def _make_client(self, side_effect=None):
+        client = mock.Mock(spec=["project", "insert_rows_json"])
+        client.project = self.PROJECT
+        if side_effect is None:
+            client.insert_rows_json.return_value = []
+        else:
+            client.insert_rows_json.side_effect = side_effect
+        return client
+
+    def _make_table(self):
+        from google.cloud.bigquery.schema import SchemaField
+        from google.cloud.bigquery.table import Table
+        from google.cloud.bigquery.table import TableReference
+
+        schema = [
+            SchemaField("full_name", "STRING", mode="REQUIRED"),
+            SchemaField("age", "INTEGER", mode="NULLABLE"),
+        ]
+        return Table(TableReference.from_string(self.TABLE_ID), schema=schema)
+
+    def _sent_rows(self, client):
+        return [
+            row for call in client.insert_rows_json.call_args_list for row in call[0][1]
+        ]
+
+    def test_ctor_w_table_reference_wo_selected_fields(self):
+        from google.cloud.bigquery.table import TableReference
+
+        client = self._make_client()
+        with self.assertRaises(ValueError):
+            self._make_one(client, TableReference.from_string(self.TABLE_ID))
+
+    def test_ctor_w_table_wo_schema(self):
+        from google.cloud.bigquery.table import Table
+        from google.cloud.bigquery.table import TableReference
+
+        client = self._make_client()
+        table = Table(TableReference.from_string(self.TABLE_ID))
+        with self.assertRaises(ValueError):
+            self._make_one(client, table)
+
+    def test_ctor_w_invalid_table(self):
+        client = self._make_client()
+        with self.assertRaises(TypeError):
+            self._make_one(client, object())
+
+    def test_ctor_w_string_and_selected_fields(self):
+        from google.cloud.bigquery.schema import SchemaField
+        from google.cloud.bigquery.table import TableReference
+
+        client = self._make_client()
+        schema = [SchemaField("full_name", "STRING")]
+        inserter = self._make_one(client, "dataset.table", selected_fields=schema)
+        self.assertEqual(
+            inserter._table,
+            TableReference.from_string("dataset.table", default_project=self.PROJECT),
+        )
+        self.assertEqual(inserter._schema, schema)
+
+    def test_insert_splits_by_row_count(self):
+        client = self._make_client()
+        table = self._make_table()
+        inserter = self._make_one(
+            client, table, max_rows_per_request=2, skip_invalid_rows=True
+        )
+        rows = (("Phred Phlyntstone", index) for index in range(5))
+
+        errors = inserter.insert(rows)
+
+        self.assertEqual(errors, [])
+        self.assertEqual(client.insert_rows_json.call_count, 3)
+        sent = self._sent_rows(client)
+        self.assertEqual([row["age"] for row in sent], ["0", "1", "2", "3", "4"])
+        row_ids = [
+            row_id
+            for call in client.insert_rows_json.call_args_list
+            for row_id in call[1]["row_ids"]
+        ]
+        self.assertEqual(len(set(row_ids)), 5)
+        for call in client.insert_rows_json.call_args_list:
+            self.assertIs(call[0][0], table)
+            self.assertTrue(call[1]["skip_invalid_rows"])
+        stats = sorted(inserter.stats, key=lambda chunk: chunk.first_index)
+        self.assertEqual([chunk.first_index for chunk in stats], [0, 2, 4])
+        self.assertEqual([chunk.num_rows for chunk in stats], [2, 2, 1])
+        self.assertEqual(inserter.total_rows, 5)
+        self.assertGreater(inserter.total_bytes, 0)
+
+    def test_insert_wo_rows(self):
+        client = self._make_client()
+        inserter = self._make_one(client, self._make_table())
+
+        errors = inserter.insert([])
+
+        self.assertEqual(errors, [])
+        client.insert_rows_json.assert_not_called()
+        self.assertEqual(inserter.total_rows, 0)
+
+    def test_insert_splits_by_bytes(self):
+        client = self._make_client()
+        inserter = self._make_one(client, self._make_table(), max_bytes_per_request=100)
+        rows = [{"full_name": "x" * 40, "age": index} for index in range(3)]
+
+        inserter.insert(rows)
+
+        # Each row is about 90 bytes, so each is sent by itself.
+        self.assertEqual(client.insert_rows_json.call_count, 3)
+        self.assertEqual(len(self._sent_rows(client)), 3)
+
+    def test_insert_retries_transient_errors(self):
+        client = self._make_client(
+            side_effect=[
+                [
+                    {"index": 1, "errors": [{"reason": "backendError"}]},
+                    {"index": 2, "errors": [{"reason": "invalid"}]},
+                ],
+                [],
+            ]
+        )
+        inserter = self._make_one(client, self._make_table())
+        rows = [("Phred", 32), ("Bharney", 33), ("Wylma", 29)]
+
+        with mock.patch("time.sleep") as sleep:
+            errors = inserter.insert(rows)
+
+        sleep.assert_called_once()
+        self.assertEqual(errors, [{"index": 2, "errors": [{"reason": "invalid"}]}])
+        first_call, second_call = client.insert_rows_json.call_args_list
+        self.assertEqual(second_call[0][1], [first_call[0][1][1]])
+        self.assertEqual(second_call[1]["row_ids"], [first_call[1]["row_ids"][1]])
+        (chunk,) = inserter.stats
+        self.assertEqual(chunk.attempts, 2)
+        self.assertEqual(chunk.num_errors, 1)
+
+    def test_insert_stops_after_max_retries(self):
+        error = {"index": 0, "errors": [{"reason": "rateLimitExceeded"}]}
+        client = self._make_client(side_effect=[[error], [error]])
+        inserter = self._make_one(
+            client, self._make_table(), max_rows_per_request=1, max_retries=1
+        )
+
+        with mock.patch("time.sleep"):
+            errors = inserter.insert([("Phred", 32)])
+
+        self.assertEqual(errors, [error])
+        self.assertEqual(client.insert_rows_json.call_count, 2)
+
+    def test_insert_error_indexes_across_chunks(self):
+        def insert_rows_json(table, json_rows, **kwargs):
+            return [
+                {"index": index, "errors": [{"reason": "invalid"}]}
+                for index, row in enumerate(json_rows)
+                if row["age"] == "3"
+            ]
+
+        client = self._make_client(side_effect=insert_rows_json)
+        inserter = self._make_one(
+            client, self._make_table(), max_rows_per_request=2, max_workers=1
+        )
+        rows = [("Phred", index) for index in range(20)]
+
+        errors = inserter.insert(rows)
+
+        self.assertEqual(errors, [{"index": 3, "errors": [{"reason": "invalid"}]}])
+
+    def test_insert_propagates_request_errors(self):
+        from google.cloud.exceptions import NotFound
+
+        client = self._make_client(side_effect=NotFound("no table"))
+        inserter = self._make_one(client, self._make_table())
+
+        with self.assertRaises(NotFound):
+            inserter.insert([("Phred", 32)])
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    def test_insert_w_dataframe(self):
+        client = self._make_client()
+        inserter = self._make_one(client, self._make_table())
+        dataframe = pandas.DataFrame({"full_name": ["Phred", None], "age": [32, 33]})
+
+        inserter.insert(dataframe)
+
+        self.assertEqual(
+            self._sent_rows(client),
+            [
+                {"full_name": "Phred", "age": "32"},
+                {"full_name": None, "age": "33"},
+            ],
+        )
+
+
+class TestInsertChunkStats(unittest.TestCase):
+    def _make_one(self, *args):
+        from google.cloud.bigquery.inserter import InsertChunkStats
+
+        return InsertChunkStats(*args)
+
+    def test_rows_per_second(self):
+        stats = self._make_one(0, 100, 2048, 1, 2.0, 0)
+        self.assertEqual(stats.rows_per_second, 50.0)
+        self.assertIn("num_rows=100", repr(stats))
+
+    def test_rows_per_second_wo_elapsed(self):
+        stats = self._make_one(0, 100, 2048, 1, 0.0, 0)
+        self.assertIsNone(stats.rows_per_second)
@@ -69,6 +69,231 @@ class Test__error_result_to_exception(unittest.TestCase):
         self.assertEqual(exception.code, http_client.INTERNAL_SERVER_ERROR)
 
 
+class Test_contains_order_by(unittest.TestCase):
+    def _call_fut(self, query):
+        from google.cloud.bigquery import job
+
+        return job._contains_order_by(query)
+
+    def test_wo_order_by(self):
+        self.assertFalse(self._call_fut("SELECT name FROM people"))
+        self.assertFalse(self._call_fut(None))
+
+    def test_w_order_by(self):
+        self.assertTrue(self._call_fut("SELECT name FROM people\nORDER BY name"))
+        self.assertTrue(self._call_fut("select name from people order  by name"))
+
+
+class Test_poll_interval(unittest.TestCase):
+    def _call_fut(self, job, elapsed):
+        from google.cloud.bigquery.job import _poll_interval
+
+        return _poll_interval(job, elapsed)
+
+    def _make_job(self, statistics):
+        from google.cloud.bigquery.job import QueryJob
+
+        job = QueryJob("job_id", "SELECT 1", _make_client())
+        job._properties["statistics"] = {"query": statistics}
+        return job
+
+    def test_grows_with_elapsed(self):
+        from google.cloud.bigquery.job import _MAX_POLL_INTERVAL_SECS
+        from google.cloud.bigquery.job import _MIN_POLL_INTERVAL_SECS
+
+        job = self._make_job({})
+        self.assertEqual(self._call_fut(job, 0.0), _MIN_POLL_INTERVAL_SECS)
+        self.assertEqual(self._call_fut(job, 8.0), 2.0)
+        self.assertEqual(self._call_fut(job, 3600.0), _MAX_POLL_INTERVAL_SECS)
+
+    def test_w_query_plan(self):
+        job = self._make_job(
+            {
+                "queryPlan": [
+                    {"parallelInputs": "10", "completedParallelInputs": "10"},
+                    {"parallelInputs": "10", "completedParallelInputs": "6"},
+                ]
+            }
+        )
+        # 16 of 20 inputs done in 32 seconds: 8 seconds left.
+        self.assertEqual(self._call_fut(job, 32.0), 4.0)
+
+    def test_w_small_query(self):
+        job = self._make_job({"estimatedBytesProcessed": "1000"})
+        self.assertEqual(self._call_fut(job, 20.0), 1.0)
+
+
+class Test_wait_for_jobs(unittest.TestCase):
+    PROJECT = "project"
+
+    def _call_fut(self, jobs, **kwargs):
+        from google.cloud.bigquery.job import wait_for_jobs
+
+        return wait_for_jobs(jobs, **kwargs)
+
+    def _resource(self, job_id, state, error_result=None):
+        resource = {
+            "jobReference": {"projectId": self.PROJECT, "jobId": job_id},
+            "status": {"state": state},
+        }
+        if error_result is not None:
+            resource["status"]["errorResult"] = error_result
+        return resource
+
+    def _make_job(self, job_id, client):
+        from google.cloud.bigquery.dataset import DatasetReference
+        from google.cloud.bigquery.job import CopyJob
+
+        destination = DatasetReference(self.PROJECT, "dataset").table("table")
+        job = CopyJob(job_id, [], destination, client)
+        job._properties["status"] = {"state": "RUNNING"}
+        return job
+
+    def test_all_completed(self):
+        connection = _make_connection(
+            self._resource("job_1", "RUNNING"),
+            self._resource("job_2", "DONE"),
+            self._resource("job_1", "DONE"),
+        )
+        client = _make_client(self.PROJECT, connection=connection)
+        job_1 = self._make_job("job_1", client)
+        job_2 = self._make_job("job_2", client)
+
+        done, not_done = self._call_fut([job_1, job_2])
+
+        self.assertEqual(done, {job_1, job_2})
+        self.assertEqual(not_done, set())
+        self.assertEqual(connection.api_request.call_count, 3)
+        self.assertIs(job_1.result(), job_1)
+
+    def test_first_completed(self):
+        import concurrent.futures
+
+        connection = _make_connection(
+            self._resource("job_1", "RUNNING"), self._resource("job_2", "DONE")
+        )
+        client = _make_client(self.PROJECT, connection=connection)
+        job_1 = self._make_job("job_1", client)
+        job_2 = self._make_job("job_2", client)
+
+        done, not_done = self._call_fut(
+            [job_1, job_2], return_when=concurrent.futures.FIRST_COMPLETED
+        )
+
+        self.assertEqual(done, {job_2})
+        self.assertEqual(not_done, {job_1})
+
+    def test_first_exception(self):
+        import concurrent.futures
+
+        connection = _make_connection(
+            self._resource("job_1", "DONE"),
+            self._resource("job_2", "RUNNING"),
+            self._resource("job_2", "DONE", error_result={"reason": "invalid"}),
+        )
+        client = _make_client(self.PROJECT, connection=connection)
+        job_1 = self._make_job("job_1", client)
+        job_2 = self._make_job("job_2", client)
+
+        done, not_done = self._call_fut(
+            [job_1, job_2], return_when=concurrent.futures.FIRST_EXCEPTION
+        )
+
+        self.assertEqual(done, {job_1, job_2})
+        self.assertEqual(not_done, set())
+
+    def test_timeout(self):
+        connection = _make_connection(self._resource("job_1", "RUNNING"))
+        client = _make_client(self.PROJECT, connection=connection)
+        job_1 = self._make_job("job_1", client)
+
+        done, not_done = self._call_fut([job_1], timeout=0)
+
+        self.assertEqual(done, set())
+        self.assertEqual(not_done, {job_1})
+        connection.api_request.assert_called_once()
+
+    def test_begins_jobs(self):
+        begun = self._resource("job_1", "RUNNING")
+        begun["configuration"] = {"copy": {}}
+        connection = _make_connection(begun, self._resource("job_1", "DONE"))
+        client = _make_client(self.PROJECT, connection=connection)
+        job_1 = self._make_job("job_1", client)
+        job_1._properties.pop("status")
+
+        done, _ = self._call_fut([job_1])
+
+        self.assertEqual(done, {job_1})
+        begin_request = connection.api_request.call_args_list[0]
+        self.assertEqual(begin_request[1]["method"], "POST")
+
+    def test_wo_jobs(self):
+        self.assertEqual(self._call_fut([]), (set(), set()))
+
+    def _call_w_clock(self, jobs, clock, **kwargs):
+        """Call with a clock which only advances while sleeping."""
+
+        def sleep(delay):
+            clock[0] += delay
+
+        with mock.patch("time.time", side_effect=lambda: clock[0]):
+            with mock.patch("time.sleep", side_effect=sleep) as sleep_mock:
+                result = self._call_fut(jobs, **kwargs)
+        return result, sleep_mock
+
+    def test_polls_each_job_when_due(self):
+        from google.cloud.bigquery.job import _MIN_POLL_INTERVAL_SECS
+
+        connection = _make_connection(
+            self._resource("job_1", "RUNNING"),
+            self._resource("job_2", "RUNNING"),
+            self._resource("job_1", "DONE"),
+            self._resource("job_2", "DONE"),
+        )
+        client = _make_client(self.PROJECT, connection=connection)
+        job_1 = self._make_job("job_1", client)
+        job_2 = self._make_job("job_2", client)
+        # Polling takes a while, so the second job is due after the first.
+        clock = [100.0]
+        responses = connection.api_request.side_effect
+
+        def api_request(*args, **kwargs):
+            clock[0] += 0.1
+            return next(responses)
+
+        connection.api_request.side_effect = api_request
+
+        (done, not_done), sleep = self._call_w_clock([job_1, job_2], clock)
+
+        self.assertEqual(done, {job_1, job_2})
+        self.assertEqual(
+            [call[1]["path"] for call in connection.api_request.call_args_list],
+            [
+                "/projects/project/jobs/job_1",
+                "/projects/project/jobs/job_2",
+                "/projects/project/jobs/job_1",
+                "/projects/project/jobs/job_2",
+            ],
+        )
+        # The first job is due once the second job's poll has finished, and
+        # the second job is due as soon as the first job's poll has finished.
+        sleep.assert_called_once()
+        self.assertAlmostEqual(sleep.call_args[0][0], _MIN_POLL_INTERVAL_SECS - 0.1)
+
+    def test_timeout_limits_sleep(self):
+        connection = _make_connection(
+            self._resource("job_1", "RUNNING"), self._resource("job_1", "RUNNING")
+        )
+        client = _make_client(self.PROJECT, connection=connection)
+        job_1 = self._make_job("job_1", client)
+
+        (done, not_done), sleep = self._call_w_clock([job_1], [100.0], timeout=0.15)
+
+        self.assertEqual(not_done, {job_1})
+        sleep.assert_called_once()
+        self.assertAlmostEqual(sleep.call_args[0][0], 0.15)
+
+
 class Test_JobReference(unittest.TestCase):
     JOB_ID = "job-id"
     PROJECT = "test-project-123"
@@ -3974,6 +4199,23 @@ class TestQueryJob(unittest.TestCase, _Base):
 
         self.assertEqual(list(result), [])
 
+    def test_result_w_order_by(self):
+        query_resource = {
+            "jobComplete": True,
+            "jobReference": {"projectId": self.PROJECT, "jobId": self.JOB_ID},
+            "schema": {"fields": [{"name": "col1", "type": "STRING"}]},
+            "totalRows": "0",
+        }
+        connection = _make_connection(query_resource, query_resource)
+        client = _make_client(self.PROJECT, connection=connection)
+        resource = self._make_resource(ended=True)
+        resource["configuration"]["query"]["query"] = "SELECT col1 ORDER BY col1"
+        job = self._get_target_class().from_api_repr(resource, client)
+
+        result = job.result()
+
+        self.assertTrue(result._preserve_order)
+
     def test_result_w_empty_schema(self):
         # Destination table may have no schema for some DDL and DML queries.
         query_resource = {
@@ -4049,6 +4291,116 @@ class TestQueryJob(unittest.TestCase, _Base):
         self.assertEqual(query_request[1]["query_params"]["timeoutMs"], 900)
         self.assertEqual(reload_request[1]["method"], "GET")
 
+    def _poll_responses(self, *complete):
+        responses = [self._make_resource()]
+        for job_complete in complete:
+            responses.append(
+                {
+                    "jobComplete": job_complete,
+                    "jobReference": {"projectId": self.PROJECT, "jobId": self.JOB_ID},
+                    "schema": {"fields": [{"name": "col1", "type": "STRING"}]},
+                }
+            )
+        done_resource = self._make_resource()
+        done_resource["status"] = {"state": "DONE"}
+        responses.append(done_resource)
+        return responses
+
+    def test_result_repolls_after_long_poll(self):
+        connection = _make_connection(*self._poll_responses(False, True))
+        client = _make_client(project=self.PROJECT, connection=connection)
+        job = self._make_one(self.JOB_ID, self.QUERY, client)
+
+        # The first poll is held by the server for 10 seconds.
+        times = iter([0.0, 0.0, 10.0, 10.0, 10.5])
+        with mock.patch("time.time", side_effect=lambda: next(times)):
+            with mock.patch("time.sleep") as sleep:
+                job._begin()
+                job._blocking_poll()
+
+        sleep.assert_not_called()
+        self.assertEqual(job.state, "DONE")
+
+    def test_result_sleeps_after_short_poll(self):
+        from google.cloud.bigquery.job import _MIN_POLL_INTERVAL_SECS
+
+        connection = _make_connection(*self._poll_responses(False, True))
+        client = _make_client(project=self.PROJECT, connection=connection)
+        job = self._make_one(self.JOB_ID, self.QUERY, client)
+
+        times = iter([0.0, 0.0, 0.1, 0.3, 0.4])
+        with mock.patch("time.time", side_effect=lambda: next(times)):
+            with mock.patch("time.sleep") as sleep:
+                job._begin()
+                job._blocking_poll()
+
+        sleep.assert_called_once_with(_MIN_POLL_INTERVAL_SECS)
+        self.assertEqual(job.state, "DONE")
+
+    def test_result_retries_poll_errors(self):
+        from google.api_core import exceptions
+
+        responses = self._poll_responses(True)
+        responses.insert(1, exceptions.TooManyRequests("slow down"))
+        connection = _make_connection(*responses)
+        client = _make_client(project=self.PROJECT, connection=connection)
+        job = self._make_one(self.JOB_ID, self.QUERY, client)
+
+        with mock.patch("time.sleep"):
+            job._begin()
+            job._blocking_poll()
+
+        self.assertEqual(job.state, "DONE")
+
+    def test_result_retries_poll_errors_not_retried_by_rpc(self):
+        from google.api_core import exceptions
+
+        responses = self._poll_responses(True)
+        # The default retry of the request does not retry this reason.
+        responses.insert(
+            1,
+            exceptions.TooManyRequests(
+                "slow down", errors=[{"reason": "jobRateLimitExceeded"}]
+            ),
+        )
+        connection = _make_connection(*responses)
+        client = _make_client(project=self.PROJECT, connection=connection)
+        job = self._make_one(self.JOB_ID, self.QUERY, client)
+
+        with mock.patch("time.sleep") as sleep:
+            job._begin()
+            job._blocking_poll()
+
+        sleep.assert_called_once()
+        self.assertEqual(job.state, "DONE")
+
+    def test_result_raises_permanent_poll_errors(self):
+        from google.api_core import exceptions
+
+        connection = _make_connection(
+            self._make_resource(), exceptions.Forbidden("denied")
+        )
+        client = _make_client(project=self.PROJECT, connection=connection)
+        job = self._make_one(self.JOB_ID, self.QUERY, client)
+
+        job._begin()
+        with self.assertRaises(exceptions.Forbidden):
+            job._blocking_poll()
+
+    def test_result_w_timeout_expired(self):
+        import concurrent.futures
+
+        connection = _make_connection(*self._poll_responses(False, False))
+        client = _make_client(project=self.PROJECT, connection=connection)
+        job = self._make_one(self.JOB_ID, self.QUERY, client)
+
+        times = iter([0.0, 0.0, 0.5, 0.5, 1.1])
+        with mock.patch("time.time", side_effect=lambda: next(times)):
+            with mock.patch("time.sleep"):
+                job._begin()
+                with self.assertRaises(concurrent.futures.TimeoutError):
+                    job._blocking_poll(timeout=1.0)
+
     def test_result_error(self):
         from google.cloud import exceptions
 
@@ -4543,6 +4895,33 @@ class TestQueryJob(unittest.TestCase, _Base):
         self.assertEqual(len(df), 4)  # verify the number of rows
         self.assertEqual(list(df), ["name", "age"])  # verify the column names
 
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    def test_to_dataframe_w_bqstorage_client(self):
+        begun_resource = self._make_resource()
+        query_resource = {
+            "jobComplete": True,
+            "jobReference": {"projectId": self.PROJECT, "jobId": self.JOB_ID},
+            "totalRows": "1000000",
+            "schema": {"fields": [{"name": "name", "type": "STRING"}]},
+        }
+        done_resource = copy.deepcopy(begun_resource)
+        done_resource["status"] = {"state": "DONE"}
+        connection = _make_connection(begun_resource, query_resource, done_resource)
+        client = _make_client(project=self.PROJECT, connection=connection)
+        job = self._make_one(self.JOB_ID, self.QUERY, client)
+        bqstorage_client = mock.Mock(spec=["create_read_session", "read_streams"])
+        read_streams = bqstorage_client.read_streams.return_value
+        read_streams.to_dataframe.return_value = pandas.DataFrame({"name": ["a"]})
+
+        df = job.to_dataframe(bqstorage_client=bqstorage_client)
+
+        self.assertEqual(list(df.name), ["a"])
+        table_reference = bqstorage_client.create_read_session.call_args[0][0]
+        self.assertEqual(table_reference["dataset_id"], "_temp_dataset")
+        self.assertEqual(table_reference["table_id"], "_temp_table")
+        # Rows are not listed with tabledata.list.
+        self.assertEqual(connection.api_request.call_count, 3)
+
     def test_iter(self):
         import types
 
@@ -0,0 +1,333 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import unittest
+
+import mock
+
+
+def _make_credentials():
+    import google.auth.credentials
+
+    return mock.Mock(spec=google.auth.credentials.Credentials)
+
+
+def _make_client(*responses):
+    import google.cloud.bigquery._http
+    from google.cloud.bigquery.client import Client
+    from google.cloud.exceptions import NotFound
+
+    client = Client(project="project", credentials=_make_credentials(), _http=object())
+    connection = mock.create_autospec(google.cloud.bigquery._http.Connection)
+    connection.api_request.side_effect = list(responses) + [NotFound("miss")]
+    client._connection = connection
+    return client
+
+
+def _job_resource(job_id, state, error_result=None, created=1500000000000):
+    resource = {
+        "jobReference": {"projectId": "project", "jobId": job_id},
+        "configuration": {
+            "copy": {
+                "sourceTables": [
+                    {"projectId": "project", "datasetId": "ds", "tableId": "src"}
+                ],
+                "destinationTable": {
+                    "projectId": "project",
+                    "datasetId": "ds",
+                    "tableId": job_id,
+                },
+            }
+        },
+        "statistics": {"creationTime": str(created)},
+        "status": {"state": state},
+    }
+    if error_result is not None:
+        resource["status"]["errorResult"] = error_result
+    return resource
+
+
+class TestJobGroupResult(unittest.TestCase):
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.bigquery.job_group import JobGroupResult
+
+        return JobGroupResult
+
+    def test_succeeded(self):
+        result = self._get_target_class()(mock.sentinel.job)
+        self.assertTrue(result.succeeded)
+        self.assertIn("sentinel.job", repr(result))
+
+    def test_failed(self):
+        result = self._get_target_class()(None, ValueError("bad"))
+        self.assertFalse(result.succeeded)
+
+
+class TestJobGroup(unittest.TestCase):
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.bigquery.job_group import JobGroup
+
+        return JobGroup
+
+    def _make_one(self, client, **kwargs):
+        kwargs.setdefault("poll_interval", 0)
+        kwargs.setdefault("max_jobs_per_second", 1000)
+        return self._get_target_class()(client, **kwargs)
+
+    def _requests(self, client):
+        return [
+            (call[1]["method"], call[1]["path"])
+            for call in client._connection.api_request.call_args_list
+        ]
+
+    def test_run_w_get_job_polls(self):
+        client = _make_client(
+            _job_resource("job_1", "RUNNING"),
+            _job_resource("job_2", "DONE"),
+            _job_resource("job_1", "DONE"),
+        )
+        group = self._make_one(client)
+        self.assertEqual(
+            group.copy_table("ds.src", "project.ds.job_1", job_id="job_1"), 0
+        )
+        self.assertEqual(
+            group.copy_table("ds.src", "project.ds.job_2", job_id="job_2"), 1
+        )
+        self.assertEqual(len(group), 2)
+        self.assertEqual(group.results, [None, None])
+
+        results = group.run()
+
+        self.assertEqual([result.job.job_id for result in results], ["job_1", "job_2"])
+        self.assertTrue(all(result.succeeded for result in results))
+        self.assertEqual(
+            self._requests(client),
+            [
+                ("POST", "/projects/project/jobs"),
+                ("POST", "/projects/project/jobs"),
+                ("GET", "/projects/project/jobs/job_1"),
+            ],
+        )
+
+    def test_run_w_list_jobs_poll(self):
+        num_jobs = 7
+        responses = [
+            _job_resource("job_{}".format(index), "RUNNING")
+            for index in range(num_jobs)
+        ]
+        # The first poll lists some of the jobs as done, including a
+        # failed one and a job which is not part of the group.
+        responses.append(
+            {
+                "jobs": [
+                    _job_resource("other", "DONE"),
+                    _job_resource("job_0", "DONE"),
+                    _job_resource("job_1", "DONE", error_result={"reason": "notFound"}),
+                    _job_resource("job_2", "DONE"),
+                ]
+            }
+        )
+        # Then few enough jobs are left to poll them one at a time.
+        for index in range(3, num_jobs):
+            responses.append(_job_resource("job_{}".format(index), "DONE"))
+        client = _make_client(*responses)
+        group = self._make_one(client)
+        for index in range(num_jobs):
+            group.copy_table("ds.src", "ds.dst", job_id="job_{}".format(index))
+
+        results = group.run()
+
+        self.assertEqual(
+            [result.succeeded for result in results],
+            [True, False, True, True, True, True, True],
+        )
+        self.assertEqual(results[1].exception.code, 404)
+        list_request = client._connection.api_request.call_args_list[num_jobs]
+        self.assertEqual(list_request[1]["path"], "/projects/project/jobs")
+        params = list_request[1]["query_params"]
+        self.assertEqual(params["stateFilter"], "done")
+        self.assertEqual(params["minCreationTime"], str(1500000000000 - 300000))
+        self.assertEqual(params["maxCreationTime"], str(1500000000000 + 300000))
+
+    def test_run_w_list_jobs_poll_stops_once_all_found(self):
+        num_jobs = 6
+        responses = []
+        for index in range(num_jobs):
+            resource = _job_resource("job_{}".format(index), "RUNNING")
+            # Without creation times, the listing is not bounded by them.
+            del resource["statistics"]
+            responses.append(resource)
+        responses.append(
+            {
+                "jobs": [
+                    _job_resource("job_{}".format(index), "DONE")
+                    for index in range(num_jobs)
+                ],
+                "nextPageToken": "more-jobs",
+            }
+        )
+        client = _make_client(*responses)
+        group = self._make_one(client)
+        for index in range(num_jobs):
+            group.copy_table("ds.src", "ds.dst", job_id="job_{}".format(index))
+
+        results = group.run()
+
+        self.assertTrue(all(result.succeeded for result in results))
+        # The next page of the listing is not requested.
+        self.assertEqual(
+            self._requests(client)[num_jobs:], [("GET", "/projects/project/jobs")]
+        )
+        params = client._connection.api_request.call_args[1]["query_params"]
+        self.assertNotIn("minCreationTime", params)
+        self.assertNotIn("maxCreationTime", params)
+
+    def test_run_w_list_jobs_poll_reads_whole_listing(self):
+        from google.cloud.bigquery.job_group import _MAX_LIST_PAGES
+
+        num_jobs = 7
+        responses = [
+            _job_resource("job_{}".format(index), "RUNNING")
+            for index in range(num_jobs)
+        ]
+        # The last page read ends the listing: the jobs which were not
+        # found are still running.
+        for page in range(_MAX_LIST_PAGES):
+            response = {"jobs": [_job_resource("job_{}".format(page), "DONE")]}
+            if page < _MAX_LIST_PAGES - 1:
+                response["nextPageToken"] = "more-jobs"
+            responses.append(response)
+        # Then few enough jobs are left to poll them one at a time.
+        responses.append(_job_resource("job_3", "RUNNING"))
+        for index in range(4, num_jobs):
+            responses.append(_job_resource("job_{}".format(index), "DONE"))
+        responses.append(_job_resource("job_3", "DONE"))
+        client = _make_client(*responses)
+        group = self._make_one(client)
+        for index in range(num_jobs):
+            group.copy_table("ds.src", "ds.dst", job_id="job_{}".format(index))
+
+        results = group.run()
+
+        self.assertTrue(all(result.succeeded for result in results))
+        self.assertEqual(
+            self._requests(client)[num_jobs:],
+            [("GET", "/projects/project/jobs")] * _MAX_LIST_PAGES
+            + [
+                ("GET", "/projects/project/jobs/job_{}".format(index))
+                for index in (3, 4, 5, 6, 3)
+            ],
+        )
+
+    def test_run_w_list_jobs_poll_caps_pages(self):
+        from google.cloud.bigquery.job_group import _MAX_LIST_PAGES
+
+        num_jobs = 6
+        responses = [
+            _job_resource("job_{}".format(index), "RUNNING")
+            for index in range(num_jobs)
+        ]
+        # Other jobs of the project fill the pages, except for one job of
+        # the group on the last page read.
+        for page in range(_MAX_LIST_PAGES):
+            jobs = [_job_resource("other_{}".format(page), "DONE")]
+            if page == _MAX_LIST_PAGES - 1:
+                jobs.append(_job_resource("job_0", "DONE"))
+            responses.append({"jobs": jobs, "nextPageToken": "more-jobs"})
+        # Then the jobs which were not found are polled one at a time.
+        responses.append(_job_resource("job_1", "RUNNING"))
+        for index in range(2, num_jobs):
+            responses.append(_job_resource("job_{}".format(index), "DONE"))
+        responses.append(_job_resource("job_1", "DONE"))
+        client = _make_client(*responses)
+        group = self._make_one(client)
+        for index in range(num_jobs):
+            group.copy_table("ds.src", "ds.dst", job_id="job_{}".format(index))
+
+        results = group.run()
+
+        self.assertTrue(all(result.succeeded for result in results))
+        self.assertEqual(
+            self._requests(client)[num_jobs:],
+            [("GET", "/projects/project/jobs")] * _MAX_LIST_PAGES
+            + [
+                ("GET", "/projects/project/jobs/job_{}".format(index))
+                for index in (1, 2, 3, 4, 5, 1)
+            ],
+        )
+
+    def test_run_w_start_error(self):
+        from google.api_core import exceptions
+
+        client = _make_client(
+            exceptions.BadRequest("invalid"), _job_resource("job_2", "DONE")
+        )
+        group = self._make_one(client)
+        group.copy_table("ds.src", "ds.dst", job_id="job_1")
+        group.copy_table("ds.src", "ds.dst", job_id="job_2")
+
+        results = group.run()
+
+        self.assertIsNone(results[0].job)
+        self.assertIsInstance(results[0].exception, exceptions.BadRequest)
+        self.assertTrue(results[1].succeeded)
+
+    def test_run_w_max_concurrent_jobs(self):
+        client = _make_client(
+            _job_resource("job_1", "RUNNING"),
+            _job_resource("job_1", "DONE"),
+            _job_resource("job_2", "DONE"),
+        )
+        group = self._make_one(client, max_concurrent_jobs=1)
+        group.load_table_from_uri("gs://bucket/1", "ds.dst", job_id="job_1")
+        group.extract_table("ds.src", "gs://bucket/2", job_id="job_2")
+
+        results = group.run()
+
+        self.assertEqual(len(results), 2)
+        self.assertEqual(
+            [method for method, _ in self._requests(client)], ["POST", "GET", "POST"]
+        )
+
+    def test_run_throttles_job_starts(self):
+        client = _make_client(
+            _job_resource("job_1", "DONE"), _job_resource("job_2", "DONE")
+        )
+        group = self._make_one(client, max_jobs_per_second=2)
+        group.copy_table("ds.src", "ds.dst", job_id="job_1")
+        group.copy_table("ds.src", "ds.dst", job_id="job_2")
+
+        with mock.patch("time.time", return_value=100.0):
+            with mock.patch("time.sleep") as sleep:
+                group.run()
+
+        sleep.assert_called_once_with(0.5)
+
+    def test_run_w_timeout(self):
+        import concurrent.futures
+
+        client = _make_client(
+            _job_resource("job_1", "RUNNING"), _job_resource("job_1", "DONE")
+        )
+        group = self._make_one(client)
+        group.copy_table("ds.src", "ds.dst", job_id="job_1")
+
+        with self.assertRaises(concurrent.futures.TimeoutError):
+            group.run(timeout=0)
+        self.assertEqual(group.results, [None])
+
+        results = group.run()
+        self.assertTrue(results[0].succeeded)
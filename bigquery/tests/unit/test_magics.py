@@ -13,6 +13,7 @@
 # limitations under the License.
 
 import re
+import sys
 import mock
 from concurrent import futures
 
@@ -167,6 +168,88 @@ def test_bigquery_magic_without_optional_arguments():
     assert list(result) == list(result)  # verify column names
 
 
+@pytest.mark.usefixtures("ipython_interactive")
+@pytest.mark.skipif(pandas is None, reason="Requires `pandas`")
+def test_bigquery_magic_with_bqstorage_api():
+    pytest.importorskip("google.cloud.bigquery_storage_v1beta1")
+    ip = IPython.get_ipython()
+    ip.extension_manager.load_extension("google.cloud.bigquery")
+    magics.context.credentials = mock.create_autospec(
+        google.auth.credentials.Credentials, instance=True
+    )
+
+    run_query_patch = mock.patch(
+        "google.cloud.bigquery.magics._run_query", autospec=True
+    )
+    bqstorage_client_patch = mock.patch(
+        "google.cloud.bigquery_storage_v1beta1.BigQueryStorageClient", autospec=True
+    )
+    query_job_mock = mock.create_autospec(
+        google.cloud.bigquery.job.QueryJob, instance=True
+    )
+    query_job_mock.to_dataframe.return_value = pandas.DataFrame([17], columns=["num"])
+    with run_query_patch as run_query_mock, bqstorage_client_patch as client_mock:
+        run_query_mock.return_value = query_job_mock
+
+        ip.run_cell_magic("bigquery", "--use_bqstorage_api", "SELECT 17 AS num")
+
+    client_mock.assert_called_once_with(credentials=magics.context.credentials)
+    query_job_mock.to_dataframe.assert_called_once_with(
+        bqstorage_client=client_mock.return_value
+    )
+
+
+def test_make_bqstorage_client_not_requested():
+    assert magics._make_bqstorage_client(False, mock.sentinel.credentials) is None
+
+
+def test_make_bqstorage_client_without_bqstorage_library(monkeypatch):
+    import google.cloud
+
+    monkeypatch.delattr(google.cloud, "bigquery_storage_v1beta1", raising=False)
+    monkeypatch.setitem(sys.modules, "google.cloud.bigquery_storage_v1beta1", None)
+
+    with pytest.warns(UserWarning):
+        got = magics._make_bqstorage_client(True, mock.sentinel.credentials)
+
+    assert got is None
+
+
+@pytest.mark.usefixtures("ipython_interactive")
+@pytest.mark.skipif(pandas is None, reason="Requires `pandas`")
+def test_bigquery_magic_with_context_use_bqstorage_api():
+    ip = IPython.get_ipython()
+    ip.extension_manager.load_extension("google.cloud.bigquery")
+    magics.context.credentials = mock.create_autospec(
+        google.auth.credentials.Credentials, instance=True
+    )
+    assert magics.context.use_bqstorage_api is False
+
+    run_query_patch = mock.patch(
+        "google.cloud.bigquery.magics._run_query", autospec=True
+    )
+    make_client_patch = mock.patch(
+        "google.cloud.bigquery.magics._make_bqstorage_client", autospec=True
+    )
+    query_job_mock = mock.create_autospec(
+        google.cloud.bigquery.job.QueryJob, instance=True
+    )
+    query_job_mock.to_dataframe.return_value = pandas.DataFrame([17], columns=["num"])
+    magics.context.use_bqstorage_api = True
+    try:
+        with run_query_patch as run_query_mock, make_client_patch as make_client:
+            run_query_mock.return_value = query_job_mock
+
+            ip.run_cell_magic("bigquery", "", "SELECT 17 AS num")
+    finally:
+        magics.context.use_bqstorage_api = False
+
+    make_client.assert_called_once_with(True, magics.context.credentials)
+    query_job_mock.to_dataframe.assert_called_once_with(
+        bqstorage_client=make_client.return_value
+    )
+
+
 @pytest.mark.usefixtures("ipython_interactive")
 def test_bigquery_magic_with_legacy_sql():
     ip = IPython.get_ipython()
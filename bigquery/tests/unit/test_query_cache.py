@@ -0,0 +1,978 @@
+# Copyright 2018 Google LLC
+#
+# Licensed under the Apache License, Version 2.0 (the "License");
+# you may not use this file except in compliance with the License.
+# You may obtain a copy of the License at
+#
+#     http://www.apache.org/licenses/LICENSE-2.0
+#
+# Unless required by applicable law or agreed to in writing, software
+# distributed under the License is distributed on an "AS IS" BASIS,
+# WITHOUT WARRANTIES OR CONDITIONS OF ANY KIND, either express or implied.
+# See the License for the specific language governing permissions and
+# limitations under the License.
+
+import shutil
+import tempfile
+import unittest
+
+import mock
+
+
+def _make_credentials():
+    import google.auth.credentials
+
+    return mock.Mock(spec=google.auth.credentials.Credentials)
+
+
+def _make_connection(*responses):
+    import google.cloud.bigquery._http
+    from google.cloud.exceptions import NotFound
+
+    mock_conn = mock.create_autospec(google.cloud.bigquery._http.Connection)
+    mock_conn.USER_AGENT = "testing 1.2.3"
+    mock_conn.api_request.side_effect = list(responses) + [NotFound("miss")]
+    return mock_conn
+
+
+def _make_entry(num_bytes, created=0.0):
+    return {"created": created, "num_bytes": num_bytes, "rows": [], "tables": {}}
+
+
+class Test_normalize_sql(unittest.TestCase):
+    def _call_fut(self, query):
+        from google.cloud.bigquery.query_cache import _normalize_sql
+
+        return _normalize_sql(query)
+
+    def test_collapses_whitespace(self):
+        query = "\n  SELECT a,\n\tb  FROM `t`  WHERE c = @c ;\n"
+        self.assertEqual(self._call_fut(query), "SELECT a, b FROM `t` WHERE c = @c")
+
+    def test_keeps_quoted_whitespace(self):
+        query = 'SELECT \'a  b\', "c\\"  d"   FROM `my  table`'
+        self.assertEqual(
+            self._call_fut(query), 'SELECT \'a  b\', "c\\"  d" FROM `my  table`'
+        )
+
+
+class Test_make_key(unittest.TestCase):
+    def _call_fut(self, query, job_config, project="proj", location="US"):
+        from google.cloud.bigquery.query_cache import _make_key
+
+        return _make_key(query, job_config, project, location)
+
+    def test_normalized_query(self):
+        from google.cloud.bigquery.job import QueryJobConfig
+
+        self.assertEqual(
+            self._call_fut("SELECT 1", QueryJobConfig()),
+            self._call_fut("  SELECT\n1;", QueryJobConfig()),
+        )
+
+    def test_parameters(self):
+        from google.cloud.bigquery.job import QueryJobConfig
+        from google.cloud.bigquery.query import ScalarQueryParameter
+
+        config_1 = QueryJobConfig()
+        config_1.query_parameters = [ScalarQueryParameter("x", "INT64", 1)]
+        config_2 = QueryJobConfig()
+        config_2.query_parameters = [ScalarQueryParameter("x", "INT64", 2)]
+        config_3 = QueryJobConfig()
+        config_3.query_parameters = [ScalarQueryParameter("x", "INT64", 1)]
+        config_3.labels = {"dashboard": "sales"}
+
+        key_1 = self._call_fut("SELECT @x", config_1)
+        self.assertNotEqual(key_1, self._call_fut("SELECT @x", config_2))
+        self.assertEqual(key_1, self._call_fut("SELECT @x", config_3))
+
+    def test_legacy_sql_default(self):
+        from google.cloud.bigquery.job import QueryJobConfig
+
+        config = QueryJobConfig()
+        config.use_legacy_sql = False
+        self.assertEqual(
+            self._call_fut("SELECT 1", QueryJobConfig()),
+            self._call_fut("SELECT 1", config),
+        )
+
+    def test_project_and_location(self):
+        from google.cloud.bigquery.job import QueryJobConfig
+
+        key = self._call_fut("SELECT 1", QueryJobConfig())
+        self.assertNotEqual(
+            key, self._call_fut("SELECT 1", QueryJobConfig(), project="other")
+        )
+        self.assertNotEqual(
+            key, self._call_fut("SELECT 1", QueryJobConfig(), location="EU")
+        )
+
+
+class Test_is_cacheable(unittest.TestCase):
+    def _call_fut(self, query, job_config=None):
+        from google.cloud.bigquery.job import QueryJobConfig
+        from google.cloud.bigquery.query_cache import _is_cacheable
+
+        return _is_cacheable(query, job_config or QueryJobConfig())
+
+    def test_select(self):
+        self.assertTrue(self._call_fut("SELECT * FROM `p.d.t` WHERE x = @x"))
+
+    def test_nondeterministic(self):
+        self.assertFalse(self._call_fut("SELECT current_timestamp()"))
+        self.assertFalse(self._call_fut("SELECT RAND() AS r"))
+        self.assertFalse(self._call_fut("SELECT * FROM `p.d.events_*`"))
+
+    def test_config(self):
+        from google.cloud.bigquery.dataset import DatasetReference
+        from google.cloud.bigquery.job import QueryJobConfig
+
+        config = QueryJobConfig()
+        config.destination = DatasetReference("p", "d").table("t")
+        self.assertFalse(self._call_fut("SELECT 1", config))
+
+        config = QueryJobConfig()
+        config.dry_run = True
+        self.assertFalse(self._call_fut("SELECT 1", config))
+
+        config = QueryJobConfig()
+        config.use_query_cache = False
+        self.assertFalse(self._call_fut("SELECT 1", config))
+
+
+class Test_CachedRowsRequest(unittest.TestCase):
+    def _make_one(self, rows):
+        from google.cloud.bigquery.query_cache import _CachedRowsRequest
+
+        return _CachedRowsRequest(rows)
+
+    def test_all_rows(self):
+        request = self._make_one([1, 2, 3])
+        response = request(method="GET", path="", query_params={})
+        self.assertEqual(response, {"rows": [1, 2, 3], "totalRows": 3})
+
+    def test_pages(self):
+        request = self._make_one([1, 2, 3])
+        response = request(method="GET", path="", query_params={"maxResults": 2})
+        self.assertEqual(response, {"rows": [1, 2], "totalRows": 3, "pageToken": "2"})
+        response = request(
+            method="GET", path="", query_params={"maxResults": 2, "pageToken": "2"}
+        )
+        self.assertEqual(response, {"rows": [3], "totalRows": 3})
+        response = request(method="GET", path="", query_params={"startIndex": 1})
+        self.assertEqual(response, {"rows": [2, 3], "totalRows": 3})
+
+
+class TestMemoryQueryCache(unittest.TestCase):
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.bigquery.query_cache import MemoryQueryCache
+
+        return MemoryQueryCache
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    def test_get_set_delete(self):
+        cache = self._make_one()
+        entry = _make_entry(10)
+
+        self.assertIsNone(cache.get("key"))
+        cache.set("key", entry)
+        self.assertIs(cache.get("key"), entry)
+        self.assertEqual(cache.num_bytes, 10)
+        cache.delete("key")
+        self.assertIsNone(cache.get("key"))
+        self.assertEqual(cache.num_bytes, 0)
+
+    def test_set_evicts_least_recently_used(self):
+        cache = self._make_one(max_bytes=25)
+        cache.set("a", _make_entry(10))
+        cache.set("b", _make_entry(10))
+        cache.get("a")
+        cache.set("c", _make_entry(10))
+
+        self.assertIsNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("a"))
+        self.assertIsNotNone(cache.get("c"))
+        self.assertEqual(len(cache), 2)
+        self.assertEqual(cache.num_bytes, 20)
+
+    def test_set_too_large(self):
+        cache = self._make_one(max_bytes=5)
+        cache.set("a", _make_entry(10))
+        self.assertEqual(len(cache), 0)
+
+    def test_clear(self):
+        cache = self._make_one()
+        cache.set("a", _make_entry(10))
+        cache.clear()
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(cache.num_bytes, 0)
+
+    def test_lookup_expired(self):
+        cache = self._make_one(ttl=60, validate_tables=False)
+        cache.set("a", _make_entry(10, created=1000.0))
+
+        with mock.patch("time.time", return_value=1030.0):
+            self.assertIsNotNone(cache._lookup("a", mock.sentinel.client))
+        with mock.patch("time.time", return_value=1061.0):
+            self.assertIsNone(cache._lookup("a", mock.sentinel.client))
+        self.assertIsNone(cache.get("a"))
+
+
+class TestDiskQueryCache(unittest.TestCase):
+    def setUp(self):
+        self.directory = tempfile.mkdtemp()
+
+    def tearDown(self):
+        shutil.rmtree(self.directory)
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.bigquery.query_cache import DiskQueryCache
+
+        return DiskQueryCache
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(self.directory, *args, **kw)
+
+    def test_get_set_delete(self):
+        cache = self._make_one()
+        entry = _make_entry(10)
+
+        self.assertIsNone(cache.get("key"))
+        cache.set("key", entry)
+        self.assertEqual(cache.get("key"), entry)
+        self.assertEqual(self._make_one().get("key"), entry)
+        cache.delete("key")
+        self.assertIsNone(cache.get("key"))
+
+    def test_set_evicts_least_recently_used(self):
+        import os
+
+        cache = self._make_one(max_bytes=200)
+        cache.set("a", _make_entry(10))
+        cache.set("b", _make_entry(10))
+        os.utime(cache._path("a"), (1000, 1000))
+        os.utime(cache._path("b"), (2000, 2000))
+        cache.set("c", _make_entry(100))
+
+        self.assertIsNone(cache.get("a"))
+        self.assertIsNotNone(cache.get("b"))
+        self.assertIsNotNone(cache.get("c"))
+
+    def test_clear(self):
+        cache = self._make_one()
+        cache.set("a", _make_entry(10))
+        cache.clear()
+        self.assertIsNone(cache.get("a"))
+
+    def test_set_too_large(self):
+        cache = self._make_one(max_bytes=5)
+        cache.set("a", _make_entry(10))
+        self.assertIsNone(cache.get("a"))
+
+    def test_ctor_creates_directory(self):
+        import os
+
+        directory = os.path.join(self.directory, "cache")
+
+        cache = self._get_target_class()(directory)
+
+        self.assertTrue(os.path.isdir(directory))
+        self.assertEqual(cache.directory, directory)
+
+    def test_get_corrupt_entry(self):
+        cache = self._make_one()
+        with open(cache._path("key"), "w") as entry_file:
+            entry_file.write("{not json")
+
+        self.assertIsNone(cache.get("key"))
+
+    def test_evict_skips_removed_file(self):
+        import os
+
+        cache = self._make_one()
+        cache.set("a", _make_entry(10))
+
+        # Another process removes the file while the cache is evicting.
+        with mock.patch.object(os, "stat", side_effect=OSError("removed")):
+            cache._evict(0)
+
+        self.assertTrue(os.path.exists(cache._path("a")))
+
+
+class TestClientQueryCache(unittest.TestCase):
+    PROJECT = "project"
+    QUERY = "SELECT name, age FROM `project.dataset.people` WHERE age > 1"
+
+    def _make_client(self, cache, *responses):
+        from google.cloud.bigquery.client import Client
+
+        client = Client(
+            project=self.PROJECT,
+            credentials=_make_credentials(),
+            _http=object(),
+            query_cache=cache,
+        )
+        client._connection = _make_connection(*responses)
+        return client
+
+    def _job_resource(self, job_id):
+        return {
+            "jobReference": {"projectId": self.PROJECT, "jobId": job_id},
+            "configuration": {
+                "query": {
+                    "query": self.QUERY,
+                    "useLegacySql": False,
+                    "destinationTable": {
+                        "projectId": self.PROJECT,
+                        "datasetId": "_anonymous",
+                        "tableId": "anon",
+                    },
+                }
+            },
+            "status": {"state": "DONE"},
+            "statistics": {
+                "startTime": "1000",
+                "query": {
+                    "statementType": "SELECT",
+                    "referencedTables": [
+                        {
+                            "projectId": self.PROJECT,
+                            "datasetId": "dataset",
+                            "tableId": "people",
+                        }
+                    ],
+                },
+            },
+        }
+
+    def _query_results_resource(self, job_id):
+        return {
+            "jobReference": {"projectId": self.PROJECT, "jobId": job_id},
+            "jobComplete": True,
+            "totalRows": "2",
+            "schema": {
+                "fields": [
+                    {"name": "name", "type": "STRING", "mode": "NULLABLE"},
+                    {"name": "age", "type": "INTEGER", "mode": "NULLABLE"},
+                ]
+            },
+        }
+
+    def _rows_resource(self):
+        return {
+            "totalRows": "2",
+            "rows": [
+                {"f": [{"v": "Phred"}, {"v": "32"}]},
+                {"f": [{"v": "Bharney"}, {"v": "33"}]},
+            ],
+        }
+
+    def _table_resource(self, modified):
+        return {
+            "tableReference": {
+                "projectId": self.PROJECT,
+                "datasetId": "dataset",
+                "tableId": "people",
+            },
+            "lastModifiedTime": modified,
+        }
+
+    def _run_query(self, client, job_config=None):
+        rows = client.query(self.QUERY, job_config=job_config).result()
+        return [tuple(row.values()) for row in rows]
+
+    def test_miss_then_hit(self):
+        from google.cloud.bigquery.query_cache import MemoryQueryCache
+
+        cache = MemoryQueryCache()
+        client = self._make_client(
+            cache,
+            self._job_resource("job_1"),
+            self._query_results_resource("job_1"),
+            self._rows_resource(),
+            self._table_resource("900"),
+            self._table_resource("900"),
+        )
+        expected = [("Phred", 32), ("Bharney", 33)]
+
+        self.assertEqual(self._run_query(client), expected)
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(client._connection.api_request.call_count, 4)
+
+        query_job = client.query(" " + self.QUERY + ";")
+        self.assertEqual(query_job.job_id, "job_1")
+        self.assertEqual(client._connection.api_request.call_count, 5)
+        _, req = client._connection.api_request.call_args
+        self.assertEqual(req["method"], "GET")
+        self.assertEqual(
+            req["path"], "/projects/project/datasets/dataset/tables/people"
+        )
+
+        self.assertEqual([tuple(row.values()) for row in query_job], expected)
+        self.assertEqual(query_job.result().total_rows, 2)
+        self.assertEqual(client._connection.api_request.call_count, 5)
+
+    def test_hit_wo_validate_tables(self):
+        from google.cloud.bigquery.query_cache import MemoryQueryCache
+
+        cache = MemoryQueryCache(validate_tables=False)
+        client = self._make_client(
+            cache,
+            self._job_resource("job_1"),
+            self._query_results_resource("job_1"),
+            self._rows_resource(),
+            self._table_resource("900"),
+        )
+
+        first = self._run_query(client)
+        self.assertEqual(self._run_query(client), first)
+        self.assertEqual(client._connection.api_request.call_count, 4)
+
+    def test_hit_w_pages(self):
+        from google.cloud.bigquery.query_cache import MemoryQueryCache
+
+        cache = MemoryQueryCache(validate_tables=False)
+        client = self._make_client(
+            cache,
+            self._job_resource("job_1"),
+            self._query_results_resource("job_1"),
+            self._rows_resource(),
+            self._table_resource("900"),
+        )
+        self._run_query(client)
+
+        rows = client.query(self.QUERY).result()
+        rows._page_size = 1
+        pages = list(rows.pages)
+        self.assertEqual(len(pages), 2)
+
+    def test_table_modified(self):
+        from google.cloud.bigquery.query_cache import MemoryQueryCache
+
+        cache = MemoryQueryCache()
+        client = self._make_client(
+            cache,
+            self._job_resource("job_1"),
+            self._query_results_resource("job_1"),
+            self._rows_resource(),
+            self._table_resource("900"),
+            self._table_resource("1500"),
+            self._job_resource("job_2"),
+        )
+        self._run_query(client)
+
+        query_job = client.query(self.QUERY)
+        self.assertEqual(query_job.job_id, mock.ANY)
+        _, req = client._connection.api_request.call_args
+        self.assertEqual(req["method"], "POST")
+        self.assertEqual(len(cache), 0)
+
+    def test_table_modified_while_running(self):
+        from google.cloud.bigquery.query_cache import MemoryQueryCache
+
+        cache = MemoryQueryCache()
+        client = self._make_client(
+            cache,
+            self._job_resource("job_1"),
+            self._query_results_resource("job_1"),
+            self._rows_resource(),
+            self._table_resource("1001"),
+        )
+        self._run_query(client)
+        self.assertEqual(len(cache), 0)
+
+    def test_table_not_readable(self):
+        from google.cloud.exceptions import Forbidden
+        from google.cloud.bigquery.query_cache import MemoryQueryCache
+
+        cache = MemoryQueryCache()
+        client = self._make_client(
+            cache,
+            self._job_resource("job_1"),
+            self._query_results_resource("job_1"),
+            self._rows_resource(),
+            Forbidden("authorized view"),
+        )
+
+        self.assertEqual(self._run_query(client), [("Phred", 32), ("Bharney", 33)])
+        self.assertEqual(len(cache), 0)
+
+    def test_table_not_readable_on_lookup(self):
+        from google.cloud.exceptions import Forbidden
+        from google.cloud.bigquery.query_cache import MemoryQueryCache
+
+        cache = MemoryQueryCache()
+        client = self._make_client(
+            cache,
+            self._job_resource("job_1"),
+            self._query_results_resource("job_1"),
+            self._rows_resource(),
+            self._table_resource("900"),
+            Forbidden("permission revoked"),
+            self._job_resource("job_2"),
+        )
+        self._run_query(client)
+        self.assertEqual(len(cache), 1)
+
+        query_job = client.query(self.QUERY)
+        self.assertEqual(query_job.job_id, mock.ANY)
+        _, req = client._connection.api_request.call_args
+        self.assertEqual(req["method"], "POST")
+        self.assertEqual(len(cache), 0)
+
+    def test_partially_read(self):
+        from google.cloud.bigquery.query_cache import MemoryQueryCache
+
+        cache = MemoryQueryCache()
+        rows = self._rows_resource()
+        rows["pageToken"] = "next"
+        client = self._make_client(
+            cache,
+            self._job_resource("job_1"),
+            self._query_results_resource("job_1"),
+            {"totalRows": "3", "rows": rows["rows"], "pageToken": "next"},
+        )
+
+        iterator = client.query(self.QUERY).result()
+        next(iterator.pages)
+        self.assertEqual(len(cache), 0)
+
+    def test_partially_read_then_reread(self):
+        from google.cloud.bigquery.query_cache import MemoryQueryCache
+
+        cache = MemoryQueryCache()
+        rows = self._rows_resource()["rows"]
+        first_page = {"totalRows": "2", "rows": rows[:1], "pageToken": "next"}
+        client = self._make_client(
+            cache,
+            self._job_resource("job_1"),
+            self._query_results_resource("job_1"),
+            first_page,
+            first_page,
+            {"totalRows": "2", "rows": rows[1:]},
+            self._table_resource("900"),
+            self._table_resource("900"),
+        )
+
+        query_job = client.query(self.QUERY)
+        next(query_job.result().pages)
+        self.assertEqual(
+            [tuple(row.values()) for row in query_job.result()],
+            [("Phred", 32), ("Bharney", 33)],
+        )
+        self.assertEqual(len(cache), 1)
+
+        self.assertEqual(self._run_query(client), [("Phred", 32), ("Bharney", 33)])
+
+    def test_read_from_start_index(self):
+        from google.cloud.bigquery.query_cache import MemoryQueryCache
+        from google.cloud.bigquery.query_cache import _CacheWriter
+
+        cache = MemoryQueryCache()
+        writer = _CacheWriter(cache, "key", mock.Mock(spec=[]))
+        writer.add_page({"totalRows": "2", "rows": [{"f": []}]}, 1)
+        writer.add_page({"totalRows": "2", "rows": [{"f": []}, {"f": []}]}, 0)
+
+        self.assertEqual(len(cache), 0)
+
+    def test_too_large(self):
+        from google.cloud.bigquery.query_cache import MemoryQueryCache
+
+        cache = MemoryQueryCache(max_bytes=10)
+        client = self._make_client(
+            cache,
+            self._job_resource("job_1"),
+            self._query_results_resource("job_1"),
+            self._rows_resource(),
+        )
+        self._run_query(client)
+        self.assertEqual(len(cache), 0)
+
+    def test_not_select(self):
+        from google.cloud.bigquery.query_cache import MemoryQueryCache
+
+        cache = MemoryQueryCache()
+        job_resource = self._job_resource("job_1")
+        job_resource["statistics"]["query"]["statementType"] = "SCRIPT"
+        client = self._make_client(
+            cache,
+            job_resource,
+            self._query_results_resource("job_1"),
+            self._rows_resource(),
+        )
+
+        self._run_query(client)
+
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(client._connection.api_request.call_count, 3)
+
+    def test_not_cacheable(self):
+        from google.cloud.bigquery.job import QueryJobConfig
+        from google.cloud.bigquery.query_cache import MemoryQueryCache
+
+        cache = MemoryQueryCache()
+        client = self._make_client(
+            cache,
+            self._job_resource("job_1"),
+            self._query_results_resource("job_1"),
+            self._rows_resource(),
+        )
+        config = QueryJobConfig()
+        config.use_query_cache = False
+        self._run_query(client, job_config=config)
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(client._connection.api_request.call_count, 3)
+
+
+class TestDryRunCache(unittest.TestCase):
+    PROJECT = "project"
+    QUERY = "SELECT name FROM `project.dataset.people` WHERE age > @age"
+
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.bigquery.query_cache import DryRunCache
+
+        return DryRunCache
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    def _make_client(self, cache, *responses):
+        from google.cloud.bigquery.client import Client
+
+        client = Client(
+            project=self.PROJECT,
+            credentials=_make_credentials(),
+            _http=object(),
+            dry_run_cache=cache,
+        )
+        client._connection = _make_connection(*responses)
+        return client
+
+    def _job_resource(self, bytes_processed="1024"):
+        return {
+            "jobReference": {"projectId": self.PROJECT},
+            "configuration": {
+                "query": {"query": self.QUERY, "useLegacySql": False},
+                "dryRun": True,
+            },
+            "status": {"state": "DONE"},
+            "statistics": {
+                "totalBytesProcessed": bytes_processed,
+                "query": {
+                    "totalBytesProcessed": bytes_processed,
+                    "referencedTables": [
+                        {
+                            "projectId": self.PROJECT,
+                            "datasetId": "dataset",
+                            "tableId": "people",
+                        }
+                    ],
+                },
+            },
+        }
+
+    def _table_resource(self, modified):
+        return {
+            "tableReference": {
+                "projectId": self.PROJECT,
+                "datasetId": "dataset",
+                "tableId": "people",
+            },
+            "lastModifiedTime": modified,
+        }
+
+    def _job_config(self, age=1):
+        from google.cloud.bigquery.job import QueryJobConfig
+        from google.cloud.bigquery.query import ScalarQueryParameter
+
+        config = QueryJobConfig()
+        config.dry_run = True
+        config.query_parameters = [ScalarQueryParameter("age", "INT64", age)]
+        return config
+
+    def _dry_run(self, client, age=1):
+        return client.query(self.QUERY, job_config=self._job_config(age))
+
+    def test_miss_then_hit(self):
+        cache = self._make_one()
+        client = self._make_client(
+            cache,
+            self._job_resource(),
+            self._table_resource("900"),
+            self._table_resource("900"),
+        )
+
+        first = self._dry_run(client)
+        self.assertEqual(first.total_bytes_processed, 1024)
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(client._connection.api_request.call_count, 2)
+
+        second = self._dry_run(client)
+        self.assertEqual(second.total_bytes_processed, 1024)
+        self.assertEqual(second.state, "DONE")
+        self.assertEqual(client._connection.api_request.call_count, 3)
+        _, req = client._connection.api_request.call_args
+        self.assertEqual(req["method"], "GET")
+        self.assertEqual(
+            req["path"], "/projects/project/datasets/dataset/tables/people"
+        )
+
+    def test_parameters_in_key(self):
+        cache = self._make_one()
+        client = self._make_client(
+            cache,
+            self._job_resource("1024"),
+            self._table_resource("900"),
+            self._job_resource("2048"),
+            self._table_resource("900"),
+        )
+
+        self._dry_run(client, age=1)
+        job = self._dry_run(client, age=2)
+
+        self.assertEqual(job.total_bytes_processed, 2048)
+        self.assertEqual(len(cache), 2)
+
+    def test_table_modified(self):
+        cache = self._make_one()
+        client = self._make_client(
+            cache,
+            self._job_resource("1024"),
+            self._table_resource("900"),
+            self._table_resource("1500"),
+            self._job_resource("2048"),
+            self._table_resource("1500"),
+        )
+
+        self._dry_run(client)
+        job = self._dry_run(client)
+
+        self.assertEqual(job.total_bytes_processed, 2048)
+        _, req = client._connection.api_request.call_args_list[3]
+        self.assertEqual(req["method"], "POST")
+        self.assertEqual(len(cache), 1)
+
+    def test_table_deleted(self):
+        from google.cloud.exceptions import NotFound
+
+        cache = self._make_one()
+        client = self._make_client(
+            cache,
+            self._job_resource(),
+            self._table_resource("900"),
+            NotFound("deleted"),
+        )
+
+        self._dry_run(client)
+        with self.assertRaises(NotFound):
+            self._dry_run(client)
+        self.assertEqual(len(cache), 0)
+
+    def test_table_not_readable(self):
+        from google.cloud.exceptions import Forbidden
+
+        cache = self._make_one()
+        client = self._make_client(
+            cache, self._job_resource(), Forbidden("authorized view")
+        )
+
+        job = self._dry_run(client)
+
+        self.assertEqual(job.total_bytes_processed, 1024)
+        self.assertEqual(len(cache), 0)
+
+    def test_table_not_readable_on_lookup(self):
+        from google.cloud.exceptions import Forbidden
+
+        cache = self._make_one()
+        client = self._make_client(
+            cache,
+            self._job_resource("1024"),
+            self._table_resource("900"),
+            Forbidden("permission revoked"),
+            self._job_resource("2048"),
+            self._table_resource("900"),
+        )
+
+        self._dry_run(client)
+        job = self._dry_run(client)
+
+        self.assertEqual(job.total_bytes_processed, 2048)
+        self.assertEqual(len(cache), 1)
+
+    def test_tables_checked_concurrently(self):
+        import threading
+
+        cache = self._make_one()
+        client = self._make_client(cache)
+        resource = self._job_resource()
+        referenced = resource["statistics"]["query"]["referencedTables"]
+        referenced.append(dict(referenced[0], tableId="places"))
+        started = []
+        both_started = threading.Event()
+
+        def api_request(method, path, **kwargs):
+            if method == "POST":
+                return resource
+            started.append(path)
+            if len(started) % 2 == 0:
+                both_started.set()
+            # Each request waits for the other table's request to start.
+            self.assertTrue(both_started.wait(5.0))
+            table_id = path.rsplit("/", 1)[-1]
+            table = self._table_resource("900")
+            table["tableReference"]["tableId"] = table_id
+            return table
+
+        client._connection.api_request.side_effect = api_request
+
+        self._dry_run(client)
+        both_started.clear()
+        job = self._dry_run(client)
+
+        self.assertEqual(job.total_bytes_processed, 1024)
+        self.assertEqual(len(started), 4)
+        self.assertEqual(client._connection.api_request.call_count, 5)
+        (entry,) = cache._entries.values()
+        self.assertEqual(
+            entry["tables"],
+            {"project.dataset.people": "900", "project.dataset.places": "900"},
+        )
+
+    def test_table_check_interval(self):
+        cache = self._make_one(table_check_interval=60.0)
+        client = self._make_client(
+            cache, self._job_resource(), self._table_resource("900")
+        )
+
+        self._dry_run(client)
+        job = self._dry_run(client)
+
+        self.assertEqual(job.total_bytes_processed, 1024)
+        self.assertEqual(client._connection.api_request.call_count, 2)
+
+    def test_invalidate_table(self):
+        cache = self._make_one(table_check_interval=60.0)
+        client = self._make_client(
+            cache,
+            self._job_resource("1024"),
+            self._table_resource("900"),
+            self._job_resource("2048"),
+            self._table_resource("1500"),
+        )
+
+        self._dry_run(client)
+        cache.invalidate_table("project.dataset.people")
+        self.assertEqual(len(cache), 0)
+
+        job = self._dry_run(client)
+        self.assertEqual(job.total_bytes_processed, 2048)
+
+    def test_invalidate_table_w_reference(self):
+        from google.cloud.bigquery.table import TableReference
+
+        places_resource = self._job_resource("2048")
+        places_resource["statistics"]["query"]["referencedTables"][0][
+            "tableId"
+        ] = "places"
+        places_table = self._table_resource("900")
+        places_table["tableReference"]["tableId"] = "places"
+        cache = self._make_one(table_check_interval=60.0)
+        client = self._make_client(
+            cache,
+            self._job_resource("1024"),
+            self._table_resource("900"),
+            places_resource,
+            places_table,
+        )
+        self._dry_run(client, age=1)
+        self._dry_run(client, age=2)
+
+        cache.invalidate_table(TableReference.from_string("project.dataset.people"))
+
+        # Only the entry of the query reading the table is removed.
+        self.assertEqual(len(cache), 1)
+        self.assertEqual(self._dry_run(client, age=2).total_bytes_processed, 2048)
+
+    def test_clear(self):
+        cache = self._make_one(table_check_interval=60.0)
+        client = self._make_client(
+            cache,
+            self._job_resource("1024"),
+            self._table_resource("900"),
+            self._job_resource("2048"),
+            self._table_resource("900"),
+        )
+        self._dry_run(client)
+
+        cache.clear()
+
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(self._dry_run(client).total_bytes_processed, 2048)
+        # The modification time of the table is fetched again.
+        self.assertEqual(client._connection.api_request.call_count, 4)
+
+    def test_failed_dry_run(self):
+        resource = self._job_resource()
+        resource["status"]["errorResult"] = {"reason": "invalidQuery"}
+        cache = self._make_one()
+        client = self._make_client(cache, resource)
+
+        self._dry_run(client)
+
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(client._connection.api_request.call_count, 1)
+
+    def test_wo_dry_run_cache(self):
+        client = self._make_client(None, self._job_resource(), self._job_resource())
+
+        self._dry_run(client)
+        job = self._dry_run(client)
+
+        self.assertEqual(job.total_bytes_processed, 1024)
+        self.assertEqual(client._connection.api_request.call_count, 2)
+
+    def test_expired(self):
+        cache = self._make_one(ttl=10.0, table_check_interval=60.0)
+        client = self._make_client(
+            cache,
+            self._job_resource("1024"),
+            self._table_resource("900"),
+            self._job_resource("2048"),
+        )
+
+        with mock.patch("time.time", return_value=1000.0):
+            self._dry_run(client)
+        with mock.patch("time.time", return_value=1011.0):
+            job = self._dry_run(client)
+
+        self.assertEqual(job.total_bytes_processed, 2048)
+
+    def test_evicts_least_recently_used(self):
+        cache = self._make_one(max_entries=1)
+        client = self._make_client(
+            cache,
+            self._job_resource("1024"),
+            self._table_resource("900"),
+            self._job_resource("2048"),
+            self._table_resource("900"),
+        )
+
+        self._dry_run(client, age=1)
+        self._dry_run(client, age=2)
+
+        self.assertEqual(len(cache), 1)
+
+    def test_not_dry_run(self):
+        cache = self._make_one()
+        client = self._make_client(cache, self._job_resource())
+
+        client.query(self.QUERY)
+
+        self.assertEqual(len(cache), 0)
+        self.assertEqual(client._connection.api_request.call_count, 1)
@@ -283,6 +283,14 @@ class Test_parse_schema_resource(unittest.TestCase, _SchemaBase):
         schema = self._call_fut(RESOURCE["schema"])
         self._verifySchema(schema, RESOURCE)
 
+    def test__parse_schema_resource_cached(self):
+        RESOURCE = self._make_resource()
+        schema = self._call_fut(RESOURCE["schema"])
+        again = self._call_fut(self._make_resource()["schema"])
+        self.assertEqual(again, schema)
+        self.assertIsNot(again, schema)
+        self.assertIs(again[0], schema[0])
+
     def test__parse_schema_resource_subfields(self):
         RESOURCE = self._make_resource()
         RESOURCE["schema"]["fields"].append(
@@ -307,6 +315,89 @@ class Test_parse_schema_resource(unittest.TestCase, _SchemaBase):
         self._verifySchema(schema, RESOURCE)
 
 
+class Test_SchemaCache(unittest.TestCase):
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.bigquery.schema import _SchemaCache
+
+        return _SchemaCache
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    @staticmethod
+    def _make_resource(name="age"):
+        return [
+            {"name": "full_name", "type": "STRING", "mode": "REQUIRED"},
+            {"name": name, "type": "INTEGER"},
+        ]
+
+    def test_from_resource_hit(self):
+        from google.cloud.bigquery.schema import SchemaField
+
+        cache = self._make_one()
+
+        entry = cache.from_resource(self._make_resource())
+
+        self.assertEqual(
+            entry.fields,
+            (
+                SchemaField("full_name", "STRING", mode="REQUIRED"),
+                SchemaField("age", "INTEGER"),
+            ),
+        )
+        self.assertEqual(entry.field_to_index, {"full_name": 0, "age": 1})
+        self.assertEqual(
+            entry.row_converter({"f": [{"v": "Phred"}, {"v": "32"}]}), ("Phred", 32)
+        )
+        self.assertIs(entry.row_converter, entry.row_converter)
+        self.assertIs(cache.from_resource(self._make_resource()), entry)
+        self.assertIsNot(cache.from_resource(self._make_resource("height")), entry)
+        self.assertEqual(len(cache), 2)
+
+    def test_from_fields_shares_entries(self):
+        from google.cloud.bigquery.schema import SchemaField
+
+        cache = self._make_one()
+        entry = cache.from_resource(self._make_resource())
+
+        self.assertIs(cache.from_fields(list(entry.fields)), entry)
+
+        fields = [SchemaField("name", "STRING")]
+        fields_entry = cache.from_fields(fields)
+        self.assertEqual(fields_entry.fields, tuple(fields))
+        self.assertIs(cache.from_fields(fields), fields_entry)
+        self.assertEqual(len(cache), 2)
+
+    def test_evicts_least_recently_used(self):
+        cache = self._make_one(max_size=2)
+        first = cache.from_resource(self._make_resource("a"))
+        cache.from_resource(self._make_resource("b"))
+        cache.from_resource(self._make_resource("a"))
+
+        third = cache.from_resource(self._make_resource("c"))
+
+        # "b" was evicted, rather than "a" which was used more recently.
+        self.assertEqual(len(cache), 2)
+        self.assertIs(cache.from_resource(self._make_resource("a")), first)
+        self.assertIs(cache.from_fields(first.fields), first)
+        self.assertEqual(len(cache), 2)
+
+        cache.from_resource(self._make_resource("b"))
+
+        self.assertIs(cache.from_fields(first.fields), first)
+        self.assertIsNot(cache.from_resource(self._make_resource("c")), third)
+
+    def test_clear(self):
+        cache = self._make_one()
+        entry = cache.from_resource(self._make_resource())
+
+        cache.clear()
+
+        self.assertEqual(len(cache), 0)
+        self.assertIsNot(cache.from_fields(entry.fields), entry)
+
+
 class Test_build_schema_resource(unittest.TestCase, _SchemaBase):
     def _call_fut(self, resource):
         from google.cloud.bigquery.schema import _build_schema_resource
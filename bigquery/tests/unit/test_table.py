@@ -1258,6 +1258,47 @@ class TestRow(unittest.TestCase):
             row["z"]
 
 
+class Test_make_row_class(unittest.TestCase):
+    def _call_fut(self, field_to_index):
+        from google.cloud.bigquery.table import _make_row_class
+
+        return _make_row_class(field_to_index)
+
+    def test_properties(self):
+        from google.cloud.bigquery.table import Row
+
+        field_to_index = {"a": 0, "keys": 1, "c": 2}
+        row_class = self._call_fut(field_to_index)
+        row = row_class((1, 2, 3), field_to_index)
+
+        self.assertIsInstance(row, Row)
+        self.assertEqual(row.a, 1)
+        self.assertEqual(row.c, 3)
+        self.assertEqual(row["keys"], 2)
+        self.assertEqual(set(row.keys()), {"a", "keys", "c"})
+        self.assertEqual(row, Row((1, 2, 3), field_to_index))
+        self.assertEqual(repr(row), "Row((1, 2, 3), {'a': 0, 'keys': 1, 'c': 2})")
+        with self.assertRaises(AttributeError):
+            row.z
+        with self.assertRaises(AttributeError):
+            row.d = 4
+
+    def test_pickle(self):
+        import copy
+        import pickle
+
+        from google.cloud.bigquery.table import Row
+
+        field_to_index = {"a": 0, "b": 1}
+        row = self._call_fut(field_to_index)((1, [2]), field_to_index)
+
+        unpickled = pickle.loads(pickle.dumps(row))
+
+        self.assertIs(type(unpickled), Row)
+        self.assertEqual(unpickled, row)
+        self.assertEqual(copy.deepcopy(row), row)
+
+
 class Test_EmptyRowIterator(unittest.TestCase):
     @mock.patch("google.cloud.bigquery.table.pandas", new=None)
     def test_to_dataframe_error_if_pandas_is_none(self):
@@ -1324,6 +1365,8 @@ class TestRowIterator(unittest.TestCase):
         val1 = six.next(rows_iter)
         self.assertEqual(val1.name, "Phred Phlyntstone")
         self.assertEqual(row_iterator.num_results, 1)
+        self.assertIs(type(val1), row_iterator._row_class)
+        self.assertIn("name", vars(type(val1)))
 
         val2 = six.next(rows_iter)
         self.assertEqual(val2.name, "Bharney Rhubble")
@@ -1334,6 +1377,34 @@ class TestRowIterator(unittest.TestCase):
 
         api_request.assert_called_once_with(method="GET", path=path, query_params={})
 
+    def test_constructor_shares_compiled_schema_with_table(self):
+        from google.cloud.bigquery.table import RowIterator
+        from google.cloud.bigquery.table import Table
+
+        table = Table.from_api_repr(
+            {
+                "tableReference": {
+                    "projectId": "p",
+                    "datasetId": "d",
+                    "tableId": "shared_schema",
+                },
+                "schema": {
+                    "fields": [
+                        {"name": "shared_name", "type": "STRING"},
+                        {"name": "shared_age", "type": "INTEGER"},
+                    ]
+                },
+            }
+        )
+        iterator_1 = RowIterator(mock.sentinel.client, None, "/foo", table.schema)
+        iterator_2 = RowIterator(mock.sentinel.client, None, "/foo", table.schema)
+
+        self.assertEqual(
+            iterator_1._field_to_index, {"shared_name": 0, "shared_age": 1}
+        )
+        self.assertIs(iterator_1._field_to_index, iterator_2._field_to_index)
+        self.assertIs(iterator_1._row_converter, iterator_2._row_converter)
+
     def test_page_size(self):
         from google.cloud.bigquery.table import RowIterator
         from google.cloud.bigquery.table import SchemaField
@@ -1360,6 +1431,257 @@ class TestRowIterator(unittest.TestCase):
             query_params={"maxResults": row_iterator._page_size},
         )
 
+    def _make_prefetch_api_request(self, num_rows, short_page_at=None):
+        def api_request(method, path, query_params):
+            start = query_params.get("startIndex", 0)
+            count = query_params.get("maxResults", 2)
+            if start == short_page_at:
+                # Simulate a response truncated by the maximum response size.
+                count = 1
+            stop = min(start + count, num_rows)
+            response = {
+                "totalRows": str(num_rows),
+                "rows": [
+                    {"f": [{"v": "row {}".format(index)}, {"v": str(index)}]}
+                    for index in range(start, stop)
+                ],
+            }
+            if stop < num_rows:
+                response["pageToken"] = "token-{}".format(stop)
+            return response
+
+        return mock.Mock(side_effect=api_request)
+
+    def _prefetch_schema(self):
+        from google.cloud.bigquery.table import SchemaField
+
+        return [
+            SchemaField("name", "STRING", mode="REQUIRED"),
+            SchemaField("age", "INTEGER", mode="REQUIRED"),
+        ]
+
+    def test_constructor_w_prefetch_and_page_token(self):
+        from google.cloud.bigquery.table import RowIterator
+
+        with self.assertRaises(ValueError):
+            RowIterator(
+                mock.sentinel.client,
+                mock.sentinel.api_request,
+                "/foo",
+                [],
+                page_token="token",
+                prefetch_pages=2,
+            )
+
+    def test_iterate_w_prefetch_pages(self):
+        from google.cloud.bigquery.table import RowIterator
+
+        api_request = self._make_prefetch_api_request(7)
+        row_iterator = RowIterator(
+            mock.sentinel.client,
+            api_request,
+            "/foo",
+            self._prefetch_schema(),
+            page_size=2,
+            extra_params={"selectedFields": "name,age"},
+            prefetch_pages=3,
+        )
+
+        rows = list(row_iterator)
+
+        self.assertEqual([row.age for row in rows], list(range(7)))
+        self.assertEqual(row_iterator.total_rows, 7)
+        self.assertEqual(api_request.call_count, 4)
+        api_request.assert_any_call(
+            method="GET",
+            path="/foo",
+            query_params={"selectedFields": "name,age", "maxResults": 2},
+        )
+        api_request.assert_any_call(
+            method="GET",
+            path="/foo",
+            query_params={
+                "selectedFields": "name,age",
+                "startIndex": 6,
+                "maxResults": 1,
+            },
+        )
+
+    def test_iterate_w_prefetch_pages_short_response(self):
+        from google.cloud.bigquery.table import RowIterator
+
+        api_request = self._make_prefetch_api_request(6, short_page_at=2)
+        row_iterator = RowIterator(
+            mock.sentinel.client,
+            api_request,
+            "/foo",
+            self._prefetch_schema(),
+            page_size=2,
+            prefetch_pages=2,
+        )
+
+        pages = [[row.age for row in page] for page in row_iterator.pages]
+
+        self.assertEqual(pages, [[0, 1], [2, 3], [4, 5]])
+        api_request.assert_any_call(
+            method="GET", path="/foo", query_params={"startIndex": 3, "maxResults": 1}
+        )
+
+    def test_iterate_w_prefetch_pages_max_results(self):
+        from google.cloud.bigquery.table import RowIterator
+
+        api_request = self._make_prefetch_api_request(10)
+        row_iterator = RowIterator(
+            mock.sentinel.client,
+            api_request,
+            "/foo",
+            self._prefetch_schema(),
+            max_results=5,
+            extra_params={"startIndex": 3},
+            prefetch_pages=4,
+        )
+
+        rows = list(row_iterator)
+
+        self.assertEqual([row.age for row in rows], [3, 4, 5, 6, 7])
+
+    def test_iterate_w_prefetch_pages_single_page(self):
+        from google.cloud.bigquery.table import RowIterator
+
+        api_request = self._make_prefetch_api_request(2)
+        row_iterator = RowIterator(
+            mock.sentinel.client,
+            api_request,
+            "/foo",
+            self._prefetch_schema(),
+            prefetch_pages=4,
+        )
+
+        rows = list(row_iterator)
+
+        self.assertEqual(len(rows), 2)
+        api_request.assert_called_once()
+        self.assertIsNone(row_iterator._prefetcher)
+
+    def test_iterate_w_prefetch_pages_wo_total_rows(self):
+        from google.cloud.bigquery.table import RowIterator
+
+        page_1 = {
+            "rows": [{"f": [{"v": "Phred Phlyntstone"}, {"v": "32"}]}],
+            "pageToken": "next-page",
+        }
+        page_2 = {"rows": [{"f": [{"v": "Bharney Rhubble"}, {"v": "33"}]}]}
+        api_request = mock.Mock(side_effect=[page_1, page_2])
+        row_iterator = RowIterator(
+            mock.sentinel.client,
+            api_request,
+            "/foo",
+            self._prefetch_schema(),
+            prefetch_pages=4,
+        )
+
+        rows = list(row_iterator)
+
+        self.assertEqual([row.age for row in rows], [32, 33])
+        api_request.assert_called_with(
+            method="GET", path="/foo", query_params={"pageToken": "next-page"}
+        )
+
+    def test_make_prefetcher_w_max_prefetch_rows(self):
+        from google.cloud.bigquery.table import RowIterator
+
+        api_request = self._make_prefetch_api_request(100)
+        row_iterator = RowIterator(
+            mock.sentinel.client,
+            api_request,
+            "/foo",
+            self._prefetch_schema(),
+            page_size=10,
+            prefetch_pages=8,
+            max_prefetch_rows=25,
+        )
+        first_page = api_request(method="GET", path="/foo", query_params={})
+        first_page["rows"] = first_page["rows"] * 5
+
+        prefetcher = row_iterator._make_prefetcher(first_page)
+
+        # Only two pages of 10 rows fit in 25 rows.
+        self.assertEqual(len(prefetcher._futures), 2)
+        self.assertEqual(prefetcher._executor._max_workers, 2)
+        while prefetcher.next_response() is not None:
+            pass
+
+    def test_iterate_w_prefetch_pages_error(self):
+        from google.cloud.bigquery.table import RowIterator
+        from google.cloud.exceptions import NotFound
+
+        first_page = {
+            "totalRows": "6",
+            "rows": [{"f": [{"v": "Phred Phlyntstone"}, {"v": "32"}]}] * 2,
+            "pageToken": "token",
+        }
+        api_request = mock.Mock(side_effect=[first_page, NotFound("gone")])
+        row_iterator = RowIterator(
+            mock.sentinel.client,
+            api_request,
+            "/foo",
+            self._prefetch_schema(),
+            prefetch_pages=1,
+        )
+        rows_iter = iter(row_iterator)
+        six.next(rows_iter)
+        six.next(rows_iter)
+
+        with self.assertRaises(NotFound):
+            six.next(rows_iter)
+
+    def test_iterate_w_prefetch_pages_error_cancels_pending(self):
+        from google.cloud.bigquery.table import RowIterator
+        from google.cloud.exceptions import NotFound
+
+        fetch_page = self._make_prefetch_api_request(6)
+
+        def api_request(method, path, query_params):
+            if query_params.get("startIndex") == 2:
+                raise NotFound("gone")
+            return fetch_page(method=method, path=path, query_params=query_params)
+
+        row_iterator = RowIterator(
+            mock.sentinel.client,
+            mock.Mock(side_effect=api_request),
+            "/foo",
+            self._prefetch_schema(),
+            page_size=2,
+            prefetch_pages=2,
+        )
+        pages = row_iterator.pages
+        six.next(pages)
+        prefetcher = row_iterator._prefetcher
+
+        with self.assertRaises(NotFound):
+            six.next(pages)
+
+        self.assertEqual(len(prefetcher._futures), 0)
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    def test_to_dataframe_w_prefetch_pages(self):
+        from google.cloud.bigquery.table import RowIterator
+
+        api_request = self._make_prefetch_api_request(5)
+        row_iterator = RowIterator(
+            mock.sentinel.client,
+            api_request,
+            "/foo",
+            self._prefetch_schema(),
+            page_size=2,
+            prefetch_pages=2,
+        )
+
+        df = row_iterator.to_dataframe()
+
+        self.assertEqual(list(df.age), [0, 1, 2, 3, 4])
+        self.assertEqual(df.age.dtype.name, "int64")
+
     @unittest.skipIf(pandas is None, "Requires `pandas`")
     def test_to_dataframe(self):
         from google.cloud.bigquery.table import RowIterator
@@ -1485,6 +1807,100 @@ class TestRowIterator(unittest.TestCase):
         self.assertEqual(df.complete.dtype.name, "bool")
         self.assertEqual(df.date.dtype.name, "object")
 
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    def test_to_dataframe_w_dtypes(self):
+        from google.cloud.bigquery.table import RowIterator
+        from google.cloud.bigquery.table import SchemaField
+
+        schema = [
+            SchemaField("start_timestamp", "TIMESTAMP"),
+            SchemaField("seconds", "INT64"),
+            SchemaField("miles", "FLOAT64"),
+            SchemaField("complete", "BOOL"),
+        ]
+        row_data = [
+            ["1.4338368E9", "420", "1.1", "true"],
+            ["1.3878117E9", "2580", "17.7", "false"],
+        ]
+        rows = [{"f": [{"v": field} for field in row]} for row in row_data]
+        path = "/foo"
+        api_request = mock.Mock(return_value={"rows": rows})
+        row_iterator = RowIterator(mock.sentinel.client, api_request, path, schema)
+
+        df = row_iterator.to_dataframe(dtypes={"seconds": "int32", "miles": "float16"})
+
+        self.assertIsInstance(df, pandas.DataFrame)
+        self.assertEqual(len(df), 2)
+        self.assertEqual(list(df), [field.name for field in schema])
+        self.assertEqual(df.start_timestamp.dtype.name, "datetime64[ns, UTC]")
+        self.assertEqual(df.seconds.dtype.name, "int32")
+        self.assertEqual(df.miles.dtype.name, "float16")
+        self.assertEqual(df.complete.dtype.name, "bool")
+        self.assertEqual(list(df.seconds), [420, 2580])
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    def test_to_dataframe_w_multiple_pages(self):
+        from google.cloud.bigquery.table import RowIterator
+        from google.cloud.bigquery.table import SchemaField
+
+        schema = [
+            SchemaField("name", "STRING", mode="REQUIRED"),
+            SchemaField("age", "INTEGER"),
+        ]
+        page_1 = {
+            "rows": [
+                {"f": [{"v": "Phred Phlyntstone"}, {"v": "32"}]},
+                {"f": [{"v": "Bharney Rhubble"}, {"v": "33"}]},
+            ],
+            "pageToken": "next-page",
+        }
+        page_2 = {"rows": [{"f": [{"v": "Wylma Phlyntstone"}, {"v": None}]}]}
+        path = "/foo"
+        api_request = mock.Mock(side_effect=[page_1, page_2])
+        row_iterator = RowIterator(mock.sentinel.client, api_request, path, schema)
+
+        df = row_iterator.to_dataframe()
+
+        self.assertEqual(len(df), 3)
+        self.assertEqual(
+            list(df.name), ["Phred Phlyntstone", "Bharney Rhubble", "Wylma Phlyntstone"]
+        )
+        # A missing value in any page makes the whole column floating point.
+        self.assertEqual(df.age.dtype.name, "float64")
+        self.assertEqual(list(df.age[:2]), [32.0, 33.0])
+        self.assertTrue(pandas.isnull(df.age[2]))
+        self.assertEqual(api_request.call_count, 2)
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    def test_to_dataframe_w_repeated_and_record(self):
+        from google.cloud.bigquery.table import RowIterator
+        from google.cloud.bigquery.table import SchemaField
+
+        schema = [
+            SchemaField("tags", "STRING", mode="REPEATED"),
+            SchemaField(
+                "point",
+                "RECORD",
+                fields=[SchemaField("x", "INT64"), SchemaField("y", "INT64")],
+            ),
+        ]
+        rows = [
+            {
+                "f": [
+                    {"v": [{"v": "a"}, {"v": "b"}]},
+                    {"v": {"f": [{"v": "1"}, {"v": "2"}]}},
+                ]
+            }
+        ]
+        path = "/foo"
+        api_request = mock.Mock(return_value={"rows": rows})
+        row_iterator = RowIterator(mock.sentinel.client, api_request, path, schema)
+
+        df = row_iterator.to_dataframe()
+
+        self.assertEqual(df.tags[0], ["a", "b"])
+        self.assertEqual(df.point[0], {"x": 1, "y": 2})
+
     @mock.patch("google.cloud.bigquery.table.pandas", new=None)
     def test_to_dataframe_error_if_pandas_is_none(self):
         from google.cloud.bigquery.table import RowIterator
@@ -1505,6 +1921,242 @@ class TestRowIterator(unittest.TestCase):
         with self.assertRaises(ValueError):
             row_iterator.to_dataframe()
 
+    def _make_bqstorage_client(self, dataframe):
+        bqstorage_client = mock.Mock(spec=["create_read_session", "read_streams"])
+        bqstorage_client.read_streams.return_value.to_dataframe.return_value = dataframe
+        return bqstorage_client
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    def test_to_dataframe_w_bqstorage_client(self):
+        from google.cloud.bigquery.table import RowIterator
+        from google.cloud.bigquery.table import SchemaField
+        from google.cloud.bigquery.table import TableReference
+
+        schema = [
+            SchemaField("name", "STRING", mode="REQUIRED"),
+            SchemaField("age", "INTEGER", mode="REQUIRED"),
+        ]
+        table = TableReference.from_string("data-project.dataset.table")
+        client = mock.Mock(project="billing-project", spec=["project"])
+        api_request = mock.Mock()
+        # Columns come back in Avro field order, with a stream-merged index.
+        bqstorage_client = self._make_bqstorage_client(
+            pandas.DataFrame(
+                {"age": [32, 33], "name": ["Phred", "Bharney"]}, index=[0, 0]
+            )
+        )
+        row_iterator = RowIterator(client, api_request, "/foo", schema, table=table)
+
+        df = row_iterator.to_dataframe(
+            dtypes={"age": "float64"}, bqstorage_client=bqstorage_client
+        )
+
+        api_request.assert_not_called()
+        bqstorage_client.create_read_session.assert_called_once_with(
+            {
+                "project_id": "data-project",
+                "dataset_id": "dataset",
+                "table_id": "table",
+            },
+            "projects/billing-project",
+            read_options={"selected_fields": ["name", "age"]},
+        )
+        bqstorage_client.read_streams.assert_called_once_with(
+            bqstorage_client.create_read_session.return_value
+        )
+        self.assertEqual(list(df.columns), ["name", "age"])
+        self.assertEqual(list(df.index), [0, 1])
+        self.assertEqual(df.age.dtype.name, "float64")
+        self.assertEqual(list(df.name), ["Phred", "Bharney"])
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    def test_to_dataframe_w_bqstorage_client_preserve_order(self):
+        from google.cloud.bigquery.table import RowIterator
+        from google.cloud.bigquery.table import SchemaField
+        from google.cloud.bigquery.table import TableReference
+
+        schema = [SchemaField("name", "STRING", mode="REQUIRED")]
+        table = TableReference.from_string("data-project.dataset.table")
+        client = mock.Mock(project="billing-project", spec=["project"])
+        bqstorage_client = self._make_bqstorage_client(
+            pandas.DataFrame({"name": ["Phred", "Bharney"]})
+        )
+        row_iterator = RowIterator(client, mock.Mock(), "/foo", schema, table=table)
+        row_iterator._preserve_order = True
+
+        df = row_iterator.to_dataframe(
+            dtypes={"missing": "float64"}, bqstorage_client=bqstorage_client
+        )
+
+        bqstorage_client.create_read_session.assert_called_once_with(
+            {
+                "project_id": "data-project",
+                "dataset_id": "dataset",
+                "table_id": "table",
+            },
+            "projects/billing-project",
+            read_options={"selected_fields": ["name"]},
+            requested_streams=1,
+        )
+        self.assertEqual(list(df.columns), ["name"])
+        self.assertEqual(list(df.name), ["Phred", "Bharney"])
+
+    @unittest.skipIf(pandas is None, "Requires `pandas`")
+    def test_to_dataframe_w_bqstorage_client_falls_back_to_rest(self):
+        from google.cloud.bigquery.table import RowIterator
+        from google.cloud.bigquery.table import SchemaField
+        from google.cloud.bigquery.table import Table
+        from google.cloud.bigquery.table import TableReference
+
+        schema = [SchemaField("name", "STRING", mode="REQUIRED")]
+        rows = [{"f": [{"v": "Phred Phlyntstone"}]}]
+        small_table = Table(
+            TableReference.from_string("data-project.dataset.table"), schema=schema
+        )
+        small_table._properties["numRows"] = "1"
+        large_table = Table(
+            TableReference.from_string("data-project.dataset.table"), schema=schema
+        )
+        large_table._properties["numRows"] = "1000000"
+
+        cases = [
+            # No table to read.
+            {},
+            # Too few rows to be worth a read session.
+            {"table": small_table},
+            # The Storage API can't read part of a table.
+            {"table": large_table, "max_results": 1},
+            {"table": large_table, "page_token": "token"},
+            {"table": large_table, "extra_params": {"startIndex": 1}},
+        ]
+        for kwargs in cases:
+            api_request = mock.Mock(return_value={"rows": rows})
+            bqstorage_client = self._make_bqstorage_client(None)
+            row_iterator = RowIterator(
+                mock.sentinel.client, api_request, "/foo", schema, **kwargs
+            )
+
+            df = row_iterator.to_dataframe(bqstorage_client=bqstorage_client)
+
+            bqstorage_client.create_read_session.assert_not_called()
+            self.assertEqual(list(df.name), ["Phred Phlyntstone"])
+
+
+class TestPartitionRowIterator(unittest.TestCase):
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.bigquery.table import PartitionRowIterator
+
+        return PartitionRowIterator
+
+    def _make_one(self, *args, **kw):
+        return self._get_target_class()(*args, **kw)
+
+    @staticmethod
+    def _make_partition(ages, fetched=None, error=None):
+        def pages():
+            for age in ages:
+                if fetched is not None:
+                    fetched.append(age)
+                yield mock.Mock(_rows=[{"f": [{"v": str(age)}]}])
+            if error is not None:
+                raise error
+
+        iterator = mock.Mock(total_rows=len(ages))
+        iterator.pages = pages()
+        return iterator
+
+    @staticmethod
+    def _schema():
+        from google.cloud.bigquery.table import SchemaField
+
+        return [SchemaField("age", "INTEGER", mode="REQUIRED")]
+
+    def test_iter_in_partition_order(self):
+        iterators = [
+            self._make_partition([1, 2]),
+            self._make_partition([]),
+            self._make_partition([3]),
+        ]
+        row_iterator = self._make_one(
+            iterators, ["a", "b", "c"], self._schema(), max_workers=2
+        )
+
+        self.assertEqual([row.age for row in row_iterator], [1, 2, 3])
+        self.assertEqual(row_iterator.total_rows, 3)
+        with self.assertRaises(ValueError):
+            list(row_iterator)
+
+    def test_iter_bounds_pages_read_ahead(self):
+        from google.cloud.bigquery.table import _PARTITION_QUEUE_PAGES
+
+        fetched = []
+        iterators = [self._make_partition(list(range(20)), fetched=fetched)]
+        row_iterator = self._make_one(iterators, ["a"], self._schema())
+
+        rows = iter(row_iterator)
+        self.assertEqual(next(rows).age, 0)
+        # One page consumed, a full queue and one page waiting to be queued.
+        self.assertLessEqual(len(fetched), _PARTITION_QUEUE_PAGES + 2)
+        rows.close()
+
+    def test_iter_w_error(self):
+        iterators = [
+            self._make_partition([1], error=ValueError("read failed")),
+            self._make_partition([2]),
+        ]
+        row_iterator = self._make_one(iterators, ["a", "b"], self._schema())
+
+        rows = iter(row_iterator)
+        self.assertEqual(next(rows).age, 1)
+        with self.assertRaises(ValueError):
+            next(rows)
+
+    def test_schema(self):
+        row_iterator = self._make_one([], [], self._schema())
+
+        self.assertEqual(row_iterator.schema, self._schema())
+        self.assertEqual(row_iterator.partition_ids, [])
+
+    def test__read_partition_retries_full_queue(self):
+        import threading
+        from google.cloud.bigquery.table import _PARTITION_DONE
+
+        pages = mock.Mock(spec=["put"])
+        pages.put.side_effect = [six.moves.queue.Full(), None, None]
+
+        total_rows = self._get_target_class()._read_partition(
+            self._make_partition([1]), pages, threading.Event()
+        )
+
+        self.assertEqual(total_rows, 1)
+        puts = [call[0][0] for call in pages.put.call_args_list]
+        self.assertEqual(len(puts), 3)
+        self.assertIs(puts[0], puts[1])
+        self.assertIs(puts[2], _PARTITION_DONE)
+
+    def test__read_partition_stopped(self):
+        import threading
+
+        fetched = []
+        pages = mock.Mock(spec=["put"])
+        stopped = threading.Event()
+        stopped.set()
+
+        self._get_target_class()._read_partition(
+            self._make_partition([1, 2], fetched=fetched), pages, stopped
+        )
+
+        self.assertEqual(fetched, [1])
+        pages.put.assert_not_called()
+
+    @mock.patch("google.cloud.bigquery.table.pandas", new=None)
+    def test_to_dataframe_error_if_pandas_is_none(self):
+        row_iterator = self._make_one([], [], self._schema())
+
+        with self.assertRaises(ValueError):
+            row_iterator.to_dataframe()
+
 
 class TestTimePartitioning(unittest.TestCase):
     def _get_target_class(self):
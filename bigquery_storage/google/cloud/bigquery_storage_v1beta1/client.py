@@ -85,14 +85,18 @@ class BigQueryStorageClient(big_query_storage_client.BigQueryStorageClient):
         Args:
             read_position (Union[ \
                 dict, \
-                ~google.cloud.bigquery_storage_v1beta1.types.StreamPosition \
+                ~google.cloud.bigquery_storage_v1beta1.types.StreamPosition, \
+                bytes \
             ]):
                 Required. Identifier of the position in the stream to start
                 reading from. The offset requested must be less than the last
                 row read from ReadRows. Requesting a larger offset is
                 undefined. If a dict is provided, it must be of the same form
                 as the protobuf message
-                :class:`~google.cloud.bigquery_storage_v1beta1.types.StreamPosition`
+                :class:`~google.cloud.bigquery_storage_v1beta1.types.StreamPosition`.
+                If bytes are provided, they must be a checkpoint from
+                :meth:`~google.cloud.bigquery_storage_v1beta1.reader.ReadRowsStream.checkpoint`,
+                and reading resumes from the position it saved.
             retry (Optional[google.api_core.retry.Retry]):  A retry object used
                 to retry requests. If ``None`` is specified, requests will not
                 be retried.
@@ -114,6 +118,9 @@ class BigQueryStorageClient(big_query_storage_client.BigQueryStorageClient):
                     to a retryable error and retry attempts failed.
             ValueError: If the parameters are invalid.
         """
+        if isinstance(read_position, bytes):
+            read_position = reader._copy_stream_position(read_position)
+
         gapic_client = super(BigQueryStorageClient, self)
         stream = gapic_client.read_rows(
             read_position, retry=retry, timeout=timeout, metadata=metadata
@@ -124,3 +131,76 @@ class BigQueryStorageClient(big_query_storage_client.BigQueryStorageClient):
             read_position,
             {"retry": retry, "timeout": timeout, "metadata": metadata},
         )
+
+    def read_streams(
+        self,
+        read_session,
+        streams=None,
+        max_workers=None,
+        max_buffered_blocks=None,
+        retry=google.api_core.gapic_v1.method.DEFAULT,
+        timeout=google.api_core.gapic_v1.method.DEFAULT,
+        metadata=None,
+    ):
+        """
+        Reads rows from many streams of a read session concurrently.
+
+        Each stream is read on a worker thread, as with :meth:`read_rows`,
+        and the blocks from all streams are merged in the order they
+        arrive.
+
+        Example:
+            >>> from google.cloud import bigquery_storage_v1beta1
+            >>>
+            >>> client = bigquery_storage_v1beta1.BigQueryStorageClient()
+            >>>
+            >>> # TODO: Initialize ``table_reference`` and ``parent``.
+            >>> session = client.create_read_session(
+            ...     table_reference, parent, requested_streams=8
+            ... )
+            >>>
+            >>> dataframe = client.read_streams(session).to_dataframe()
+
+        Args:
+            read_session ( \
+                ~google.cloud.bigquery_storage_v1beta1.types.ReadSession \
+            ):
+                Required. The read session to read.
+            streams (Sequence[ \
+                ~google.cloud.bigquery_storage_v1beta1.types.Stream \
+            ]):
+                The streams to read. Defaults to all streams of the read
+                session.
+            max_workers (int): The maximum number of streams read at once.
+                Defaults to the number of streams.
+            max_buffered_blocks (int): The maximum number of blocks read
+                ahead of the consumer. Defaults to twice the number of
+                workers.
+            retry (Optional[google.api_core.retry.Retry]):  A retry object used
+                to retry requests. If ``None`` is specified, requests will not
+                be retried.
+            timeout (Optional[float]): The amount of time, in seconds, to wait
+                for the request to complete. Note that if ``retry`` is
+                specified, the timeout applies to each individual attempt.
+            metadata (Optional[Sequence[Tuple[str, str]]]): Additional metadata
+                that is provided to the method.
+
+        Returns:
+            ~google.cloud.bigquery_storage_v1beta1.reader.MultiStreamReader:
+                An iterable of
+                :class:`~google.cloud.bigquery_storage_v1beta1.types.ReadRowsResponse`
+                from all streams.
+        """
+        gapic_client = super(BigQueryStorageClient, self)
+        return reader.MultiStreamReader(
+            gapic_client,
+            read_session,
+            streams=streams,
+            max_workers=max_workers,
+            max_buffered_blocks=max_buffered_blocks,
+            read_rows_kwargs={
+                "retry": retry,
+                "timeout": timeout,
+                "metadata": metadata,
+            },
+        )
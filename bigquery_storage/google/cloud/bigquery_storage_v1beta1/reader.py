@@ -14,8 +14,16 @@
 
 from __future__ import absolute_import
 
+import base64
+import concurrent.futures
+import copy
+import datetime
+import functools
 import itertools
 import json
+import os
+import threading
+import time
 
 try:
     import fastavro
@@ -23,10 +31,18 @@ except ImportError:  # pragma: NO COVER
     fastavro = None
 import google.api_core.exceptions
 
+try:
+    import numpy
+except ImportError:  # pragma: NO COVER
+    numpy = None
 try:
     import pandas
 except ImportError:  # pragma: NO COVER
     pandas = None
+try:
+    import pyarrow
+except ImportError:  # pragma: NO COVER
+    pyarrow = None
 import six
 
 from google.cloud.bigquery_storage_v1beta1 import types
@@ -37,6 +53,13 @@ _STREAM_RESUMPTION_EXCEPTIONS = (
     google.api_core.exceptions.ServiceUnavailable,
 )
 _FASTAVRO_REQUIRED = "fastavro is required to parse Avro blocks"
+_PANDAS_REQUIRED = "pandas is required to create a DataFrame"
+_PYARROW_REQUIRED = "pyarrow is required to create record batches"
+_PUT_TIMEOUT = 0.1
+"""How often, in seconds, a stream blocked on a full buffer checks whether
+the reader was closed."""
+_CHECKPOINT_VERSION = 1
+_DEFAULT_CHECKPOINT_INTERVAL = 30.0
 
 
 class ReadRowsStream(object):
@@ -53,6 +76,16 @@ class ReadRowsStream(object):
     If the pandas and fastavro libraries are installed, use the
     :func:`~google.cloud.bigquery_storage_v1beta1.reader.ReadRowsStream.to_dataframe()`
     method to parse all blocks into a :class:`pandas.DataFrame`.
+
+    If the pyarrow and fastavro libraries are installed, use the
+    :func:`~google.cloud.bigquery_storage_v1beta1.reader.ReadRowsStream.to_arrow()`
+    method to parse all blocks into a :class:`pyarrow.Table`.
+
+    Use the
+    :func:`~google.cloud.bigquery_storage_v1beta1.reader.ReadRowsStream.save_checkpoints()`
+    method to periodically save the position of the stream, so that a
+    reader which crashed can resume where it stopped rather than reading
+    the stream again from the start.
     """
 
     def __init__(self, wrapped, client, read_position, read_rows_kwargs):
@@ -72,14 +105,17 @@ class ReadRowsStream(object):
                 this class.
             read_position (Union[ \
                 dict, \
-                ~google.cloud.bigquery_storage_v1beta1.types.StreamPosition \
+                ~google.cloud.bigquery_storage_v1beta1.types.StreamPosition, \
+                bytes \
             ]):
                 Required. Identifier of the position in the stream to start
                 reading from. The offset requested must be less than the last
                 row read from ReadRows. Requesting a larger offset is
                 undefined. If a dict is provided, it must be of the same form
                 as the protobuf message
-                :class:`~google.cloud.bigquery_storage_v1beta1.types.StreamPosition`
+                :class:`~google.cloud.bigquery_storage_v1beta1.types.StreamPosition`.
+                If bytes are provided, they must be a checkpoint returned by
+                :meth:`checkpoint`.
             read_rows_kwargs (dict):
                 Keyword arguments to use when reconnecting to a ReadRows
                 stream.
@@ -97,6 +133,10 @@ class ReadRowsStream(object):
         self._client = client
         self._wrapped = wrapped
         self._read_rows_kwargs = read_rows_kwargs
+        self._checkpoint_session = None
+        self._checkpoint_destination = None
+        self._checkpoint_interval = None
+        self._last_checkpoint = None
 
     def __iter__(self):
         """An iterable of blocks.
@@ -117,6 +157,11 @@ class ReadRowsStream(object):
                     self._position.offset += rowcount
                     yield block
 
+                    # The caller asked for the next block, so it is done
+                    # with this one and the new offset is safe to save.
+                    self._maybe_save_checkpoint()
+
+                self._save_checkpoint()
                 return  # Made it through the whole stream.
             except _STREAM_RESUMPTION_EXCEPTIONS:
                 # Transient error, so reconnect to the stream.
@@ -130,16 +175,98 @@ class ReadRowsStream(object):
             _copy_stream_position(self._position), **self._read_rows_kwargs
         )
 
+    @property
+    def position(self):
+        """~google.cloud.bigquery_storage_v1beta1.types.StreamPosition: The
+        position of the next row to read from the stream.
+
+        The offset counts the rows of every block returned so far.
+        """
+        return _copy_stream_position(self._position)
+
+    def checkpoint(self, read_session):
+        """Serialize the position of the stream and its read session.
+
+        The checkpoint is a small blob which can be stored anywhere. Pass
+        it to
+        :meth:`~google.cloud.bigquery_storage_v1beta1.client.BigQueryStorageClient.read_rows`
+        to resume reading from the position of the checkpoint, and to
+        :func:`~google.cloud.bigquery_storage_v1beta1.reader.load_checkpoint`
+        to get back the read session needed to parse the rows.
+
+        Args:
+            read_session ( \
+                ~google.cloud.bigquery_storage_v1beta1.types.ReadSession \
+            ):
+                The read session associated with this read rows stream.
+
+        Returns:
+            bytes: The checkpoint.
+        """
+        return _dump_checkpoint(
+            read_session.SerializeToString(), self._position
+        )
+
+    def save_checkpoints(
+        self, read_session, destination, interval=_DEFAULT_CHECKPOINT_INTERVAL
+    ):
+        """Periodically save a checkpoint while iterating over the stream.
+
+        A checkpoint is saved after the caller is done with a block, at most
+        once every ``interval`` seconds, and once more when the stream is
+        exhausted. Rows of the block the caller was processing when the
+        reader stopped are not covered by the last checkpoint, so a resumed
+        reader reads them again.
+
+        Args:
+            read_session ( \
+                ~google.cloud.bigquery_storage_v1beta1.types.ReadSession \
+            ):
+                The read session associated with this read rows stream.
+            destination (Union[str, Callable[[bytes], None]]):
+                The path of a local file, which is atomically replaced by
+                each checkpoint, or a function called with each checkpoint.
+            interval (float):
+                (Optional) The minimum time, in seconds, between two
+                checkpoints. Defaults to 30 seconds.
+
+        Returns:
+            ~google.cloud.bigquery_storage_v1beta1.reader.ReadRowsStream:
+                This stream, to iterate over.
+        """
+        if isinstance(destination, six.string_types):
+            destination = functools.partial(
+                _write_checkpoint_file, destination
+            )
+
+        self._checkpoint_session = read_session.SerializeToString()
+        self._checkpoint_destination = destination
+        self._checkpoint_interval = interval
+        self._last_checkpoint = time.time()
+        return self
+
+    def _maybe_save_checkpoint(self):
+        """Save a checkpoint if the interval since the last one elapsed."""
+        if self._checkpoint_destination is None:
+            return
+        if time.time() - self._last_checkpoint >= self._checkpoint_interval:
+            self._save_checkpoint()
+
+    def _save_checkpoint(self):
+        """Save a checkpoint of the current position, if requested."""
+        if self._checkpoint_destination is None:
+            return
+        self._checkpoint_destination(
+            _dump_checkpoint(self._checkpoint_session, self._position)
+        )
+        self._last_checkpoint = time.time()
+
     def rows(self, read_session):
         """Iterate over all rows in the stream.
 
         This method requires the fastavro library in order to parse row
         blocks.
 
-        .. warning::
-            DATETIME columns are not supported. They are currently parsed as
-            strings in the fastavro library.
-
         Args:
             read_session ( \
                 ~google.cloud.bigquery_storage_v1beta1.types.ReadSession \
@@ -155,8 +282,8 @@ class ReadRowsStream(object):
         if fastavro is None:
             raise ImportError(_FASTAVRO_REQUIRED)
 
-        avro_schema = _avro_schema(read_session)
-        blocks = (_avro_rows(block, avro_schema) for block in self)
+        decoder = _AvroColumnDecoder(read_session)
+        blocks = (decoder.rows(block) for block in self)
         return itertools.chain.from_iterable(blocks)
 
     def to_dataframe(self, read_session):
@@ -165,10 +292,6 @@ class ReadRowsStream(object):
         This method requires the pandas libary to create a data frame and the
         fastavro library to parse row blocks.
 
-        .. warning::
-            DATETIME columns are not supported. They are currently parsed as
-            strings in the fastavro library.
-
         Args:
             read_session ( \
                 ~google.cloud.bigquery_storage_v1beta1.types.ReadSession \
@@ -184,59 +307,691 @@ class ReadRowsStream(object):
         if fastavro is None:
             raise ImportError(_FASTAVRO_REQUIRED)
         if pandas is None:
-            raise ImportError("pandas is required to create a DataFrame")
+            raise ImportError(_PANDAS_REQUIRED)
+
+        decoder = _AvroColumnDecoder(read_session)
+        column_chunks = [decoder.decode_block(block) for block in self]
+        return decoder.to_dataframe(column_chunks)
+
+    def record_batches(self, read_session):
+        """Iterate over the blocks in the stream as Arrow record batches.
+
+        This method requires the pyarrow library to create record batches
+        and the fastavro library to parse row blocks. Each block is decoded
+        into column arrays, which are wrapped in a record batch without
+        creating Python objects for numeric and TIMESTAMP values.
+
+        Args:
+            read_session ( \
+                ~google.cloud.bigquery_storage_v1beta1.types.ReadSession \
+            ):
+                The read session associated with this read rows stream. This
+                contains the schema, which is required to parse the data
+                blocks.
 
-        avro_schema = _avro_schema(read_session)
-        frames = []
-        for block in self:
-            dataframe = pandas.DataFrame(list(_avro_rows(block, avro_schema)))
-            frames.append(dataframe)
-        return pandas.concat(frames)
+        Returns:
+            Iterable[pyarrow.RecordBatch]:
+                One record batch per block in the stream.
+        """
+        if fastavro is None:
+            raise ImportError(_FASTAVRO_REQUIRED)
+        if pyarrow is None:
+            raise ImportError(_PYARROW_REQUIRED)
 
+        decoder = _AvroColumnDecoder(read_session)
+        return (
+            decoder.to_record_batch(decoder.decode_block(block))
+            for block in self
+        )
+
+    def to_arrow(self, read_session):
+        """Create a :class:`pyarrow.Table` of all rows in the stream.
 
-def _avro_schema(read_session):
-    """Extract and parse Avro schema from a read session.
+        This method requires the pyarrow library to create a table and the
+        fastavro library to parse row blocks. Use
+        :meth:`pyarrow.Table.to_pandas` to convert the table to a
+        :class:`pandas.DataFrame`.
+
+        Args:
+            read_session ( \
+                ~google.cloud.bigquery_storage_v1beta1.types.ReadSession \
+            ):
+                The read session associated with this read rows stream. This
+                contains the schema, which is required to parse the data
+                blocks.
+
+        Returns:
+            pyarrow.Table:
+                A table of all rows in the stream, with one record batch
+                per block.
+        """
+        if fastavro is None:
+            raise ImportError(_FASTAVRO_REQUIRED)
+        if pyarrow is None:
+            raise ImportError(_PYARROW_REQUIRED)
+
+        decoder = _AvroColumnDecoder(read_session)
+        batches = [
+            decoder.to_record_batch(decoder.decode_block(block))
+            for block in self
+        ]
+        return pyarrow.Table.from_batches(batches, schema=decoder.arrow_schema)
+
+
+class _StreamError(object):
+    """An error raised while reading one of the streams of a session."""
+
+    def __init__(self, exception):
+        self.exception = exception
+
+
+_STREAM_DONE = object()
+
+
+def _put(items, item, closed):
+    """Put an item in a bounded queue, unless the reader is closed.
+
+    Returns:
+        bool: True if the item was added to the queue.
+    """
+    while not closed.is_set():
+        try:
+            items.put(item, timeout=_PUT_TIMEOUT)
+            return True
+        except six.moves.queue.Full:
+            continue
+    return False
+
+
+class MultiStreamReader(object):
+    """Read many streams of a read session concurrently.
+
+    Each stream is read on a worker thread by a
+    :class:`~google.cloud.bigquery_storage_v1beta1.reader.ReadRowsStream`,
+    which reconnects to its stream on transient errors. Blocks from all
+    streams are merged in the order they arrive, so rows are not ordered
+    across streams. At most ``max_buffered_blocks`` blocks are buffered
+    ahead of the consumer: when the buffer is full, the workers wait.
+
+    Iterate over the reader to fetch all row blocks.
 
     Args:
+        client ( \
+            ~google.cloud.bigquery_storage_v1beta1.gapic. \
+                big_query_storage_client.BigQueryStorageClient \
+        ):
+            A GAPIC client used to connect to the ReadRows streams.
         read_session ( \
             ~google.cloud.bigquery_storage_v1beta1.types.ReadSession \
         ):
-            The read session associated with this read rows stream. This
-            contains the schema, which is required to parse the data
-            blocks.
-
-    Returns:
-        A parsed Avro schema, using :func:`fastavro.schema.parse_schema`.
+            The read session to read. It contains the schema, which is
+            required to parse the data blocks.
+        streams (Sequence[ \
+            ~google.cloud.bigquery_storage_v1beta1.types.Stream \
+        ]):
+            (Optional) The streams to read. Defaults to all streams of the
+            read session.
+        max_workers (int):
+            (Optional) The maximum number of streams read at once. Defaults
+            to the number of streams.
+        max_buffered_blocks (int):
+            (Optional) The maximum number of blocks read ahead of the
+            consumer. Defaults to twice the number of workers.
+        read_rows_kwargs (dict):
+            (Optional) Keyword arguments to use when connecting to a
+            ReadRows stream.
     """
-    json_schema = json.loads(read_session.avro_schema.schema)
-    return fastavro.parse_schema(json_schema)
+
+    def __init__(
+        self,
+        client,
+        read_session,
+        streams=None,
+        max_workers=None,
+        max_buffered_blocks=None,
+        read_rows_kwargs=None,
+    ):
+        if streams is None:
+            streams = read_session.streams
+        streams = list(streams)
+        if max_workers is None:
+            max_workers = len(streams)
+        if max_buffered_blocks is None:
+            max_buffered_blocks = 2 * max_workers
+
+        self._client = client
+        self._read_session = read_session
+        self._streams = streams
+        self._max_workers = max_workers
+        self._max_buffered_blocks = max_buffered_blocks
+        self._read_rows_kwargs = read_rows_kwargs or {}
+
+    def __iter__(self):
+        """An iterable of blocks from all streams.
+
+        Returns:
+            Iterable[ \
+                ~google.cloud.bigquery_storage_v1beta1.types.ReadRowsResponse \
+            ]:
+                A sequence of row blocks.
+        """
+        return self._read(lambda block: block)
+
+    def rows(self):
+        """Iterate over all rows in the streams.
+
+        This method requires the fastavro library in order to parse row
+        blocks. Blocks are parsed on the worker threads.
+
+        Returns:
+            Iterable[Mapping]:
+                A sequence of rows, represented as dictionaries.
+        """
+        if fastavro is None:
+            raise ImportError(_FASTAVRO_REQUIRED)
+
+        decoder = _AvroColumnDecoder(self._read_session)
+        blocks = self._read(lambda block: list(decoder.rows(block)))
+        return itertools.chain.from_iterable(blocks)
+
+    def to_dataframe(self):
+        """Create a :class:`pandas.DataFrame` of all rows in the streams.
+
+        This method requires the pandas libary to create a data frame and the
+        fastavro library to parse row blocks. Blocks are decoded into column
+        arrays on the worker threads, and the data frame is built once all
+        streams have been read.
+
+        Returns:
+            pandas.DataFrame:
+                A data frame of all rows in the streams.
+        """
+        if fastavro is None:
+            raise ImportError(_FASTAVRO_REQUIRED)
+        if pandas is None:
+            raise ImportError(_PANDAS_REQUIRED)
+
+        decoder = _AvroColumnDecoder(self._read_session)
+        column_chunks = list(self._read(decoder.decode_block))
+        return decoder.to_dataframe(column_chunks)
+
+    def record_batches(self):
+        """Iterate over the blocks in the streams as Arrow record batches.
+
+        This method requires the pyarrow library to create record batches
+        and the fastavro library to parse row blocks. Record batches are
+        created on the worker threads.
+
+        Returns:
+            Iterable[pyarrow.RecordBatch]:
+                One record batch per block, in the order the blocks arrive.
+        """
+        if fastavro is None:
+            raise ImportError(_FASTAVRO_REQUIRED)
+        if pyarrow is None:
+            raise ImportError(_PYARROW_REQUIRED)
+
+        decoder = _AvroColumnDecoder(self._read_session)
+        return self._read(
+            lambda block: decoder.to_record_batch(decoder.decode_block(block))
+        )
+
+    def to_arrow(self):
+        """Create a :class:`pyarrow.Table` of all rows in the streams.
+
+        This method requires the pyarrow library to create a table and the
+        fastavro library to parse row blocks.
+
+        Returns:
+            pyarrow.Table:
+                A table of all rows in the streams, with one record batch
+                per block.
+        """
+        batches = list(self.record_batches())
+        decoder = _AvroColumnDecoder(self._read_session)
+        return pyarrow.Table.from_batches(batches, schema=decoder.arrow_schema)
+
+    def _read(self, transform):
+        """Read all streams, and yield each block passed through ``transform``.
+
+        Stops the workers when the consumer stops iterating, and raises the
+        first error raised while reading a stream.
+        """
+        if not self._streams:
+            return
+
+        items = six.moves.queue.Queue(maxsize=self._max_buffered_blocks)
+        closed = threading.Event()
+        executor = concurrent.futures.ThreadPoolExecutor(self._max_workers)
+        for stream in self._streams:
+            executor.submit(
+                self._read_stream, stream, transform, items, closed
+            )
+        # Don't wait for the workers: they stop on their own once the
+        # reader is closed.
+        executor.shutdown(wait=False)
+
+        remaining = len(self._streams)
+        try:
+            while remaining:
+                item = items.get()
+                if item is _STREAM_DONE:
+                    remaining -= 1
+                elif isinstance(item, _StreamError):
+                    raise item.exception
+                else:
+                    yield item
+        finally:
+            closed.set()
+
+    def _read_stream(self, stream, transform, items, closed):
+        """Read one stream on a worker thread."""
+        if closed.is_set():
+            return
+
+        try:
+            position = types.StreamPosition(stream=stream)
+            stream_reader = ReadRowsStream(
+                self._client.read_rows(position, **self._read_rows_kwargs),
+                self._client,
+                position,
+                self._read_rows_kwargs,
+            )
+            for block in stream_reader:
+                if not _put(items, transform(block), closed):
+                    return
+        except Exception as exc:
+            _put(items, _StreamError(exc), closed)
+            return
+
+        _put(items, _STREAM_DONE, closed)
 
 
 def _avro_rows(block, avro_schema):
     """Parse all rows in a stream block.
 
     Args:
-        read_session ( \
-            ~google.cloud.bigquery_storage_v1beta1.types.ReadSession \
+        block ( \
+            ~google.cloud.bigquery_storage_v1beta1.types.ReadRowsResponse \
         ):
-            The read session associated with this read rows stream. This
-            contains the schema, which is required to parse the data
-            blocks.
+            A block of rows from a read rows stream.
+        avro_schema (Mapping):
+            The Avro schema of the rows, parsed by
+            :func:`fastavro.parse_schema`.
 
     Returns:
         Iterable[Mapping]:
             A sequence of rows, represented as dictionaries.
     """
     blockio = six.BytesIO(block.avro_rows.serialized_binary_rows)
-    while True:
-        # Loop in a while loop because schemaless_reader can only read
-        # a single record.
-        try:
-            # TODO: Parse DATETIME into datetime.datetime (no timezone),
-            #       instead of as a string.
-            yield fastavro.schemaless_reader(blockio, avro_schema)
-        except StopIteration:
-            break  # Finished with block
+    # schemaless_reader reads a single record, so read as many records as
+    # the block says it contains.
+    for _ in six.moves.range(block.avro_rows.row_count):
+        yield fastavro.schemaless_reader(blockio, avro_schema)
+
+
+def _parse_datetime(value):
+    """Parse a DATETIME value, which fastavro reads as a string."""
+    value = value.replace(" ", "T")
+    if "." in value:
+        return datetime.datetime.strptime(value, "%Y-%m-%dT%H:%M:%S.%f")
+    return datetime.datetime.strptime(value, "%Y-%m-%dT%H:%M:%S")
+
+
+def _parse_datetimes(values):
+    """Parse an ``object`` array of DATETIME strings into ``datetime64``.
+
+    Null values become ``NaT``.
+    """
+    return numpy.array(values, dtype="datetime64[us]")
+
+
+def _null_type(avro_type):
+    """Split the ``null`` branch off a nullable Avro type.
+
+    Returns:
+        Tuple[object, bool]:
+            The non-null Avro type and whether the type is nullable.
+    """
+    if (
+        isinstance(avro_type, list)
+        and len(avro_type) == 2
+        and "null" in avro_type
+    ):
+        non_null = [branch for branch in avro_type if branch != "null"][0]
+        return non_null, True
+    return avro_type, False
+
+
+_COLUMN_DTYPES = {
+    "long": "int64",
+    "int": "int64",
+    "double": "float64",
+    "float": "float64",
+    "boolean": "bool",
+    "timestamp-micros": "int64",
+}
+"""NumPy data types of the Avro types decoded into typed column arrays.
+
+Other types, such as strings, dates or records, are decoded into ``object``
+arrays of the values fastavro produces.
+"""
+
+_ARROW_SCALAR_TYPES = {
+    "long": "int64",
+    "int": "int64",
+    "double": "float64",
+    "float": "float64",
+    "boolean": "bool_",
+    "string": "string",
+    "bytes": "binary",
+}
+"""Names of the pyarrow type factories for Avro primitive types."""
+
+
+def _arrow_type(avro_type, top_level=False):
+    """Convert an Avro type, as found in a read session schema, to Arrow.
+
+    DATETIME values are only parsed in top-level fields, so nested DATETIME
+    values stay strings.
+    """
+    avro_type, _ = _null_type(avro_type)
+    if isinstance(avro_type, dict):
+        logical_type = avro_type.get("logicalType")
+        if logical_type == "timestamp-micros":
+            return pyarrow.timestamp("us", tz="UTC")
+        if logical_type == "date":
+            return pyarrow.date32()
+        if logical_type == "time-micros":
+            return pyarrow.time64("us")
+        if logical_type == "decimal":
+            return pyarrow.decimal128(
+                avro_type["precision"], avro_type["scale"]
+            )
+        if avro_type.get("sqlType") == "DATETIME" and top_level:
+            return pyarrow.timestamp("us")
+        if avro_type["type"] == "record":
+            return pyarrow.struct(
+                [
+                    pyarrow.field(field["name"], _arrow_type(field["type"]))
+                    for field in avro_type["fields"]
+                ]
+            )
+        if avro_type["type"] == "array":
+            return pyarrow.list_(_arrow_type(avro_type["items"]))
+        avro_type = avro_type["type"]
+    return getattr(pyarrow, _ARROW_SCALAR_TYPES[avro_type])()
+
+
+class _AvroColumnDecoder(object):
+    """Decode Avro blocks of a read session into column arrays.
+
+    The decoder is built once per read session: each field of the Avro
+    schema is mapped to a NumPy data type, and TIMESTAMP fields are decoded
+    as plain microseconds since the epoch, which are converted to
+    ``datetime64`` values for a whole column at once instead of creating a
+    :class:`datetime.datetime` per value. DATETIME fields, which fastavro
+    reads as strings, are parsed into timezone-naive values.
+
+    Args:
+        read_session ( \
+            ~google.cloud.bigquery_storage_v1beta1.types.ReadSession \
+        ):
+            The read session, which contains the Avro schema of the blocks.
+    """
+
+    def __init__(self, read_session):
+        json_schema = json.loads(read_session.avro_schema.schema)
+        self._record_schema = fastavro.parse_schema(copy.deepcopy(json_schema))
+        self._field_types = [field["type"] for field in json_schema["fields"]]
+        self._names = []
+        self._kinds = []
+        self._nullable = []
+        fields = []
+        for field in copy.deepcopy(json_schema)["fields"]:
+            avro_type, nullable = _null_type(field["type"])
+            kind = avro_type
+            if isinstance(avro_type, dict):
+                kind = avro_type.get("logicalType", avro_type["type"])
+                if avro_type.get("sqlType") == "DATETIME":
+                    kind = "datetime"
+                if kind == "timestamp-micros":
+                    # Decode the raw microseconds.
+                    raw_type = "long"
+                    field["type"] = (
+                        ["null", raw_type] if nullable else raw_type
+                    )
+            if not isinstance(kind, six.string_types):
+                kind = None
+            self._names.append(field["name"])
+            self._kinds.append(kind)
+            self._nullable.append(nullable)
+            fields.append(field)
+        self._avro_schema = fastavro.parse_schema(
+            dict(json_schema, fields=fields)
+        )
+        self._datetime_names = [
+            name
+            for name, kind in zip(self._names, self._kinds)
+            if kind == "datetime"
+        ]
+        self._arrow_schema = None
+
+    @property
+    def arrow_schema(self):
+        """pyarrow.Schema: The schema of the record batches."""
+        if self._arrow_schema is None:
+            self._arrow_schema = pyarrow.schema(
+                [
+                    pyarrow.field(name, _arrow_type(avro_type, top_level=True))
+                    for name, avro_type in zip(self._names, self._field_types)
+                ]
+            )
+        return self._arrow_schema
+
+    def rows(self, block):
+        """Parse all rows in a block into dictionaries.
+
+        Args:
+            block ( \
+                ~google.cloud.bigquery_storage_v1beta1.types.ReadRowsResponse \
+            ):
+                A block of rows from a read rows stream.
+
+        Returns:
+            Iterable[Mapping]:
+                A sequence of rows, represented as dictionaries.
+        """
+        datetime_names = self._datetime_names
+        for row in _avro_rows(block, self._record_schema):
+            for name in datetime_names:
+                if row[name] is not None:
+                    row[name] = _parse_datetime(row[name])
+            yield row
+
+    def decode_block(self, block):
+        """Decode a block of rows into one array per column.
+
+        Args:
+            block ( \
+                ~google.cloud.bigquery_storage_v1beta1.types.ReadRowsResponse \
+            ):
+                A block of rows from a read rows stream.
+
+        Returns:
+            List[Tuple[numpy.ndarray, Optional[numpy.ndarray]]]:
+                For each column, the array of values and, for nullable
+                columns, a boolean array which is ``True`` for null values.
+        """
+        row_count = block.avro_rows.row_count
+        names = self._names
+        values = []
+        masks = []
+        for kind, nullable in zip(self._kinds, self._nullable):
+            dtype = _COLUMN_DTYPES.get(kind, "object")
+            values.append(numpy.empty(row_count, dtype=dtype))
+            masks.append(
+                numpy.zeros(row_count, dtype="bool") if nullable else None
+            )
+        columns = list(zip(names, values, masks))
+
+        blockio = six.BytesIO(block.avro_rows.serialized_binary_rows)
+        reader = fastavro.schemaless_reader
+        avro_schema = self._avro_schema
+        for index in six.moves.range(row_count):
+            record = reader(blockio, avro_schema)
+            for name, array, mask in columns:
+                value = record[name]
+                if value is None:
+                    mask[index] = True
+                else:
+                    array[index] = value
+        return list(zip(values, masks))
+
+    def to_dataframe(self, column_chunks):
+        """Concatenate decoded blocks into a single data frame.
+
+        Args:
+            column_chunks (Sequence[List[Tuple[ \
+                numpy.ndarray, Optional[numpy.ndarray] \
+            ]]]):
+                The decoded blocks, as returned by :meth:`decode_block`.
+
+        Returns:
+            pandas.DataFrame:
+                A data frame with one column per field in the schema.
+                INT64 columns with nulls become ``float64`` columns and
+                BOOL columns with nulls become ``object`` columns, as when
+                pandas creates a data frame from rows.
+        """
+        columns = {}
+        for index, (name, kind) in enumerate(zip(self._names, self._kinds)):
+            chunks = [chunk[index] for chunk in column_chunks]
+            dtype = _COLUMN_DTYPES.get(kind, "object")
+            if chunks:
+                array = numpy.concatenate([values for values, _ in chunks])
+            else:
+                array = numpy.empty(0, dtype=dtype)
+            mask = None
+            if self._nullable[index] and chunks:
+                mask = numpy.concatenate([mask for _, mask in chunks])
+            columns[name] = _finalize_column(array, mask, kind)
+        return pandas.DataFrame(columns, columns=self._names)
+
+    def to_record_batch(self, chunk):
+        """Create a record batch from a decoded block.
+
+        Args:
+            chunk (List[Tuple[numpy.ndarray, Optional[numpy.ndarray]]]):
+                A decoded block, as returned by :meth:`decode_block`.
+
+        Returns:
+            pyarrow.RecordBatch: A record batch of the rows in the block.
+        """
+        arrays = []
+        columns = zip(chunk, self._kinds, self.arrow_schema)
+        for (values, mask), kind, field in columns:
+            if kind == "timestamp-micros":
+                values = values.view("datetime64[us]")
+            elif kind == "datetime":
+                values = _parse_datetimes(values)
+            if values.dtype.kind == "O":
+                # Null values are already None.
+                mask = None
+            arrays.append(pyarrow.array(values, mask=mask, type=field.type))
+        return pyarrow.RecordBatch.from_arrays(arrays, self._names)
+
+
+def _finalize_column(array, mask, kind):
+    """Apply the null mask to a column and convert its values for pandas."""
+    has_nulls = mask is not None and mask.any()
+    if kind == "timestamp-micros":
+        array = array.astype("datetime64[us]")
+        if has_nulls:
+            array[mask] = numpy.datetime64("NaT")
+        return pandas.Series(pandas.to_datetime(array, utc=True))
+    if kind == "datetime":
+        return pandas.Series(_parse_datetimes(array))
+    if not has_nulls:
+        return pandas.Series(array)
+    if array.dtype.kind in "if":
+        array = array.astype("float64")
+        array[mask] = numpy.nan
+    else:
+        array = array.astype("object")
+        array[mask] = None
+    return pandas.Series(array)
+
+
+def load_checkpoint(checkpoint):
+    """Parse a checkpoint of a read rows stream.
+
+    Args:
+        checkpoint (bytes):
+            A checkpoint returned by
+            :meth:`~google.cloud.bigquery_storage_v1beta1.reader.ReadRowsStream.checkpoint`.
+
+    Returns:
+        Tuple[ \
+            ~google.cloud.bigquery_storage_v1beta1.types.ReadSession, \
+            ~google.cloud.bigquery_storage_v1beta1.types.StreamPosition, \
+        ]:
+            The read session of the stream and the position to resume
+            reading from.
+
+    Raises:
+        ValueError: If the checkpoint is invalid.
+    """
+    if isinstance(checkpoint, six.binary_type):
+        checkpoint = checkpoint.decode("ascii")
+    try:
+        resource = json.loads(checkpoint)
+        version = resource["version"]
+        session = base64.b64decode(resource["session"])
+        position = base64.b64decode(resource["position"])
+    except (KeyError, TypeError, ValueError):
+        raise ValueError("Invalid read rows checkpoint.")
+    if version != _CHECKPOINT_VERSION:
+        raise ValueError(
+            "Unsupported read rows checkpoint version {!r}.".format(version)
+        )
+
+    return (
+        types.ReadSession.FromString(session),
+        types.StreamPosition.FromString(position),
+    )
+
+
+def _dump_checkpoint(serialized_session, position):
+    """Serialize a checkpoint of a read rows stream.
+
+    Args:
+        serialized_session (bytes): The serialized read session.
+        position (~google.cloud.bigquery_storage_v1beta1.types.StreamPosition):
+            The position to resume reading from.
+
+    Returns:
+        bytes: The checkpoint.
+    """
+    serialized_position = position.SerializeToString()
+    resource = {
+        "version": _CHECKPOINT_VERSION,
+        "session": base64.b64encode(serialized_session).decode("ascii"),
+        "position": base64.b64encode(serialized_position).decode("ascii"),
+    }
+    return json.dumps(resource, sort_keys=True).encode("ascii")
+
+
+def _write_checkpoint_file(path, checkpoint):
+    """Atomically replace the contents of a file with a checkpoint."""
+    temp_path = path + ".tmp"
+    with open(temp_path, "wb") as temp_file:
+        temp_file.write(checkpoint)
+        temp_file.flush()
+        os.fsync(temp_file.fileno())
+    # os.rename cannot replace an existing file on Windows, but
+    # os.replace is only available on Python 3.
+    getattr(os, "replace", os.rename)(temp_path, path)
 
 
 def _copy_stream_position(position):
@@ -245,14 +1000,20 @@ def _copy_stream_position(position):
     Args:
         position (Union[ \
             dict, \
-            ~google.cloud.bigquery_storage_v1beta1.types.StreamPosition \
+            ~google.cloud.bigquery_storage_v1beta1.types.StreamPosition, \
+            bytes \
         ]):
-            StreamPostion (or dictionary in StreamPosition format) to copy.
+            StreamPostion (or dictionary in StreamPosition format) to copy,
+            or a checkpoint to take the position from.
 
     Returns:
         ~google.cloud.bigquery_storage_v1beta1.types.StreamPosition:
             A copy of the input StreamPostion.
     """
+    if isinstance(position, six.binary_type):
+        _, position = load_checkpoint(position)
+        return position
+
     if isinstance(position, types.StreamPosition):
         output = types.StreamPosition()
         output.CopyFrom(position)
@@ -88,3 +88,35 @@ def test_read_rows(mock_transport, client_under_test):
     mock_transport.create_read_session.read_rows(
         expected_request, metadata=mock.ANY, timeout=mock.ANY
     )
+
+
+def test_read_rows_w_checkpoint(mock_transport, client_under_test):
+    from google.cloud.bigquery_storage_v1beta1 import reader
+
+    stream_position = types.StreamPosition(stream={"name": "test"}, offset=42)
+    checkpoint = reader.ReadRowsStream([], None, stream_position, {}).checkpoint(
+        types.ReadSession()
+    )
+
+    stream = client_under_test.read_rows(checkpoint)
+
+    assert stream.position == stream_position
+    request = mock_transport.read_rows.call_args[0][0]
+    assert request.read_position == stream_position
+
+
+def test_read_streams(mock_transport, client_under_test):
+    from google.cloud.bigquery_storage_v1beta1 import reader
+
+    read_session = types.ReadSession()
+    read_session.streams.add(name="stream-1")
+    read_session.streams.add(name="stream-2")
+
+    multi_stream_reader = client_under_test.read_streams(
+        read_session, streams=read_session.streams[1:], max_workers=1
+    )
+
+    assert isinstance(multi_stream_reader, reader.MultiStreamReader)
+    assert multi_stream_reader._streams == [read_session.streams[1]]
+    assert multi_stream_reader._max_workers == 1
+    assert multi_stream_reader._max_buffered_blocks == 2
@@ -18,11 +18,14 @@ import datetime
 import decimal
 import itertools
 import json
+import threading
+import time
 
 import fastavro
 import mock
 import pandas
 import pandas.testing
+import pyarrow
 import pytest
 import pytz
 import six
@@ -301,6 +304,500 @@ def test_to_dataframe_w_scalars(class_under_test):
     )
 
 
+def test_to_dataframe_w_empty_stream(class_under_test, mock_client):
+    bq_columns = [
+        {"name": "int_col", "type": "int64"},
+        {"name": "ts_col", "type": "timestamp"},
+    ]
+    avro_schema = _bq_to_avro_schema(bq_columns)
+    read_session = _generate_read_session(avro_schema)
+    reader = class_under_test(
+        [], mock_client, bigquery_storage_v1beta1.types.StreamPosition(), {}
+    )
+
+    got = reader.to_dataframe(read_session)
+
+    assert list(got.columns) == ["int_col", "ts_col"]
+    assert len(got) == 0
+
+
+def test_to_dataframe_w_nulls(class_under_test, mock_client):
+    bq_columns = [
+        {"name": "int_col", "type": "int64"},
+        {"name": "required_int_col", "type": "int64", "mode": "required"},
+        {"name": "float_col", "type": "float64"},
+        {"name": "bool_col", "type": "bool"},
+        {"name": "str_col", "type": "string"},
+        {"name": "ts_col", "type": "timestamp"},
+    ]
+    avro_schema = _bq_to_avro_schema(bq_columns)
+    read_session = _generate_read_session(avro_schema)
+    bq_blocks = [
+        [
+            {
+                "int_col": 1,
+                "required_int_col": 1,
+                "float_col": 1.5,
+                "bool_col": True,
+                "str_col": "a",
+                "ts_col": datetime.datetime(2000, 1, 1, 5, 0, tzinfo=pytz.utc),
+            }
+        ],
+        [
+            {
+                "int_col": None,
+                "required_int_col": 2,
+                "float_col": None,
+                "bool_col": None,
+                "str_col": None,
+                "ts_col": None,
+            },
+            {
+                "int_col": 3,
+                "required_int_col": 3,
+                "float_col": 3.5,
+                "bool_col": False,
+                "str_col": "c",
+                "ts_col": datetime.datetime(2001, 1, 1, 5, 0, tzinfo=pytz.utc),
+            },
+        ],
+    ]
+    avro_blocks = _bq_to_avro_blocks(bq_blocks, avro_schema)
+    reader = class_under_test(
+        avro_blocks, mock_client, bigquery_storage_v1beta1.types.StreamPosition(), {}
+    )
+
+    got = reader.to_dataframe(read_session)
+
+    assert list(got.columns) == [column["name"] for column in bq_columns]
+    assert got["int_col"].dtype.name == "float64"
+    assert got["required_int_col"].dtype.name == "int64"
+    assert list(got.index) == [0, 1, 2]
+    assert got["int_col"].isnull().tolist() == [False, True, False]
+    assert got["float_col"].isnull().tolist() == [False, True, False]
+    assert got["bool_col"].tolist() == [True, None, False]
+    assert got["str_col"].tolist() == ["a", None, "c"]
+    assert str(got["ts_col"].dtype) == "datetime64[ns, UTC]"
+    assert got["ts_col"].isnull().tolist() == [False, True, False]
+    assert got["ts_col"][2] == pandas.Timestamp("2001-01-01T05:00:00Z")
+
+
+def test_rows_w_datetime(class_under_test, mock_client):
+    bq_columns = [{"name": "dt_col", "type": "datetime"}]
+    avro_schema = _bq_to_avro_schema(bq_columns)
+    read_session = _generate_read_session(avro_schema)
+    avro_blocks = _bq_to_avro_blocks(
+        [[{"dt_col": "2018-01-02T03:04:05.678901"}, {"dt_col": None}]], avro_schema
+    )
+    reader = class_under_test(
+        avro_blocks, mock_client, bigquery_storage_v1beta1.types.StreamPosition(), {}
+    )
+
+    got = list(reader.rows(read_session))
+
+    assert got == [
+        {"dt_col": datetime.datetime(2018, 1, 2, 3, 4, 5, 678901)},
+        {"dt_col": None},
+    ]
+
+
+def test_to_dataframe_w_datetime(class_under_test, mock_client):
+    bq_columns = [{"name": "dt_col", "type": "datetime"}]
+    avro_schema = _bq_to_avro_schema(bq_columns)
+    read_session = _generate_read_session(avro_schema)
+    avro_blocks = _bq_to_avro_blocks(
+        [[{"dt_col": "2018-01-02T03:04:05"}, {"dt_col": None}]], avro_schema
+    )
+    reader = class_under_test(
+        avro_blocks, mock_client, bigquery_storage_v1beta1.types.StreamPosition(), {}
+    )
+
+    got = reader.to_dataframe(read_session)
+
+    assert str(got["dt_col"].dtype) == "datetime64[ns]"
+    assert got["dt_col"][0] == pandas.Timestamp("2018-01-02T03:04:05")
+    assert pandas.isnull(got["dt_col"][1])
+
+
+def test_to_arrow_no_pyarrow_raises_import_error(
+    mut, class_under_test, mock_client, monkeypatch
+):
+    monkeypatch.setattr(mut, "pyarrow", None)
+    reader = class_under_test(
+        [], mock_client, bigquery_storage_v1beta1.types.StreamPosition(), {}
+    )
+    read_session = bigquery_storage_v1beta1.types.ReadSession()
+
+    with pytest.raises(ImportError):
+        reader.to_arrow(read_session)
+    with pytest.raises(ImportError):
+        reader.record_batches(read_session)
+
+
+def test_to_arrow_w_scalars(class_under_test, mock_client):
+    avro_schema = _bq_to_avro_schema(SCALAR_COLUMNS)
+    read_session = _generate_read_session(avro_schema)
+    avro_blocks = _bq_to_avro_blocks(SCALAR_BLOCKS, avro_schema)
+    reader = class_under_test(
+        avro_blocks, mock_client, bigquery_storage_v1beta1.types.StreamPosition(), {}
+    )
+
+    got = reader.to_arrow(read_session)
+
+    assert got.schema == pyarrow.schema(
+        [
+            ("int_col", pyarrow.int64()),
+            ("float_col", pyarrow.float64()),
+            ("num_col", pyarrow.decimal128(38, 9)),
+            ("bool_col", pyarrow.bool_()),
+            ("str_col", pyarrow.string()),
+            ("bytes_col", pyarrow.binary()),
+            ("date_col", pyarrow.date32()),
+            ("time_col", pyarrow.time64("us")),
+            ("ts_col", pyarrow.timestamp("us", tz="UTC")),
+        ]
+    )
+    assert got.num_rows == 3
+    assert got.column("int_col").to_pylist() == [123, 456, 789]
+    assert got.column("num_col").to_pylist() == [
+        decimal.Decimal("9.99"),
+        decimal.Decimal("0.99"),
+        decimal.Decimal("5.67"),
+    ]
+    assert got.column("date_col").to_pylist() == [
+        row["date_col"] for row in itertools.chain.from_iterable(SCALAR_BLOCKS)
+    ]
+    assert got.column("ts_col").to_pylist() == [
+        row["ts_col"] for row in itertools.chain.from_iterable(SCALAR_BLOCKS)
+    ]
+
+
+def test_record_batches_w_nulls_and_datetime(class_under_test, mock_client):
+    bq_columns = [
+        {"name": "int_col", "type": "int64"},
+        {"name": "bool_col", "type": "bool"},
+        {"name": "str_col", "type": "string"},
+        {"name": "dt_col", "type": "datetime"},
+        {"name": "ts_col", "type": "timestamp"},
+    ]
+    avro_schema = _bq_to_avro_schema(bq_columns)
+    read_session = _generate_read_session(avro_schema)
+    null_row = {column["name"]: None for column in bq_columns}
+    bq_blocks = [
+        [
+            {
+                "int_col": 1,
+                "bool_col": True,
+                "str_col": "a",
+                "dt_col": "2018-01-02T03:04:05.000006",
+                "ts_col": datetime.datetime(2000, 1, 1, tzinfo=pytz.utc),
+            }
+        ],
+        [null_row],
+    ]
+    avro_blocks = _bq_to_avro_blocks(bq_blocks, avro_schema)
+    reader = class_under_test(
+        avro_blocks, mock_client, bigquery_storage_v1beta1.types.StreamPosition(), {}
+    )
+
+    got = list(reader.record_batches(read_session))
+
+    assert [batch.num_rows for batch in got] == [1, 1]
+    assert got[0].schema.field("dt_col").type == pyarrow.timestamp("us")
+    assert got[0].to_pydict()["dt_col"] == [datetime.datetime(2018, 1, 2, 3, 4, 5, 6)]
+    assert got[1].to_pydict() == {name: [None] for name in null_row}
+    assert got[1].column(0).null_count == 1
+
+
+def _generate_multi_stream_session(avro_schema_json, stream_names):
+    read_session = _generate_read_session(avro_schema_json)
+    for name in stream_names:
+        read_session.streams.add(name=name)
+    return read_session
+
+
+def _read_rows_by_stream(stream_blocks):
+    def read_rows(position, **kwargs):
+        return stream_blocks[position.stream.name].pop(0)
+
+    return read_rows
+
+
+def test_multi_stream_iter(mut, mock_client):
+    bq_columns = [{"name": "int_col", "type": "int64"}]
+    avro_schema = _bq_to_avro_schema(bq_columns)
+    read_session = _generate_multi_stream_session(avro_schema, ["s1", "s2"])
+    s1_blocks = _bq_to_avro_blocks([[{"int_col": 1}], [{"int_col": 2}]], avro_schema)
+    s2_blocks = _bq_to_avro_blocks([[{"int_col": 3}]], avro_schema)
+    mock_client.read_rows.side_effect = _read_rows_by_stream(
+        {"s1": [s1_blocks], "s2": [s2_blocks]}
+    )
+
+    reader = mut.MultiStreamReader(
+        mock_client, read_session, read_rows_kwargs={"timeout": 5}
+    )
+    got = list(reader)
+
+    assert len(got) == 3
+    assert all(block in got for block in s1_blocks + s2_blocks)
+    # Blocks of the same stream stay in order.
+    assert got.index(s1_blocks[0]) < got.index(s1_blocks[1])
+    assert mock_client.read_rows.call_count == 2
+    mock_client.read_rows.assert_any_call(
+        bigquery_storage_v1beta1.types.StreamPosition(stream={"name": "s1"}),
+        timeout=5,
+    )
+
+
+def test_multi_stream_rows_w_streams_subset(mut, mock_client):
+    bq_columns = [{"name": "int_col", "type": "int64"}]
+    avro_schema = _bq_to_avro_schema(bq_columns)
+    read_session = _generate_multi_stream_session(avro_schema, ["s1", "s2", "s3"])
+    mock_client.read_rows.side_effect = _read_rows_by_stream(
+        {
+            "s2": [_bq_to_avro_blocks([[{"int_col": 1}, {"int_col": 2}]], avro_schema)],
+            "s3": [_bq_to_avro_blocks([[{"int_col": 3}]], avro_schema)],
+        }
+    )
+
+    reader = mut.MultiStreamReader(
+        mock_client, read_session, streams=read_session.streams[1:], max_workers=1
+    )
+    got = sorted(row["int_col"] for row in reader.rows())
+
+    assert got == [1, 2, 3]
+
+
+def test_multi_stream_rows_w_reconnect(mut, mock_client):
+    bq_columns = [{"name": "int_col", "type": "int64"}]
+    avro_schema = _bq_to_avro_schema(bq_columns)
+    read_session = _generate_multi_stream_session(avro_schema, ["s1", "s2"])
+    mock_client.read_rows.side_effect = _read_rows_by_stream(
+        {
+            "s1": [
+                _avro_blocks_w_deadline(
+                    _bq_to_avro_blocks([[{"int_col": 1}, {"int_col": 2}]], avro_schema)
+                ),
+                _bq_to_avro_blocks([[{"int_col": 3}]], avro_schema),
+            ],
+            "s2": [_bq_to_avro_blocks([[{"int_col": 4}]], avro_schema)],
+        }
+    )
+
+    reader = mut.MultiStreamReader(mock_client, read_session)
+    got = sorted(row["int_col"] for row in reader.rows())
+
+    assert got == [1, 2, 3, 4]
+    mock_client.read_rows.assert_any_call(
+        bigquery_storage_v1beta1.types.StreamPosition(stream={"name": "s1"}, offset=2)
+    )
+
+
+def test_multi_stream_to_dataframe(mut, mock_client):
+    avro_schema = _bq_to_avro_schema(SCALAR_COLUMNS)
+    read_session = _generate_multi_stream_session(avro_schema, ["s1", "s2"])
+    mock_client.read_rows.side_effect = _read_rows_by_stream(
+        {
+            "s1": [_bq_to_avro_blocks(SCALAR_BLOCKS[:1], avro_schema)],
+            "s2": [_bq_to_avro_blocks(SCALAR_BLOCKS[1:], avro_schema)],
+        }
+    )
+
+    reader = mut.MultiStreamReader(mock_client, read_session)
+    got = reader.to_dataframe().sort_values("int_col").reset_index(drop=True)
+
+    assert list(got.columns) == [column["name"] for column in SCALAR_COLUMNS]
+    assert got["int_col"].tolist() == [123, 456, 789]
+    assert got["str_col"].tolist() == ["hello world", "hallo welt", u"こんにちは世界"]
+
+
+def test_multi_stream_to_arrow(mut, mock_client):
+    bq_columns = [{"name": "int_col", "type": "int64"}]
+    avro_schema = _bq_to_avro_schema(bq_columns)
+    read_session = _generate_multi_stream_session(avro_schema, ["s1", "s2"])
+    mock_client.read_rows.side_effect = _read_rows_by_stream(
+        {
+            "s1": [
+                _bq_to_avro_blocks([[{"int_col": 1}], [{"int_col": 2}]], avro_schema)
+            ],
+            "s2": [_bq_to_avro_blocks([[{"int_col": 3}]], avro_schema)],
+        }
+    )
+
+    got = mut.MultiStreamReader(mock_client, read_session).to_arrow()
+
+    assert got.schema == pyarrow.schema([("int_col", pyarrow.int64())])
+    assert sorted(got.column("int_col").to_pylist()) == [1, 2, 3]
+
+
+def test_multi_stream_to_dataframe_w_empty_session(mut, mock_client):
+    bq_columns = [{"name": "int_col", "type": "int64"}]
+    read_session = _generate_read_session(_bq_to_avro_schema(bq_columns))
+
+    got = mut.MultiStreamReader(mock_client, read_session).to_dataframe()
+
+    assert list(got.columns) == ["int_col"]
+    assert len(got) == 0
+    mock_client.read_rows.assert_not_called()
+
+
+def test_multi_stream_w_error(mut, mock_client):
+    bq_columns = [{"name": "int_col", "type": "int64"}]
+    avro_schema = _bq_to_avro_schema(bq_columns)
+    read_session = _generate_multi_stream_session(avro_schema, ["s1"])
+    mock_client.read_rows.side_effect = google.api_core.exceptions.NotFound("gone")
+
+    reader = mut.MultiStreamReader(mock_client, read_session)
+
+    with pytest.raises(google.api_core.exceptions.NotFound):
+        list(reader)
+
+
+def test_multi_stream_stops_workers_when_closed(mut, mock_client):
+    bq_columns = [{"name": "int_col", "type": "int64"}]
+    avro_schema = _bq_to_avro_schema(bq_columns)
+    read_session = _generate_multi_stream_session(avro_schema, ["s1"])
+    blocks = _bq_to_avro_blocks(
+        [[{"int_col": index}] for index in range(10)], avro_schema
+    )
+    consumed = []
+
+    def read_blocks():
+        for block in blocks:
+            consumed.append(block)
+            yield block
+
+    mock_client.read_rows.return_value = read_blocks()
+
+    reader = mut.MultiStreamReader(mock_client, read_session, max_buffered_blocks=1)
+    iterator = iter(reader)
+    next(iterator)
+    iterator.close()
+
+    # The worker stops once it sees the reader is closed, without reading
+    # the rest of the stream.
+    for _ in range(50):
+        if not any(
+            thread.name.startswith("ThreadPoolExecutor")
+            for thread in threading.enumerate()
+        ):
+            break
+        time.sleep(0.1)
+    assert len(consumed) < len(blocks)
+
+
+def test_checkpoint_round_trip(mut, class_under_test, mock_client):
+    avro_schema = _bq_to_avro_schema([{"name": "int_col", "type": "int64"}])
+    read_session = _generate_read_session(avro_schema)
+    read_session.name = "projects/p/sessions/s"
+    avro_blocks = _bq_to_avro_blocks([[{"int_col": 1}, {"int_col": 2}]], avro_schema)
+    reader = class_under_test(
+        avro_blocks,
+        mock_client,
+        bigquery_storage_v1beta1.types.StreamPosition(
+            stream={"name": "test"}, offset=10
+        ),
+        {},
+    )
+    tuple(reader)
+
+    got_session, got_position = mut.load_checkpoint(reader.checkpoint(read_session))
+
+    assert got_session == read_session
+    assert got_position == bigquery_storage_v1beta1.types.StreamPosition(
+        stream={"name": "test"}, offset=12
+    )
+    assert reader.position == got_position
+
+
+def test_load_checkpoint_invalid(mut):
+    with pytest.raises(ValueError):
+        mut.load_checkpoint(b"not a checkpoint")
+    with pytest.raises(ValueError):
+        mut.load_checkpoint(
+            json.dumps({"version": 99, "session": "", "position": ""}).encode("ascii")
+        )
+
+
+def test_save_checkpoints_w_callback_and_reconnect(mut, class_under_test, mock_client):
+    avro_schema = _bq_to_avro_schema([{"name": "int_col", "type": "int64"}])
+    read_session = _generate_read_session(avro_schema)
+    avro_blocks_1 = _avro_blocks_w_deadline(
+        _bq_to_avro_blocks([[{"int_col": 1}, {"int_col": 2}]], avro_schema)
+    )
+    mock_client.read_rows.return_value = _bq_to_avro_blocks(
+        [[{"int_col": 3}], [{"int_col": 4}, {"int_col": 5}]], avro_schema
+    )
+    reader = class_under_test(
+        avro_blocks_1,
+        mock_client,
+        bigquery_storage_v1beta1.types.StreamPosition(stream={"name": "test"}),
+        {},
+    )
+    checkpoints = []
+
+    assert reader.save_checkpoints(read_session, checkpoints.append, 0) is reader
+    blocks = iter(reader)
+    next(blocks)
+    # Nothing is saved while the caller still processes a block.
+    assert checkpoints == []
+    tuple(blocks)
+
+    offsets = [mut.load_checkpoint(data)[1].offset for data in checkpoints]
+    # One checkpoint after each block, and a last one at the end.
+    assert offsets == [2, 3, 5, 5]
+    assert mut.load_checkpoint(checkpoints[-1])[0] == read_session
+
+
+def test_save_checkpoints_w_interval(mut, class_under_test, mock_client):
+    avro_schema = _bq_to_avro_schema([{"name": "int_col", "type": "int64"}])
+    read_session = _generate_read_session(avro_schema)
+    avro_blocks = _bq_to_avro_blocks([[{"int_col": 1}]] * 3, avro_schema)
+    reader = class_under_test(
+        avro_blocks, mock_client, bigquery_storage_v1beta1.types.StreamPosition(), {}
+    )
+    checkpoints = []
+
+    with mock.patch("time.time", return_value=100.0):
+        reader.save_checkpoints(read_session, checkpoints.append, 30)
+        tuple(reader)
+
+    # Only the final checkpoint is saved before the interval elapses.
+    assert len(checkpoints) == 1
+    assert mut.load_checkpoint(checkpoints[0])[1].offset == 3
+
+
+def test_save_checkpoints_w_file_resumes(mut, class_under_test, mock_client, tmpdir):
+    avro_schema = _bq_to_avro_schema([{"name": "int_col", "type": "int64"}])
+    read_session = _generate_read_session(avro_schema)
+    bq_blocks = [[{"int_col": 1}, {"int_col": 2}], [{"int_col": 3}], [{"int_col": 4}]]
+    avro_blocks = _bq_to_avro_blocks(bq_blocks, avro_schema)
+    path = str(tmpdir.join("checkpoint"))
+    reader = class_under_test(
+        avro_blocks,
+        mock_client,
+        bigquery_storage_v1beta1.types.StreamPosition(stream={"name": "test"}),
+        {},
+    ).save_checkpoints(read_session, path, interval=0)
+
+    # The worker "crashes" while processing the second block.
+    blocks = iter(reader)
+    next(blocks)
+    next(blocks)
+    del blocks
+
+    with open(path, "rb") as checkpoint_file:
+        checkpoint = checkpoint_file.read()
+    assert not tmpdir.join("checkpoint.tmp").check()
+    got_session, _ = mut.load_checkpoint(checkpoint)
+    resumed = class_under_test(avro_blocks[1:], mock_client, checkpoint, {})
+
+    got = tuple(resumed.rows(got_session))
+
+    assert got == ({"int_col": 3}, {"int_col": 4})
+    assert resumed.position.offset == 4
+
+
 def test_copy_stream_position(mut):
     read_position = bigquery_storage_v1beta1.types.StreamPosition(
         stream={"name": "test"}, offset=41
@@ -316,3 +813,15 @@ def test_copy_stream_position_w_dict(mut):
     got = mut._copy_stream_position(read_position)
     assert got.stream.name == "test"
     assert got.offset == 42
+
+
+def test_copy_stream_position_w_checkpoint(mut, class_under_test, mock_client):
+    read_position = bigquery_storage_v1beta1.types.StreamPosition(
+        stream={"name": "test"}, offset=42
+    )
+    reader = class_under_test([], mock_client, read_position, {})
+    checkpoint = reader.checkpoint(bigquery_storage_v1beta1.types.ReadSession())
+
+    got = mut._copy_stream_position(checkpoint)
+
+    assert got == read_position
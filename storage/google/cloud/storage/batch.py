@@ -15,6 +15,7 @@
 
 See https://cloud.google.com/storage/docs/json_api/v1/how-tos/batch
 """
+import concurrent.futures
 from email.encoders import encode_noop
 from email.generator import Generator
 from email.mime.application import MIMEApplication
@@ -22,13 +23,28 @@ from email.mime.multipart import MIMEMultipart
 from email.parser import Parser
 import io
 import json
+import time
 
 import requests
 import six
+from six.moves import http_client
 
 from google.cloud import _helpers
 from google.cloud import exceptions
 from google.cloud.storage._http import Connection
+from google.cloud.storage.blob import _ThreadSessions
+
+
+_MAX_SUB_BATCH_SIZE = 100
+_MAX_SUB_BATCH_ATTEMPTS = 5
+_MAX_SUB_BATCH_RETRY_DELAY = 32.0
+_RETRYABLE_STATUS_CODES = (
+    429,  # Too Many Requests
+    http_client.INTERNAL_SERVER_ERROR,
+    http_client.BAD_GATEWAY,
+    http_client.SERVICE_UNAVAILABLE,
+    http_client.GATEWAY_TIMEOUT,
+)
 
 
 class MIMEApplicationHTTP(MIMEApplication):
@@ -139,21 +155,35 @@ class _FutureResponse(requests.Response):
 class Batch(Connection):
     """Proxy an underlying connection, batching up change operations.
 
+    If ``max_workers`` is passed, any number of requests may be deferred:
+    when the batch is finished, they are split into sub-batches of 100
+    requests, which are sent concurrently. Requests which fail with a
+    transient error (429 or 5xx) are sent again in a later sub-batch,
+    without sending the requests which succeeded again. Use
+    :meth:`as_completed` to handle the responses as they arrive.
+
     :type client: :class:`google.cloud.storage.client.Client`
     :param client: The client to use for making connections.
+
+    :type max_workers: int
+    :param max_workers: (Optional) The number of sub-batches to send
+                        concurrently.
     """
 
     _MAX_BATCH_SIZE = 1000
 
-    def __init__(self, client):
+    def __init__(self, client, max_workers=None):
         super(Batch, self).__init__(client)
+        self._max_workers = max_workers
         self._requests = []
         self._target_objects = []
+        self._finished = False
 
     def _do_request(self, method, url, headers, data, target_object):
         """Override Connection:  defer actual HTTP request.
 
-        Only allow up to ``_MAX_BATCH_SIZE`` requests to be deferred.
+        Only allow up to ``_MAX_BATCH_SIZE`` requests to be deferred, unless
+        ``max_workers`` was passed.
 
         :type method: str
         :param method: The HTTP method to use in the request.
@@ -177,7 +207,7 @@ class Batch(Connection):
                 and ``content`` (a string).
         :returns: The HTTP response object and the content of the response.
         """
-        if len(self._requests) >= self._MAX_BATCH_SIZE:
+        if self._max_workers is None and len(self._requests) >= self._MAX_BATCH_SIZE:
             raise ValueError(
                 "Too many deferred requests (max %d)" % self._MAX_BATCH_SIZE
             )
@@ -188,19 +218,26 @@ class Batch(Connection):
             target_object._properties = result
         return _FutureResponse(result)
 
-    def _prepare_batch_request(self):
+    def _prepare_batch_request(self, deferred=None):
         """Prepares headers and body for a batch request.
 
+        :type deferred: list of tuples
+        :param deferred: (Optional) The ``(method, uri, headers, body)``
+                         requests to send. Defaults to all of the deferred
+                         requests.
+
         :rtype: tuple (dict, str)
         :returns: The pair of headers and body of the batch request to be sent.
         :raises: :class:`ValueError` if no requests have been deferred.
         """
-        if len(self._requests) == 0:
+        if deferred is None:
+            deferred = self._requests
+        if len(deferred) == 0:
             raise ValueError("No deferred requests")
 
         multi = MIMEMultipart()
 
-        for method, uri, headers, body in self._requests:
+        for method, uri, headers, body in deferred:
             subrequest = MIMEApplicationHTTP(method, uri, headers, body)
             multi.attach(subrequest)
 
@@ -236,21 +273,135 @@ class Batch(Connection):
         for target_object, subresponse in zip(self._target_objects, responses):
             if not 200 <= subresponse.status_code < 300:
                 exception_args = exception_args or subresponse
-            elif target_object is not None:
-                try:
-                    target_object._properties = subresponse.json()
-                except ValueError:
-                    target_object._properties = subresponse.content
+            else:
+                _finish_future(target_object, subresponse)
 
         if exception_args is not None:
             raise exceptions.from_http_response(exception_args)
 
+    def _send_sub_batch(self, sessions, deferred, indexes):
+        """Send one sub-batch, retrying requests which fail transiently.
+
+        :type sessions: :class:`~google.cloud.storage.blob._ThreadSessions`
+        :param sessions: The sessions of the worker threads, since the
+                         session of the client is not thread-safe.
+
+        :type deferred: list of tuples
+        :param deferred: All of the ``(method, uri, headers, body)``
+                         requests deferred in this batch.
+
+        :type indexes: list of int
+        :param indexes: The positions in ``deferred`` of the requests to
+                        send.
+
+        :rtype: list of tuples
+        :returns: one ``(index, response)`` tuple per request sent.
+        :raises: :class:`ValueError` if the batch response does not contain
+                 a response for every request.
+        """
+        url = "%s/batch/storage/v1" % self.API_BASE_URL
+        results = []
+        attempt = 0
+        while True:
+            headers, body = self._prepare_batch_request(
+                [deferred[index] for index in indexes]
+            )
+            # The headers ``_make_request`` adds to every request.
+            headers.update(self._EXTRA_HEADERS)
+            headers["Accept-Encoding"] = "gzip"
+            headers["User-Agent"] = self.USER_AGENT
+            response = sessions.get().request(
+                url=url, method="POST", headers=headers, data=body
+            )
+            if response.status_code in _RETRYABLE_STATUS_CODES:
+                # The whole sub-batch failed, so every request failed.
+                responses = [response] * len(indexes)
+            elif not 200 <= response.status_code < 300:
+                raise exceptions.from_http_response(response)
+            else:
+                responses = list(_unpack_batch_response(response))
+                if len(responses) != len(indexes):
+                    raise ValueError("Expected a response for every request.")
+
+            attempt += 1
+            retry_indexes = []
+            for index, subresponse in zip(indexes, responses):
+                if (
+                    subresponse.status_code in _RETRYABLE_STATUS_CODES
+                    and attempt < _MAX_SUB_BATCH_ATTEMPTS
+                ):
+                    retry_indexes.append(index)
+                else:
+                    results.append((index, subresponse))
+
+            if not retry_indexes:
+                return results
+            indexes = retry_indexes
+            time.sleep(min(2.0 ** attempt, _MAX_SUB_BATCH_RETRY_DELAY))
+
+    def as_completed(self):
+        """Submit the deferred requests in concurrent sub-batches.
+
+        Responses are yielded as their sub-batches complete, so they are
+        not in the order of the requests. Unlike :meth:`finish`, a request
+        which failed does not raise an exception: check the
+        ``status_code`` of its response.
+
+        :rtype: iterator of tuples
+        :returns: one ``(index, response)`` tuple per deferred request,
+                  where ``index`` is the position of the request among the
+                  deferred requests.
+        :raises: :class:`ValueError` if no requests have been deferred.
+        """
+        if len(self._requests) == 0:
+            raise ValueError("No deferred requests")
+
+        deferred, self._requests = self._requests, []
+        target_objects, self._target_objects = self._target_objects, []
+        self._finished = True
+
+        sessions = _ThreadSessions(self._client._credentials)
+        executor = concurrent.futures.ThreadPoolExecutor(
+            max_workers=self._max_workers or 1
+        )
+        futures = []
+        try:
+            for start in range(0, len(deferred), _MAX_SUB_BATCH_SIZE):
+                indexes = list(
+                    range(start, min(start + _MAX_SUB_BATCH_SIZE, len(deferred)))
+                )
+                futures.append(
+                    executor.submit(self._send_sub_batch, sessions, deferred, indexes)
+                )
+            for future in concurrent.futures.as_completed(futures):
+                for index, subresponse in future.result():
+                    if 200 <= subresponse.status_code < 300:
+                        _finish_future(target_objects[index], subresponse)
+                    yield index, subresponse
+        finally:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=True)
+            sessions.close()
+
     def finish(self):
         """Submit a single `multipart/mixed` request with deferred requests.
 
+        If ``max_workers`` was passed, the requests are instead submitted
+        in concurrent sub-batches (see :meth:`as_completed`).
+
         :rtype: list of tuples
         :returns: one ``(headers, payload)`` tuple per deferred request.
         """
+        if self._max_workers is not None:
+            responses = [None] * len(self._requests)
+            for index, subresponse in self.as_completed():
+                responses[index] = subresponse
+            for subresponse in responses:
+                if not 200 <= subresponse.status_code < 300:
+                    raise exceptions.from_http_response(subresponse)
+            return responses
+
         headers, body = self._prepare_batch_request()
 
         url = "%s/batch/storage/v1" % self.API_BASE_URL
@@ -275,12 +426,31 @@ class Batch(Connection):
 
     def __exit__(self, exc_type, exc_val, exc_tb):
         try:
-            if exc_type is None:
+            # Requests already submitted with ``as_completed`` are not sent
+            # again.
+            if exc_type is None and (self._requests or not self._finished):
                 self.finish()
         finally:
             self._client._pop_batch()
 
 
+def _finish_future(target_object, subresponse):
+    """Apply a successful batch response to its target object, if any.
+
+    :type target_object: object
+    :param target_object: The object whose properties are the future value
+                          of the deferred request, or :data:`None`.
+
+    :type subresponse: :class:`requests.Response`
+    :param subresponse: The response to the deferred request.
+    """
+    if target_object is not None:
+        try:
+            target_object._properties = subresponse.json()
+        except ValueError:
+            target_object._properties = subresponse.content
+
+
 def _generate_faux_mime_message(parser, response):
     """Convert response, content -> (multipart) email.message.
 
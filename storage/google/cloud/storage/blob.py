@@ -26,14 +26,24 @@
 """
 
 import base64
+import concurrent.futures
 import copy
 import hashlib
 from io import BytesIO
 import mimetypes
 import os
+import struct
+import threading
 import time
+import uuid
 import warnings
 
+try:
+    import crcmod.predefined
+except ImportError:  # pragma: NO COVER
+    crcmod = None
+import requests
+from six.moves import http_client
 from six.moves.urllib.parse import parse_qsl
 from six.moves.urllib.parse import quote
 from six.moves.urllib.parse import urlencode
@@ -41,6 +51,7 @@ from six.moves.urllib.parse import urlsplit
 from six.moves.urllib.parse import urlunsplit
 
 from google import resumable_media
+import google.auth.transport.requests
 from google.resumable_media.requests import ChunkedDownload
 from google.resumable_media.requests import Download
 from google.resumable_media.requests import MultipartUpload
@@ -99,6 +110,20 @@ _READ_LESS_THAN_SIZE = (
 
 _DEFAULT_CHUNKSIZE = 104857600  # 1024 * 1024 B * 100 = 100 MB
 _MAX_MULTIPART_SIZE = 8388608  # 8 MB
+_DEFAULT_SLICE_SIZE = 67108864  # 1024 * 1024 B * 64 = 64 MB
+_MAX_TRANSFER_ATTEMPTS = 5
+_MAX_TRANSFER_RETRY_DELAY = 32.0
+_VERIFY_BLOCK_SIZE = 1048576  # 1 MB
+_DEFAULT_COMPONENT_SIZE = 52428800  # 1024 * 1024 B * 50 = 50 MB
+_MAX_COMPOSE_COMPONENTS = 32
+_COMPONENT_NAME_TEMPLATE = u"{}.{}.component-{:d}"
+_RETRYABLE_TRANSFER_STATUS_CODES = (
+    429,  # Too Many Requests
+    http_client.INTERNAL_SERVER_ERROR,
+    http_client.BAD_GATEWAY,
+    http_client.SERVICE_UNAVAILABLE,
+    http_client.GATEWAY_TIMEOUT,
+)
 
 
 class Blob(_PropertyMixin):
@@ -561,12 +586,31 @@ class Blob(_PropertyMixin):
         except resumable_media.InvalidResponse as exc:
             _raise_from_invalid_response(exc)
 
-    def download_to_filename(self, filename, client=None, start=None, end=None):
+    def download_to_filename(
+        self,
+        filename,
+        client=None,
+        start=None,
+        end=None,
+        max_workers=None,
+        slice_size=_DEFAULT_SLICE_SIZE,
+    ):
         """Download the contents of this blob into a named file.
 
         If :attr:`user_project` is set on the bucket, bills the API request
         to that project.
 
+        If ``max_workers`` is passed, the blob is downloaded in slices: the
+        bytes are split into ranges of ``slice_size`` bytes, which are
+        fetched concurrently and written in place into the file. A slice
+        which fails with a transient error is resumed from its last written
+        byte, without fetching the other slices again. Once a whole blob has
+        been downloaded, the file is checked against the blob's MD5 hash,
+        or against its CRC32C checksum when the blob has no MD5 hash (such
+        as composite objects) and the ``crcmod`` library is installed.
+        Blobs stored with ``Content-Encoding: gzip`` are always downloaded
+        in one piece.
+
         :type filename: str
         :param filename: A filename to be passed to ``open``.
 
@@ -581,11 +625,28 @@ class Blob(_PropertyMixin):
         :type end: int
         :param end: Optional, The last byte in a range to be downloaded.
 
+        :type max_workers: int
+        :param max_workers: Optional, the number of slices to download
+                            concurrently.
+
+        :type slice_size: int
+        :param slice_size: Optional, the size of each slice, in bytes, when
+                           ``max_workers`` is passed. Defaults to 64 MB.
+
         :raises: :class:`google.cloud.exceptions.NotFound`
+        :raises: :class:`google.resumable_media.DataCorruption` if the
+                 downloaded file does not match the blob's checksum.
         """
         try:
-            with open(filename, "wb") as file_obj:
-                self.download_to_file(file_obj, client=client, start=start, end=end)
+            if max_workers is not None:
+                self._do_sliced_download(
+                    filename, client, start, end, max_workers, slice_size
+                )
+            else:
+                with open(filename, "wb") as file_obj:
+                    self.download_to_file(
+                        file_obj, client=client, start=start, end=end
+                    )
         except resumable_media.DataCorruption:
             # Delete the corrupt downloaded file.
             os.remove(filename)
@@ -594,7 +655,132 @@ class Blob(_PropertyMixin):
         updated = self.updated
         if updated is not None:
             mtime = time.mktime(updated.timetuple())
-            os.utime(file_obj.name, (mtime, mtime))
+            os.utime(filename, (mtime, mtime))
+
+    def _do_sliced_download(
+        self, filename, client, start, end, max_workers, slice_size
+    ):
+        """Download a blob into a file in concurrent byte ranges.
+
+        See :meth:`download_to_filename` for the arguments.
+
+        :raises: :class:`google.cloud.exceptions.GoogleCloudError` if a
+                 slice could not be downloaded.
+        :raises: :class:`google.resumable_media.DataCorruption` if the
+                 downloaded file does not match the blob's checksum.
+        """
+        if self.size is None:
+            self.reload(client=client)
+
+        first = start or 0
+        last = self.size - 1 if end is None else min(end, self.size - 1)
+        if self.content_encoding == "gzip" or last - first < slice_size:
+            with open(filename, "wb") as file_obj:
+                self.download_to_file(file_obj, client=client, start=start, end=end)
+            return
+
+        client = self._require_client(client)
+        download_url = self._get_download_url()
+        headers = _get_encryption_headers(self._encryption_key)
+        headers["accept-encoding"] = "gzip"
+
+        # Preallocate the file, so that each slice is written in place.
+        with open(filename, "wb") as file_obj:
+            file_obj.truncate(last - first + 1)
+
+        sessions = _ThreadSessions(client._credentials)
+
+        def download_slice(slice_start):
+            slice_end = min(slice_start + slice_size, last + 1) - 1
+            self._download_slice(
+                sessions.get(),
+                filename,
+                slice_start - first,
+                download_url,
+                headers,
+                slice_start,
+                slice_end,
+            )
+
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+        futures = []
+        try:
+            futures = [
+                executor.submit(download_slice, slice_start)
+                for slice_start in range(first, last + 1, slice_size)
+            ]
+            for future in futures:
+                try:
+                    future.result()
+                except resumable_media.InvalidResponse as exc:
+                    _raise_from_invalid_response(exc)
+        finally:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=True)
+            sessions.close()
+
+        if first == 0 and last == self.size - 1:
+            _verify_download(filename, self.md5_hash, self.crc32c)
+
+    def _download_slice(
+        self, transport, filename, offset, download_url, headers, start, end
+    ):
+        """Download one byte range of the blob into a part of a file.
+
+        The range is fetched in chunks of :attr:`chunk_size` bytes, or in a
+        single request if it is not set. When a request fails with a
+        transient error, the download resumes from the last byte written.
+
+        :type transport:
+            :class:`~google.auth.transport.requests.AuthorizedSession`
+        :param transport: The transport (with credentials) that will
+                          make authenticated requests.
+
+        :type filename: str
+        :param filename: The preallocated file to write into.
+
+        :type offset: int
+        :param offset: The position in the file of the first byte of the
+                       range.
+
+        :type download_url: str
+        :param download_url: The URL where the media can be accessed.
+
+        :type headers: dict
+        :param headers: Headers to be sent with the requests.
+
+        :type start: int
+        :param start: The first byte of the range.
+
+        :type end: int
+        :param end: The last byte of the range.
+        """
+        chunk_size = self.chunk_size or end - start + 1
+        with open(filename, "r+b") as file_obj:
+            file_obj.seek(offset)
+            attempt = 0
+            while True:
+                written = file_obj.tell() - offset
+                download = ChunkedDownload(
+                    download_url,
+                    chunk_size,
+                    file_obj,
+                    headers=dict(headers),
+                    start=start + written,
+                    end=end,
+                )
+                try:
+                    while not download.finished:
+                        download.consume_next_chunk(transport)
+                    return
+                except (IOError, resumable_media.InvalidResponse) as exc:
+                    attempt += 1
+                    if not _is_retryable_transfer_error(exc):
+                        raise
+                    if attempt >= _MAX_TRANSFER_ATTEMPTS:
+                        raise
+                time.sleep(min(2.0 ** attempt, _MAX_TRANSFER_RETRY_DELAY))
 
     def download_as_string(self, client=None, start=None, end=None):
         """Download the contents of this blob as a string.
@@ -707,7 +893,14 @@ class Blob(_PropertyMixin):
         return headers, object_metadata, content_type
 
     def _do_multipart_upload(
-        self, client, stream, content_type, size, num_retries, predefined_acl
+        self,
+        client,
+        stream,
+        content_type,
+        size,
+        num_retries,
+        predefined_acl,
+        transport=None,
     ):
         """Perform a multipart upload.
 
@@ -740,6 +933,11 @@ class Blob(_PropertyMixin):
         :type predefined_acl: str
         :param predefined_acl: (Optional) predefined access control list
 
+        :type transport:
+            :class:`~google.auth.transport.requests.AuthorizedSession`
+        :param transport: (Optional) The transport to make the requests
+                          with. Defaults to the client's transport.
+
         :rtype: :class:`~requests.Response`
         :returns: The "200 OK" response object returned after the multipart
                   upload request.
@@ -754,7 +952,8 @@ class Blob(_PropertyMixin):
                 msg = _READ_LESS_THAN_SIZE.format(size, len(data))
                 raise ValueError(msg)
 
-        transport = self._get_transport(client)
+        if transport is None:
+            transport = self._get_transport(client)
         info = self._get_upload_arguments(content_type)
         headers, object_metadata, content_type = info
 
@@ -792,6 +991,7 @@ class Blob(_PropertyMixin):
         predefined_acl=None,
         extra_headers=None,
         chunk_size=None,
+        transport=None,
     ):
         """Initiate a resumable upload.
 
@@ -835,6 +1035,11 @@ class Blob(_PropertyMixin):
             If not passed, will fall back to the chunk size on the
             current blob.
 
+        :type transport:
+            :class:`~google.auth.transport.requests.AuthorizedSession`
+        :param transport: (Optional) The transport to make the requests
+                          with. Defaults to the client's transport.
+
         :rtype: tuple
         :returns:
             Pair of
@@ -848,7 +1053,8 @@ class Blob(_PropertyMixin):
             if chunk_size is None:
                 chunk_size = _DEFAULT_CHUNKSIZE
 
-        transport = self._get_transport(client)
+        if transport is None:
+            transport = self._get_transport(client)
         info = self._get_upload_arguments(content_type)
         headers, object_metadata, content_type = info
         if extra_headers is not None:
@@ -886,7 +1092,14 @@ class Blob(_PropertyMixin):
         return upload, transport
 
     def _do_resumable_upload(
-        self, client, stream, content_type, size, num_retries, predefined_acl
+        self,
+        client,
+        stream,
+        content_type,
+        size,
+        num_retries,
+        predefined_acl,
+        transport=None,
     ):
         """Perform a resumable upload.
 
@@ -921,6 +1134,11 @@ class Blob(_PropertyMixin):
         :type predefined_acl: str
         :param predefined_acl: (Optional) predefined access control list
 
+        :type transport:
+            :class:`~google.auth.transport.requests.AuthorizedSession`
+        :param transport: (Optional) The transport to make the requests
+                          with. Defaults to the client's transport.
+
         :rtype: :class:`~requests.Response`
         :returns: The "200 OK" response object returned after the final chunk
                   is uploaded.
@@ -932,6 +1150,7 @@ class Blob(_PropertyMixin):
             size,
             num_retries,
             predefined_acl=predefined_acl,
+            transport=transport,
         )
 
         while not upload.finished:
@@ -940,7 +1159,14 @@ class Blob(_PropertyMixin):
         return response
 
     def _do_upload(
-        self, client, stream, content_type, size, num_retries, predefined_acl
+        self,
+        client,
+        stream,
+        content_type,
+        size,
+        num_retries,
+        predefined_acl,
+        transport=None,
     ):
         """Determine an upload strategy and then perform the upload.
 
@@ -977,6 +1203,11 @@ class Blob(_PropertyMixin):
         :type predefined_acl: str
         :param predefined_acl: (Optional) predefined access control list
 
+        :type transport:
+            :class:`~google.auth.transport.requests.AuthorizedSession`
+        :param transport: (Optional) The transport to make the requests
+                          with. Defaults to the client's transport.
+
         :rtype: dict
         :returns: The parsed JSON from the "200 OK" response. This will be the
                   **only** response in the multipart case and it will be the
@@ -984,11 +1215,23 @@ class Blob(_PropertyMixin):
         """
         if size is not None and size <= _MAX_MULTIPART_SIZE:
             response = self._do_multipart_upload(
-                client, stream, content_type, size, num_retries, predefined_acl
+                client,
+                stream,
+                content_type,
+                size,
+                num_retries,
+                predefined_acl,
+                transport=transport,
             )
         else:
             response = self._do_resumable_upload(
-                client, stream, content_type, size, num_retries, predefined_acl
+                client,
+                stream,
+                content_type,
+                size,
+                num_retries,
+                predefined_acl,
+                transport=transport,
             )
 
         return response.json()
@@ -1085,7 +1328,13 @@ class Blob(_PropertyMixin):
             _raise_from_invalid_response(exc)
 
     def upload_from_filename(
-        self, filename, content_type=None, client=None, predefined_acl=None
+        self,
+        filename,
+        content_type=None,
+        client=None,
+        predefined_acl=None,
+        max_workers=None,
+        component_size=_DEFAULT_COMPONENT_SIZE,
     ):
         """Upload this blob's contents from the content of a named file.
 
@@ -1111,6 +1360,19 @@ class Blob(_PropertyMixin):
         If :attr:`user_project` is set on the bucket, bills the API request
         to that project.
 
+        If ``max_workers`` is passed and the file is larger than
+        ``component_size``, the file is uploaded as a parallel composite
+        upload: its byte ranges are uploaded concurrently as temporary
+        component blobs, which are then composed into this blob and
+        deleted. A component which fails with a transient error is
+        uploaded again, without uploading the other components again. At
+        most 32 components are used, so ``component_size`` is raised for
+        very large files. Blobs with a `customer-supplied`_ encryption key
+        are always uploaded in one piece.
+
+        .. note::
+           Composite objects have no MD5 hash, only a CRC32C checksum.
+
         :type filename: str
         :param filename: The path to the file.
 
@@ -1123,9 +1385,35 @@ class Blob(_PropertyMixin):
 
         :type predefined_acl: str
         :param predefined_acl: (Optional) predefined access control list
+
+        :type max_workers: int
+        :param max_workers: (Optional) The number of components to upload
+                            concurrently.
+
+        :type component_size: int
+        :param component_size: (Optional) The size of each component, in
+                               bytes, when ``max_workers`` is passed.
+                               Defaults to 50 MB.
+
+        :raises: :class:`~google.cloud.exceptions.GoogleCloudError`
+                 if the upload response returns an error status.
         """
         content_type = self._get_content_type(content_type, filename=filename)
 
+        if max_workers is not None and self._encryption_key is None:
+            total_bytes = os.path.getsize(filename)
+            if total_bytes > component_size:
+                self._do_composite_upload(
+                    client,
+                    filename,
+                    total_bytes,
+                    content_type,
+                    predefined_acl,
+                    max_workers,
+                    component_size,
+                )
+                return
+
         with open(filename, "rb") as file_obj:
             total_bytes = os.fstat(file_obj.fileno()).st_size
             self.upload_from_file(
@@ -1136,6 +1424,150 @@ class Blob(_PropertyMixin):
                 predefined_acl=predefined_acl,
             )
 
+    def _do_composite_upload(
+        self,
+        client,
+        filename,
+        total_bytes,
+        content_type,
+        predefined_acl,
+        max_workers,
+        component_size,
+    ):
+        """Upload a file as concurrent components, then compose them.
+
+        See :meth:`upload_from_filename` for the arguments.
+
+        :raises: :class:`~google.cloud.exceptions.GoogleCloudError`
+                 if a component could not be uploaded or composed.
+        """
+        predefined_acl = ACL.validate_predefined(predefined_acl)
+        client = self._require_client(client)
+
+        # A compose request accepts a limited number of source objects.
+        min_component_size = -(-total_bytes // _MAX_COMPOSE_COMPONENTS)
+        component_size = max(component_size, min_component_size)
+        token = uuid.uuid4().hex
+        components = [
+            Blob(
+                _COMPONENT_NAME_TEMPLATE.format(self.name, token, index),
+                bucket=self.bucket,
+                chunk_size=self.chunk_size,
+                kms_key_name=self.kms_key_name,
+            )
+            for index in range(-(-total_bytes // component_size))
+        ]
+
+        sessions = _ThreadSessions(client._credentials)
+
+        def upload_component(component, offset, size):
+            component._upload_component(
+                client, filename, offset, size, content_type, sessions.get()
+            )
+
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+        futures = []
+        composed = False
+        try:
+            for index, component in enumerate(components):
+                offset = index * component_size
+                size = min(component_size, total_bytes - offset)
+                futures.append(
+                    executor.submit(upload_component, component, offset, size)
+                )
+            for future in futures:
+                try:
+                    future.result()
+                except resumable_media.InvalidResponse as exc:
+                    _raise_from_invalid_response(exc)
+
+            query_params = {}
+            if self.user_project is not None:
+                query_params["userProject"] = self.user_project
+            if predefined_acl is not None:
+                query_params["destinationPredefinedAcl"] = predefined_acl
+
+            destination = self._get_writable_metadata()
+            destination["contentType"] = content_type
+            request = {
+                "sourceObjects": [{"name": component.name} for component in components],
+                "destination": destination,
+            }
+            api_response = client._connection.api_request(
+                method="POST",
+                path=self.path + "/compose",
+                query_params=query_params,
+                data=request,
+                _target_object=self,
+            )
+            self._set_properties(api_response)
+            composed = True
+        finally:
+            for future in futures:
+                future.cancel()
+            executor.shutdown(wait=True)
+            sessions.close()
+            try:
+                # Components which were never created are ignored.
+                self.bucket.delete_blobs(
+                    components, on_error=lambda component: None, client=client
+                )
+            except Exception:
+                # Do not hide the error which made the upload fail.
+                if composed:
+                    raise
+
+    def _upload_component(
+        self, client, filename, offset, size, content_type, transport
+    ):
+        """Upload a byte range of a file as this (component) blob.
+
+        When the upload fails with a transient error, the whole component
+        is uploaded again.
+
+        :type client: :class:`~google.cloud.storage.client.Client`
+        :param client: The client to use.
+
+        :type filename: str
+        :param filename: The path to the file.
+
+        :type offset: int
+        :param offset: The position in the file of the first byte of the
+                       component.
+
+        :type size: int
+        :param size: The number of bytes in the component.
+
+        :type content_type: str
+        :param content_type: Type of content being uploaded.
+
+        :type transport:
+            :class:`~google.auth.transport.requests.AuthorizedSession`
+        :param transport: The transport (with credentials) that will
+                          make authenticated requests.
+        """
+        attempt = 0
+        while True:
+            with _FileSlice(filename, offset, size) as stream:
+                try:
+                    self._do_upload(
+                        client,
+                        stream,
+                        content_type,
+                        size,
+                        None,
+                        None,
+                        transport=transport,
+                    )
+                    return
+                except (IOError, resumable_media.InvalidResponse) as exc:
+                    attempt += 1
+                    if not _is_retryable_transfer_error(exc):
+                        raise
+                    if attempt >= _MAX_TRANSFER_ATTEMPTS:
+                        raise
+            time.sleep(min(2.0 ** attempt, _MAX_TRANSFER_RETRY_DELAY))
+
     def upload_from_string(
         self, data, content_type="text/plain", client=None, predefined_acl=None
     ):
@@ -1915,6 +2347,161 @@ def _get_encryption_headers(key, source=False):
     }
 
 
+def _is_retryable_transfer_error(exc):
+    """Check whether a failed slice or component transfer may be retried.
+
+    :type exc: Exception
+    :param exc: The error raised while transferring the slice or component.
+
+    :rtype: bool
+    :returns: True for connection errors and transient HTTP errors. Other
+              errors, such as a full disk, are not retried.
+    """
+    if isinstance(exc, resumable_media.InvalidResponse):
+        return exc.response.status_code in _RETRYABLE_TRANSFER_STATUS_CODES
+    return isinstance(exc, requests.exceptions.ConnectionError)
+
+
+def _verify_download(filename, md5_hash, crc32c):
+    """Check a downloaded file against the checksums of its blob.
+
+    The MD5 hash is used if the blob has one. Otherwise, the CRC32C
+    checksum is used if the ``crcmod`` library is installed.
+
+    :type filename: str
+    :param filename: The downloaded file.
+
+    :type md5_hash: str
+    :param md5_hash: The base64-encoded MD5 hash of the blob, if any.
+
+    :type crc32c: str
+    :param crc32c: The base64-encoded CRC32C checksum of the blob, if any.
+
+    :raises: :class:`google.resumable_media.DataCorruption` if the file
+             does not match the checksum.
+    """
+    if md5_hash is not None:
+        name = "md5"
+        expected = md5_hash
+        checksum = hashlib.md5()
+    elif crc32c is not None and crcmod is not None:
+        name = "crc32c"
+        expected = crc32c
+        checksum = crcmod.predefined.Crc("crc-32c")
+    else:
+        return
+
+    with open(filename, "rb") as file_obj:
+        for block in iter(lambda: file_obj.read(_VERIFY_BLOCK_SIZE), b""):
+            checksum.update(block)
+
+    if name == "md5":
+        digest = checksum.digest()
+    else:
+        digest = struct.pack(">I", checksum.crcValue)
+    actual = _bytes_to_unicode(base64.b64encode(digest))
+    if actual != expected:
+        raise resumable_media.DataCorruption(
+            None,
+            u"Checksum mismatch while downloading {}: expected {} {}, got "
+            u"{}.".format(filename, name, expected, actual),
+        )
+
+
+class _ThreadSessions(object):
+    """Authorized sessions for concurrent transfers, one per thread.
+
+    Sessions are not thread-safe, so each worker thread of a sliced
+    download or composite upload makes its requests with its own.
+
+    :type credentials: :class:`~google.auth.credentials.Credentials`
+    :param credentials: The credentials of the sessions.
+    """
+
+    def __init__(self, credentials):
+        self._credentials = credentials
+        self._local = threading.local()
+        self._sessions = []
+        self._lock = threading.Lock()
+
+    def get(self):
+        """Get the session of the current thread, creating it if needed.
+
+        :rtype: :class:`~google.auth.transport.requests.AuthorizedSession`
+        :returns: The session of the current thread.
+        """
+        session = getattr(self._local, "session", None)
+        if session is None:
+            session = google.auth.transport.requests.AuthorizedSession(
+                self._credentials
+            )
+            self._local.session = session
+            with self._lock:
+                self._sessions.append(session)
+        return session
+
+    def close(self):
+        """Close all the sessions created so far."""
+        with self._lock:
+            sessions, self._sessions = self._sessions, []
+        for session in sessions:
+            session.close()
+
+
+class _FileSlice(object):
+    """A read-only view of a byte range of a file.
+
+    Positions are relative to the start of the range, so that the range can
+    be uploaded as though it were a whole file.
+
+    :type filename: str
+    :param filename: The path to the file.
+
+    :type offset: int
+    :param offset: The position in the file of the first byte of the range.
+
+    :type size: int
+    :param size: The number of bytes in the range.
+    """
+
+    def __init__(self, filename, offset, size):
+        self._file_obj = open(filename, "rb")
+        self._offset = offset
+        self._size = size
+        self._file_obj.seek(offset)
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_val, exc_tb):
+        self.close()
+
+    def close(self):
+        """Close the underlying file."""
+        self._file_obj.close()
+
+    def tell(self):
+        """Get the current position, relative to the start of the range."""
+        return self._file_obj.tell() - self._offset
+
+    def seek(self, pos, whence=os.SEEK_SET):
+        """Move to a position, relative to the start of the range."""
+        if whence == os.SEEK_CUR:
+            pos += self.tell()
+        elif whence == os.SEEK_END:
+            pos += self._size
+        pos = min(max(pos, 0), self._size)
+        self._file_obj.seek(self._offset + pos)
+        return pos
+
+    def read(self, size=-1):
+        """Read at most ``size`` bytes, without going past the range."""
+        remaining = self._size - self.tell()
+        if size is None or size < 0 or size > remaining:
+            size = remaining
+        return self._file_obj.read(size)
+
+
 def _quote(value):
     """URL-quote a string.
 
@@ -15,18 +15,24 @@
 """Create / interact with Google Cloud Storage buckets."""
 
 import base64
+import collections
+import concurrent.futures
 import copy
 import datetime
+import itertools
 import json
+import threading
 import warnings
 
 import six
+from six.moves import queue
 
 from google.api_core import page_iterator
 from google.api_core import datetime_helpers
 from google.cloud._helpers import _datetime_to_rfc3339
 from google.cloud._helpers import _NOW
 from google.cloud._helpers import _rfc3339_to_datetime
+from google.cloud import exceptions
 from google.cloud.exceptions import NotFound
 from google.api_core.iam import Policy
 from google.cloud.storage import _signing
@@ -35,6 +41,7 @@ from google.cloud.storage._helpers import _scalar_property
 from google.cloud.storage._helpers import _validate_name
 from google.cloud.storage.acl import BucketACL
 from google.cloud.storage.acl import DefaultObjectACL
+from google.cloud.storage.batch import _MAX_SUB_BATCH_SIZE
 from google.cloud.storage.blob import Blob
 from google.cloud.storage.blob import _get_encryption_headers
 from google.cloud.storage.notification import BucketNotification
@@ -48,6 +55,45 @@ _LOCATION_SETTER_MESSAGE = (
 )
 
 
+_SHARD_SPLIT_CHARACTERS = (
+    "0123456789ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz"
+)
+"""Characters after the prefix at which to split the keyspace by default."""
+
+_SHARD_QUEUE_PAGES = 2
+"""Pages of blobs which each worker may list ahead of the consumer."""
+
+_SHARD_DONE = object()
+"""Marks the end of the pages of a shard."""
+
+_SHARD_LOOKAHEAD = 1000
+"""Top-level blobs and folders discovered ahead of an ordered consumer."""
+
+
+def _range_segments(prefix, split_points):
+    """Split the keyspace under a prefix into ranges of names.
+
+    :type prefix: str
+    :param prefix: The prefix to split the keyspace under, or :data:`None`.
+
+    :type split_points: list of str
+    :param split_points: Blob names at which to split the keyspace, or
+                         :data:`None` to split at ``prefix`` followed by
+                         each of :data:`_SHARD_SPLIT_CHARACTERS`.
+
+    :rtype: list of dict
+    :returns: The arguments to :meth:`Bucket.list_blobs` listing each range,
+              in lexicographic order.
+    """
+    if split_points is None:
+        split_points = [(prefix or "") + char for char in _SHARD_SPLIT_CHARACTERS]
+    bounds = [None] + sorted(split_points) + [None]
+    return [
+        {"prefix": prefix, "start_offset": start, "end_offset": end}
+        for start, end in zip(bounds[:-1], bounds[1:])
+    ]
+
+
 def _blobs_page_start(iterator, page, response):
     """Grab prefixes after a :class:`~google.cloud.iterator.Page` started.
 
@@ -617,6 +663,8 @@ class Bucket(_PropertyMixin):
         projection="noAcl",
         fields=None,
         client=None,
+        start_offset=None,
+        end_offset=None,
     ):
         """Return an iterator used to find blobs in the bucket.
 
@@ -657,6 +705,15 @@ class Bucket(_PropertyMixin):
         :param client: (Optional) The client to use.  If not passed, falls back
                        to the ``client`` stored on the current bucket.
 
+        :type start_offset: str
+        :param start_offset: (Optional) Only return blobs whose names are
+                             lexicographically equal to or after
+                             ``start_offset``.
+
+        :type end_offset: str
+        :param end_offset: (Optional) Only return blobs whose names are
+                           lexicographically before ``end_offset``.
+
         :rtype: :class:`~google.api_core.page_iterator.Iterator`
         :returns: Iterator of all :class:`~google.cloud.storage.blob.Blob`
                   in this bucket matching the arguments.
@@ -669,6 +726,12 @@ class Bucket(_PropertyMixin):
         if delimiter is not None:
             extra_params["delimiter"] = delimiter
 
+        if start_offset is not None:
+            extra_params["startOffset"] = start_offset
+
+        if end_offset is not None:
+            extra_params["endOffset"] = end_offset
+
         if versions is not None:
             extra_params["versions"] = versions
 
@@ -694,6 +757,293 @@ class Bucket(_PropertyMixin):
         iterator.prefixes = set()
         return iterator
 
+    def list_blobs_parallel(
+        self,
+        prefix=None,
+        delimiter="/",
+        split_points=None,
+        max_workers=8,
+        ordered=False,
+        versions=None,
+        projection="noAcl",
+        fields=None,
+        client=None,
+    ):
+        """Return an iterator of the blobs in the bucket, listed in shards.
+
+        The keyspace under ``prefix`` is split into shards, whose pages of
+        blobs are listed concurrently and merged into a single iterator:
+
+        * If ``split_points`` is passed, each shard is the range of names
+          between two consecutive split points.
+        * Otherwise, if ``delimiter`` is passed, the top-level "folders"
+          under ``prefix`` are found by listing with ``delimiter``, and each
+          of them is a shard. The top-level blobs are returned as they are
+          listed. If the first page of this listing holds more blobs than
+          folders, the namespace is mostly flat, and the keyspace is split
+          as if ``delimiter`` were not passed instead.
+        * Otherwise, the keyspace is split at ``prefix`` followed by each
+          digit and ASCII letter.
+
+        If the names of the blobs are skewed towards a few folders or
+        characters, pass ``split_points`` which divide them evenly.
+
+        If :attr:`user_project` is set, bills the API requests to that
+        project.
+
+        :type prefix: str
+        :param prefix: (Optional) prefix used to filter blobs.
+
+        :type delimiter: str
+        :param delimiter: (Optional) Delimiter of the top-level "folders"
+                          used as shards. Defaults to ``'/'``.
+
+        :type split_points: list of str
+        :param split_points: (Optional) Blob names at which to split the
+                             keyspace.
+
+        :type max_workers: int
+        :param max_workers: (Optional) The number of shards to list
+                            concurrently. Defaults to 8.
+
+        :type ordered: bool
+        :param ordered: (Optional) If True, blobs are returned in
+                        lexicographic order of their names, as
+                        :meth:`list_blobs` returns them. Otherwise, they are
+                        returned as soon as their pages are listed.
+
+        :type versions: bool
+        :param versions: (Optional) Whether object versions should be returned
+                         as separate blobs.
+
+        :type projection: str
+        :param projection: (Optional) If used, must be 'full' or 'noAcl'.
+                           Defaults to ``'noAcl'``. Specifies the set of
+                           properties to return.
+
+        :type fields: str
+        :param fields: (Optional) Selector specifying which fields to include
+                       in a partial response, as for :meth:`list_blobs`. It
+                       must include ``nextPageToken``.
+
+        :type client: :class:`~google.cloud.storage.client.Client`
+        :param client: (Optional) The client to use.  If not passed, falls back
+                       to the ``client`` stored on the current bucket.
+
+        :rtype: iterator
+        :returns: Iterator of all :class:`~google.cloud.storage.blob.Blob`
+                  in this bucket matching the arguments.
+        """
+        client = self._require_client(client)
+        list_kwargs = {
+            "versions": versions,
+            "projection": projection,
+            "fields": fields,
+            "client": client,
+        }
+
+        # Each segment is either a blob, or the arguments listing a shard.
+        if split_points is None and delimiter is not None:
+            segments = self._top_level_segments(prefix, delimiter, list_kwargs)
+        else:
+            segments = _range_segments(prefix, split_points)
+
+        return self._iter_shards(segments, max_workers, ordered, list_kwargs)
+
+    def _top_level_segments(self, prefix, delimiter, list_kwargs):
+        """List the top-level blobs and "folders" under a prefix.
+
+        If the first page of the listing holds more blobs than "folders",
+        the listing is abandoned, and the keyspace is split into ranges
+        instead, as by :func:`_range_segments`.
+
+        :type prefix: str
+        :param prefix: The prefix to list under, or :data:`None`.
+
+        :type delimiter: str
+        :param delimiter: Delimiter of the "folders".
+
+        :type list_kwargs: dict
+        :param list_kwargs: Other arguments to :meth:`list_blobs`.
+
+        :rtype: iterator
+        :returns: The top-level blobs, and the arguments listing the blobs
+                  in each "folder", in lexicographic order, as they are
+                  listed.
+        """
+        list_kwargs = dict(list_kwargs)
+        fields = list_kwargs["fields"]
+        if fields is not None and "prefixes" not in fields:
+            list_kwargs["fields"] = fields + ",prefixes"
+
+        iterator = self.list_blobs(prefix=prefix, delimiter=delimiter, **list_kwargs)
+        pages = iterator.pages
+        page = next(pages, None)
+        if page is None:
+            return iter(())
+        blobs = list(page)
+        if iterator.next_page_token is not None and len(blobs) > len(page.prefixes):
+            return iter(_range_segments(prefix, None))
+
+        listed = itertools.chain(
+            [(blobs, page.prefixes)], ((list(page), page.prefixes) for page in pages)
+        )
+        return self._merge_top_level(listed)
+
+    @staticmethod
+    def _merge_top_level(listed):
+        """Merge the blobs and "folders" of each page of a listing.
+
+        :type listed: iterator
+        :param listed: The blobs and the "folders" of each page of a
+                       listing with a delimiter.
+
+        :rtype: iterator
+        :returns: The blobs, and the arguments listing the blobs in each
+                  "folder", in lexicographic order.
+        """
+        seen = set()
+        for blobs, prefixes in listed:
+            segments = [(blob.name, blob) for blob in blobs]
+            segments.extend(
+                (folder, {"prefix": folder})
+                for folder in prefixes
+                if folder not in seen
+            )
+            seen.update(prefixes)
+            # Every blob in a folder sorts next to the folder's prefix, and
+            # pages follow each other in lexicographic order.
+            segments.sort(key=lambda segment: segment[0])
+            for _, segment in segments:
+                yield segment
+
+    def _iter_shards(self, segments, max_workers, ordered, list_kwargs):
+        """Iterate over blobs, listing the shards among them concurrently.
+
+        The pages of each shard are listed by a worker thread, at most
+        :data:`_SHARD_QUEUE_PAGES` pages ahead of the consumer. Shards are
+        started in order as ``segments`` are consumed, so that, when
+        ``ordered`` is True, the shard being consumed has always been
+        started.
+
+        :type segments: iterable
+        :param segments: Blobs, and the arguments to :meth:`list_blobs`
+                         listing each shard.
+
+        :type max_workers: int
+        :param max_workers: The number of shards to list concurrently.
+
+        :type ordered: bool
+        :param ordered: Whether to yield blobs in the order of ``segments``.
+
+        :type list_kwargs: dict
+        :param list_kwargs: Other arguments to :meth:`list_blobs`.
+
+        :rtype: iterator
+        :returns: Iterator of :class:`~google.cloud.storage.blob.Blob`.
+        """
+        stopped = threading.Event()
+
+        def put(pages, item):
+            # Give up once the consumer has stopped consuming.
+            while not stopped.is_set():
+                try:
+                    pages.put(item, timeout=0.1)
+                    return
+                except queue.Full:
+                    pass
+
+        def list_shard(index, shard_kwargs, pages):
+            try:
+                kwargs = dict(list_kwargs, **shard_kwargs)
+                for page in self.list_blobs(**kwargs).pages:
+                    if stopped.is_set():
+                        return
+                    put(pages, (index, list(page)))
+            finally:
+                put(pages, (index, _SHARD_DONE))
+
+        def consume_shard(pages):
+            while True:
+                index, page = pages.get()
+                if page is _SHARD_DONE:
+                    # Raise any error listing the shard.
+                    futures[index].result()
+                    return
+                for blob in page:
+                    yield blob
+
+        finished = set()
+
+        def consume_shared(pages, block=True):
+            # Unless ``block``, stop as soon as no page is ready.
+            while len(finished) < len(futures):
+                try:
+                    index, page = pages.get(block=block)
+                except queue.Empty:
+                    return
+                if page is _SHARD_DONE:
+                    futures[index].result()
+                    finished.add(index)
+                else:
+                    for blob in page:
+                        yield blob
+
+        executor = concurrent.futures.ThreadPoolExecutor(max_workers=max_workers)
+        futures = {}
+        try:
+            if ordered:
+                pending = collections.deque()
+                ahead = 0
+                for index, segment in enumerate(segments):
+                    if isinstance(segment, dict):
+                        pages = queue.Queue(maxsize=_SHARD_QUEUE_PAGES)
+                        futures[index] = executor.submit(
+                            list_shard, index, segment, pages
+                        )
+                        segment = pages
+                        ahead += 1
+                    pending.append(segment)
+                    # Keep at most ``max_workers`` shards, and a bounded
+                    # number of segments, ahead of the consumer.
+                    while pending and (
+                        not isinstance(pending[0], queue.Queue)
+                        or ahead > max_workers
+                        or len(pending) > _SHARD_LOOKAHEAD
+                    ):
+                        segment = pending.popleft()
+                        if isinstance(segment, queue.Queue):
+                            ahead -= 1
+                            for blob in consume_shard(segment):
+                                yield blob
+                        else:
+                            yield segment
+                for segment in pending:
+                    if isinstance(segment, queue.Queue):
+                        for blob in consume_shard(segment):
+                            yield blob
+                    else:
+                        yield segment
+            else:
+                shared = queue.Queue(maxsize=max_workers * _SHARD_QUEUE_PAGES)
+                for index, segment in enumerate(segments):
+                    if isinstance(segment, dict):
+                        futures[index] = executor.submit(
+                            list_shard, index, segment, shared
+                        )
+                    else:
+                        # Listed blobs do not wait for the shards.
+                        yield segment
+                    for blob in consume_shared(shared, block=False):
+                        yield blob
+                for blob in consume_shared(shared):
+                    yield blob
+        finally:
+            stopped.set()
+            for future in futures.values():
+                future.cancel()
+            executor.shutdown(wait=True)
+
     def list_notifications(self, client=None):
         """List Pub / Sub notifications for this bucket.
 
@@ -833,11 +1183,19 @@ class Bucket(_PropertyMixin):
             _target_object=None,
         )
 
-    def delete_blobs(self, blobs, on_error=None, client=None):
+    def delete_blobs(
+        self, blobs, on_error=None, client=None, max_workers=None, on_progress=None
+    ):
         """Deletes a list of blobs from the current bucket.
 
         Uses :meth:`delete_blob` to delete each individual blob.
 
+        If ``max_workers`` is passed, the deletes are instead sent in
+        batches of 100 requests, ``max_workers`` batches at a time, and
+        ``blobs`` may be any iterable, such as the iterator returned by
+        :meth:`list_blobs`. It is consumed lazily, so emptying a large
+        bucket does not hold all of its blobs in memory.
+
         If :attr:`user_project` is set, bills the API request to that project.
 
         :type blobs: list
@@ -854,9 +1212,40 @@ class Bucket(_PropertyMixin):
         :param client: (Optional) The client to use.  If not passed, falls back
                        to the ``client`` stored on the current bucket.
 
+        :type max_workers: int
+        :param max_workers: (Optional) The number of batches of deletes to
+                            send concurrently.
+
+        :type on_progress: callable
+        :param on_progress: (Optional) Only used if ``max_workers`` is
+                            passed. Takes two arguments: ``blob`` and
+                            ``error``. Called once for each blob, when its
+                            delete completes, with the
+                            :class:`~google.cloud.exceptions.GoogleCloudError`
+                            which it failed with, or :data:`None`. Errors
+                            reported to ``on_progress`` are not propagated.
+
         :raises: :class:`~google.cloud.exceptions.NotFound` (if
                  `on_error` is not passed).
         """
+        if max_workers is not None:
+
+            def delete(blob, client):
+                blob_name = blob
+                if not isinstance(blob_name, six.string_types):
+                    blob_name = blob.name
+                self.delete_blob(blob_name, client=client)
+
+            self._bulk_apply(
+                blobs,
+                delete,
+                client=client,
+                max_workers=max_workers,
+                on_error=on_error,
+                on_progress=on_progress,
+            )
+            return
+
         for blob in blobs:
             try:
                 blob_name = blob
@@ -869,6 +1258,141 @@ class Bucket(_PropertyMixin):
                 else:
                     raise
 
+    def _bulk_apply(
+        self, blobs, make_request, client, max_workers, on_error=None, on_progress=None
+    ):
+        """Make one request per blob, in concurrent batches.
+
+        Blobs are taken from ``blobs`` in chunks of 100 blobs per worker.
+        The requests for a chunk are deferred in a
+        :class:`~google.cloud.storage.batch.Batch`, which sends them in
+        concurrent sub-batches of 100 requests, before the next chunk is
+        taken.
+
+        :type blobs: iterable
+        :param blobs: The blobs (or blob names) to make requests for.
+
+        :type make_request: callable
+        :param make_request: Takes two arguments: ``blob`` and ``client``.
+                             Makes the request for the blob, through
+                             ``client._connection``.
+
+        :type client: :class:`~google.cloud.storage.client.Client` or
+                      ``NoneType``
+        :param client: The client to use.  If not passed, falls back
+                       to the ``client`` stored on the current bucket.
+
+        :type max_workers: int
+        :param max_workers: The number of sub-batches to send concurrently.
+
+        :type on_error: callable
+        :param on_error: (Optional) Takes single argument: ``blob``. Called
+                         once for each blob whose request failed with
+                         :class:`~google.cloud.exceptions.NotFound`.
+
+        :type on_progress: callable
+        :param on_progress: (Optional) Takes two arguments: ``blob`` and
+                            ``error``. Called once for each blob, when its
+                            request completes, with the error which it
+                            failed with, or :data:`None`.
+
+        :raises: :class:`~google.cloud.exceptions.GoogleCloudError` for the
+                 first failed request which was reported neither to
+                 ``on_error`` nor to ``on_progress``, once the requests of
+                 its chunk have completed.
+        """
+        client = self._require_client(client)
+        blobs = iter(blobs)
+        chunk_size = max_workers * _MAX_SUB_BATCH_SIZE
+        while True:
+            chunk = list(itertools.islice(blobs, chunk_size))
+            if not chunk:
+                return
+
+            batch = client.batch(max_workers=max_workers)
+            # Only push the batch while deferring the requests, so that
+            # listing ``blobs`` and the callbacks are not batched.
+            client._push_batch(batch)
+            try:
+                for blob in chunk:
+                    make_request(blob, client)
+            finally:
+                client._pop_batch()
+
+            first_error = None
+            for index, response in batch.as_completed():
+                blob = chunk[index]
+                error = None
+                if not 200 <= response.status_code < 300:
+                    error = exceptions.from_http_response(response)
+
+                if isinstance(error, NotFound) and on_error is not None:
+                    on_error(blob)
+                elif error is not None and on_progress is None:
+                    first_error = first_error or error
+
+                if on_progress is not None:
+                    on_progress(blob, error)
+
+            if first_error is not None:
+                raise first_error
+
+    def _bulk_update_acls(self, grant, client, max_workers, on_progress):
+        """Grant or revoke anonymous read access to every blob in the bucket.
+
+        The ACL of each blob is patched from its listed ACL, in concurrent
+        batches (see :meth:`_bulk_apply`).
+
+        :type grant: bool
+        :param grant: If True, grant read access; otherwise, revoke it.
+
+        :type client: :class:`~google.cloud.storage.client.Client` or
+                      ``NoneType``
+        :param client: The client to use.  If not passed, falls back
+                       to the ``client`` stored on the current bucket.
+
+        :type max_workers: int
+        :param max_workers: The number of batches to send concurrently.
+
+        :type on_progress: callable
+        :param on_progress: (Optional) Takes two arguments: ``blob`` and
+                            ``error``. Called once for each blob, when its
+                            ACL has been patched.
+        """
+        query_params = {"projection": "full"}
+        if self.user_project is not None:
+            query_params["userProject"] = self.user_project
+
+        def patch_acl(blob, client):
+            acl = blob.acl
+            # The listed ACL is used as is, rather than reloaded.
+            acl.reset()
+            acl.loaded = True
+            for entry in blob._properties.get("acl", ()):
+                acl.add_entity(acl.entity_from_dict(entry))
+            if grant:
+                acl.all().grant_read()
+            else:
+                acl.all().revoke_read()
+            client._connection.api_request(
+                method="PATCH",
+                path=blob.path,
+                data={"acl": list(acl)},
+                query_params=query_params,
+                _target_object=None,
+            )
+
+        blobs = self.list_blobs(
+            projection="full", fields="items(name,acl),nextPageToken", client=client
+        )
+        self._bulk_apply(
+            blobs,
+            patch_acl,
+            client=client,
+            max_workers=max_workers,
+            on_progress=on_progress,
+        )
+
     def copy_blob(
         self,
         blob,
@@ -1650,7 +2174,14 @@ class Bucket(_PropertyMixin):
         )
         return resp.get("permissions", [])
 
-    def make_public(self, recursive=False, future=False, client=None):
+    def make_public(
+        self,
+        recursive=False,
+        future=False,
+        client=None,
+        max_workers=None,
+        on_progress=None,
+    ):
         """Update bucket's ACL, granting read access to anonymous users.
 
         :type recursive: bool
@@ -1666,13 +2197,27 @@ class Bucket(_PropertyMixin):
         :param client: Optional. The client to use.  If not passed, falls back
                        to the ``client`` stored on the current bucket.
 
+        :type max_workers: int
+        :param max_workers: (Optional) If passed with ``recursive``, the ACLs
+                            of the blobs are patched in this many concurrent
+                            batches, as their listing is paged in, and the
+                            bucket may contain any number of blobs.
+
+        :type on_progress: callable
+        :param on_progress: (Optional) Only used if ``max_workers`` is
+                            passed. Takes two arguments: ``blob`` and
+                            ``error``. Called once for each blob, when its
+                            ACL has been patched, with the
+                            :class:`~google.cloud.exceptions.GoogleCloudError`
+                            which the patch failed with, or :data:`None`.
+                            Errors reported to ``on_progress`` are not
+                            propagated.
+
         :raises ValueError:
-            If ``recursive`` is True, and the bucket contains more than 256
-            blobs.  This is to prevent extremely long runtime of this
-            method.  For such buckets, iterate over the blobs returned by
-            :meth:`list_blobs` and call
-            :meth:`~google.cloud.storage.blob.Blob.make_public`
-            for each blob.
+            If ``recursive`` is True, ``max_workers`` is not passed, and the
+            bucket contains more than 256 blobs.  This is to prevent
+            extremely long runtime of this method.  For such buckets, pass
+            ``max_workers``.
         """
         self.acl.all().grant_read()
         self.acl.save(client=client)
@@ -1684,7 +2229,9 @@ class Bucket(_PropertyMixin):
             doa.all().grant_read()
             doa.save(client=client)
 
-        if recursive:
+        if recursive and max_workers is not None:
+            self._bulk_update_acls(True, client, max_workers, on_progress)
+        elif recursive:
             blobs = list(
                 self.list_blobs(
                     projection="full",
@@ -1706,7 +2253,14 @@ class Bucket(_PropertyMixin):
                 blob.acl.all().grant_read()
                 blob.acl.save(client=client)
 
-    def make_private(self, recursive=False, future=False, client=None):
+    def make_private(
+        self,
+        recursive=False,
+        future=False,
+        client=None,
+        max_workers=None,
+        on_progress=None,
+    ):
         """Update bucket's ACL, revoking read access for anonymous users.
 
         :type recursive: bool
@@ -1722,13 +2276,27 @@ class Bucket(_PropertyMixin):
         :param client: Optional. The client to use.  If not passed, falls back
                        to the ``client`` stored on the current bucket.
 
+        :type max_workers: int
+        :param max_workers: (Optional) If passed with ``recursive``, the ACLs
+                            of the blobs are patched in this many concurrent
+                            batches, as their listing is paged in, and the
+                            bucket may contain any number of blobs.
+
+        :type on_progress: callable
+        :param on_progress: (Optional) Only used if ``max_workers`` is
+                            passed. Takes two arguments: ``blob`` and
+                            ``error``. Called once for each blob, when its
+                            ACL has been patched, with the
+                            :class:`~google.cloud.exceptions.GoogleCloudError`
+                            which the patch failed with, or :data:`None`.
+                            Errors reported to ``on_progress`` are not
+                            propagated.
+
         :raises ValueError:
-            If ``recursive`` is True, and the bucket contains more than 256
-            blobs.  This is to prevent extremely long runtime of this
-            method.  For such buckets, iterate over the blobs returned by
-            :meth:`list_blobs` and call
-            :meth:`~google.cloud.storage.blob.Blob.make_private`
-            for each blob.
+            If ``recursive`` is True, ``max_workers`` is not passed, and the
+            bucket contains more than 256 blobs.  This is to prevent
+            extremely long runtime of this method.  For such buckets, pass
+            ``max_workers``.
         """
         self.acl.all().revoke_read()
         self.acl.save(client=client)
@@ -1740,7 +2308,9 @@ class Bucket(_PropertyMixin):
             doa.all().revoke_read()
             doa.save(client=client)
 
-        if recursive:
+        if recursive and max_workers is not None:
+            self._bulk_update_acls(False, client, max_workers, on_progress)
+        elif recursive:
             blobs = list(
                 self.list_blobs(
                     projection="full",
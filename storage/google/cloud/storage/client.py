@@ -190,17 +190,22 @@ class Client(ClientWithProject):
         """
         return Bucket(client=self, name=bucket_name, user_project=user_project)
 
-    def batch(self):
+    def batch(self, max_workers=None):
         """Factory constructor for batch object.
 
         .. note::
           This will not make an HTTP request; it simply instantiates
           a batch object owned by this client.
 
+        :type max_workers: int
+        :param max_workers: (Optional) The number of sub-batches to send
+                            concurrently. If passed, the batch is not
+                            limited in size.
+
         :rtype: :class:`google.cloud.storage.batch.Batch`
         :returns: The batch object created.
         """
-        return Batch(client=self)
+        return Batch(client=self, max_workers=max_workers)
 
     def get_bucket(self, bucket_name):
         """Get a bucket by name.
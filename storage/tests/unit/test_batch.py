@@ -40,6 +40,39 @@ def _make_requests_session(responses):
     return session
 
 
+def _make_sub_batch_session(statuses=None):
+    """Session answering each subrequest, by URL, with queued statuses."""
+    import json
+    import re
+
+    statuses = dict(statuses or {})
+
+    def request(method, url, headers=None, data=None):
+        urls = re.findall(r"^[A-Z]+ (\S+) HTTP/1\.1", data, re.MULTILINE)
+        if urls and statuses.get(None):
+            return _make_response(status=statuses[None].pop(0))
+        parts = []
+        for index, sub_url in enumerate(urls):
+            queued = statuses.get(sub_url)
+            status = queued.pop(0) if queued else http_client.OK
+            body = json.dumps({"url": sub_url}) if status == http_client.OK else ""
+            parts.append(
+                "--DEADBEEF=\nContent-Type: application/json\n"
+                "Content-ID: <response-{}>\n\n"
+                "HTTP/1.1 {} Status\nContent-Type: application/json\n"
+                "Content-Length: {}\n\n{}\n".format(index, status, len(body), body)
+            )
+        content = "".join(parts) + "--DEADBEEF=--\n"
+        return _make_response(
+            content=content.encode("utf-8"),
+            headers={"content-type": 'multipart/mixed; boundary="DEADBEEF="'},
+        )
+
+    session = mock.create_autospec(requests.Session, instance=True)
+    session.request.side_effect = request
+    return session
+
+
 class TestMIMEApplicationHTTP(unittest.TestCase):
     @staticmethod
     def _get_target_class():
@@ -245,6 +278,18 @@ class TestBatch(unittest.TestCase):
         with self.assertRaises(ValueError):
             batch._make_request("POST", url, data={"foo": 1})
 
+    def test__make_request_w_max_workers_no_limit(self):
+        url = "http://example.com/api"
+        http = _make_requests_session([])
+        connection = _Connection(http=http)
+        batch = self._make_one(connection, max_workers=2)
+
+        batch._MAX_BATCH_SIZE = 1
+        batch._requests.append(("POST", url, {}, {"bar": 2}))
+        batch._make_request("POST", url, data={"foo": 1})
+
+        self.assertEqual(len(batch._requests), 2)
+
     def test_finish_empty(self):
         http = _make_requests_session([])
         connection = _Connection(http=http)
@@ -427,6 +472,152 @@ class TestBatch(unittest.TestCase):
         with self.assertRaises(ValueError):
             batch.finish()
 
+    def _patch_sessions(self, session):
+        # Sub-batches are sent on the sessions of the worker threads.
+        patch = mock.patch(
+            "google.auth.transport.requests.AuthorizedSession", return_value=session
+        )
+        session_class = patch.start()
+        self.addCleanup(patch.stop)
+        return session_class
+
+    def _make_sub_batch(self, statuses=None, count=3, max_workers=2):
+        http = _make_sub_batch_session(statuses)
+        self._patch_sessions(http)
+        connection = _Connection(http=None)
+        client = _Client(connection)
+        batch = self._make_one(client, max_workers=max_workers)
+        batch.API_BASE_URL = "http://api.example.com"
+
+        urls = ["http://api.example.com/o/{}".format(index) for index in range(count)]
+        targets = [_MockObject() for _ in urls]
+        for url, target in zip(urls, targets):
+            batch._do_request("GET", url, {}, None, target)
+        return batch, http, urls, targets
+
+    def test_finish_w_max_workers(self):
+        batch, http, urls, targets = self._make_sub_batch(count=250, max_workers=3)
+
+        result = batch.finish()
+
+        expected = [{"url": url} for url in urls]
+        self.assertEqual([response.json() for response in result], expected)
+        self.assertEqual([target._properties for target in targets], expected)
+        self.assertEqual(http.request.call_count, 3)
+        self.assertEqual(batch._requests, [])
+
+    def test_finish_w_max_workers_w_status_failure(self):
+        from google.cloud.exceptions import NotFound
+
+        statuses = {"http://api.example.com/o/1": [http_client.NOT_FOUND]}
+        batch, http, urls, targets = self._make_sub_batch(statuses)
+
+        with self.assertRaises(NotFound):
+            batch.finish()
+
+        self.assertEqual(targets[0]._properties, {"url": urls[0]})
+        self.assertEqual(targets[2]._properties, {"url": urls[2]})
+
+    def test_as_completed(self):
+        statuses = {"http://api.example.com/o/1": [http_client.NOT_FOUND]}
+        batch, http, urls, targets = self._make_sub_batch(statuses)
+
+        results = dict(batch.as_completed())
+
+        self.assertEqual(sorted(results), [0, 1, 2])
+        self.assertEqual(results[0].json(), {"url": urls[0]})
+        self.assertEqual(results[1].status_code, http_client.NOT_FOUND)
+        self.assertEqual(results[2].json(), {"url": urls[2]})
+
+    def test_as_completed_w_thread_sessions(self):
+        http = _make_sub_batch_session()
+        session_class = self._patch_sessions(http)
+        client = _Client(_Connection(http=None))
+        batch = self._make_one(client, max_workers=3)
+        batch.API_BASE_URL = "http://api.example.com"
+        for index in range(250):
+            url = "http://api.example.com/o/{}".format(index)
+            batch._do_request("GET", url, {}, None, None)
+
+        results = dict(batch.as_completed())
+
+        self.assertEqual(sorted(results), list(range(250)))
+        self.assertEqual(http.request.call_count, 3)
+        # Each worker thread creates its own session, and closes it.
+        self.assertLessEqual(session_class.call_count, 3)
+        session_class.assert_called_with(client._credentials)
+        self.assertEqual(http.close.call_count, session_class.call_count)
+        _, kwargs = http.request.call_args
+        self.assertEqual(kwargs["method"], "POST")
+        self.assertEqual(kwargs["url"], "http://api.example.com/batch/storage/v1")
+        self.assertEqual(kwargs["headers"]["User-Agent"], batch.USER_AGENT)
+        self.assertEqual(kwargs["headers"]["Accept-Encoding"], "gzip")
+
+    def test_as_completed_empty(self):
+        batch, http, urls, targets = self._make_sub_batch(count=0)
+
+        with self.assertRaises(ValueError):
+            list(batch.as_completed())
+
+    def test_as_completed_retries_failed_subrequests(self):
+        statuses = {
+            "http://api.example.com/o/1": [
+                http_client.SERVICE_UNAVAILABLE,
+                http_client.INTERNAL_SERVER_ERROR,
+            ]
+        }
+        batch, http, urls, targets = self._make_sub_batch(statuses)
+
+        with mock.patch("time.sleep") as sleep:
+            results = dict(batch.as_completed())
+
+        self.assertEqual(
+            [results[index].json() for index in range(3)],
+            [{"url": url} for url in urls],
+        )
+        self.assertEqual(http.request.call_count, 3)
+        retried = http.request.mock_calls[2][2]["data"]
+        self.assertNotIn(urls[0], retried)
+        self.assertIn(urls[1], retried)
+        self.assertEqual(sleep.mock_calls, [mock.call(2.0), mock.call(4.0)])
+
+    def test_as_completed_retries_failed_batch_request(self):
+        statuses = {None: [http_client.SERVICE_UNAVAILABLE]}
+        batch, http, urls, targets = self._make_sub_batch(statuses)
+
+        with mock.patch("time.sleep"):
+            results = dict(batch.as_completed())
+
+        self.assertEqual(
+            [results[index].json() for index in range(3)],
+            [{"url": url} for url in urls],
+        )
+        self.assertEqual(http.request.call_count, 2)
+
+    def test_as_completed_gives_up_after_max_attempts(self):
+        from google.cloud.storage.batch import _MAX_SUB_BATCH_ATTEMPTS
+
+        statuses = {
+            "http://api.example.com/o/1": [http_client.SERVICE_UNAVAILABLE]
+            * _MAX_SUB_BATCH_ATTEMPTS
+        }
+        batch, http, urls, targets = self._make_sub_batch(statuses)
+
+        with mock.patch("time.sleep"):
+            results = dict(batch.as_completed())
+
+        self.assertEqual(results[1].status_code, http_client.SERVICE_UNAVAILABLE)
+        self.assertEqual(http.request.call_count, _MAX_SUB_BATCH_ATTEMPTS)
+
+    def test_as_completed_w_batch_request_failure(self):
+        from google.cloud.exceptions import Forbidden
+
+        statuses = {None: [http_client.FORBIDDEN]}
+        batch, http, urls, targets = self._make_sub_batch(statuses)
+
+        with self.assertRaises(Forbidden):
+            list(batch.as_completed())
+
     def test_as_context_mgr_wo_error(self):
         from google.cloud.storage.client import Client
 
@@ -504,6 +695,23 @@ class TestBatch(unittest.TestCase):
         self.assertIsInstance(target2._properties, _FutureDict)
         self.assertIsInstance(target3._properties, _FutureDict)
 
+    def test_as_context_mgr_w_as_completed(self):
+        http = _make_sub_batch_session()
+        self._patch_sessions(http)
+        connection = _Connection(http=None)
+        client = _Client(connection)
+        client._push_batch = mock.Mock(spec=[])
+        client._pop_batch = mock.Mock(spec=[])
+        url = "http://api.example.com/o/0"
+
+        with self._make_one(client, max_workers=2) as batch:
+            batch.API_BASE_URL = "http://api.example.com"
+            batch._do_request("GET", url, {}, None, None)
+            results = list(batch.as_completed())
+
+        self.assertEqual(len(results), 1)
+        self.assertEqual(http.request.call_count, 1)
+
 
 class Test__unpack_batch_response(unittest.TestCase):
     def _call_fut(self, headers, content):
@@ -631,3 +839,4 @@ class _MockObject(object):
 class _Client(object):
     def __init__(self, connection):
         self._base_connection = connection
+        self._credentials = _make_credentials()
@@ -1101,6 +1101,134 @@ class Test_Blob(unittest.TestCase):
         }
         self._check_session_mocks(client, transport, media_link, headers=key_headers)
 
+    def _mock_range_transport(self, payload, fail_ranges=()):
+        import re
+
+        fail_ranges = list(fail_ranges)
+        requested = []
+
+        def request(method, url, data=None, headers=None, **kwargs):
+            byte_range = headers.get("range")
+            requested.append(byte_range)
+            if byte_range is None:
+                return self._mock_requests_response(
+                    http_client.OK,
+                    {"content-length": str(len(payload))},
+                    content=payload,
+                    stream=True,
+                )
+            if byte_range in fail_ranges:
+                fail_ranges.remove(byte_range)
+                return self._mock_requests_response(
+                    http_client.SERVICE_UNAVAILABLE, {}, content=b"try again"
+                )
+            start, end = map(int, re.match(r"bytes=(\d+)-(\d+)", byte_range).groups())
+            content = payload[start : end + 1]
+            return self._mock_requests_response(
+                http_client.PARTIAL_CONTENT,
+                {
+                    "content-length": str(len(content)),
+                    "content-range": "bytes {}-{}/{}".format(
+                        start, start + len(content) - 1, len(payload)
+                    ),
+                },
+                content=content,
+            )
+
+        transport = mock.Mock(spec=["request", "close"])
+        transport.request.side_effect = request
+        transport.requested = requested
+        return transport
+
+    def _sliced_download_helper(self, filename, payload, md5_hash=None, **kw):
+        transport = self._mock_range_transport(payload, **kw)
+        client = mock.Mock(
+            _http=transport,
+            _credentials=_make_credentials(),
+            spec=["_http", "_credentials"],
+        )
+        bucket = _Bucket(client)
+        properties = {
+            "mediaLink": "http://example.com/media/",
+            "size": str(len(payload)),
+        }
+        if md5_hash is not None:
+            properties["md5Hash"] = md5_hash
+        blob = self._make_one("blob-name", bucket=bucket, properties=properties)
+
+        session_patch = mock.patch(
+            "google.auth.transport.requests.AuthorizedSession",
+            return_value=transport,
+        )
+        with session_patch as session_class, mock.patch("time.sleep"):
+            blob.download_to_filename(filename, max_workers=3, slice_size=4)
+        # Each worker's session is closed once the download is over.
+        self.assertEqual(transport.close.call_count, session_class.call_count)
+        with open(filename, "rb") as file_obj:
+            wrote = file_obj.read()
+        return wrote, transport
+
+    def test_download_to_filename_sliced(self):
+        from google.cloud._testing import _NamedTemporaryFile
+
+        payload = b"abcdefghijklmnopqrstuvwxyz"
+        md5_hash = base64.b64encode(hashlib.md5(payload).digest()).decode(u"utf-8")
+
+        with _NamedTemporaryFile() as temp:
+            wrote, transport = self._sliced_download_helper(
+                temp.name, payload, md5_hash=md5_hash
+            )
+
+        self.assertEqual(wrote, payload)
+        self.assertEqual(
+            sorted(transport.requested),
+            sorted(
+                "bytes={}-{}".format(start, min(start + 3, len(payload) - 1))
+                for start in range(0, len(payload), 4)
+            ),
+        )
+
+    def test_download_to_filename_sliced_retries_failed_slice(self):
+        from google.cloud._testing import _NamedTemporaryFile
+
+        payload = b"abcdefghijkl"
+
+        with _NamedTemporaryFile() as temp:
+            wrote, transport = self._sliced_download_helper(
+                temp.name, payload, fail_ranges=["bytes=4-7"]
+            )
+
+        self.assertEqual(wrote, payload)
+        self.assertEqual(
+            sorted(transport.requested),
+            ["bytes=0-3", "bytes=4-7", "bytes=4-7", "bytes=8-11"],
+        )
+
+    def test_download_to_filename_sliced_corrupted(self):
+        from google.resumable_media import DataCorruption
+
+        payload = b"abcdefghijkl"
+        md5_hash = base64.b64encode(hashlib.md5(b"other").digest()).decode(u"utf-8")
+
+        temp_dir = tempfile.mkdtemp()
+        self.addCleanup(os.rmdir, temp_dir)
+        filename = os.path.join(temp_dir, "blob-name")
+        with self.assertRaises(DataCorruption):
+            self._sliced_download_helper(filename, payload, md5_hash=md5_hash)
+
+        self.assertFalse(os.path.exists(filename))
+
+    def test_download_to_filename_sliced_small_blob(self):
+        from google.cloud._testing import _NamedTemporaryFile
+
+        payload = b"abc"
+
+        with _NamedTemporaryFile() as temp:
+            wrote, transport = self._sliced_download_helper(temp.name, payload)
+
+        self.assertEqual(wrote, payload)
+        self.assertEqual(transport.requested, [None])
+
     def test_download_as_string(self):
         blob_name = "blob-name"
         transport = self._mock_download_transport()
@@ -1645,13 +1773,25 @@ class Test_Blob(unittest.TestCase):
         response.json.assert_called_once_with()
         if size is not None and size <= google.cloud.storage.blob._MAX_MULTIPART_SIZE:
             blob._do_multipart_upload.assert_called_once_with(
-                client, stream, content_type, size, num_retries, predefined_acl
+                client,
+                stream,
+                content_type,
+                size,
+                num_retries,
+                predefined_acl,
+                transport=None,
             )
             blob._do_resumable_upload.assert_not_called()
         else:
             blob._do_multipart_upload.assert_not_called()
             blob._do_resumable_upload.assert_called_once_with(
-                client, stream, content_type, size, num_retries, predefined_acl
+                client,
+                stream,
+                content_type,
+                size,
+                num_retries,
+                predefined_acl,
+                transport=None,
             )
 
     def test__do_upload_uses_multipart(self):
@@ -1781,6 +1921,175 @@ class Test_Blob(unittest.TestCase):
         self.assertEqual(stream.mode, "rb")
         self.assertEqual(stream.name, temp.name)
 
+    def _composite_upload_helper(
+        self, data, side_effect=None, delete_error=None, **kwargs
+    ):
+        from google.cloud._testing import _NamedTemporaryFile
+        from google.cloud.storage.blob import Blob
+
+        uploaded = {}
+        side_effect = list(side_effect or ())
+        self.sessions = []
+        self.upload_transports = set()
+
+        def make_session(credentials):
+            session = mock.Mock(spec=["close"])
+            self.sessions.append(session)
+            return session
+
+        def do_upload(component, client, stream, content_type, size, *args, **kw):
+            self.upload_transports.add(kw.get("transport"))
+            if side_effect:
+                raise side_effect.pop(0)
+            uploaded[component.name] = stream.read(size)
+            return {}
+
+        connection = _Connection(({"status": http_client.OK}, {"componentCount": "3"}))
+        client = _Client(connection)
+        bucket = _Bucket(client=client)
+        bucket.delete_blobs = mock.Mock(spec=[], side_effect=delete_error)
+        blob = self._make_one("blob-name", bucket=bucket)
+
+        upload_patch = mock.patch.object(Blob, "_do_upload", autospec=True)
+        session_patch = mock.patch(
+            "google.auth.transport.requests.AuthorizedSession",
+            side_effect=make_session,
+        )
+        with _NamedTemporaryFile() as temp:
+            with open(temp.name, "wb") as file_obj:
+                file_obj.write(data)
+            with upload_patch as do_upload_mock, mock.patch("time.sleep"):
+                do_upload_mock.side_effect = do_upload
+                with session_patch:
+                    blob.upload_from_filename(
+                        temp.name, content_type=u"text/plain", client=client, **kwargs
+                    )
+
+        return blob, uploaded, connection, bucket
+
+    def test_upload_from_filename_composite(self):
+        data = b"0123456789"
+
+        blob, uploaded, connection, bucket = self._composite_upload_helper(
+            data, predefined_acl="private", max_workers=2, component_size=4
+        )
+
+        self.assertEqual(blob.component_count, 3)
+        names = sorted(uploaded)
+        self.assertEqual(len(names), 3)
+        self.assertEqual(
+            [uploaded[name] for name in names], [b"0123", b"4567", b"89"]
+        )
+        for name in names:
+            self.assertTrue(name.startswith(u"blob-name."))
+
+        (compose_kw,) = connection._requested
+        self.assertEqual(compose_kw["method"], "POST")
+        self.assertEqual(compose_kw["path"], "/b/name/o/blob-name/compose")
+        self.assertEqual(
+            compose_kw["query_params"], {"destinationPredefinedAcl": "private"}
+        )
+        self.assertEqual(
+            compose_kw["data"],
+            {
+                "sourceObjects": [{"name": name} for name in names],
+                "destination": {"name": u"blob-name", "contentType": u"text/plain"},
+            },
+        )
+
+        components = bucket.delete_blobs.call_args[0][0]
+        self.assertEqual([component.name for component in components], names)
+
+        # Each worker uploads with its own session, closed at the end.
+        self.assertTrue(1 <= len(self.sessions) <= 2)
+        self.assertEqual(self.upload_transports, set(self.sessions))
+        for session in self.sessions:
+            session.close.assert_called_once_with()
+
+    def test_upload_from_filename_composite_retries_component(self):
+        from google.resumable_media import InvalidResponse
+
+        data = b"0123456789"
+        response = self._mock_requests_response(http_client.SERVICE_UNAVAILABLE, {})
+
+        blob, uploaded, connection, bucket = self._composite_upload_helper(
+            data,
+            side_effect=[InvalidResponse(response)],
+            max_workers=1,
+            component_size=4,
+        )
+
+        self.assertEqual(
+            [uploaded[name] for name in sorted(uploaded)], [b"0123", b"4567", b"89"]
+        )
+        self.assertEqual(len(connection._requested), 1)
+
+    def test_upload_from_filename_composite_failure(self):
+        from google.cloud.exceptions import NotFound
+        from google.resumable_media import InvalidResponse
+
+        data = b"0123456789"
+        response = self._mock_requests_response(http_client.NOT_FOUND, {})
+
+        with self.assertRaises(NotFound):
+            self._composite_upload_helper(
+                data,
+                side_effect=[InvalidResponse(response)],
+                max_workers=1,
+                component_size=4,
+            )
+
+    def test_upload_from_filename_composite_failure_w_cleanup_error(self):
+        from google.cloud.exceptions import NotFound
+        from google.cloud.exceptions import ServiceUnavailable
+        from google.resumable_media import InvalidResponse
+
+        data = b"0123456789"
+        response = self._mock_requests_response(http_client.NOT_FOUND, {})
+
+        with self.assertRaises(NotFound):
+            self._composite_upload_helper(
+                data,
+                side_effect=[InvalidResponse(response)],
+                delete_error=ServiceUnavailable("try again"),
+                max_workers=1,
+                component_size=4,
+            )
+
+    def test_upload_from_filename_composite_cleanup_error(self):
+        from google.cloud.exceptions import ServiceUnavailable
+
+        data = b"0123456789"
+
+        with self.assertRaises(ServiceUnavailable):
+            self._composite_upload_helper(
+                data,
+                delete_error=ServiceUnavailable("try again"),
+                max_workers=1,
+                component_size=4,
+            )
+
+    def test_upload_from_filename_composite_max_components(self):
+        data = b"x" * 100
+
+        blob, uploaded, connection, bucket = self._composite_upload_helper(
+            data, max_workers=4, component_size=1
+        )
+
+        self.assertEqual(len(uploaded), 25)
+        self.assertEqual(b"".join(uploaded.values()), data)
+
+    def test_upload_from_filename_composite_small_file(self):
+        data = b"0123"
+
+        blob, uploaded, connection, bucket = self._composite_upload_helper(
+            data, max_workers=2, component_size=4
+        )
+
+        self.assertEqual(uploaded, {u"blob-name": data})
+        self.assertEqual(connection._requested, [])
+        bucket.delete_blobs.assert_not_called()
+
     def _upload_from_string_helper(self, data, **kwargs):
         from google.cloud._helpers import _to_bytes
 
@@ -3003,6 +3312,45 @@ class Test__quote(unittest.TestCase):
             self._call_fut(None)
 
 
+class Test__FileSlice(unittest.TestCase):
+    @staticmethod
+    def _get_target_class():
+        from google.cloud.storage.blob import _FileSlice
+
+        return _FileSlice
+
+    def _make_one(self, data, offset, size):
+        from google.cloud._testing import _NamedTemporaryFile
+
+        temp = _NamedTemporaryFile()
+        self.addCleanup(temp.__exit__, None, None, None)
+        with open(temp.name, "wb") as file_obj:
+            file_obj.write(data)
+        file_slice = self._get_target_class()(temp.name, offset, size)
+        self.addCleanup(file_slice.close)
+        return file_slice
+
+    def test_read(self):
+        file_slice = self._make_one(b"0123456789", 2, 5)
+
+        self.assertEqual(file_slice.tell(), 0)
+        self.assertEqual(file_slice.read(3), b"234")
+        self.assertEqual(file_slice.tell(), 3)
+        self.assertEqual(file_slice.read(), b"56")
+        self.assertEqual(file_slice.read(1), b"")
+
+    def test_seek(self):
+        file_slice = self._make_one(b"0123456789", 2, 5)
+
+        self.assertEqual(file_slice.seek(1), 1)
+        self.assertEqual(file_slice.read(2), b"34")
+        self.assertEqual(file_slice.seek(-1, os.SEEK_CUR), 2)
+        self.assertEqual(file_slice.read(1), b"4")
+        self.assertEqual(file_slice.seek(-2, os.SEEK_END), 3)
+        self.assertEqual(file_slice.read(10), b"56")
+        self.assertEqual(file_slice.seek(100), 5)
+
+
 class Test__maybe_rewind(unittest.TestCase):
     @staticmethod
     def _call_fut(*args, **kwargs):
@@ -3071,6 +3419,43 @@ class Test__raise_from_invalid_response(unittest.TestCase):
         self.assertEqual(exc_info.exception.errors, [])
 
 
+class Test__is_retryable_transfer_error(unittest.TestCase):
+    @staticmethod
+    def _call_fut(exc):
+        from google.cloud.storage.blob import _is_retryable_transfer_error
+
+        return _is_retryable_transfer_error(exc)
+
+    def _invalid_response(self, code):
+        import requests
+
+        from google.resumable_media import InvalidResponse
+
+        response = requests.Response()
+        response.status_code = code
+        return InvalidResponse(response, "Failure")
+
+    def test_transient_status(self):
+        self.assertTrue(self._call_fut(self._invalid_response(429)))
+        self.assertTrue(
+            self._call_fut(self._invalid_response(http_client.SERVICE_UNAVAILABLE))
+        )
+
+    def test_other_status(self):
+        self.assertFalse(self._call_fut(self._invalid_response(http_client.NOT_FOUND)))
+
+    def test_connection_error(self):
+        import requests
+
+        self.assertTrue(self._call_fut(requests.exceptions.ConnectionError()))
+
+    def test_os_error(self):
+        import errno
+
+        error = IOError(errno.ENOSPC, "No space left on device")
+        self.assertFalse(self._call_fut(error))
+
+
 class Test__add_query_parameters(unittest.TestCase):
     @staticmethod
     def _call_fut(*args, **kwargs):
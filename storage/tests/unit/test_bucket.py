@@ -658,6 +658,162 @@ class Test_Bucket(unittest.TestCase):
         self.assertEqual(kw["path"], "/b/%s/o" % NAME)
         self.assertEqual(kw["query_params"], {"projection": "noAcl"})
 
+    def test_list_blobs_w_offsets(self):
+        NAME = "name"
+        connection = _Connection({"items": []})
+        client = _Client(connection)
+        bucket = self._make_one(client=client, name=NAME)
+        iterator = bucket.list_blobs(start_offset="b", end_offset="d")
+        blobs = list(iterator)
+        self.assertEqual(blobs, [])
+        kw, = connection._requested
+        self.assertEqual(
+            kw["query_params"],
+            {"projection": "noAcl", "startOffset": "b", "endOffset": "d"},
+        )
+
+    _SHARDED_NAMES = (
+        "a",
+        "a.txt",
+        "a/1",
+        "a/2",
+        "a/3",
+        "a0",
+        "b/1",
+        "b/c/2",
+        "c",
+        "Z/1",
+        "~",
+    )
+
+    def _list_blobs_parallel_helper(self, **kw):
+        connection = _ListingConnection(self._SHARDED_NAMES)
+        client = _Client(connection)
+        bucket = self._make_one(client=client, name="name")
+        blobs = list(bucket.list_blobs_parallel(max_workers=2, **kw))
+        for blob in blobs:
+            self.assertIs(blob.bucket, bucket)
+        return [blob.name for blob in blobs], connection._requested
+
+    def test_list_blobs_parallel_by_delimiter(self):
+        names, requested = self._list_blobs_parallel_helper(ordered=True)
+
+        self.assertEqual(names, sorted(self._SHARDED_NAMES))
+        self.assertEqual(
+            requested[0]["query_params"], {"projection": "noAcl", "delimiter": "/"}
+        )
+        prefixes = sorted(
+            kw["query_params"]["prefix"]
+            for kw in requested
+            if "prefix" in kw["query_params"]
+        )
+        # The "a/" folder spans two pages.
+        self.assertEqual(prefixes, ["Z/", "a/", "a/", "b/"])
+
+    def test_list_blobs_parallel_unordered(self):
+        names, requested = self._list_blobs_parallel_helper()
+
+        self.assertEqual(sorted(names), sorted(self._SHARDED_NAMES))
+        # Top-level blobs are returned as they are listed.
+        self.assertEqual(
+            [name for name in names if "/" not in name],
+            sorted(name for name in self._SHARDED_NAMES if "/" not in name),
+        )
+
+    def test_list_blobs_parallel_streams_top_level(self):
+        connection = _ListingConnection(self._SHARDED_NAMES)
+        client = _Client(connection)
+        bucket = self._make_one(client=client, name="name")
+
+        iterator = bucket.list_blobs_parallel(max_workers=2)
+        blob = next(blob for blob in iterator if "/" not in blob.name)
+        self.assertEqual(blob.name, "a")
+        iterator.close()
+
+        # Only the first page of top-level blobs and folders was listed.
+        discovery = [
+            kw for kw in connection._requested if "delimiter" in kw["query_params"]
+        ]
+        self.assertEqual(len(discovery), 1)
+
+    def test_list_blobs_parallel_flat_namespace(self):
+        from google.cloud.storage.bucket import _SHARD_SPLIT_CHARACTERS
+
+        connection = _ListingConnection(["a", "b", "c", "d/1", "e"])
+        client = _Client(connection)
+        bucket = self._make_one(client=client, name="name")
+
+        blobs = list(bucket.list_blobs_parallel(max_workers=2, ordered=True))
+
+        self.assertEqual([blob.name for blob in blobs], ["a", "b", "c", "d/1", "e"])
+        discovery, shards = connection._requested[0], connection._requested[1:]
+        self.assertEqual(
+            discovery["query_params"], {"projection": "noAcl", "delimiter": "/"}
+        )
+        # The first page holds only blobs, so the keyspace is split in ranges.
+        starts = set(kw["query_params"].get("startOffset") for kw in shards)
+        self.assertEqual(starts, set([None] + list(_SHARD_SPLIT_CHARACTERS)))
+        for kw in shards:
+            self.assertNotIn("delimiter", kw["query_params"])
+
+    def test_list_blobs_parallel_w_split_points(self):
+        names, requested = self._list_blobs_parallel_helper(
+            split_points=["b", "a/"], ordered=True
+        )
+
+        self.assertEqual(names, sorted(self._SHARDED_NAMES))
+        bounds = set(
+            (kw["query_params"].get("startOffset"), kw["query_params"].get("endOffset"))
+            for kw in requested
+        )
+        self.assertEqual(bounds, set([(None, "a/"), ("a/", "b"), ("b", None)]))
+
+    def test_list_blobs_parallel_wo_delimiter(self):
+        from google.cloud.storage.bucket import _SHARD_SPLIT_CHARACTERS
+
+        names, requested = self._list_blobs_parallel_helper(
+            prefix="a", delimiter=None, ordered=True
+        )
+
+        self.assertEqual(names, ["a", "a.txt", "a/1", "a/2", "a/3", "a0"])
+        starts = set(kw["query_params"].get("startOffset") for kw in requested)
+        self.assertEqual(
+            starts, set([None] + ["a" + char for char in _SHARD_SPLIT_CHARACTERS])
+        )
+        for kw in requested:
+            self.assertEqual(kw["query_params"]["prefix"], "a")
+
+    def test_list_blobs_parallel_w_fields(self):
+        fields = "items(name),nextPageToken"
+        names, requested = self._list_blobs_parallel_helper(fields=fields)
+
+        self.assertEqual(sorted(names), sorted(self._SHARDED_NAMES))
+        for kw in requested:
+            params = kw["query_params"]
+            if "delimiter" in params:
+                self.assertEqual(params["fields"], fields + ",prefixes")
+            else:
+                self.assertEqual(params["fields"], fields)
+
+    def test_list_blobs_parallel_w_shard_failure(self):
+        from google.cloud.exceptions import NotFound
+
+        connection = _ListingConnection(self._SHARDED_NAMES, missing_prefix="b/")
+        client = _Client(connection)
+        bucket = self._make_one(client=client, name="name")
+
+        with self.assertRaises(NotFound):
+            list(bucket.list_blobs_parallel(max_workers=2))
+
+    def test_list_blobs_parallel_stopped_early(self):
+        connection = _ListingConnection(self._SHARDED_NAMES)
+        client = _Client(connection)
+        bucket = self._make_one(client=client, name="name")
+
+        iterator = bucket.list_blobs_parallel(max_workers=1, ordered=True)
+        self.assertEqual(next(iterator).name, "Z/1")
+        iterator.close()
+
     def test_list_notifications(self):
         from google.cloud.storage.notification import BucketNotification
         from google.cloud.storage.notification import _TOPIC_REF_FMT
@@ -893,6 +1049,79 @@ class Test_Bucket(unittest.TestCase):
         self.assertEqual(kw[1]["method"], "DELETE")
         self.assertEqual(kw[1]["path"], "/b/%s/o/%s" % (NAME, NONESUCH))
 
+    def test_delete_blobs_w_max_workers(self):
+        NAME = "name"
+        USER_PROJECT = "user-project-123"
+        client = _BatchClient(_Connection())
+        bucket = self._make_one(client=client, name=NAME, user_project=USER_PROJECT)
+        blob_names = ("blob-name-%d" % index for index in range(250))
+        progress = []
+
+        bucket.delete_blobs(
+            blob_names,
+            max_workers=2,
+            on_progress=lambda blob, error: progress.append((blob, error)),
+        )
+
+        self.assertEqual([batch._max_workers for batch in client._batches], [2, 2])
+        requested = [kw for batch in client._batches for kw in batch._requested]
+        self.assertEqual(len(requested), 250)
+        self.assertEqual(requested[0]["method"], "DELETE")
+        self.assertEqual(requested[0]["path"], "/b/%s/o/blob-name-0" % NAME)
+        self.assertEqual(requested[0]["query_params"], {"userProject": USER_PROJECT})
+        self.assertEqual(len(client._batches[1]._requested), 50)
+        self.assertEqual(
+            sorted(blob for blob, _ in progress),
+            sorted("blob-name-%d" % index for index in range(250)),
+        )
+        self.assertEqual(set(error for _, error in progress), set([None]))
+        self.assertIsNone(client._current_batch)
+
+    def test_delete_blobs_w_max_workers_miss_w_on_error(self):
+        NAME = "name"
+        NONESUCH = "nonesuch"
+        statuses = {"/b/%s/o/%s" % (NAME, NONESUCH): 404}
+        client = _BatchClient(_Connection(), statuses)
+        bucket = self._make_one(client=client, name=NAME)
+        blob = bucket.blob("blob-name")
+        errors = []
+
+        bucket.delete_blobs([blob, NONESUCH], errors.append, max_workers=4)
+
+        self.assertEqual(errors, [NONESUCH])
+        (batch,) = client._batches
+        self.assertEqual(len(batch._requested), 2)
+
+    def test_delete_blobs_w_max_workers_miss_no_on_error(self):
+        from google.cloud.exceptions import NotFound
+
+        NAME = "name"
+        NONESUCH = "nonesuch"
+        statuses = {"/b/%s/o/%s" % (NAME, NONESUCH): 404}
+        client = _BatchClient(_Connection(), statuses)
+        bucket = self._make_one(client=client, name=NAME)
+
+        with self.assertRaises(NotFound):
+            bucket.delete_blobs(["blob-name", NONESUCH], max_workers=4)
+
+    def test_delete_blobs_w_max_workers_failure_w_on_progress(self):
+        from google.cloud.exceptions import Forbidden
+
+        NAME = "name"
+        statuses = {"/b/%s/o/forbidden" % (NAME,): 403}
+        client = _BatchClient(_Connection(), statuses)
+        bucket = self._make_one(client=client, name=NAME)
+        progress = {}
+
+        bucket.delete_blobs(
+            ["blob-name", "forbidden"],
+            max_workers=4,
+            on_progress=progress.__setitem__,
+        )
+
+        self.assertIsNone(progress["blob-name"])
+        self.assertIsInstance(progress["forbidden"], Forbidden)
+
     @staticmethod
     def _make_blob(bucket_name, blob_name):
         from google.cloud.storage.blob import Blob
@@ -1993,6 +2222,68 @@ class Test_Bucket(unittest.TestCase):
         bucket._MAX_OBJECTS_FOR_ITERATION = 1
         self.assertRaises(ValueError, bucket.make_public, recursive=True)
 
+    def _bulk_acl_helper(self, method_name, acl):
+        NAME = "name"
+        owner = {"entity": "user-owner", "role": "OWNER"}
+        items = [
+            {"name": "blob-name-1", "acl": [owner] + acl},
+            {"name": "blob-name-2", "acl": [owner] + acl},
+        ]
+        after = {"acl": [], "defaultObjectAcl": []}
+        connection = _Connection(after, {"items": items})
+        client = _BatchClient(connection)
+        bucket = self._make_one(client=client, name=NAME)
+        bucket.acl.loaded = True
+        bucket.default_object_acl.loaded = True
+        # The limit does not apply when batching.
+        bucket._MAX_OBJECTS_FOR_ITERATION = 1
+        progress = []
+
+        getattr(bucket, method_name)(
+            recursive=True,
+            max_workers=2,
+            on_progress=lambda blob, error: progress.append((blob.name, error)),
+        )
+
+        list_kw = connection._requested[1]
+        self.assertEqual(list_kw["method"], "GET")
+        self.assertEqual(list_kw["path"], "/b/%s/o" % NAME)
+        self.assertEqual(
+            list_kw["query_params"],
+            {"projection": "full", "fields": "items(name,acl),nextPageToken"},
+        )
+        self.assertEqual(
+            sorted(progress), [("blob-name-1", None), ("blob-name-2", None)]
+        )
+        (batch,) = client._batches
+        self.assertEqual(
+            [kw["path"] for kw in batch._requested],
+            ["/b/%s/o/blob-name-1" % NAME, "/b/%s/o/blob-name-2" % NAME],
+        )
+        for kw in batch._requested:
+            self.assertEqual(kw["method"], "PATCH")
+            self.assertEqual(kw["query_params"], {"projection": "full"})
+        return owner, [kw["data"]["acl"] for kw in batch._requested]
+
+    def test_make_public_recursive_w_max_workers(self):
+        from google.cloud.storage.acl import _ACLEntity
+
+        public = {"entity": "allUsers", "role": _ACLEntity.READER_ROLE}
+        owner, patched = self._bulk_acl_helper("make_public", [])
+
+        for acl in patched:
+            self.assertEqual(
+                sorted(acl, key=lambda entry: entry["entity"]), [public, owner]
+            )
+
+    def test_make_private_recursive_w_max_workers(self):
+        from google.cloud.storage.acl import _ACLEntity
+
+        public = {"entity": "allUsers", "role": _ACLEntity.READER_ROLE}
+        owner, patched = self._bulk_acl_helper("make_private", [public])
+
+        self.assertEqual(patched, [[owner], [owner]])
+
     def test_make_private_defaults(self):
         NAME = "name"
         no_permissions = []
@@ -2421,6 +2712,100 @@ class _Connection(object):
             return response
 
 
+class _ListingConnection(object):
+    """Lists blobs with the given names, two blobs or prefixes per page."""
+
+    def __init__(self, names, missing_prefix=None):
+        self._names = sorted(names)
+        self._missing_prefix = missing_prefix
+        self._requested = []
+
+    def api_request(self, **kw):
+        from google.cloud.exceptions import NotFound
+
+        self._requested.append(kw)
+        params = kw["query_params"]
+        prefix = params.get("prefix", "")
+        if prefix == self._missing_prefix:
+            raise NotFound("miss")
+
+        delimiter = params.get("delimiter")
+        entries = []
+        for name in self._names:
+            if not name.startswith(prefix):
+                continue
+            if name < params.get("startOffset", ""):
+                continue
+            if "endOffset" in params and name >= params["endOffset"]:
+                continue
+            if delimiter and delimiter in name[len(prefix) :]:
+                folder = name[: name.index(delimiter, len(prefix)) + 1]
+                if ("prefix", folder) not in entries:
+                    entries.append(("prefix", folder))
+            else:
+                entries.append(("item", name))
+        # Blobs and prefixes are paged together, in the order of names.
+        entries.sort(key=lambda entry: entry[1])
+
+        start = int(params.get("pageToken", 0))
+        page = entries[start : start + 2]
+        response = {"items": [{"name": name} for kind, name in page if kind == "item"]}
+        prefixes = [name for kind, name in page if kind == "prefix"]
+        if prefixes:
+            response["prefixes"] = prefixes
+        if start + 2 < len(entries):
+            response["nextPageToken"] = str(start + 2)
+        return response
+
+
+class _Batch(object):
+    def __init__(self, statuses, max_workers):
+        self._statuses = statuses
+        self._max_workers = max_workers
+        self._requested = []
+
+    def api_request(self, **kw):
+        self._requested.append(kw)
+
+    def as_completed(self):
+        import requests
+
+        # Sub-batches may complete in any order.
+        for index in reversed(range(len(self._requested))):
+            response = requests.Response()
+            response.status_code = self._statuses.get(
+                self._requested[index]["path"], 200
+            )
+            response._content = b"{}"
+            response.request = requests.Request("BATCH", "contentid://").prepare()
+            yield index, response
+
+
+class _BatchClient(object):
+    def __init__(self, connection, statuses=None):
+        self._base_connection = connection
+        self._statuses = statuses or {}
+        self._batches = []
+        self._current_batch = None
+
+    @property
+    def _connection(self):
+        if self._current_batch is not None:
+            return self._current_batch
+        return self._base_connection
+
+    def batch(self, max_workers=None):
+        batch = _Batch(self._statuses, max_workers)
+        self._batches.append(batch)
+        return batch
+
+    def _push_batch(self, batch):
+        self._current_batch = batch
+
+    def _pop_batch(self):
+        self._current_batch = None
+
+
 class _Client(object):
     def __init__(self, connection, project=None):
         self._connection = connection
@@ -260,6 +260,15 @@ class TestClient(unittest.TestCase):
         batch = client.batch()
         self.assertIsInstance(batch, Batch)
         self.assertIs(batch._client, client)
+        self.assertIsNone(batch._max_workers)
+
+    def test_batch_w_max_workers(self):
+        PROJECT = "PROJECT"
+        CREDENTIALS = _make_credentials()
+
+        client = self._make_one(project=PROJECT, credentials=CREDENTIALS)
+        batch = client.batch(max_workers=4)
+        self.assertEqual(batch._max_workers, 4)
 
     def test_get_bucket_miss(self):
         from google.cloud.exceptions import NotFound